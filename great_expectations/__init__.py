@@ -12,18 +12,9 @@ import great_expectations.core
 
 from great_expectations.data_context.data_context.context_factory import get_context
 
-# # By placing this registry function in our top-level __init__,  we ensure that all
-# # GX workflows have populated expectation registries before they are used.
-from great_expectations.expectations.registry import (
-    register_core_expectations as _register_core_expectations,
-    register_core_metrics as _register_core_metrics,
-)
-
-_register_core_metrics()
-_register_core_expectations()
-
-del _register_core_metrics
-del _register_core_expectations
+# Core Expectations and Metrics are not imported here: registry imports each of them on first lookup
+# (see "great_expectations.expectations.registry"); only base classes of Metric providers are.
+import great_expectations.expectations.metrics
 
 from great_expectations import exceptions
 from great_expectations import expectations
@@ -18,11 +18,11 @@ from typing import (
     Union,
 )
 
-import requests
 from typing_extensions import Annotated
 
 from great_expectations._docs_decorators import public_api
 from great_expectations.checkpoint.util import (
+    get_notification_session,
     send_email,
     send_microsoft_teams_notifications,
     send_opsgenie_alert,
@@ -57,6 +57,8 @@ from great_expectations.render.renderer.renderer import Renderer
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 if TYPE_CHECKING:
+    import requests
+
     from great_expectations.checkpoint.checkpoint import CheckpointResult
     from great_expectations.core.expectation_validation_result import (
         ExpectationSuiteValidationResult,
@@ -829,7 +831,7 @@ class APINotificationAction(ValidationAction):
     def send_results(self, payload) -> requests.Response:
         try:
             headers = {"Content-Type": "application/json"}
-            return requests.post(self.url, headers=headers, data=payload)
+            return get_notification_session().post(self.url, headers=headers, data=payload)
         except Exception as e:
             print(f"Exception when sending data to API - {e}")
             raise e  # noqa: TRY201
@@ -2,15 +2,23 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Any,
     Callable,
+    Deque,
     Dict,
+    Hashable,
     List,
     Mapping,
     Optional,
+    Tuple,
     TypedDict,
     Union,
     cast,
@@ -34,7 +42,7 @@ from great_expectations.compatibility.pydantic import (
 )
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
-    ExpectationSuiteValidationResult,  # noqa: TCH001
+    ExpectationSuiteValidationResult,
 )
 from great_expectations.core.freshness_diagnostics import CheckpointFreshnessDiagnostics
 from great_expectations.core.result_format import DEFAULT_RESULT_FORMAT, ResultFormatUnion
@@ -46,6 +54,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.datasource.fluent.interfaces import isolated_execution_engines
 from great_expectations.exceptions import (
     CheckpointNotAddedError,
     CheckpointNotFreshError,
@@ -58,12 +67,15 @@ from great_expectations.exceptions.exceptions import (
 )
 from great_expectations.exceptions.resource_freshness import ResourceFreshnessAggregateError
 from great_expectations.render.renderer.renderer import Renderer
+from great_expectations.validator.batch_registry import BatchRegistry
 
 if TYPE_CHECKING:
     from great_expectations.data_context.store.validation_definition_store import (
         ValidationDefinitionStore,
     )
 
+logger = logging.getLogger(__name__)
+
 
 @public_api
 class Checkpoint(BaseModel):
@@ -79,6 +91,13 @@ class Checkpoint(BaseModel):
         actions: List of actions to be taken after the validation definitions are run.
         result_format: The format in which to return the results of the validation definitions. Default is ResultFormat.SUMMARY.
         id: An optional unique identifier for the checkpoint.
+        max_concurrent_validation_definitions: The maximum number of validation definitions to run concurrently
+            (each in its own thread, with its own execution engines). Default is 1 (run one at a time).
+        max_concurrent_actions: The maximum number of actions (other than UpdateDataDocsActions, which always run
+            first) to run concurrently, each in its own thread. Default is 1 (run one at a time).
+        action_timeout: The number of seconds to wait for each action (other than UpdateDataDocsActions) to finish.
+            An action that does not finish in time is logged and left running in the background, and the
+            checkpoint run returns without its result. Default is None (wait for each action to finish).
 
     """  # noqa: E501
 
@@ -87,6 +106,9 @@ class Checkpoint(BaseModel):
     actions: List[CheckpointAction] = Field(default_factory=list)
     result_format: ResultFormatUnion = DEFAULT_RESULT_FORMAT
     id: Union[str, None] = None
+    max_concurrent_validation_definitions: int = Field(default=1, ge=1)
+    max_concurrent_actions: int = Field(default=1, ge=1)
+    action_timeout: Optional[float] = Field(default=None, gt=0)
 
     class Config:
         """
@@ -209,6 +231,20 @@ class Checkpoint(BaseModel):
         else:
             exclude["__all__"] = "validation_definitions"  # type: ignore[index] # FIXME
 
+        # Concurrency settings are only serialized if set (existing configurations are unchanged).
+        for field_name in (
+            "max_concurrent_validation_definitions",
+            "max_concurrent_actions",
+            "action_timeout",
+        ):
+            if getattr(self, field_name) != self.__fields__[field_name].default:
+                continue
+
+            if isinstance(exclude, set):
+                exclude.add(field_name)
+            else:
+                exclude[field_name] = True  # type: ignore[index] # FIXME
+
         return exclude
 
     def _serialize_validation_definitions(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -316,15 +352,26 @@ class Checkpoint(BaseModel):
         result_format: ResultFormatUnion,
         run_id: RunIdentifier,
     ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
-        run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
-        for validation_definition in self.validation_definitions:
-            validation_result = validation_definition.run(
-                checkpoint_id=self.id,
-                batch_parameters=batch_parameters,
-                expectation_parameters=expectation_parameters,
-                result_format=result_format,
-                run_id=run_id,
+        # Validation definitions of the same batch definition share the batch (loaded once per run).
+        batch_registry = BatchRegistry()
+        try:
+            validation_results: List[ExpectationSuiteValidationResult] = (
+                self._run_validation_definitions_with_batch_registry(
+                    batch_parameters=batch_parameters,
+                    expectation_parameters=expectation_parameters,
+                    result_format=result_format,
+                    run_id=run_id,
+                    batch_registry=batch_registry,
+                )
             )
+        finally:
+            batch_registry.release()
+
+        # Results are keyed in order of validation definitions, regardless of order of completion.
+        run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
+        for validation_definition, validation_result in zip(
+            self.validation_definitions, validation_results
+        ):
             key = self._build_result_key(
                 validation_definition=validation_definition,
                 run_id=run_id,
@@ -334,6 +381,130 @@ class Checkpoint(BaseModel):
 
         return run_results
 
+    def _run_validation_definitions_with_batch_registry(
+        self,
+        batch_parameters: Dict[str, Any] | None,
+        expectation_parameters: Dict[str, Any] | None,
+        result_format: ResultFormatUnion,
+        run_id: RunIdentifier,
+        batch_registry: BatchRegistry,
+    ) -> List[ExpectationSuiteValidationResult]:
+        # Validation definitions sharing a batch also share its execution engine; hence, they run
+        # one after another (in the same thread).
+        indices_by_batch: Dict[Hashable, List[int]] = {}
+        for index, validation_definition in enumerate(self.validation_definitions):
+            indices_by_batch.setdefault(
+                BatchRegistry.get_key(
+                    batch_definition=validation_definition.batch_definition,
+                    batch_parameters=batch_parameters,
+                ),
+                [],
+            ).append(index)
+
+        max_workers: int = min(self.max_concurrent_validation_definitions, len(indices_by_batch))
+        if max_workers <= 1:
+            return [
+                validation_definition.run(
+                    checkpoint_id=self.id,
+                    batch_parameters=batch_parameters,
+                    expectation_parameters=expectation_parameters,
+                    result_format=result_format,
+                    run_id=run_id,
+                    batch_registry=batch_registry,
+                )
+                for validation_definition in self.validation_definitions
+            ]
+
+        return self._run_validation_definitions_concurrently(
+            indices_by_batch=list(indices_by_batch.values()),
+            batch_parameters=batch_parameters,
+            expectation_parameters=expectation_parameters,
+            result_format=result_format,
+            run_id=run_id,
+            batch_registry=batch_registry,
+            max_workers=max_workers,
+        )
+
+    def _run_validation_definitions_concurrently(  # noqa: PLR0913
+        self,
+        indices_by_batch: List[List[int]],
+        batch_parameters: Dict[str, Any] | None,
+        expectation_parameters: Dict[str, Any] | None,
+        result_format: ResultFormatUnion,
+        run_id: RunIdentifier,
+        batch_registry: BatchRegistry,
+        max_workers: int,
+    ) -> List[ExpectationSuiteValidationResult]:
+        """Runs validation definitions of each batch in pool of "max_workers" threads, returning results in order of definitions.
+
+        Just as sequential run stops at first failure, validation definitions that have not started by the time one
+        fails are not run; those already running are waited for, and the error of the first failed validation
+        definition (in order of definitions) is raised.
+        """  # noqa: E501
+        outcomes: Dict[int, ExpectationSuiteValidationResult | Exception] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-validation-definition"
+        ) as executor:
+            futures: List[Future[Dict[int, ExpectationSuiteValidationResult | Exception]]] = [
+                executor.submit(
+                    self._run_isolated_validation_definitions,
+                    indices=indices,
+                    batch_parameters=batch_parameters,
+                    expectation_parameters=expectation_parameters,
+                    result_format=result_format,
+                    run_id=run_id,
+                    batch_registry=batch_registry,
+                )
+                for indices in indices_by_batch
+            ]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                outcomes.update(future.result())
+                if any(isinstance(outcome, Exception) for outcome in outcomes.values()):
+                    for pending_future in futures:
+                        pending_future.cancel()
+
+        outcome: ExpectationSuiteValidationResult | Exception
+        for _, outcome in sorted(outcomes.items()):
+            if isinstance(outcome, Exception):
+                raise outcome
+
+        return [
+            cast(ExpectationSuiteValidationResult, outcomes[index])
+            for index in range(len(self.validation_definitions))
+        ]
+
+    def _run_isolated_validation_definitions(  # noqa: PLR0913
+        self,
+        indices: List[int],
+        batch_parameters: Dict[str, Any] | None,
+        expectation_parameters: Dict[str, Any] | None,
+        result_format: ResultFormatUnion,
+        run_id: RunIdentifier,
+        batch_registry: BatchRegistry,
+    ) -> Dict[int, ExpectationSuiteValidationResult | Exception]:
+        outcomes: Dict[int, ExpectationSuiteValidationResult | Exception] = {}
+        # Execution engines (which keep state of active batch) are not shared with concurrent runs.
+        with isolated_execution_engines():
+            for index in indices:
+                try:
+                    outcomes[index] = self.validation_definitions[index].run(
+                        checkpoint_id=self.id,
+                        batch_parameters=batch_parameters,
+                        expectation_parameters=expectation_parameters,
+                        result_format=result_format,
+                        run_id=run_id,
+                        batch_registry=batch_registry,
+                    )
+                except Exception as e:
+                    # Remaining validation definitions are not run (as in sequential run).
+                    outcomes[index] = e
+                    break
+
+        return outcomes
+
     def _build_result_key(
         self,
         validation_definition: ValidationDefinition,
@@ -368,13 +539,108 @@ class Checkpoint(BaseModel):
     ) -> None:
         action_context = ActionContext()
         sorted_actions = self._sort_actions()
-        for action in sorted_actions:
+        # UpdateDataDocsActions (results of which other actions reference) run first, one at a time.
+        num_priority_actions: int = sum(
+            isinstance(action, UpdateDataDocsAction) for action in sorted_actions
+        )
+        max_workers: int = min(
+            self.max_concurrent_actions, len(sorted_actions) - num_priority_actions
+        )
+        if max_workers <= 1 and self.action_timeout is None:
+            num_priority_actions = len(sorted_actions)
+
+        for action in sorted_actions[:num_priority_actions]:
             action_result = action.run(
                 checkpoint_result=checkpoint_result,
                 action_context=action_context,
             )
             action_context.update(action=action, action_result=action_result)
 
+        if num_priority_actions < len(sorted_actions):
+            self._run_actions_concurrently(
+                actions=sorted_actions[num_priority_actions:],
+                checkpoint_result=checkpoint_result,
+                action_context=action_context,
+                max_workers=max_workers,
+            )
+
+    def _run_actions_concurrently(
+        self,
+        actions: List[CheckpointAction],
+        checkpoint_result: CheckpointResult,
+        action_context: ActionContext,
+        max_workers: int,
+    ) -> None:
+        """Runs up to "max_workers" actions at a time, updating "action_context" with their results in order of actions.
+
+        Every action sees "action_context" as it was before any of them ran.  An action, which does not finish within
+        "action_timeout" seconds of starting, is logged and left running in a background thread (threads cannot be
+        interrupted), and its place is taken by the next action.  Just as sequential run stops at first failure,
+        actions that have not started by the time one fails are not run, and the error of the first failed action (in
+        order of actions) is raised.
+        """  # noqa: E501
+        snapshot = ActionContext()
+        for action, action_result in action_context.data:
+            snapshot.update(action=action, action_result=action_result)
+
+        outcomes: Dict[int, dict | BaseException] = {}
+        waiting: Deque[int] = deque(range(len(actions)))
+        running: Dict[Future[dict], Tuple[int, float]] = {}
+        while waiting or running:
+            while waiting and len(running) < max_workers:
+                index: int = waiting.popleft()
+                running[
+                    _start_action(
+                        action=actions[index],
+                        checkpoint_result=checkpoint_result,
+                        action_context=snapshot,
+                    )
+                ] = (index, time.monotonic())
+
+            done, _ = wait(
+                running,
+                timeout=self._get_action_wait_timeout(started_at=[t for _, t in running.values()]),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                index, _ = running.pop(future)
+                outcomes[index] = future.exception() or future.result()
+                if isinstance(outcomes[index], BaseException):
+                    waiting.clear()
+
+            self._stop_waiting_for_timed_out_actions(actions=actions, running=running)
+
+        outcome: dict | BaseException
+        for index, outcome in sorted(outcomes.items()):
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+            action_context.update(action=actions[index], action_result=outcome)
+
+    def _stop_waiting_for_timed_out_actions(
+        self, actions: List[CheckpointAction], running: Dict[Future[dict], Tuple[int, float]]
+    ) -> None:
+        if self.action_timeout is None:
+            return
+
+        now: float = time.monotonic()
+        future: Future[dict]
+        index: int
+        started_at: float
+        for future, (index, started_at) in list(running.items()):
+            if now - started_at >= self.action_timeout:
+                del running[future]
+                logger.warning(
+                    f"""Action "{actions[index].name}" did not finish within {self.action_timeout} seconds; continuing without its result."""  # noqa: E501
+                )
+
+    def _get_action_wait_timeout(self, started_at: List[float]) -> Optional[float]:
+        """Returns number of seconds until the earliest of running actions times out (None, if actions never time out)."""  # noqa: E501
+        if self.action_timeout is None:
+            return None
+
+        return max(min(started_at) + self.action_timeout - time.monotonic(), 0)
+
     def _sort_actions(self) -> List[CheckpointAction]:
         """
         UpdateDataDocsActions are prioritized to run first, followed by all other actions.
@@ -436,6 +702,29 @@ class Checkpoint(BaseModel):
         store.add(key=key, value=self)
 
 
+def _start_action(
+    action: CheckpointAction,
+    checkpoint_result: CheckpointResult,
+    action_context: ActionContext,
+) -> Future[dict]:
+    """Runs action in its own (daemon) thread, so that action, which never finishes, does not hold up interpreter exit."""  # noqa: E501
+    future: Future[dict] = Future()
+    future.set_running_or_notify_cancel()
+
+    def run_action() -> None:
+        try:
+            future.set_result(
+                action.run(checkpoint_result=checkpoint_result, action_context=action_context)
+            )
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(
+        target=run_action, name=f"gx-checkpoint-action-{action.name}", daemon=True
+    ).start()
+    return future
+
+
 class CheckpointResult(BaseModel):
     run_id: RunIdentifier
     run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]
@@ -4,15 +4,65 @@ import json
 import logging
 import smtplib
 import ssl
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from great_expectations.compatibility import aws
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for connection to (and for response from) notification endpoint or SMTP server.
+DEFAULT_REQUEST_TIMEOUT = 30
+# Failed connections and rate-limited requests are retried with backoff.
+DEFAULT_REQUEST_RETRIES = 3
+DEFAULT_REQUEST_BACKOFF_FACTOR = 0.5
+# Only responses, which guarantee that request was not processed, are retried (gateway errors do
+# not; notification, retried after one, may be sent twice).
+RETRYABLE_STATUS_CODES = (429,)
+
+# Sessions are not guaranteed to be thread-safe; hence, every thread has a Session of its own.
+_notification_sessions = threading.local()
+
+
+class _NotificationSession(requests.Session):
+    """Session, whose requests time out after "DEFAULT_REQUEST_TIMEOUT" seconds, unless given own timeout."""  # noqa: E501
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[no-untyped-def,override] # same as base
+        kwargs.setdefault("timeout", DEFAULT_REQUEST_TIMEOUT)
+        return super().request(method, url, *args, **kwargs)
+
+
+def get_notification_session() -> requests.Session:
+    """Returns Session, shared by notification actions of current thread (so that connections to their endpoints are reused).
+
+    Requests of Session time out, and failed connections and rate-limited ("429") requests are retried with
+    exponential backoff.  Requests, which server may have processed (read errors and other error responses), are not
+    retried, so that notifications are not sent twice.
+    """  # noqa: E501
+    session: requests.Session | None = getattr(_notification_sessions, "session", None)
+    if session is None:
+        retry = Retry(
+            total=DEFAULT_REQUEST_RETRIES,
+            read=0,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            backoff_factor=DEFAULT_REQUEST_BACKOFF_FACTOR,
+            # Response to last attempt is handled by caller (as any other error response).
+            raise_on_status=False,
+        )
+        session = _NotificationSession()
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _notification_sessions.session = session
+
+    return session
+
 
 def send_slack_notification(
     payload: dict,
@@ -20,7 +70,7 @@ def send_slack_notification(
     slack_channel: str | None = None,
     slack_token: str | None = None,
 ) -> str | None:
-    session = requests.Session()
+    session = get_notification_session()
     url = slack_webhook
     headers = None
 
@@ -41,7 +91,9 @@ def send_slack_notification(
         response = session.post(url=url, headers=headers, json=payload)
         response.raise_for_status()
     except requests.ConnectionError:
-        logger.warning(f"Failed to connect to Slack webhook after {10} retries.")
+        logger.warning(
+            f"Failed to connect to Slack webhook after {DEFAULT_REQUEST_RETRIES} retries."
+        )
         return None
     except requests.HTTPError:
         logger.warning(
@@ -70,7 +122,7 @@ def send_opsgenie_alert(query: str, message: str, settings: dict) -> bool:
         "tags": settings["tags"],
     }
 
-    session = requests.Session()
+    session = get_notification_session()
 
     try:
         response = session.post(url, headers=headers, json=payload)
@@ -85,12 +137,15 @@ def send_opsgenie_alert(query: str, message: str, settings: dict) -> bool:
 
 
 def send_microsoft_teams_notifications(payload: dict, microsoft_teams_webhook: str) -> str | None:
-    session = requests.Session()
+    session = get_notification_session()
     try:
         response = session.post(url=microsoft_teams_webhook, json=payload)
         response.raise_for_status()
     except requests.ConnectionError:
-        logger.warning("Failed to connect to Microsoft Teams webhook after 10 retries.")
+        logger.warning(
+            "Failed to connect to Microsoft Teams webhook "
+            f"after {DEFAULT_REQUEST_RETRIES} retries."
+        )
         return None
     except requests.HTTPError as e:
         logger.warning(f"Request to Microsoft Teams API returned error {response.status_code}: {e}")  # type: ignore[possibly-undefined] # ok for httperror
@@ -100,11 +155,14 @@ def send_microsoft_teams_notifications(payload: dict, microsoft_teams_webhook: s
 
 
 def send_webhook_notifications(query, webhook, target_platform):
-    session = requests.Session()
+    session = get_notification_session()
     try:
         response = session.post(url=webhook, json=query)
     except requests.ConnectionError:
-        logger.warning(f"Failed to connect to {target_platform} webhook after 10 retries.")
+        logger.warning(
+            f"Failed to connect to {target_platform} webhook "
+            f"after {DEFAULT_REQUEST_RETRIES} retries."
+        )
     except Exception as e:
         logger.error(str(e))  # noqa: TRY400
     else:
@@ -140,14 +198,16 @@ def send_email(  # noqa: C901, PLR0913
             if use_tls:
                 logger.warning("Please choose between SSL or TLS, will default to SSL")
             context = ssl.create_default_context()
-            mailserver = smtplib.SMTP_SSL(smtp_address, smtp_port, context=context)
+            mailserver = smtplib.SMTP_SSL(
+                smtp_address, smtp_port, context=context, timeout=DEFAULT_REQUEST_TIMEOUT
+            )
         elif use_tls:
-            mailserver = smtplib.SMTP(smtp_address, smtp_port)
+            mailserver = smtplib.SMTP(smtp_address, smtp_port, timeout=DEFAULT_REQUEST_TIMEOUT)
             context = ssl.create_default_context()
             mailserver.starttls(context=context)
         else:
             logger.warning("Not using TLS or SSL to send an email is not secure")
-            mailserver = smtplib.SMTP(smtp_address, smtp_port)
+            mailserver = smtplib.SMTP(smtp_address, smtp_port, timeout=DEFAULT_REQUEST_TIMEOUT)
         if sender_login is not None and sender_password is not None:
             mailserver.login(sender_login, sender_password)
         elif not (sender_login is None and sender_password is None):
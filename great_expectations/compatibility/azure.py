@@ -11,6 +11,11 @@ try:
 except ImportError:
     storage = AZURE_BLOB_STORAGE_NOT_IMPORTED
 
+try:
+    from azure.core.exceptions import ResourceNotFoundError
+except ImportError:
+    ResourceNotFoundError = AZURE_BLOB_STORAGE_NOT_IMPORTED  # type: ignore[misc] # assigning to type
+
 try:
     from azure.identity import DefaultAzureCredential
 except ImportError:
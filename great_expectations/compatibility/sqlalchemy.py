@@ -224,6 +224,36 @@ try:
 except (ImportError, AttributeError):
     WithinGroup = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
 
+try:
+    from sqlalchemy.sql.expression import Over
+except (ImportError, AttributeError):
+    Over = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
+
+try:
+    from sqlalchemy.sql.expression import FunctionFilter
+except (ImportError, AttributeError):
+    FunctionFilter = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
+
+try:
+    from sqlalchemy.sql.expression import ScalarSelect
+except (ImportError, AttributeError):
+    ScalarSelect = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
+
+try:
+    from sqlalchemy.sql.expression import UnaryExpression
+except (ImportError, AttributeError):
+    UnaryExpression = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
+
+try:
+    from sqlalchemy.sql import operators
+except (ImportError, AttributeError):
+    operators = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
+
+try:
+    from sqlalchemy.sql import visitors
+except (ImportError, AttributeError):
+    visitors = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
+
 try:
     from sqlalchemy.sql.operators import custom_op
 except (ImportError, AttributeError):
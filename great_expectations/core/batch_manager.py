@@ -141,6 +141,16 @@ class BatchManager:
         self._batch_cache = OrderedDict()
         self._active_batch_id = None
 
+    def release_batch(self, batch_id: str) -> None:
+        """Removes Batch and its BatchData from cache (deactivating them, if active)"""
+        self._batch_cache.pop(batch_id, None)
+        self._batch_data_cache.pop(batch_id, None)
+        if self._active_batch_id == batch_id:
+            self._active_batch_id = None
+
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
     def load_batch_list(self, batch_list: Sequence[AnyBatch]) -> None:
         batch: AnyBatch
         for batch in batch_list:
@@ -37,6 +37,7 @@ from great_expectations.expectations.expectation_configuration import (
 from great_expectations.expectations.registry import (
     _registered_metrics,
     _registered_renderers,
+    register_core_metrics,
 )
 from great_expectations.render import (
     CollapseContent,
@@ -158,6 +159,8 @@ class ExpectationDoctor:
             )
         )
 
+        # Engines are introspected from the whole Metric registry (so core Metrics are imported).
+        register_core_metrics()
         introspected_execution_engines: ExpectationExecutionEngineDiagnostics = (
             self._get_execution_engine_diagnostics(
                 metric_diagnostics_list=metric_diagnostics_list,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Set, TypeVar, Union
+from typing import Any, Dict, Optional, Set, Tuple, TypeVar, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
@@ -11,13 +11,32 @@ T = TypeVar("T")
 
 
 class IDDict(dict):
+    """Dictionary, identified by digest of its JSON-serializable contents (e.g., metric Domain and value kwargs).
+
+    Default ID (i.e., computed using all keys, less "_id_ignore_keys") is computed once and reused, until dictionary is
+    modified using any of its (top-level) mutating methods.  Values are expected not to be modified in place, once ID
+    has been computed (as such modifications cannot be detected).
+    """  # noqa: E501
+
     _id_ignore_keys: Set[str] = set()
 
+    # Cached default ID (class-level default spares overriding "dict.__init__()" signatures).
+    _cached_id: Optional[Union[str, Tuple[()]]] = None
+
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            if self._cached_id is None:
+                self._set_cached_id(_intern_id(self._compute_id(self.keys(), self._id_ignore_keys)))
+
+            return self._cached_id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+        return self._compute_id(id_keys, id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys):
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -28,12 +47,71 @@ class IDDict(dict):
         _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
         return hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
 
+    def _set_cached_id(self, cached_id: Optional[Union[str, Tuple[()]]]) -> None:
+        # Bypasses "__setattr__" (which "DotDict" subclasses map to setting keys).
+        object.__setattr__(self, "_cached_id", cached_id)
+
     @override
     def __hash__(self) -> int:  # type: ignore[override]
         """Overrides the default implementation"""
         _result_hash: int = hash(self.to_id())
         return _result_hash
 
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._set_cached_id(None)
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._set_cached_id(None)
+        super().__delitem__(key)
+
+    @override
+    def __ior__(self, other):  # type: ignore[override,misc]
+        self._set_cached_id(None)
+        return super().__ior__(other)
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._set_cached_id(None)
+        super().update(*args, **kwargs)
+
+    @override
+    def setdefault(self, key, default=None):
+        self._set_cached_id(None)
+        return super().setdefault(key, default)
+
+    @override
+    def pop(self, key, *args):
+        self._set_cached_id(None)
+        return super().pop(key, *args)
+
+    @override
+    def popitem(self):
+        self._set_cached_id(None)
+        return super().popitem()
+
+    @override
+    def clear(self) -> None:
+        self._set_cached_id(None)
+        super().clear()
+
+
+# Interning table of IDs, so that equal IDs (e.g., of identical metric Domains across Expectations)
+# share one object, which makes their comparisons (e.g., in dictionary lookups) identity checks.
+_INTERNED_IDS: Dict[Any, Any] = {}
+_INTERNED_IDS_MAX_SIZE: int = 2**18
+
+
+def _intern_id(id_: T) -> T:
+    """Returns previously interned object equal to "id_" (or interns "id_" itself, if it is new)."""
+    # Bounding table size keeps long-running processes from accumulating IDs no longer in use.
+    if len(_INTERNED_IDS) >= _INTERNED_IDS_MAX_SIZE:
+        _INTERNED_IDS.clear()
+
+    return _INTERNED_IDS.setdefault(id_, id_)
+
 
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict],
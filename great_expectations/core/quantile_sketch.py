@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Value of "allow_relative_error", with which quantiles (and medians) are computed from sketch.
+QUANTILE_SKETCH_RELATIVE_ERROR = "sketch"
+# Default accuracy parameter: normalized rank error of about 1.3% (with 99% confidence).
+DEFAULT_KLL_SKETCH_K = 200
+MIN_KLL_SKETCH_K = 8
+# Capacity of compactor level shrinks by this factor with every level below the top one.
+_KLL_CAPACITY_DECAY = 2.0 / 3.0
+_KLL_MIN_LEVEL_CAPACITY = 2
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (Karnin, Lang, and Liberty: "Optimal Quantile Approximation in Streams").
+
+    Sketch is built in one pass over values (in batches of any size), takes space proportional to "k" (regardless of
+    number of values), and is mergeable: sketches of partitions of data (e.g., built in parallel, or at different times)
+    merge into sketch of all of their data, with same error guarantee.
+
+    Returned quantile of "q" is value, whose rank (in sorted order of all values) is within "normalized_rank_error * n"
+    of "q * n" (with 99% confidence).  As long as sketch holds all values (i.e., until "k" of them are seen), quantiles
+    are exact (and are those of "percentile_disc").
+
+    Args:
+        k: Accuracy parameter (size of largest compactor); error is roughly inversely proportional to it.
+        seed: Seed of random choices made by compactors (for reproducible sketches).
+    """  # noqa: E501
+
+    def __init__(self, k: int = DEFAULT_KLL_SKETCH_K, seed: Optional[int] = None) -> None:
+        if k < MIN_KLL_SKETCH_K:
+            raise ValueError(f"KLLSketch requires k of at least {MIN_KLL_SKETCH_K} (got {k}).")  # noqa: TRY003
+
+        self._k = k
+        self._n = 0
+        self._min_value = math.inf
+        self._max_value = -math.inf
+        # Values at level "h" of compactor hierarchy stand for 2**h values each.
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def n(self) -> int:
+        """Number of values seen by sketch."""
+        return self._n
+
+    @property
+    def is_empty(self) -> bool:
+        return self._n == 0
+
+    @property
+    def min_value(self) -> Optional[float]:
+        return None if self.is_empty else self._min_value
+
+    @property
+    def max_value(self) -> Optional[float]:
+        return None if self.is_empty else self._max_value
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether or not sketch still holds every value it has seen (i.e., whether or not its quantiles are exact)."""  # noqa: E501
+        return len(self._levels) == 1
+
+    @property
+    def normalized_rank_error(self) -> float:
+        """Bound on rank error of returned quantiles, as fraction of "n" (which holds with 99% confidence).
+
+        Empirical bound for single quantile, published by Apache DataSketches for its KLL sketch (same algorithm).
+        """  # noqa: E501
+        if self.is_exact:
+            return 0.0
+
+        return 2.296 / self._k**0.9723
+
+    def update(self, values: Iterable[float] | np.ndarray) -> None:
+        """Adds batch of numeric values (nulls and NaN values are skipped) to sketch."""
+        array: np.ndarray = np.asarray(values, dtype=np.float64).ravel()
+        array = array[~np.isnan(array)]
+        if array.size == 0:
+            return
+
+        self._n += int(array.size)
+        self._min_value = min(self._min_value, float(array.min()))
+        self._max_value = max(self._max_value, float(array.max()))
+        self._levels[0] = np.concatenate([self._levels[0], array])
+        self._compress()
+
+    def merge(self, other: KLLSketch) -> KLLSketch:
+        """Merges "other" sketch into this one (sketch of more accurate of two is coarsened to other one's "k").
+
+        Returns:
+            This sketch (so that sketches can be merged by "functools.reduce()").
+        """  # noqa: E501
+        if other.is_empty:
+            return self
+
+        self._k = min(self._k, other._k)
+        self._n += other._n
+        self._min_value = min(self._min_value, other._min_value)
+        self._max_value = max(self._max_value, other._max_value)
+        for level_index, level in enumerate(other._levels):
+            if level_index == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+
+            self._levels[level_index] = np.concatenate([self._levels[level_index], level])
+
+        self._compress()
+        return self
+
+    def get_quantiles(self, quantiles: Iterable[float]) -> List[Optional[float]]:
+        """Returns values of "quantiles" (each between 0 and 1), or None values, if sketch has not seen any value."""  # noqa: E501
+        quantile_list: List[float] = list(quantiles)
+        if any(not 0.0 <= quantile <= 1.0 for quantile in quantile_list):
+            raise ValueError(f"Quantiles must be between 0 and 1 (got {quantile_list}).")  # noqa: TRY003
+
+        if self.is_empty:
+            return [None] * len(quantile_list)
+
+        values: np.ndarray = np.concatenate(self._levels)
+        weights: np.ndarray = np.concatenate(
+            [np.full(len(level), 2**level_index) for level_index, level in enumerate(self._levels)]
+        )
+        order: np.ndarray = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+
+        result: List[Optional[float]] = []
+        for quantile in quantile_list:
+            if quantile == 0.0:
+                result.append(self._min_value)
+            elif quantile == 1.0:
+                result.append(self._max_value)
+            else:
+                # First value, at least "quantile" of all values (by weight) are not greater than.
+                index = int(np.searchsorted(cumulative_weights, quantile * cumulative_weights[-1]))
+                result.append(float(values[min(index, len(values) - 1)]))
+
+        return result
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Returns JSON-serializable representation of sketch (from which "from_json_dict()" restores it)."""  # noqa: E501
+        return {
+            "k": self._k,
+            "n": self._n,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "levels": [level.tolist() for level in self._levels],
+        }
+
+    @classmethod
+    def from_json_dict(cls, data: Dict[str, Any], seed: Optional[int] = None) -> KLLSketch:
+        sketch = cls(k=data["k"], seed=seed)
+        sketch._n = data["n"]
+        if sketch._n:
+            sketch._min_value = data["min_value"]
+            sketch._max_value = data["max_value"]
+
+        sketch._levels = [np.asarray(level, dtype=np.float64) for level in data["levels"]] or [
+            np.empty(0, dtype=np.float64)
+        ]
+        return sketch
+
+    def _get_level_capacity(self, level_index: int) -> int:
+        depth: int = len(self._levels) - level_index - 1
+        return max(_KLL_MIN_LEVEL_CAPACITY, int(math.ceil(self._k * _KLL_CAPACITY_DECAY**depth)))
+
+    def _compress(self) -> None:
+        level_index = 0
+        while level_index < len(self._levels):
+            if len(self._levels[level_index]) > self._get_level_capacity(level_index):
+                self._compact(level_index)
+
+            level_index += 1
+
+    def _compact(self, level_index: int) -> None:
+        """Promotes every other value (starting at random one of first two) of sorted level to next level."""  # noqa: E501
+        if level_index + 1 == len(self._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+
+        level: np.ndarray = np.sort(self._levels[level_index])
+        # Of odd number of values, one stays at its level.
+        kept: np.ndarray = level[: len(level) % 2]
+        level = level[len(level) % 2 :]
+        promoted: np.ndarray = level[int(self._rng.integers(2)) :: 2]
+        self._levels[level_index] = kept
+        self._levels[level_index + 1] = np.concatenate([self._levels[level_index + 1], promoted])
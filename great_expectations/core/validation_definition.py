@@ -51,6 +51,7 @@ if TYPE_CHECKING:
     )
     from great_expectations.datasource.fluent.batch_request import BatchParameters
     from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
+    from great_expectations.validator.batch_registry import BatchRegistry
 
 
 @public_api
@@ -237,7 +238,7 @@ class ValidationDefinition(BaseModel):
         return batch_definition
 
     @public_api
-    def run(
+    def run(  # noqa: PLR0913
         self,
         *,
         checkpoint_id: Optional[str] = None,
@@ -245,6 +246,7 @@ class ValidationDefinition(BaseModel):
         expectation_parameters: Optional[dict[str, Any]] = None,
         result_format: ResultFormatUnion = DEFAULT_RESULT_FORMAT,
         run_id: RunIdentifier | None = None,
+        batch_registry: BatchRegistry | None = None,
     ) -> ExpectationSuiteValidationResult:
         """
         Runs a validation using the configured data and suite.
@@ -268,6 +270,8 @@ class ValidationDefinition(BaseModel):
               definition. Otherwise, it should be None.
             run_id: An identifier for this run. Typically, this should be set to None and it will
               be generated by this call.
+            batch_registry: This is used by the checkpoints code to share loaded batches between
+              validation definitions of a run. Otherwise, it should be None.
         """
         diagnostics = self.is_fresh()
         if not diagnostics.success:
@@ -281,6 +285,7 @@ class ValidationDefinition(BaseModel):
             batch_definition=self.batch_definition,
             batch_parameters=batch_parameters,
             result_format=result_format,
+            batch_registry=batch_registry,
         )
         results = validator.validate_expectation_suite(self.suite, expectation_parameters)
         results.meta["validation_id"] = self.id
@@ -44,6 +44,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.types.base import DataContextConfig
     from great_expectations.datasource.datasource_dict import DatasourceDict
     from great_expectations.datasource.fluent.batch_request import BatchRequest
+    from great_expectations.datasource.fluent.interfaces import Batch
     from great_expectations.validator.validator import Validator
 
 ContextModes: TypeAlias = Literal["file", "cloud", "ephemeral"]
@@ -106,8 +107,12 @@ class ProjectManager:
     def get_datasources(self) -> DatasourceDict:
         return self._project.data_sources.all()
 
-    def get_validator(self, batch_request: BatchRequest) -> Validator:
-        return self._project.get_validator(batch_request=batch_request)
+    def get_validator(
+        self,
+        batch_request: BatchRequest | None = None,
+        batch_list: list[Batch] | None = None,
+    ) -> Validator:
+        return self._project.get_validator(batch_request=batch_request, batch_list=batch_list)
 
     def is_using_cloud(self) -> bool:
         from great_expectations.data_context import CloudDataContext
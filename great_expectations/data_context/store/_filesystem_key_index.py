@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+
+class FilesystemKeyIndex:
+    """SQLite-backed index of the files held by a TupleFilesystemStoreBackend.
+
+    Every indexed file is recorded under its filepath (relative to the base directory of the store)
+    together with the key that it represents (or None, if the file is not listed as a key of the
+    store -- e.g., because its name lacks the configured filepath suffix).  Since filepaths form the
+    primary key of the index, existence checks and prefix queries are served by an index lookup.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS gx_store_keys (filepath TEXT PRIMARY KEY, key TEXT)"
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def add(self, filepath: str, key: Optional[tuple]) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO gx_store_keys (filepath, key) VALUES (?, ?)",
+                (self._normalize(filepath), self._serialize_key(key)),
+            )
+
+    def remove(self, filepath: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM gx_store_keys WHERE filepath = ?", (self._normalize(filepath),)
+            )
+
+    def contains(self, filepath: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM gx_store_keys WHERE filepath = ?", (self._normalize(filepath),)
+            ).fetchone()
+        return row is not None
+
+    def list_keys(self, directory: str = "") -> List[tuple]:
+        """Returns keys of all indexed files located (at any depth) under "directory".
+
+        Args:
+            directory: directory, relative to the base directory of the store ("" for all keys)
+
+        Returns:
+            List of keys, ordered by their filepaths.
+        """
+        query: str = "SELECT key FROM gx_store_keys WHERE key IS NOT NULL"
+        parameters: Tuple[str, ...] = ()
+        if directory:
+            # Range scan over filepaths starting with "directory" followed by the path separator.
+            lower_bound: str = self._normalize(directory) + os.sep
+            upper_bound: str = lower_bound[:-1] + chr(ord(os.sep) + 1)
+            query += " AND filepath >= ? AND filepath < ?"
+            parameters = (lower_bound, upper_bound)
+
+        with self._lock:
+            rows = self._connection.execute(f"{query} ORDER BY filepath", parameters).fetchall()
+        return [tuple(json.loads(row[0])) for row in rows]
+
+    def replace_all(self, entries: Iterable[Tuple[str, Optional[tuple]]]) -> int:
+        """Atomically replaces the contents of the index with "entries".
+
+        Args:
+            entries: (filepath, key) pairs of all files held by the store
+
+        Returns:
+            Number of files in the index.
+        """
+        rows: List[Tuple[str, Optional[str]]] = [
+            (self._normalize(filepath), self._serialize_key(key)) for filepath, key in entries
+        ]
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.execute("DELETE FROM gx_store_keys")
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO gx_store_keys (filepath, key) VALUES (?, ?)", rows
+                )
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return len(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM gx_store_keys").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _normalize(filepath: str) -> str:
+        return os.path.normpath(filepath)
+
+    @staticmethod
+    def _serialize_key(key: Optional[tuple]) -> Optional[str]:
+        return None if key is None else json.dumps(list(key))
@@ -4,7 +4,7 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 import pyparsing as pp
 
@@ -124,6 +124,20 @@ class StoreBackend(metaclass=ABCMeta):
     def get_all(self):
         return self._get_all()
 
+    def get_many(self, keys: Sequence[tuple]) -> list[Any]:
+        """Retrieves values of multiple keys in bulk.
+
+        Args:
+            keys: keys whose values to retrieve
+
+        Returns:
+            Values, positionally aligned with "keys" (None for each key that does not exist).
+        """
+        for key in keys:
+            self._validate_key(key)
+
+        return self._get_many(keys)
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -219,6 +233,17 @@ class StoreBackend(metaclass=ABCMeta):
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
 
+    def _get_many(self, keys: Sequence[tuple]) -> list[Any]:
+        # Backends, for which every retrieval is a round trip to a remote service, override this.
+        values: list[Any] = []
+        for key in keys:
+            try:
+                values.append(self._get(key))
+            except InvalidKeyError:
+                values.append(None)
+
+        return values
+
     @abstractmethod
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
 import re
 import tempfile
 from mimetypes import guess_type
+from typing import Dict, Optional, Set, Type
 from zipfile import ZipFile, is_zipfile
 
 from great_expectations.core.data_context_key import DataContextKey
@@ -23,7 +25,12 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+    StoreBackendError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -103,6 +110,12 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
+    # Manifest of built site records fingerprint (content hash of source resource, and version of
+    # its renderer and templates) of every page, so that unchanged pages are not rendered again.
+    MANIFEST_KEY = ("gx_data_docs_manifest.json",)
+    MANIFEST_VERSION = 1
+    STATIC_ASSETS_MANIFEST_ENTRY = "static_assets"
+
     def __init__(  # noqa: C901 - 11
         self, store_backend=None, runtime_environment=None
     ) -> None:
@@ -241,6 +254,11 @@ class HtmlSiteStore:
         # can't necessarily set and list_keys like most other Stores.
         self.keys = set()  # type: ignore[var-annotated]
 
+        self._is_gx_cloud_store = is_gx_cloud_store
+        # Manifest is loaded from store backend when first needed (and saved by "save_manifest()").
+        self._manifest: Optional[Dict[str, str]] = None
+        self._manifest_changed = False
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.  # noqa: E501
         self._config = {
@@ -362,6 +380,76 @@ class HtmlSiteStore:
             for key in keys:
                 target_store_backend.remove_key(key)
 
+        # Manifest (if it was written) is removed along with static assets.
+        self._manifest = {}
+        self._manifest_changed = False
+
+    @property
+    def supports_manifest(self) -> bool:
+        """Whether or not pages of site are tracked by manifest (GX Cloud store backends do not keep manifest)."""  # noqa: E501
+        return not self._is_gx_cloud_store
+
+    @staticmethod
+    def get_manifest_entry_name(key: SiteSectionIdentifier) -> str:
+        """Returns name of manifest entry of page, identified by "key"."""
+        return "/".join(
+            [key.site_section_name, *(str(part) for part in key.resource_identifier.to_tuple())]
+        )
+
+    def get_manifest_entry(self, name: str) -> Optional[str]:
+        """Returns fingerprint, recorded in manifest under "name" (or None, if none is recorded)."""
+        return self._get_manifest().get(name)
+
+    def set_manifest_entry(self, name: str, fingerprint: str) -> None:
+        """Records "fingerprint" under "name" in manifest (written by "save_manifest()")."""
+        manifest: Dict[str, str] = self._get_manifest()
+        if manifest.get(name) != fingerprint:
+            manifest[name] = fingerprint
+            self._manifest_changed = True
+
+    def save_manifest(self) -> None:
+        """Writes manifest to store backend (if any of its entries were changed since it was loaded)."""  # noqa: E501
+        if not (self.supports_manifest and self._manifest_changed and self._manifest is not None):
+            return
+
+        self.store_backends["static_assets"].set(
+            self.MANIFEST_KEY,
+            json.dumps(
+                {"version": self.MANIFEST_VERSION, "entries": self._manifest},
+                indent=2,
+                sort_keys=True,
+            ),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+        self._manifest_changed = False
+
+    def list_page_key_tuples(self, resource_identifier_class: Type[DataContextKey]) -> Set[tuple]:
+        """Returns keys (as tuples) of pages (of "resource_identifier_class" resources) that exist in store backend."""  # noqa: E501
+        return set(self.store_backends[resource_identifier_class].list_keys())
+
+    def _get_manifest(self) -> Dict[str, str]:
+        if self._manifest is None:
+            self._manifest = self._load_manifest()
+
+        return self._manifest
+
+    def _load_manifest(self) -> Dict[str, str]:
+        if not self.supports_manifest:
+            return {}
+
+        try:
+            manifest: dict = json.loads(self.store_backends["static_assets"].get(self.MANIFEST_KEY))
+        except (InvalidKeyError, StoreBackendError, ValueError, TypeError) as e:
+            logger.debug(f"Data Docs manifest could not be loaded (building all pages): {e!r}")
+            return {}
+
+        # Manifest of other version (or malformed one) is discarded, so that all pages are built.
+        if not isinstance(manifest, dict) or manifest.get("version") != self.MANIFEST_VERSION:
+            return {}
+
+        return dict(manifest.get("entries") or {})
+
     def copy_static_assets(  # noqa: C901 - 11
         self, static_assets_source_dir: str | None = None
     ):
@@ -9,6 +9,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
 )
@@ -221,15 +222,31 @@ class Store:
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.get(key)
 
-        if self.cloud_mode:
-            self._validate_key(key)
-            value = self._store_backend.get(self.key_to_tuple(key))
-            # TODO [Robby] MER-285: Handle non-200 http errors
-            if value:
-                value = self.gx_cloud_response_json_to_object_dict(response_json=value)
-        else:
+        self._validate_key(key)
+        value = self._store_backend.get(self.key_to_tuple(key))
+        return self._deserialize_retrieved_value(value=value)
+
+    def get_many(
+        self, keys: Sequence[DataContextKey | GXCloudIdentifier | ConfigurationIdentifier]
+    ) -> list[Optional[Any]]:
+        """Retrieves values of multiple keys in bulk (concurrently, if supported by store backend).
+
+        Args:
+            keys: keys whose values to retrieve
+
+        Returns:
+            Deserialized values, positionally aligned with "keys" (None for each key that does not exist).
+        """  # noqa: E501
+        for key in keys:
             self._validate_key(key)
-            value = self._store_backend.get(self.key_to_tuple(key))
+
+        values: list[Any] = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [self._deserialize_retrieved_value(value=value) for value in values]
+
+    def _deserialize_retrieved_value(self, value: Any) -> Optional[Any]:
+        # TODO [Robby] MER-285: Handle non-200 http errors
+        if value and self.cloud_mode:
+            value = self.gx_cloud_response_json_to_object_dict(response_json=value)
 
         if value:
             return self.deserialize(value)
@@ -9,10 +9,12 @@ import random
 import re
 import shutil
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.data_context.store._filesystem_key_index import FilesystemKeyIndex
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
@@ -29,6 +31,9 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     three components.
     """  # noqa: E501
 
+    # Maximum number of objects, which backends of remote object stores download concurrently.
+    MAX_CONCURRENT_GETS = 16
+
     def __init__(  # noqa: PLR0913
         self,
         filepath_template=None,
@@ -76,6 +81,34 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             self.verify_that_key_to_filepath_operation_is_reversible()
             self._fixed_length_key = True
 
+    def _get_many_concurrently(
+        self, keys: Sequence[tuple], get_fn: Callable[[tuple], Any]
+    ) -> list[Any]:
+        """Retrieves values of keys using a bounded thread pool, preserving order of keys.
+
+        Args:
+            keys: keys whose values to retrieve
+            get_fn: retrieves value of single key (raising InvalidKeyError if key does not exist)
+
+        Returns:
+            Values, positionally aligned with "keys" (None for each key that does not exist).
+        """
+        max_workers: int = min(self.MAX_CONCURRENT_GETS, len(keys))
+        if max_workers <= 1:
+            return [self._get_or_none(key=key, get_fn=get_fn) for key in keys]
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-store-get"
+        ) as executor:
+            return list(executor.map(lambda key: self._get_or_none(key=key, get_fn=get_fn), keys))
+
+    @staticmethod
+    def _get_or_none(key: tuple, get_fn: Callable[[tuple], Any]) -> Any:
+        try:
+            return get_fn(key)
+        except InvalidKeyError:
+            return None
+
     @staticmethod
     def _is_missing_prefix_or_suffix(filepath_prefix: str, filepath_suffix: str, key: str) -> bool:
         missing_prefix = bool(filepath_prefix and not key.startswith(filepath_prefix))
@@ -220,8 +253,17 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    If use_key_index is True, the files held by the store are additionally recorded in a SQLite
+    index (KEY_INDEX_FILENAME, placed in the base directory), which is kept up to date on every
+    write, move, and removal made through the store backend.  Listing keys (optionally, by prefix)
+    and checking for the existence of a key are then answered by the index, rather than by walking
+    the directory tree.  Should files be changed by other means, rebuild_key_index() resynchronizes
+    the index with the contents of the base directory.
     """  # noqa: E501
 
+    KEY_INDEX_FILENAME = ".ge_store_key_index.sqlite"
+
     def __init__(  # noqa: PLR0913
         self,
         base_directory,
@@ -236,6 +278,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        use_key_index: bool = False,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -249,6 +292,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             base_public_path=base_public_path,
             store_name=store_name,
         )
+        self._key_index: Optional[FilesystemKeyIndex] = None
         if os.path.isabs(base_directory):  # noqa: PTH117
             self.full_base_directory = base_directory
         else:  # noqa: PLR5501
@@ -269,6 +313,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             str(os.path.dirname(self.full_base_directory)),  # noqa: PTH120
             exist_ok=True,
         )
+        if use_key_index:
+            self._open_key_index()
+
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -288,11 +335,73 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "use_key_index": use_key_index,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    @property
+    def key_index_path(self) -> str:
+        return os.path.join(self.full_base_directory, self.KEY_INDEX_FILENAME)  # noqa: PTH118
+
+    def _open_key_index(self) -> None:
+        os.makedirs(self.full_base_directory, exist_ok=True)  # noqa: PTH103
+        is_new_key_index: bool = not os.path.isfile(self.key_index_path)  # noqa: PTH113
+        self._key_index = FilesystemKeyIndex(path=self.key_index_path)
+        if is_new_key_index:
+            self.rebuild_key_index()
+
+    def rebuild_key_index(self) -> int:
+        """Resynchronizes the key index with the files currently present in the base directory.
+
+        Returns:
+            Number of files recorded in the rebuilt index.
+        """
+        if self._key_index is None:
+            raise StoreBackendError(  # noqa: TRY003
+                f"{self.__class__.__name__} was not configured with use_key_index enabled."
+            )
+
+        return self._key_index.replace_all(
+            (filepath, self._get_listed_key_for_filepath(filepath))
+            for filepath in self._walk_filepaths()
+        )
+
+    def _walk_filepaths(self, prefix: Tuple = ()) -> Iterator[str]:
+        """Yields paths (relative to the base directory) of files stored under the given prefix."""
+        for root, dirs, files in os.walk(
+            os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118
+        ):
+            for file_ in files:
+                full_path, file_name = os.path.split(
+                    os.path.join(root, file_)  # noqa: PTH118
+                )
+                if file_name.startswith(self.KEY_INDEX_FILENAME):
+                    continue
+
+                relative_path = os.path.relpath(
+                    full_path,
+                    self.full_base_directory,
+                )
+                if relative_path == ".":
+                    yield file_name
+                else:
+                    yield os.path.join(relative_path, file_name)  # noqa: PTH118
+
+    def _get_listed_key_for_filepath(self, filepath: str) -> Optional[tuple]:
+        """Returns the key of file at "filepath" if list_keys() reports it, and None otherwise."""
+        if self._is_missing_prefix_or_suffix(
+            filepath_prefix=self.filepath_prefix,
+            filepath_suffix=self.filepath_suffix,
+            key=filepath,
+        ):
+            return None
+        key = self._convert_filepath_to_key(filepath)
+        if key and not self.is_ignored_key(key):
+            return key
+        return None
+
     def _get(self, key):  # type: ignore[explicit-override] # FIXME
         filepath: str = os.path.join(  # noqa: PTH118
             self.full_base_directory, self._convert_key_to_filepath(key)
@@ -326,53 +435,49 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
+
+        if self._key_index is not None:
+            relative_filepath: str = self._convert_key_to_filepath(key)
+            self._key_index.add(
+                filepath=relative_filepath,
+                key=self._get_listed_key_for_filepath(relative_filepath),
+            )
+
         return filepath
 
     def _move(self, source_key, dest_key, **kwargs):  # type: ignore[explicit-override] # FIXME
-        source_path = os.path.join(  # noqa: PTH118
-            self.full_base_directory, self._convert_key_to_filepath(source_key)
-        )
+        source_filepath: str = self._convert_key_to_filepath(source_key)
+        source_path = os.path.join(self.full_base_directory, source_filepath)  # noqa: PTH118
 
-        dest_path = os.path.join(  # noqa: PTH118
-            self.full_base_directory, self._convert_key_to_filepath(dest_key)
-        )
+        dest_filepath: str = self._convert_key_to_filepath(dest_key)
+        dest_path = os.path.join(self.full_base_directory, dest_filepath)  # noqa: PTH118
         dest_dir, _dest_filename = os.path.split(dest_path)
 
         if os.path.exists(source_path):  # noqa: PTH110
             os.makedirs(dest_dir, exist_ok=True)  # noqa: PTH103
             shutil.move(source_path, dest_path)
+            if self._key_index is not None:
+                self._key_index.remove(filepath=source_filepath)
+                self._key_index.add(
+                    filepath=dest_filepath,
+                    key=self._get_listed_key_for_filepath(dest_filepath),
+                )
             return dest_key
 
         return False
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        key_list = []
-        for root, dirs, files in os.walk(
-            os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118
-        ):
-            for file_ in files:
-                full_path, file_name = os.path.split(
-                    os.path.join(root, file_)  # noqa: PTH118
-                )
-                relative_path = os.path.relpath(
-                    full_path,
-                    self.full_base_directory,
-                )
-                if relative_path == ".":
-                    filepath = file_name
-                else:
-                    filepath = os.path.join(relative_path, file_name)  # noqa: PTH118
+        if self._key_index is not None:
+            return self._key_index.list_keys(
+                directory=os.path.join(*prefix) if prefix else ""  # noqa: PTH118
+            )
 
-                if self._is_missing_prefix_or_suffix(
-                    filepath_prefix=self.filepath_prefix,
-                    filepath_suffix=self.filepath_suffix,
-                    key=filepath,
-                ):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
+        key_list = []
+        for filepath in self._walk_filepaths(prefix=prefix):
+            key = self._get_listed_key_for_filepath(filepath)
+            if key:
+                key_list.append(key)
 
         return key_list
 
@@ -396,13 +501,14 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
-        filepath = os.path.join(  # noqa: PTH118
-            self.full_base_directory, self._convert_key_to_filepath(key)
-        )
+        relative_filepath: str = self._convert_key_to_filepath(key)
+        filepath = os.path.join(self.full_base_directory, relative_filepath)  # noqa: PTH118
 
         if os.path.exists(filepath):  # noqa: PTH110
             d_path = os.path.dirname(filepath)  # noqa: PTH120
             os.remove(filepath)  # noqa: PTH107
+            if self._key_index is not None:
+                self._key_index.remove(filepath=relative_filepath)
             self.rrmdir(self.full_base_directory, d_path)
             return True
         return False
@@ -429,6 +535,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         return public_url
 
     def _has_key(self, key):  # type: ignore[explicit-override] # FIXME
+        if self._key_index is not None:
+            return self._key_index.contains(filepath=self._convert_key_to_filepath(key))
+
         return os.path.isfile(  # noqa: PTH113
             os.path.join(  # noqa: PTH118
                 self.full_base_directory, self._convert_key_to_filepath(key)
@@ -546,15 +655,22 @@ class TupleS3StoreBackend(TupleStoreBackend):
     @override
     def _get_all(self) -> list[Any]:
         """Get all objects from the store.
-        NOTE: This is non-performant because we download each object separately.
+        NOTE: S3 has no bulk download; objects are downloaded concurrently (see "_get_many").
         See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/bucket/objects.html#objects
         for the docs.
         """
-        client = self._create_client()
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
-        s3_object_keys = [self._build_s3_object_key(key) for key in keys]
-        return [self._get_by_s3_object_key(client, key) for key in s3_object_keys]
+        return [value for value in self._get_many(keys) if value is not None]
+
+    @override
+    def _get_many(self, keys: Sequence[tuple]) -> list[Any]:
+        # boto3 clients are thread-safe; one client (and its connection pool) serves all downloads.
+        client = self._create_client()
+        return self._get_many_concurrently(
+            keys=keys,
+            get_fn=lambda key: self._get_by_s3_object_key(client, self._build_s3_object_key(key)),
+        )
 
     def _get_by_s3_object_key(self, s3_client, s3_object_key):
         try:
@@ -842,7 +958,24 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
 
-        return [self._get_by_gcs_object_key(bucket, key) for key in keys]
+        return [
+            value
+            for value in self._get_many_concurrently(
+                keys=keys, get_fn=lambda key: self._get_by_gcs_object_key(bucket, key)
+            )
+            if value is not None
+        ]
+
+    @override
+    def _get_many(self, keys: Sequence[tuple]) -> list[Any]:
+        from great_expectations.compatibility import google
+
+        gcs = google.storage.Client(project=self.project)
+        bucket = gcs.bucket(self.bucket)
+
+        return self._get_many_concurrently(
+            keys=keys, get_fn=lambda key: self._get_by_gcs_object_key(bucket, key)
+        )
 
     def _get_by_gcs_object_key(self, bucket, key):
         gcs_object_key = self._build_gcs_object_key(key)
@@ -1071,8 +1204,23 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
     @override
     def _get_all(self) -> list[Any]:
-        keys = self.list_keys()
-        return [self._get(key) for key in keys]
+        keys = [key for key in self.list_keys() if key != StoreBackend.STORE_BACKEND_ID_KEY]
+        return [value for value in self._get_many(keys) if value is not None]
+
+    @override
+    def _get_many(self, keys: Sequence[tuple]) -> list[Any]:
+        # The (cached) container client is thread-safe and is shared by all downloads.
+        return self._get_many_concurrently(keys=keys, get_fn=self._get_existing)
+
+    def _get_existing(self, key):
+        from great_expectations.compatibility import azure
+
+        try:
+            return self._get(key)
+        except azure.ResourceNotFoundError as e:
+            raise InvalidKeyError(  # noqa: TRY003
+                f"Unable to retrieve object from TupleAzureBlobStoreBackend with the following Key: {key!s}"  # noqa: E501
+            ) from e
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):  # type: ignore[explicit-override] # FIXME
         from great_expectations.compatibility.azure import ContentSettings
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Dict, Optional, Type
+import json
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Sequence, Type
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
@@ -17,15 +19,19 @@ from great_expectations.data_context.types.resource_identifiers import (
     GXCloudIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import instantiate_class_from_config, load_class
+from great_expectations.exceptions import StoreBackendError
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
 )
 
 if TYPE_CHECKING:
+    from great_expectations.data_context.store._store_backend import StoreBackend
     from great_expectations.data_context.types.refs import GXCloudResourceRef
 
+logger = logging.getLogger(__name__)
+
 
 class ValidationResultsStore(Store):
     """
@@ -94,10 +100,19 @@ class ValidationResultsStore(Store):
             bug_risk: Moderate
 
     --ge-feature-maturity-info--
+
+    Stores with TupleStoreBackend (filesystem, S3, GCS, or Azure) also keep compact summary (success, statistics, and
+    Batch metadata) of every Validation Result, next to it (with the same key, and SUMMARY_FILEPATH_SUFFIX appended to
+    its suffix), so that Data Docs index page is built without retrieving results.  Summary is rewritten whenever its
+    result is set, and is removed along with it.
     """  # noqa: E501
 
     _key_class: ClassVar[Type] = ValidationResultIdentifier
 
+    SUMMARY_FILEPATH_SUFFIX: ClassVar[str] = ".summary"
+    # Keys of Validation Result "meta", which are kept in its summary.
+    SUMMARY_META_KEYS: ClassVar[tuple] = ("active_batch_definition", "batch_kwargs", "batch_spec")
+
     def __init__(self, store_backend=None, runtime_environment=None, store_name=None) -> None:
         self._expectationSuiteValidationResultSchema = ExpectationSuiteValidationResultSchema()
 
@@ -132,6 +147,9 @@ class ValidationResultsStore(Store):
             runtime_environment=runtime_environment,
             store_name=store_name,
         )
+        self._summary_store_backend: Optional[StoreBackend] = self._build_summary_store_backend(
+            store_backend=store_backend, runtime_environment=runtime_environment
+        )
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.  # noqa: E501
@@ -144,6 +162,37 @@ class ValidationResultsStore(Store):
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    def _build_summary_store_backend(
+        self, store_backend: Optional[dict], runtime_environment: Optional[dict]
+    ) -> Optional[StoreBackend]:
+        if (
+            self.cloud_mode
+            or not isinstance(self._store_backend, TupleStoreBackend)
+            or self._store_backend.filepath_template is not None
+            or not self._store_backend.filepath_suffix
+        ):
+            return None
+
+        # Summaries live next to results, yet (with their own suffix) are not listed among them.
+        summary_store_backend_config: dict = {
+            key: value for key, value in (store_backend or {}).items() if key != "use_key_index"
+        }
+        summary_store_backend_config.update(
+            {
+                "filepath_suffix": self._store_backend.filepath_suffix
+                + self.SUMMARY_FILEPATH_SUFFIX,
+                "suppress_store_backend_id": True,
+            }
+        )
+        return instantiate_class_from_config(
+            config=summary_store_backend_config,
+            runtime_environment=runtime_environment or {},
+            config_defaults={
+                "module_name": "great_expectations.data_context.store",
+                "store_name": self._store_name,
+            },
+        )
+
     @override
     @staticmethod
     def gx_cloud_response_json_to_object_dict(response_json: Dict) -> Dict:
@@ -202,6 +251,104 @@ class ValidationResultsStore(Store):
             expectation_suite_id=expectation_suite_id,
         )
 
+    @override
+    def set(self, key, value, **kwargs):
+        result = super().set(key, value, **kwargs)
+        # Summary is (re-)written after result, so that every summary refers to stored result.
+        if (
+            self._summary_store_backend is not None
+            and isinstance(key, ValidationResultIdentifier)
+            and isinstance(value, ExpectationSuiteValidationResult)
+        ):
+            self._set_summary(key=key, summary=self.get_summary(value))
+
+        return result
+
+    @override
+    def remove_key(self, key):
+        result = super().remove_key(key)
+        if self._summary_store_backend is not None and isinstance(
+            key, (ValidationResultIdentifier, tuple)
+        ):
+            self._remove_summary(key=key)
+
+        return result
+
+    @classmethod
+    def get_summary(cls, suite_validation_result: ExpectationSuiteValidationResult) -> dict:
+        """Returns compact summary of Validation Result: its success, statistics, and metadata of its Batch.
+
+        Args:
+            suite_validation_result: Validation Result to summarize
+
+        Returns:
+            JSON-serializable dictionary with "success", "statistics", and "meta" (with SUMMARY_META_KEYS only) keys.
+        """  # noqa: E501
+        meta: dict = suite_validation_result.meta or {}
+        # Serialized as result itself is, only without its (potentially large) Expectation results.
+        summary_json: dict = ExpectationSuiteValidationResult(
+            success=suite_validation_result.success,
+            results=[],
+            suite_name=suite_validation_result.suite_name,
+            statistics=suite_validation_result.statistics,
+            meta={key: meta[key] for key in cls.SUMMARY_META_KEYS if key in meta},
+        ).to_json_dict()
+        return {key: summary_json[key] for key in ("success", "statistics", "meta")}
+
+    def get_summaries(self, keys: Sequence[ValidationResultIdentifier]) -> List[Optional[dict]]:
+        """Retrieves summaries of Validation Results in bulk (without retrieving results themselves).
+
+        Args:
+            keys: keys of Validation Results, whose summaries to retrieve
+
+        Returns:
+            Summaries (as returned by get_summary()), positionally aligned with "keys" (None for each result without
+            stored summary, such as one stored before summaries were introduced, or directly through store backend).
+        """  # noqa: E501
+        if self._summary_store_backend is None or not keys:
+            return [None] * len(keys)
+
+        try:
+            values: List[Any] = self._summary_store_backend.get_many(
+                [self.key_to_tuple(key) for key in keys]
+            )
+        except StoreBackendError as e:
+            logger.warning(f"Unable to retrieve Validation Result summaries: {e!r}")
+            return [None] * len(keys)
+
+        return [_load_summary(value) for value in values]
+
+    def _set_summary(self, key: ValidationResultIdentifier, summary: dict) -> None:
+        assert self._summary_store_backend is not None
+        try:
+            self._summary_store_backend.set(
+                self.key_to_tuple(key), json.dumps(summary, indent=2, sort_keys=True)
+            )
+        except StoreBackendError as e:
+            # Missing summary only makes Data Docs fall back to retrieving result itself.
+            logger.warning(f"Unable to store summary of Validation Result {key.to_tuple()}: {e!r}")
+
+    def _remove_summary(self, key: ValidationResultIdentifier | tuple) -> None:
+        assert self._summary_store_backend is not None
+        key_tuple: tuple = key if isinstance(key, tuple) else self.key_to_tuple(key)
+        try:
+            if self._summary_store_backend.has_key(key_tuple):
+                self._summary_store_backend.remove_key(key_tuple)
+        except StoreBackendError as e:
+            logger.warning(f"Unable to remove summary of Validation Result {key_tuple}: {e!r}")
+
     @staticmethod
     def parse_result_url_from_gx_cloud_ref(ref: GXCloudResourceRef) -> str | None:
         return ref.response["data"]["result_url"]
+
+
+def _load_summary(value: Any) -> Optional[dict]:
+    if not value:
+        return None
+
+    try:
+        summary = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+
+    return summary if isinstance(summary, dict) else None
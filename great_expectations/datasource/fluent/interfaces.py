@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import copy
 import dataclasses
 import functools
 import logging
+import threading
 import uuid
 import warnings
 from abc import ABC, abstractmethod
@@ -16,6 +18,7 @@ from typing import (
     ClassVar,
     Dict,
     Final,
+    Generator,
     Generic,
     List,
     Mapping,
@@ -25,6 +28,7 @@ from typing import (
     Protocol,
     Sequence,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -604,6 +608,40 @@ def _sort_batch_identifiers_with_none_metadata_values(
 _DataAssetT = TypeVar("_DataAssetT", bound=DataAsset)
 
 
+class _ExecutionEngineScope(threading.local):
+    """ExecutionEngines of Datasources, private to current thread (while "isolated_execution_engines()" is active)."""  # noqa: E501
+
+    def __init__(self) -> None:
+        self.execution_engines: Optional[Dict[int, Tuple[Datasource, Any]]] = None
+
+
+_execution_engine_scope = _ExecutionEngineScope()
+
+
+@contextlib.contextmanager
+def isolated_execution_engines() -> Generator[None, None, None]:
+    """Gives every Datasource, whose ExecutionEngine is requested in current thread within the block, its own ExecutionEngine.
+
+    Datasource caches one ExecutionEngine, and ExecutionEngine keeps state of loaded (and active) Batches; hence,
+    validations running concurrently (in separate threads) must not share it.  ExecutionEngines created within the block
+    are closed (if they support it) when the block exits.  Nested blocks reuse ExecutionEngines of outermost block.
+    """  # noqa: E501
+    if _execution_engine_scope.execution_engines is not None:
+        yield
+        return
+
+    execution_engines: Dict[int, Tuple[Datasource, Any]] = {}
+    _execution_engine_scope.execution_engines = execution_engines
+    try:
+        yield
+    finally:
+        _execution_engine_scope.execution_engines = None
+        for _, execution_engine in execution_engines.values():
+            close: Optional[Callable[[], None]] = getattr(execution_engine, "close", None)
+            if close is not None:
+                close()
+
+
 class Datasource(
     FluentBaseModel,
     Generic[_DataAssetT, _ExecutionEngineT],
@@ -736,7 +774,38 @@ class Datasource(
         updated_datasource = self.data_context.update_datasource(loaded_datasource)
         assert isinstance(updated_datasource, Datasource)
 
+    def _get_isolated_execution_engine(self) -> Optional[_ExecutionEngineT]:
+        """Returns ExecutionEngine private to current thread, if "isolated_execution_engines()" is active.
+
+        Isolated ExecutionEngine is created by copy of this Datasource (with empty ExecutionEngine cache), so that it is
+        configured exactly as cached ExecutionEngine of this Datasource would be.
+        """  # noqa: E501
+        execution_engines: Optional[Dict[int, Tuple[Datasource, Any]]] = (
+            _execution_engine_scope.execution_engines
+        )
+        if execution_engines is None:
+            return None
+
+        entry: Optional[Tuple[Datasource, Any]] = execution_engines.get(id(self))
+        if entry is None:
+            datasource_copy: Datasource = self.copy()
+            datasource_copy._execution_engine = None
+            # Scope is suspended, so that copy creates its ExecutionEngine the usual way.
+            _execution_engine_scope.execution_engines = None
+            try:
+                entry = (self, datasource_copy.get_execution_engine())
+            finally:
+                _execution_engine_scope.execution_engines = execution_engines
+
+            execution_engines[id(self)] = entry
+
+        return entry[1]
+
     def get_execution_engine(self) -> _ExecutionEngineT:
+        isolated_execution_engine = self._get_isolated_execution_engine()
+        if isolated_execution_engine is not None:
+            return isolated_execution_engine
+
         current_execution_engine_kwargs = self.dict(
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
@@ -722,6 +722,10 @@ class SnowflakeDatasource(SQLDatasource):
 
         For Snowflake specifically we may represent the connection_string as a dict, which is not supported by SQLAlchemy.
         """  # noqa: E501
+        isolated_execution_engine = self._get_isolated_execution_engine()
+        if isolated_execution_engine is not None:
+            return isolated_execution_engine
+
         gx_execution_engine_type: Type[SqlAlchemyExecutionEngine] = self.execution_engine_type
 
         connection_string: str | None = (
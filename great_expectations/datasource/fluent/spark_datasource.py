@@ -131,6 +131,10 @@ class _SparkDatasource(Datasource):
     def get_execution_engine(self) -> SparkDFExecutionEngine:
         # Method override is required because PrivateAttr _spark won't be passed into Execution Engine  # noqa: E501
         # unless it is passed explicitly.
+        isolated_execution_engine = self._get_isolated_execution_engine()
+        if isolated_execution_engine is not None:
+            return isolated_execution_engine
+
         current_execution_engine_kwargs = self.dict(
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
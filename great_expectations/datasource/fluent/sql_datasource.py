@@ -1092,6 +1092,10 @@ class SQLDatasource(Datasource):
         # Overrides get_execution_engine in Datasource
         # because we need to pass the kwargs as keyvalue args to the execution engine
         # when then passes them to the engine.
+        isolated_execution_engine = self._get_isolated_execution_engine()
+        if isolated_execution_engine is not None:
+            return isolated_execution_engine
+
         current_execution_engine_kwargs = self.dict(
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import (
     TYPE_CHECKING,
@@ -20,7 +21,15 @@ from typing import (
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
+from great_expectations.execution_engine.metric_cache import (
+    BoundedMetricValueCache,
+    MetricValueCacheStats,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -46,11 +55,22 @@ if TYPE_CHECKING:
         BatchMarkers,
         BatchSpec,
     )
+    from great_expectations.execution_engine.metric_cache import (
+        MetricCache,
+        MetricCacheKey,
+    )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
 
+# Domain kwargs, which only filter records of otherwise identical Domain (of the same base data).
+ROW_FILTER_DOMAIN_KWARGS_KEYS: Tuple[str, ...] = (
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+)
+
 
 class NoOpDict:
     def __getitem__(self, item):
@@ -63,6 +83,10 @@ class NoOpDict:
     def update(self, value):
         return None
 
+    # noinspection PyMethodMayBeStatic
+    def clear(self):
+        return None
+
 
 @dataclass(frozen=True)
 class MetricComputationConfiguration(DictDot):
@@ -134,17 +158,24 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        metric_cache_max_bytes: if given (and caching is enabled), the local in-memory cache of resolved metrics is \
+            bounded by this (estimated) number of bytes, evicting least recently used metrics no longer needed by the \
+            validation graph being resolved; otherwise, the local cache is unbounded.
+        metric_cache: MetricCache object (optional), which stores resolved metrics keyed on fingerprint of Batch data, \
+            so that they can be reused by other ExecutionEngine objects and (for persistent backends) subsequent runs.
     """  # noqa: E501
 
     recognized_batch_spec_defaults: Set[str] = set()
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         name: Optional[str] = None,
         caching: bool = True,
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        metric_cache_max_bytes: Optional[int] = None,
+        metric_cache: Optional[MetricCache] = None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -152,11 +183,15 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store  # noqa: E501
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+        if not self._caching:
+            self._metric_cache: Union[Dict, BoundedMetricValueCache, NoOpDict] = NoOpDict()
+        elif metric_cache_max_bytes is None:
+            self._metric_cache = {}
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = BoundedMetricValueCache(max_bytes=metric_cache_max_bytes)
+
+        self._fingerprinted_metric_cache = metric_cache
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -187,6 +222,7 @@ class ExecutionEngine(ABC):
         self._config = {
             "name": name,
             "caching": caching,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
@@ -209,6 +245,39 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def max_concurrent_metric_computations(self) -> int:
+        """Maximum number of directly-computable metric functions that may be executed concurrently.
+
+        Engines whose metric functions are thread-safe and spend most of their time waiting on an external system
+        (e.g., issuing one query per metric) can override this in order to overlap those computations.  The default of
+        1 executes metric functions serially, in the calling thread.
+        """  # noqa: E501
+        return 1
+
+    @property
+    def metric_cache_stats(self) -> Optional[MetricValueCacheStats]:
+        """Hit, miss, and eviction counters, as well as occupancy, of bounded in-memory metric cache (if configured)."""  # noqa: E501
+        if isinstance(self._metric_cache, BoundedMetricValueCache):
+            return self._metric_cache.stats
+
+        return None
+
+    @property
+    def has_bounded_metric_cache(self) -> bool:
+        """Whether or not in-memory metric cache evicts metrics (so that metrics still needed must be protected)."""  # noqa: E501
+        return isinstance(self._metric_cache, BoundedMetricValueCache)
+
+    def protect_cached_metrics(self, metric_ids: Iterable[Tuple[str, str, str]]) -> None:
+        """Prevents specified metrics (e.g., those still needed by unresolved edges of validation graph) from being
+        evicted from bounded in-memory metric cache (replacing any previously protected metrics).
+
+        Args:
+            metric_ids: IDs of metrics to protect (empty in order to lift protection)
+        """  # noqa: E501
+        if isinstance(self._metric_cache, BoundedMetricValueCache):
+            self._metric_cache.protect(metric_ids=metric_ids)
+
     @property
     def batch_manager(self) -> BatchManager:
         """Getter for batch_manager"""
@@ -224,8 +293,55 @@ class ExecutionEngine(ABC):
             self.load_batch_data(batch_id=batch_id, batch_data=batch_data)  # type: ignore[arg-type]
 
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        self._batch_fingerprints.pop(batch_id, None)
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def release_batch(self, batch_id: str) -> None:
+        """Releases loaded data of Batch (and, once data of no Batch remains loaded, all cached metrics).
+
+        Args:
+            batch_id: identifier of Batch, whose data was loaded into this ExecutionEngine
+        """  # noqa: E501
+        self._batch_fingerprints.pop(batch_id, None)
+        self._batch_manager.release_batch(batch_id=batch_id)
+        if not self._batch_manager.batch_data_cache:
+            self._metric_cache.clear()
+
+    def get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Returns fingerprint, identifying contents of data of specified Batch (memoized until Batch data is reloaded).
+
+        Args:
+            batch_id: identifier of Batch, whose data was loaded into this ExecutionEngine
+
+        Returns:
+            Fingerprint string, which changes whenever Batch data changes; None if it cannot be determined.
+        """  # noqa: E501
+        if batch_id is None:
+            return None
+
+        if batch_id not in self._batch_fingerprints:
+            try:
+                self._batch_fingerprints[batch_id] = self._compute_batch_fingerprint(
+                    batch_id=batch_id
+                )
+            except Exception as e:
+                logger.debug(f"Unable to compute fingerprint of Batch {batch_id}: {e!r}")
+                self._batch_fingerprints[batch_id] = None
+
+        return self._batch_fingerprints[batch_id]
+
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Computes fingerprint of Batch data; by default, "pandas_data_fingerprint" of BatchMarkers (if available).
+
+        Engines, capable of fingerprinting their Batch data more broadly, override this method.
+        """  # noqa: E501
+        batch = self._batch_manager.batch_cache.get(batch_id)
+        batch_markers: Optional[BatchMarkers] = getattr(batch, "batch_markers", None)
+        if not batch_markers:
+            return None
+
+        return batch_markers.get("pandas_data_fingerprint")
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -266,21 +382,121 @@ class ExecutionEngine(ABC):
         if not metrics_to_resolve:
             return metrics or {}
 
-        metric_fn_direct_configurations: List[MetricComputationConfiguration]
-        metric_fn_bundle_configurations: List[MetricComputationConfiguration]
-        (
-            metric_fn_direct_configurations,
-            metric_fn_bundle_configurations,
-        ) = self._build_direct_and_bundled_metric_computation_configurations(
-            metrics_to_resolve=metrics_to_resolve,
-            metrics=metrics,
-            runtime_configuration=runtime_configuration,
-        )
-        return self._process_direct_and_bundled_metric_computation_configurations(
-            metric_fn_direct_configurations=metric_fn_direct_configurations,
-            metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+        cached_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        metric_cache_keys: Dict[Tuple[str, str, str], MetricCacheKey] = {}
+        if self._fingerprinted_metric_cache is not None:
+            metrics_to_resolve = list(metrics_to_resolve)
+            metric_cache_keys = self._get_metric_cache_keys(metrics_to_resolve=metrics_to_resolve)
+            cached_metrics = self._get_fingerprinted_cached_metrics(
+                metric_cache_keys=metric_cache_keys
+            )
+            if cached_metrics:
+                metrics_to_resolve = [
+                    metric_configuration
+                    for metric_configuration in metrics_to_resolve
+                    if metric_configuration.id not in cached_metrics
+                ]
+                if self._caching:
+                    self._metric_cache.update(cached_metrics)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if metrics_to_resolve:
+            metric_fn_direct_configurations: List[MetricComputationConfiguration]
+            metric_fn_bundle_configurations: List[MetricComputationConfiguration]
+            (
+                metric_fn_direct_configurations,
+                metric_fn_bundle_configurations,
+            ) = self._build_direct_and_bundled_metric_computation_configurations(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+            resolved_metrics = self._process_direct_and_bundled_metric_computation_configurations(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+
+        if self._fingerprinted_metric_cache is not None:
+            self._set_fingerprinted_cached_metrics(
+                resolved_metrics=resolved_metrics, metric_cache_keys=metric_cache_keys
+            )
+
+        resolved_metrics.update(cached_metrics)
+        return resolved_metrics
+
+    def _get_fingerprinted_cached_metrics(
+        self, metric_cache_keys: Dict[Tuple[str, str, str], MetricCacheKey]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Looks up values of metrics (by their "MetricCache" keys) that were previously computed on identical data."""  # noqa: E501
+        assert self._fingerprinted_metric_cache is not None
+
+        cached_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        metric_id: Tuple[str, str, str]
+        metric_cache_key: MetricCacheKey
+        for metric_id, metric_cache_key in metric_cache_keys.items():
+            found: bool
+            value: MetricValue
+            found, value = self._fingerprinted_metric_cache.get(key=metric_cache_key)
+            if found:
+                cached_metrics[metric_id] = value
+
+        return cached_metrics
+
+    def _set_fingerprinted_cached_metrics(
+        self,
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+        metric_cache_keys: Dict[Tuple[str, str, str], MetricCacheKey],
+    ) -> None:
+        """Stores values of newly computed metrics (by their "MetricCache" keys) for reuse."""
+        assert self._fingerprinted_metric_cache is not None
+
+        metric_id: Tuple[str, str, str]
+        value: MetricValue
+        for metric_id, value in resolved_metrics.items():
+            if metric_id in metric_cache_keys:
+                self._fingerprinted_metric_cache.set(key=metric_cache_keys[metric_id], value=value)
+
+    def _get_metric_cache_keys(
+        self, metrics_to_resolve: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], MetricCacheKey]:
+        """Builds "MetricCache" keys for metrics, whose values can be shared across ExecutionEngine objects and runs.
+
+        Partial-function metrics (engine-specific deferred computations) and metrics of Batch objects, whose data
+        cannot be fingerprinted, are not eligible for caching and are omitted.
+
+        Args:
+            metrics_to_resolve: the metrics to evaluate
+
+        Returns:
+            Dictionary, mapping "MetricConfiguration.id" to corresponding "MetricCache" key.
+        """  # noqa: E501
+        partial_function_suffixes: Tuple[str, ...] = tuple(
+            f".{suffix.value}" for suffix in MetricPartialFunctionTypeSuffixes
         )
 
+        metric_cache_keys: Dict[Tuple[str, str, str], MetricCacheKey] = {}
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            if metric_configuration.metric_name.endswith(partial_function_suffixes):
+                continue
+
+            batch_id: Optional[str] = (
+                metric_configuration.metric_domain_kwargs.get("batch_id")
+                or self._batch_manager.active_batch_data_id
+            )
+            batch_fingerprint: Optional[str] = self.get_batch_fingerprint(batch_id=batch_id)
+            if batch_id is None or batch_fingerprint is None:
+                continue
+
+            metric_cache_keys[metric_configuration.id] = (
+                batch_id,
+                batch_fingerprint,
+                metric_configuration.id,
+            )
+
+        return metric_cache_keys
+
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], MetricValue]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
         raise NotImplementedError
@@ -370,6 +586,70 @@ class ExecutionEngine(ABC):
         new_domain_kwargs.setdefault("filter_conditions", []).append(row_condition)
         return new_domain_kwargs
 
+    @staticmethod
+    def _get_unfiltered_domain_kwargs(domain_kwargs: dict) -> IDDict:
+        """Removes row filtering directives (row_condition, filter_conditions) from Domain kwargs.
+
+        Args:
+            domain_kwargs: Domain kwargs, possibly containing row filtering directives
+
+        Returns:
+            Domain kwargs, describing all records of the same base data
+        """
+        return IDDict(
+            {
+                key: value
+                for key, value in domain_kwargs.items()
+                if key not in ROW_FILTER_DOMAIN_KWARGS_KEYS
+            }
+        )
+
+    def _is_row_filter_fusable(self, domain_kwargs: dict) -> bool:
+        """Determines whether or not row filters of Domain can be evaluated within a scan shared with other Domains.
+
+        Execution engines, which are able to compute metrics of several row-filtered Domains in one pass over their
+        common base data, override this method.
+
+        Args:
+            domain_kwargs: Domain kwargs, possibly containing row filtering directives
+
+        Returns:
+            Boolean indicating whether or not metrics of Domain can be computed together with metrics of other Domains
+            that differ only in their row filters
+        """  # noqa: E501
+        return False
+
+    def _group_row_filter_fusable_bundles(
+        self, bundles: Dict[Tuple[str, str, str], dict]
+    ) -> List[List[dict]]:
+        """Groups per-Domain metric bundles, whose Domains differ only in row filters, in order of first occurrence.
+
+        Each bundle must hold its Domain kwargs under "domain_kwargs" key.  Bundles of Domains, whose row filters
+        cannot be fused, are placed in groups of their own.
+
+        Args:
+            bundles: Dictionary of Domain IDs and bundles of metrics to be computed on corresponding Domains
+
+        Returns:
+            List of groups of bundles, whose metrics can be computed in one pass over their common base data
+        """  # noqa: E501
+        groups: Dict[Tuple[str, str, str], List[dict]] = {}
+
+        group_id: Tuple[str, str, str]
+        domain_id: Tuple[str, str, str]
+        bundle: dict
+        for domain_id, bundle in bundles.items():
+            if self._is_row_filter_fusable(domain_kwargs=bundle["domain_kwargs"]):
+                group_id = self._get_unfiltered_domain_kwargs(
+                    domain_kwargs=bundle["domain_kwargs"]
+                ).to_id()
+            else:
+                group_id = domain_id
+
+            groups.setdefault(group_id, []).append(bundle)
+
+        return list(groups.values())
+
     def _build_direct_and_bundled_metric_computation_configurations(
         self,
         metrics_to_resolve: Iterable[MetricConfiguration],
@@ -527,18 +807,11 @@ class ExecutionEngine(ABC):
 
         metric_computation_configuration: MetricComputationConfiguration
 
-        for metric_computation_configuration in metric_fn_direct_configurations:
-            try:
-                resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
-                    metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
-                        **metric_computation_configuration.metric_provider_kwargs
-                    )
-                )
-            except Exception as e:
-                raise gx_exceptions.MetricResolutionError(
-                    message=str(e),
-                    failed_metrics=(metric_computation_configuration.metric_configuration,),
-                ) from e
+        resolved_metrics.update(
+            self._process_direct_metric_computation_configurations(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+            )
+        )
 
         try:
             # an engine-specific way of computing metrics together
@@ -560,6 +833,78 @@ class ExecutionEngine(ABC):
 
         return resolved_metrics
 
+    def _process_direct_metric_computation_configurations(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        This method executes metric functions of directly-computable "MetricComputationConfiguration" objects, using a
+        bounded thread pool whenever "max_concurrent_metric_computations" of this engine is greater than 1.
+
+        Failures are reported exactly as for serial execution: the first failing metric function (in the order given)
+        raises "MetricResolutionError" naming only that metric, so that per-metric failure accounting is unaffected;
+        metric functions, which have not started by then, are cancelled.
+
+        Args:
+            metric_fn_direct_configurations: directly-computable "MetricComputationConfiguration" objects
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
+        """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        metric_computation_configuration: MetricComputationConfiguration
+
+        max_workers: int = min(
+            self.max_concurrent_metric_computations, len(metric_fn_direct_configurations)
+        )
+        if max_workers <= 1:
+            for metric_computation_configuration in metric_fn_direct_configurations:
+                try:
+                    resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
+                        metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+                            **metric_computation_configuration.metric_provider_kwargs
+                        )
+                    )
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e),
+                        failed_metrics=(metric_computation_configuration.metric_configuration,),
+                    ) from e
+
+            return resolved_metrics
+
+        future: Future
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-metric-fn"
+        ) as executor:
+            futures: List[Future] = [
+                executor.submit(
+                    metric_computation_configuration.metric_fn,  # type: ignore[arg-type] # F not callable
+                    **metric_computation_configuration.metric_provider_kwargs,
+                )
+                for metric_computation_configuration in metric_fn_direct_configurations
+            ]
+            for metric_computation_configuration, future in zip(
+                metric_fn_direct_configurations, futures
+            ):
+                try:
+                    resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
+                        future.result()
+                    )
+                except Exception as e:
+                    # Metric functions that have not started yet are not run (same as
+                    # "executor.shutdown(cancel_futures=True)", which requires Python 3.9).
+                    for pending_future in futures:
+                        pending_future.cancel()
+
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e),
+                        failed_metrics=(metric_computation_configuration.metric_configuration,),
+                    ) from e
+
+        return resolved_metrics
+
     def _partition_domain_kwargs(
         self,
         domain_kwargs: Dict[str, Any],
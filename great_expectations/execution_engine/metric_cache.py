@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import json
+import logging
+import pathlib
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import singledispatch
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.exceptions import InvalidConfigError
+
+logger = logging.getLogger(__name__)
+
+MetricCacheKey = Tuple[str, str, Tuple[str, str, str]]
+"""Key of a cached metric value: ("batch_id", "batch_fingerprint", "MetricConfiguration.id")."""
+
+
+class MetricCache(ABC):
+    """MetricCache stores resolved metric values across ExecutionEngine instances (and, for persistent backends,
+    across runs), keyed on the fingerprint of the Batch whose data the metric was computed from.
+
+    Because the key incorporates the Batch fingerprint, a cached value is only served while the underlying data is
+    unchanged; once the data changes, its fingerprint (and thus the key) changes, and the stale entry is never read
+    again (it is eventually evicted).  Implementations must be safe to use from multiple threads.
+    """  # noqa: E501
+
+    @abstractmethod
+    def get(self, key: MetricCacheKey) -> Tuple[bool, Any]:
+        """Looks up cached metric value.
+
+        Args:
+            key: ("batch_id", "batch_fingerprint", "MetricConfiguration.id") of metric
+
+        Returns:
+            Tuple of (True, metric value) if present in cache; (False, None) otherwise.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: MetricCacheKey, value: Any) -> None:
+        """Stores metric value under given key.
+
+        Args:
+            key: ("batch_id", "batch_fingerprint", "MetricConfiguration.id") of metric
+            value: metric value
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from cache."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, key: MetricCacheKey) -> bool:
+        return self.get(key=key)[0]
+
+
+class InMemoryMetricCache(MetricCache):
+    """MetricCache, holding up to "max_entries" metric values in process memory (least recently used are evicted).
+
+    An instance can be shared among ExecutionEngine objects in order to reuse metrics computed on identical Batch data.
+
+    Args:
+        max_entries: maximum number of metric values retained
+    """  # noqa: E501
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        if max_entries < 1:
+            raise InvalidConfigError(  # noqa: TRY003
+                f'"max_entries" of {self.__class__.__name__} must be a positive integer (got {max_entries}).'  # noqa: E501
+            )
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict[MetricCacheKey, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @override
+    def get(self, key: MetricCacheKey) -> Tuple[bool, Any]:
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    @override
+    def set(self, key: MetricCacheKey, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @override
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteMetricCache(MetricCache):
+    """MetricCache, persisting up to "max_entries" pickled metric values in a local SQLite database file, so that
+    metrics computed on unchanged Batch data are reused across runs (least recently used entries are evicted).
+
+    Metric values, which cannot be pickled, are not persisted.  Since cached values are unpickled when read, the
+    database file must reside in a location that only trusted processes can write to.
+
+    Args:
+        path: location of SQLite database file (created if it does not exist)
+        max_entries: maximum number of metric values retained
+    """  # noqa: E501
+
+    _TABLE_NAME = "gx_metric_cache"
+
+    def __init__(self, path: Union[str, pathlib.Path], max_entries: int = 100000) -> None:
+        if max_entries < 1:
+            raise InvalidConfigError(  # noqa: TRY003
+                f'"max_entries" of {self.__class__.__name__} must be a positive integer (got {max_entries}).'  # noqa: E501
+            )
+
+        self._path = pathlib.Path(path)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self._path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, last_accessed REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._TABLE_NAME}_last_accessed "
+                f"ON {self._TABLE_NAME} (last_accessed)"
+            )
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    @override
+    def get(self, key: MetricCacheKey) -> Tuple[bool, Any]:
+        serialized_key: str = self._serialize_key(key=key)
+        with self._lock:
+            row: Optional[Tuple[bytes]] = self._connection.execute(
+                f"SELECT value FROM {self._TABLE_NAME} WHERE key = ?", (serialized_key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+
+            with self._connection:
+                self._connection.execute(
+                    f"UPDATE {self._TABLE_NAME} SET last_accessed = ? WHERE key = ?",
+                    (time.time(), serialized_key),
+                )
+
+        try:
+            return True, pickle.loads(row[0])  # trusted, local cache file
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cached metric value for {key}: {e!r}")
+            return False, None
+
+    @override
+    def set(self, key: MetricCacheKey, value: Any) -> None:
+        try:
+            serialized_value: bytes = pickle.dumps(value)
+        except Exception as e:
+            logger.debug(f"Not persisting metric value for {key}, which cannot be pickled: {e!r}")
+            return
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self._TABLE_NAME} (key, value, last_accessed) "
+                "VALUES (?, ?, ?)",
+                (self._serialize_key(key=key), serialized_value, time.time()),
+            )
+            self._connection.execute(
+                f"DELETE FROM {self._TABLE_NAME} WHERE key IN (SELECT key FROM {self._TABLE_NAME} "
+                "ORDER BY last_accessed DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    @override
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self._TABLE_NAME}")
+
+    def close(self) -> None:
+        """Closes connection to underlying SQLite database file."""
+        with self._lock:
+            self._connection.close()
+
+    @override
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self._TABLE_NAME}").fetchone()[
+                0
+            ]
+
+    @staticmethod
+    def _serialize_key(key: MetricCacheKey) -> str:
+        return json.dumps(key, default=str)
+
+
+# Sizes of containers with more elements than this are extrapolated from a sample of their elements.
+_SIZE_ESTIMATE_SAMPLE_SIZE = 100
+
+
+@singledispatch
+def estimate_metric_value_size(value: Any) -> int:
+    """Estimates number of bytes of memory occupied by metric value.
+
+    Estimates are dispatched on type of metric value; additional types can be supported by registering them with
+    "estimate_metric_value_size.register()".  Large containers are estimated from a sample of their elements.
+
+    Args:
+        value: metric value
+
+    Returns:
+        Estimated size (in bytes).
+    """  # noqa: E501
+    return sys.getsizeof(value)
+
+
+@estimate_metric_value_size.register(pd.DataFrame)
+@estimate_metric_value_size.register(pd.Series)
+@estimate_metric_value_size.register(pd.Index)
+def _estimate_pandas_object_size(value: Union[pd.DataFrame, pd.Series, pd.Index]) -> int:
+    memory_usage = value.memory_usage(deep=True)
+    return int(memory_usage.sum()) if isinstance(memory_usage, pd.Series) else int(memory_usage)
+
+
+@estimate_metric_value_size.register(np.ndarray)
+def _estimate_ndarray_size(value: np.ndarray) -> int:
+    if value.dtype == object:
+        return sys.getsizeof(value) + _estimate_elements_size(
+            elements=value.flat, num_elements=value.size
+        )
+
+    return sys.getsizeof(value) + value.nbytes
+
+
+@estimate_metric_value_size.register(list)
+@estimate_metric_value_size.register(tuple)
+@estimate_metric_value_size.register(set)
+@estimate_metric_value_size.register(frozenset)
+def _estimate_collection_size(value: Union[list, tuple, set, frozenset]) -> int:
+    return sys.getsizeof(value) + _estimate_elements_size(elements=value, num_elements=len(value))
+
+
+@estimate_metric_value_size.register(dict)
+def _estimate_dict_size(value: dict) -> int:
+    return sys.getsizeof(value) + _estimate_elements_size(
+        elements=(item for pair in value.items() for item in pair), num_elements=2 * len(value)
+    )
+
+
+def _estimate_elements_size(elements: Iterable[Any], num_elements: int) -> int:
+    if num_elements == 0:
+        return 0
+
+    sample_size: int = min(num_elements, _SIZE_ESTIMATE_SAMPLE_SIZE)
+    sample_total: int = 0
+    for idx, element in enumerate(elements):
+        if idx >= sample_size:
+            break
+
+        sample_total += estimate_metric_value_size(element)
+
+    return sample_total * num_elements // sample_size
+
+
+@dataclass(frozen=True)
+class MetricValueCacheStats:
+    """Counters and occupancy of BoundedMetricValueCache (useful for choosing its byte budget)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    num_entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class BoundedMetricValueCache:
+    """In-memory cache of resolved metric values (keyed on "MetricConfiguration.id"), whose estimated total size is
+    kept within a byte budget by evicting least recently used entries.
+
+    Entries of protected metrics (i.e., those, which are still needed by unresolved edges of the validation graph being
+    resolved) are never evicted; should protected entries alone exceed the budget, it is exceeded temporarily, until
+    protection is lifted.  Values larger than the entire budget are not cached.
+
+    Args:
+        max_bytes: budget (in bytes) for estimated total size of cached metric values
+    """  # noqa: E501
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < 1:
+            raise InvalidConfigError(  # noqa: TRY003
+                f'"max_bytes" of {self.__class__.__name__} must be a positive integer (got {max_bytes}).'  # noqa: E501
+            )
+
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Tuple[str, str, str], Tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._protected_ids: Set[Tuple[str, str, str]] = set()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> MetricValueCacheStats:
+        return MetricValueCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            num_entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            max_bytes=self._max_bytes,
+        )
+
+    def protect(self, metric_ids: Iterable[Tuple[str, str, str]]) -> None:
+        """Replaces set of metrics, whose entries must not be evicted, and evicts entries no longer protected (if over
+        budget).
+        """  # noqa: E501
+        self._protected_ids = set(metric_ids)
+        self._evict()
+
+    def __contains__(self, metric_id: Tuple[str, str, str]) -> bool:
+        # "ExecutionEngine" looks up cached metrics by membership test; count hits/misses here.
+        if metric_id in self._entries:
+            self._hits += 1
+            return True
+
+        self._misses += 1
+        return False
+
+    def __getitem__(self, metric_id: Tuple[str, str, str]) -> Any:
+        value: Any = self._entries[metric_id][0]
+        self._entries.move_to_end(metric_id)
+        return value
+
+    def __setitem__(self, metric_id: Tuple[str, str, str], value: Any) -> None:
+        self._discard(metric_id=metric_id)
+
+        size: int = estimate_metric_value_size(value)
+        if size > self._max_bytes:
+            logger.debug(
+                f"Not caching metric {metric_id}, whose estimated size of {size} bytes exceeds budget of {self._max_bytes} bytes."  # noqa: E501
+            )
+            return
+
+        self._entries[metric_id] = (value, size)
+        self._size_bytes += size
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, metrics: Dict[Tuple[str, str, str], Any]) -> None:
+        metric_id: Tuple[str, str, str]
+        value: Any
+        for metric_id, value in metrics.items():
+            self[metric_id] = value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def _discard(self, metric_id: Tuple[str, str, str]) -> None:
+        entry: Optional[Tuple[Any, int]] = self._entries.pop(metric_id, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    def _evict(self) -> None:
+        if self._size_bytes <= self._max_bytes:
+            return
+
+        metric_id: Tuple[str, str, str]
+        for metric_id in list(self._entries):
+            if self._size_bytes <= self._max_bytes:
+                break
+
+            if metric_id in self._protected_ids:
+                continue
+
+            self._discard(metric_id=metric_id)
+            self._evictions += 1
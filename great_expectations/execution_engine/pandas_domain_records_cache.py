@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class PandasDomainRecordsCache:
+    """Remembers which rows of batch DataFrames satisfy Domain row filters, so that every filter is evaluated once.
+
+    Positions of rows (rather than filtered copies of DataFrames) are kept for as long as batch DataFrame is loaded.
+    Filtered DataFrame of a row filter is shared by all callers for as long as any of them references it; hence, memory
+    used for Domain records scales with number of distinct row filters in use, and not with number of metrics.
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._row_positions: Dict[Tuple[int, Hashable], Tuple[weakref.ref, np.ndarray]] = {}
+        self._domain_records: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def get_domain_records(
+        self,
+        data: pd.DataFrame,
+        row_filter_key: Hashable,
+        compute_row_mask: Callable[[pd.DataFrame], np.ndarray],
+    ) -> pd.DataFrame:
+        """Returns rows of "data" satisfying row filter, identified by "row_filter_key".
+
+        Args:
+            data: batch DataFrame
+            row_filter_key: hashable description of row filter (e.g., row_condition and ignore_row_if directives)
+            compute_row_mask: computes boolean mask of rows of "data" that satisfy row filter
+
+        Returns:
+            Batch DataFrame itself, if all of its rows satisfy row filter; otherwise, DataFrame of satisfying rows.
+        """  # noqa: E501
+        cache_key: Tuple[int, Hashable] = (id(data), row_filter_key)
+
+        with self._lock:
+            row_positions: np.ndarray = self._get_row_positions(
+                data=data, cache_key=cache_key, compute_row_mask=compute_row_mask
+            )
+            if len(row_positions) == len(data):
+                return data
+
+            domain_records: pd.DataFrame | None = self._domain_records.get(cache_key)
+            if domain_records is None:
+                domain_records = data.take(row_positions)
+                self._domain_records[cache_key] = domain_records
+
+            return domain_records
+
+    def _get_row_positions(
+        self,
+        data: pd.DataFrame,
+        cache_key: Tuple[int, Hashable],
+        compute_row_mask: Callable[[pd.DataFrame], np.ndarray],
+    ) -> np.ndarray:
+        entry: Tuple[weakref.ref, np.ndarray] | None = self._row_positions.get(cache_key)
+        # Identifiers of garbage-collected DataFrames can be reused, so source DataFrame is checked.
+        if entry is not None and entry[0]() is data:
+            return entry[1]
+
+        row_positions: np.ndarray = np.flatnonzero(compute_row_mask(data))
+        self._row_positions[cache_key] = (weakref.ref(data), row_positions)
+        self._domain_records.pop(cache_key, None)
+        return row_positions
+
+    def clear(self) -> None:
+        """Forgets all row positions and filtered DataFrames (e.g., when batch data is loaded)."""
+        with self._lock:
+            self._row_positions.clear()
+            self._domain_records.clear()
+
+    def __len__(self) -> int:
+        return len(self._row_positions)
@@ -12,6 +12,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -19,6 +20,7 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
@@ -48,6 +50,9 @@ from great_expectations.execution_engine.execution_engine import (
     PartitionDomainKwargs,  # noqa: TCH001
 )
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_domain_records_cache import (
+    PandasDomainRecordsCache,
+)
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
@@ -120,6 +125,9 @@ class PandasExecutionEngine(ExecutionEngine):
         self._azure: azure.BlobServiceClient | None = None
         self._gcs = None
 
+        # Batch data passed to constructor is loaded by base class, so cache must exist beforehand.
+        self._domain_records_cache = PandasDomainRecordsCache()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -198,7 +206,32 @@ class PandasExecutionEngine(ExecutionEngine):
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"  # noqa: E501
             )
 
+        reloaded: bool = self.batch_manager.batch_data_cache.get(batch_id) is batch_data
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        # Row positions located in previously loaded DataFrames do not apply to newly loaded ones.
+        if not reloaded:
+            self._domain_records_cache.clear()
+
+    @override
+    def release_batch(self, batch_id: str) -> None:
+        super().release_batch(batch_id=batch_id)
+        self._domain_records_cache.clear()
+
+    @override
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        batch_data: Optional[PandasBatchData] = cast(
+            Optional[PandasBatchData], self.batch_manager.batch_data_cache.get(batch_id)
+        )
+        if batch_data is None:
+            return None
+
+        df: pd.DataFrame = batch_data.dataframe
+        if df.memory_usage().sum() >= HASH_THRESHOLD:
+            return None
+
+        # Column names and types are not reflected in hash of values; hence, they are added to fingerprint explicitly.  # noqa: E501
+        schema: str = repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()])
+        return hashlib.md5(f"{schema}:{hash_pandas_dataframe(df)}".encode()).hexdigest()
 
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
@@ -483,7 +516,7 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
         return {}  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).  # noqa: E501
 
     @override
-    def get_domain_records(  # noqa: C901, PLR0912
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
@@ -520,7 +553,31 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
-        # Filtering by row condition.
+        row_filter_key: Optional[tuple] = self._get_domain_row_filter_key(
+            domain_kwargs=domain_kwargs
+        )
+        if row_filter_key is None:
+            return data
+
+        # Rows satisfying same row filter are located once per batch and shared by all metrics using it.  # noqa: E501
+        return self._domain_records_cache.get_domain_records(
+            data=data,
+            row_filter_key=row_filter_key,
+            compute_row_mask=partial(self._compute_domain_row_mask, domain_kwargs=domain_kwargs),
+        )
+
+    @staticmethod
+    def _get_domain_row_filter_key(domain_kwargs: dict) -> Optional[tuple]:
+        """Validates row filtering directives (row_condition and ignore_row_if) of Domain and describes them.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            Hashable description of row filter, shared by all Domains that select the same rows (or None, if no filter)
+        """  # noqa: E501
+        row_filter_key: tuple = ()
+
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
@@ -531,65 +588,98 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                     "condition_parser is required when setting a row_condition,"
                     " and must be 'python' or 'pandas'"
                 )
-            else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
 
+            row_filter_key += ("row_condition", row_condition, condition_parser)
+
+        ignore_row_if_subset: Optional[Tuple[List[str], str]] = (
+            PandasExecutionEngine._get_ignore_row_if_subset(domain_kwargs=domain_kwargs)
+        )
+        if ignore_row_if_subset is not None:
+            subset, how = ignore_row_if_subset
+            row_filter_key += ("ignore_row_if", tuple(subset), how)
+
+        return row_filter_key or None
+
+    @staticmethod
+    def _get_ignore_row_if_subset(domain_kwargs: dict) -> Optional[Tuple[List[str], str]]:
+        """Translates ignore_row_if directive of column pair and multicolumn Domains into "DataFrame.dropna()" arguments.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            Tuple of "subset" and "how" arguments of "DataFrame.dropna()" (or None, if no rows are to be ignored)
+        """  # noqa: E501
         if "column" in domain_kwargs:
-            return data
+            return None
 
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
         ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
-                )
-            elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+            subset: List[str] = [domain_kwargs["column_A"], domain_kwargs["column_B"]]
+            how_by_ignore_row_if: Dict[str, Optional[str]] = {
+                "both_values_are_missing": "all",
+                "either_value_is_missing": "any",
+                "neither": None,
+            }
+        elif "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
+            subset = domain_kwargs["column_list"]
+            how_by_ignore_row_if = {
+                "all_values_are_missing": "all",
+                "any_value_is_missing": "any",
+                "never": None,
+            }
+        else:
+            return None
 
-            return data
+        ignore_row_if = domain_kwargs["ignore_row_if"]
+        if ignore_row_if not in how_by_ignore_row_if:
+            raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
 
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
+        how: Optional[str] = how_by_ignore_row_if[ignore_row_if]
+        if how is None:
+            return None
 
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
-            elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
+        return subset, how
+
+    def _compute_domain_row_mask(self, data: pd.DataFrame, domain_kwargs: dict) -> np.ndarray:
+        """Computes boolean mask of rows of "data" satisfying row filtering directives of Domain.
+
+        Args:
+            data: batch DataFrame
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            Boolean numpy array, with one entry per row of "data"
+        """  # noqa: E501
+        row_mask: np.ndarray = np.ones(len(data), dtype=bool)
+
+        row_condition = domain_kwargs.get("row_condition", None)
+        if row_condition:
+            # Same evaluation as "DataFrame.query()" performs, but without materializing filtered copy.  # noqa: E501
+            condition_result = data.eval(row_condition, parser=domain_kwargs["condition_parser"])
+            if not pd.api.types.is_bool_dtype(getattr(condition_result, "dtype", None)):
+                raise ValueError(  # noqa: TRY003
+                    f'row_condition "{row_condition}" does not evaluate to a boolean value for every row.'  # noqa: E501
                 )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
 
-            return data
+            row_mask &= np.asarray(condition_result, dtype=bool)
+
+        ignore_row_if_subset: Optional[Tuple[List[str], str]] = self._get_ignore_row_if_subset(
+            domain_kwargs=domain_kwargs
+        )
+        if ignore_row_if_subset is not None:
+            subset, how = ignore_row_if_subset
+            not_missing: pd.DataFrame = data[subset].notna()
+            # Equivalent to "DataFrame.dropna(axis=0, how=how, subset=subset)".
+            if how == "all":
+                row_mask &= not_missing.any(axis=1).to_numpy()
+            else:
+                row_mask &= not_missing.all(axis=1).to_numpy()
 
-        return data
+        return row_mask
 
     @override
     def get_compute_domain(
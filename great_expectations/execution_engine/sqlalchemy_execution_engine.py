@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import datetime
 import hashlib
+import json
 import logging
 import math
 import os
@@ -11,6 +12,7 @@ import re
 import string
 import traceback
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import (
@@ -20,8 +22,10 @@ from typing import (
     Dict,
     Iterable,
     List,
+    Mapping,
     MutableMapping,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -79,6 +83,7 @@ from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_temp_table_registry import TempTableRegistry
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -143,6 +148,8 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.metric_cache import MetricCache
+
 
 def _get_dialect_type_module(dialect):  # noqa: C901
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -249,6 +256,131 @@ def _dialect_requires_persisted_connection(
     return return_val
 
 
+# Aggregate functions ignore NULL inputs; hence, replacing inputs from rows not satisfying a row
+# filter with NULL restricts their computation to rows that do (while query scans all base data).
+_ROW_FILTERABLE_AGGREGATE_FUNCTION_NAMES = frozenset(
+    {
+        "avg",
+        "count",
+        "max",
+        "min",
+        "stddev",
+        "stddev_pop",
+        "stddev_samp",
+        "sum",
+        "var_pop",
+        "var_samp",
+        "variance",
+    }
+)
+
+# Dialects, in which aggregate functions are restricted using "FILTER (WHERE ...)" clause (not
+# "CASE WHEN ... THEN ... END" wrapping of their inputs).
+_FILTER_CLAUSE_DIALECTS = (GXSqlDialect.POSTGRESQL,)
+
+
+def _restrict_aggregate_to_row_filter(
+    aggregate: sqlalchemy.functions.FunctionElement,
+    condition: sqlalchemy.ColumnElement,
+    use_filter_clause: bool,
+) -> Optional[sqlalchemy.ColumnElement]:
+    """Restricts aggregate function to rows satisfying condition.
+
+    Args:
+        aggregate: NULL-ignoring aggregate function (e.g., "sum", "count", "max")
+        condition: row filter condition
+        use_filter_clause: whether to use "FILTER (WHERE ...)" clause or to wrap input with "CASE WHEN ... END"
+
+    Returns:
+        Restricted aggregate function or None, if aggregate function does not have exactly one argument
+    """  # noqa: E501
+    if use_filter_clause:
+        return aggregate.filter(condition)
+
+    arguments: list = list(aggregate.clauses)
+    if len(arguments) != 1:
+        return None
+
+    argument: sqlalchemy.ColumnElement = arguments[0]
+    is_distinct: bool = (
+        isinstance(argument, sqlalchemy.UnaryExpression)
+        and argument.operator is sqlalchemy.operators.distinct_op
+    )
+    if is_distinct:
+        argument = argument.element
+
+    if (
+        isinstance(argument, sqlalchemy.ColumnClause)
+        and argument.is_literal
+        and argument.name == "*"
+    ):
+        argument = sa.literal_column("1")
+
+    restricted_argument: sqlalchemy.ColumnElement = sa.case((condition, argument))
+    if is_distinct:
+        restricted_argument = sa.distinct(restricted_argument)
+
+    return getattr(sa.func, aggregate.name)(restricted_argument, type_=aggregate.type)
+
+
+def _restrict_metric_fn_to_row_filter(
+    metric_fn: sqlalchemy.ColumnElement,
+    condition: sqlalchemy.ColumnElement,
+    use_filter_clause: bool,
+) -> Optional[sqlalchemy.ColumnElement]:
+    """Rewrites every aggregate function of bundled metric function so that it only aggregates rows satisfying condition.
+
+    Args:
+        metric_fn: bundled (aggregate) metric function, as computed on unfiltered records
+        condition: row filter condition
+        use_filter_clause: whether to use "FILTER (WHERE ...)" clause or to wrap inputs with "CASE WHEN ... END"
+
+    Returns:
+        Restricted metric function or None, if metric function cannot be restricted (e.g., it uses unsupported
+        aggregate functions or references columns outside of aggregate functions) and must be computed on its own.
+    """  # noqa: E501
+    is_restrictable: bool = True
+
+    def _replace(element: Any) -> Any:
+        nonlocal is_restrictable
+
+        if (
+            isinstance(element, sqlalchemy.functions.FunctionElement)
+            and str(getattr(element, "name", "")).lower()
+            in _ROW_FILTERABLE_AGGREGATE_FUNCTION_NAMES
+        ):
+            restricted_aggregate = _restrict_aggregate_to_row_filter(
+                aggregate=element, condition=condition, use_filter_clause=use_filter_clause
+            )
+            if restricted_aggregate is None:
+                is_restrictable = False
+                return element
+
+            return restricted_aggregate
+
+        if isinstance(
+            element,
+            (
+                sqlalchemy.ColumnClause,
+                sqlalchemy.TextClause,
+                sqlalchemy.Over,
+                sqlalchemy.WithinGroup,
+                sqlalchemy.FunctionFilter,
+                sqlalchemy.ScalarSelect,
+            ),
+        ):
+            is_restrictable = False
+            return element
+
+        return None
+
+    restricted_metric_fn = sqlalchemy.visitors.replacement_traverse(metric_fn, {}, _replace)
+    if not is_restrictable:
+        return None
+
+    return restricted_metric_fn
+
+
 class SqlAlchemyExecutionEngine(ExecutionEngine):
     """SparkDFExecutionEngine instantiates the ExecutionEngine API to support computations using Spark platform.
 
@@ -274,6 +406,22 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        create_temp_table (bool): Whether to leverage temporary tables during metric computation.
+        max_concurrent_queries (int): Maximum number of queries that may be in flight at once while resolving \
+            metrics (per-domain bundle queries, as well as directly-computed metrics, such as \
+            "column.value_counts", that issue their own queries).  The default of 1 executes them serially.  Values \
+            greater than 1 run them on a bounded thread pool drawing connections from the engine's connection pool \
+            (ignored for dialects that require a single persisted connection, e.g. sqlite and mssql).
+        fuse_row_filtered_domains (bool): Whether to compute bundled metrics of Domains, which differ only in their \
+            row filters, in one query over their unfiltered base data (restricting every aggregate to records of its \
+            Domain).  This saves scans of the same table, but (as every aggregate is evaluated on all records) may be \
+            slower when row filters are selective or indexed; hence, it is disabled by default.
+        metric_cache_max_bytes (int): If given, the in-memory cache of resolved metrics is bounded by this (estimated) \
+            number of bytes, evicting least recently used metrics that are no longer needed.
+        metric_cache (MetricCache): Optional cache, which stores resolved metrics keyed on fingerprint of Batch data \
+            (computed from row count and latest values of date/time columns), so that they can be reused by other \
+            ExecutionEngine objects and (for persistent backends) subsequent runs.  Changes to Batch data, which leave \
+            both unaffected (e.g., in-place updates of existing rows), are not detected.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -293,16 +441,32 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        max_concurrent_queries: int = 1,
+        fuse_row_filtered_domains: bool = False,
+        metric_cache_max_bytes: Optional[int] = None,
+        metric_cache: Optional[MetricCache] = None,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache_max_bytes=metric_cache_max_bytes,
+            metric_cache=metric_cache,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        if max_concurrent_queries < 1:
+            raise InvalidConfigError(  # noqa: TRY003
+                f"max_concurrent_queries must be a positive integer; received {max_concurrent_queries}."  # noqa: E501
+            )
+
+        self._max_concurrent_queries = max_concurrent_queries
+        self._fuse_row_filtered_domains = fuse_row_filtered_domains
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by  # noqa: E501
@@ -311,6 +475,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # (e.g. for accessing temporary tables), if we don't keep a reference
         # then we get errors like sqlite3.ProgrammingError: Cannot operate on a closed database.
         self._connection: sqlalchemy.Connection | None = None
+        # Temporary tables, created by metrics, are reused per connection and dropped on close().
+        self._temp_table_registry = TempTableRegistry()
 
         # Use a single instance of SQLAlchemy engine to avoid creating multiple engine instances
         # for the same SQLAlchemy engine. This allows us to take advantage of SQLAlchemy's
@@ -428,6 +594,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "max_concurrent_queries": max_concurrent_queries
+            if max_concurrent_queries > 1
+            else None,
+            "fuse_row_filtered_domains": fuse_row_filtered_domains,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -497,6 +668,16 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def dialect(self) -> sqlalchemy.Dialect:
         return self.engine.dialect
 
+    @property
+    @override
+    def max_concurrent_metric_computations(self) -> int:
+        # Dialects that require a single persisted connection (e.g. for temporary tables) cannot
+        # share that connection across threads, so their queries are always executed serially.
+        if self.dialect_name in _PERSISTED_CONNECTION_DIALECTS:
+            return 1
+
+        return self._max_concurrent_queries
+
     @property
     def dialect_name(self) -> str:
         """Retrieve the string name of the engine dialect in lowercase e.g. "postgresql".
@@ -642,11 +823,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             selectable = data_object.selectable
 
-        """
-        If a custom query is passed, selectable will be TextClause and not formatted
-        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-        to TextualSelect using sa.columns() before it can be converted to type Subquery
-        """
+        # If a custom query is passed, selectable will be TextClause and not formatted
+        # as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        # to TextualSelect using sa.columns() before it can be converted to type Subquery
         if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
             selectable = selectable.columns().subquery()
 
@@ -946,7 +1125,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         return PartitionDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
     @override
-    def resolve_metric_bundle(  # noqa: C901 - too complex
+    def resolve_metric_bundle(
         self,
         metric_fn_bundle: Iterable[MetricComputationConfiguration],
     ) -> Dict[Tuple[str, str, str], MetricValue]:
@@ -965,8 +1144,6 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """  # noqa: E501
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
-        res: List[sqlalchemy.Row]
-
         # We need a different query for each Domain (where clause).
         queries: Dict[Tuple[str, str, str], dict] = {}
 
@@ -1005,44 +1182,27 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
-        for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
-
-            assert len(query["select"]) == len(query["metric_ids"])
-
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (  # type: ignore[truthy-function]
-                    sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)  # type: ignore[truthy-function]
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable.subquery())
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable)  # type: ignore[arg-type]
+        fused_queries: List[dict]
+        if self._fuse_row_filtered_domains:
+            # Domains, which differ only in row filters, are computed in one scan of base data.
+            fused_queries = self._fuse_row_filtered_bundle_queries(queries=queries)
+        else:
+            fused_queries = list(queries.values())
 
-                logger.debug(f"Attempting query {sa_query_object!s}")
-                res = self.execute_query(sa_query_object).fetchall()  # type: ignore[assignment]
+        sa_query_objects: List[sqlalchemy.Select] = [
+            self._build_bundle_query_object(query=query) for query in fused_queries
+        ]
+        results: List[List[sqlalchemy.Row]] = self._execute_bundle_queries(
+            sa_query_objects=sa_query_objects
+        )
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
-                )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += (
-                    f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400
-                raise ExecutionEngineError(message=exception_message)
+        # Results are merged in the order in which domains were first encountered, regardless of the order in  # noqa: E501
+        # which their queries completed, so that resolution remains deterministic.
+        for query, res in zip(fused_queries, results):
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{IDDict(query["domain_kwargs"]).to_id()}"""
+            )
 
             assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
             assert len(query["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
@@ -1056,6 +1216,239 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    @override
+    def _is_row_filter_fusable(self, domain_kwargs: dict) -> bool:
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if (
+            row_condition is not None
+            and domain_kwargs.get("condition_parser") != "great_expectations__experimental__"
+        ):
+            return False
+
+        filter_conditions: List[RowCondition] = domain_kwargs.get("filter_conditions", [])
+        return len(filter_conditions) <= 1 and all(
+            filter_condition.condition_type == RowConditionParserType.GE
+            for filter_condition in filter_conditions
+        )
+
+    def _build_row_filter_condition(
+        self, domain_kwargs: dict
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        """Combines row_condition and filter_conditions of Domain into single SqlAlchemy condition.
+
+        Args:
+            domain_kwargs: Domain kwargs, whose row filters are fusable
+
+        Returns:
+            SqlAlchemy condition, selecting records of Domain out of its unfiltered base data (or None, if unfiltered)
+        """  # noqa: E501
+        conditions: List[sqlalchemy.ColumnElement] = []
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if row_condition is not None:
+            conditions.append(parse_condition_to_sqlalchemy(row_condition))
+
+        filter_condition: RowCondition
+        for filter_condition in domain_kwargs.get("filter_conditions", []):
+            conditions.append(parse_condition_to_sqlalchemy(filter_condition.condition))
+
+        if not conditions:
+            return None
+
+        return sa.and_(*conditions)
+
+    def _fuse_row_filtered_bundle_queries(
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> List[dict]:
+        """Fuses bundled queries of Domains, which differ only in their row filters, into one query per base data.
+
+        In fused query, every metric function is computed on unfiltered base data, with its aggregate functions
+        restricted to records of its Domain (using "FILTER (WHERE ...)" or "CASE WHEN ... END" constructs).  If any
+        metric function of a group cannot be restricted this way, queries of that group are left as they are.
+
+        Args:
+            queries: Dictionary of Domain IDs and bundled queries ("select", "metric_ids", and "domain_kwargs")
+
+        Returns:
+            List of bundled queries, in order in which their Domains were first encountered
+        """  # noqa: E501
+        use_filter_clause: bool = self.dialect_name in _FILTER_CLAUSE_DIALECTS
+
+        fused_queries: List[dict] = []
+
+        query_group: List[dict]
+        for query_group in self._group_row_filter_fusable_bundles(bundles=queries):
+            fused_query: Optional[dict] = None
+            if len(query_group) > 1:
+                fused_query = self._fuse_query_group(
+                    query_group=query_group, use_filter_clause=use_filter_clause
+                )
+
+            if fused_query is None:
+                fused_queries.extend(query_group)
+            else:
+                logger.debug(
+                    f"SqlAlchemyExecutionEngine fused {len(query_group)} row-filtered domains into one query."  # noqa: E501
+                )
+                fused_queries.append(fused_query)
+
+        return fused_queries
+
+    def _fuse_query_group(self, query_group: List[dict], use_filter_clause: bool) -> Optional[dict]:
+        """Builds single query on unfiltered base data, computing metrics of every query in group.
+
+        Returns:
+            Fused query or None, if some metric function of group cannot be restricted to its Domain
+        """
+        fused_query: dict = {
+            "select": [],
+            "metric_ids": [],
+            "domain_kwargs": self._get_unfiltered_domain_kwargs(
+                domain_kwargs=query_group[0]["domain_kwargs"]
+            ),
+        }
+
+        query: dict
+        for query in query_group:
+            condition: Optional[sqlalchemy.ColumnElement] = self._build_row_filter_condition(
+                domain_kwargs=query["domain_kwargs"]
+            )
+            metric_fn: sqlalchemy.ColumnElement
+            for metric_fn in query["select"]:
+                if condition is not None:
+                    metric_fn = _restrict_metric_fn_to_row_filter(  # noqa: PLW2901
+                        metric_fn=metric_fn,
+                        condition=condition,
+                        use_filter_clause=use_filter_clause,
+                    )
+                    if metric_fn is None:
+                        return None
+
+                fused_query["select"].append(metric_fn)
+
+            fused_query["metric_ids"].extend(query["metric_ids"])
+
+        return fused_query
+
+    def _build_bundle_query_object(self, query: dict) -> sqlalchemy.Select:
+        """Wraps the domain records of a bundled query in a SELECT of all of its bundled metric functions.
+
+        Args:
+            query: Dictionary holding the "select" list, the "metric_ids", and the "domain_kwargs" of one domain.
+
+        Returns:
+            SqlAlchemy Select object computing every bundled metric of the domain in a single statement.
+        """  # noqa: E501
+        domain_kwargs: dict = query["domain_kwargs"]
+        selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+        assert len(query["select"]) == len(query["metric_ids"])
+
+        # If a custom query is passed, selectable will be TextClause and not formatted
+        # as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        # to TextualSelect using sa.columns() before it can be converted to type Subquery
+        if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+            return sa.select(*query["select"]).select_from(selectable.columns().subquery())
+
+        if (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (  # type: ignore[truthy-function]
+            sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)  # type: ignore[truthy-function]
+        ):
+            return sa.select(*query["select"]).select_from(selectable.subquery())
+
+        return sa.select(*query["select"]).select_from(selectable)  # type: ignore[arg-type]
+
+    def _execute_bundle_query(self, sa_query_object: sqlalchemy.Select) -> List[sqlalchemy.Row]:
+        """Executes one bundled metric query, converting driver errors into ExecutionEngineError.
+
+        Args:
+            sa_query_object: Query computing all bundled metrics of a single domain.
+
+        Returns:
+            List of result rows (a single row is expected for bundle-computed metrics).
+        """
+        try:
+            logger.debug(f"Attempting query {sa_query_object!s}")
+            return self.execute_query(sa_query_object).fetchall()  # type: ignore[return-value]
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)  # noqa: TRY400
+            raise ExecutionEngineError(message=exception_message)
+
+    def _execute_bundle_queries(
+        self, sa_query_objects: List[sqlalchemy.Select]
+    ) -> List[List[sqlalchemy.Row]]:
+        """Executes bundled metric queries, concurrently if so configured, returning results in input order.
+
+        Args:
+            sa_query_objects: One query per compute domain.
+
+        Returns:
+            List of query results, positionally aligned with "sa_query_objects".
+        """  # noqa: E501
+        max_workers: int = min(self.max_concurrent_metric_computations, len(sa_query_objects))
+        if max_workers <= 1:
+            return [
+                self._execute_bundle_query(sa_query_object=sa_query_object)
+                for sa_query_object in sa_query_objects
+            ]
+
+        logger.debug(
+            f"Executing {len(sa_query_objects)} bundled metric queries with up to {max_workers} concurrent connections."  # noqa: E501
+        )
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-sql-bundle"
+        ) as executor:
+            # "Executor.map()" yields results in submission order and re-raises the first failure.
+            return list(executor.map(self._execute_bundle_query, sa_query_objects))
+
+    @override
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Fingerprints Batch data by its row count and maximum values of its date/time columns (one query).
+
+        Unlike hashing all values, this is cheap enough to evaluate on every run; however, changes to Batch data, which
+        leave both of these unaffected (e.g., in-place updates of existing rows), are not detected.
+        """  # noqa: E501
+        # Imported here to avoid circular import (metric implementations import this module).
+        from great_expectations.expectations.metrics.table_metrics.table_column_types import (
+            _get_sqlalchemy_column_metadata,
+        )
+
+        batch_data: Optional[SqlAlchemyBatchData] = cast(
+            Optional[SqlAlchemyBatchData], self.batch_manager.batch_data_cache.get(batch_id)
+        )
+        if batch_data is None:
+            return None
+
+        column_metadata: Sequence[Mapping[str, Any]] = (
+            _get_sqlalchemy_column_metadata(execution_engine=self, batch_data=batch_data) or []
+        )
+        temporal_column_names: List[str] = [
+            column["name"]
+            for column in column_metadata
+            if isinstance(column["type"], (sa.types.Date, sa.types.DateTime))
+        ]
+        select: List[sqlalchemy.Label] = [sa.func.count().label("row_count")] + [
+            sa.func.max(sa.column(column_name)).label(f"max_{idx}")
+            for idx, column_name in enumerate(temporal_column_names)
+        ]
+        sa_query_object: sqlalchemy.Select = self._build_bundle_query_object(
+            query={
+                "select": select,
+                "metric_ids": list(range(len(select))),
+                "domain_kwargs": {"batch_id": batch_id},
+            }
+        )
+        row: sqlalchemy.Row = self._execute_bundle_query(sa_query_object=sa_query_object)[0]
+
+        schema: List[Tuple[str, str]] = [
+            (str(column["name"]), str(column["type"])) for column in column_metadata
+        ]
+        return hashlib.md5(json.dumps([schema, list(row)], default=str).encode()).hexdigest()
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1074,6 +1467,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """  # noqa: E501
+        self._temp_table_registry.drop_all()
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1324,6 +1718,25 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return result
 
+    def get_or_create_temp_table(
+        self,
+        key: str,
+        create_fn: Callable[[sqlalchemy.Connection], sqlalchemy.Table],
+    ) -> sqlalchemy.Table:
+        """Get a temporary table for the current connection, creating it only once per connection.
+
+        Args:
+            key: Identifies the purpose of the temporary table.
+            create_fn: Creates the temporary table on the given connection.
+
+        Returns:
+            Sqlalchemy table, which is dropped when the execution engine is closed.
+        """
+        with self.get_connection() as connection:
+            return self._temp_table_registry.get_or_create(
+                connection=connection, key=key, create_fn=create_fn
+            )
+
     @new_method_or_class(version="0.16.14")
     def execute_query_in_transaction(
         self, query: sqlalchemy.Selectable
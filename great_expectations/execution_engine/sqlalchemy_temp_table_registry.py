@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Dict, Tuple
+
+from great_expectations.compatibility import sqlalchemy
+
+logger = logging.getLogger(__name__)
+
+
+class TempTableRegistry:
+    """Keeps track of temporary tables, so that each one is created once per connection (session) and reused.
+
+    Temporary tables only exist within the connection (session) that created them; hence, a registered table is
+    reused only for as long as requests for it are made on the same open connection, and is created anew otherwise.
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._temp_tables: Dict[str, Tuple[sqlalchemy.Connection, sqlalchemy.Table]] = {}
+
+    def get_or_create(
+        self,
+        connection: sqlalchemy.Connection,
+        key: str,
+        create_fn: Callable[[sqlalchemy.Connection], sqlalchemy.Table],
+    ) -> sqlalchemy.Table:
+        """Returns temporary table registered under "key" for "connection", creating it if necessary.
+
+        Args:
+            connection: connection (session), within which temporary table is used
+            key: identifies purpose of temporary table (tables with different purposes are separate)
+            create_fn: creates temporary table on given connection
+
+        Returns:
+            Temporary table, which exists within "connection".
+        """  # noqa: E501
+        with self._lock:
+            registered: Tuple[sqlalchemy.Connection, sqlalchemy.Table] | None = (
+                self._temp_tables.get(key)
+            )
+            if registered is not None:
+                registered_connection, temp_table = registered
+                if registered_connection is connection and not connection.closed:
+                    return temp_table
+
+            temp_table = create_fn(connection)
+            self._temp_tables[key] = (connection, temp_table)
+            return temp_table
+
+    def drop_all(self) -> None:
+        """Drops registered temporary tables (whose connections are open) and empties registry."""
+        with self._lock:
+            connection: sqlalchemy.Connection
+            temp_table: sqlalchemy.Table
+            for connection, temp_table in self._temp_tables.values():
+                if connection.closed:
+                    continue
+
+                try:
+                    if connection.in_transaction():
+                        temp_table.drop(bind=connection, checkfirst=True)
+                    else:
+                        with connection.begin():
+                            temp_table.drop(bind=connection, checkfirst=True)
+                except sqlalchemy.SQLAlchemyError as e:
+                    logger.debug(f"Unable to drop temporary table {temp_table.name}: {e!r}")
+
+            self._temp_tables.clear()
+
+    def __len__(self) -> int:
+        return len(self._temp_tables)
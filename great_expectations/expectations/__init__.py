@@ -1,59 +1,124 @@
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
 from great_expectations.expectations.expectation import Expectation
 
-from .core import (
-    ExpectColumnDistinctValuesToBeInSet,
-    ExpectColumnDistinctValuesToContainSet,
-    ExpectColumnDistinctValuesToEqualSet,
-    ExpectColumnKLDivergenceToBeLessThan,
-    ExpectColumnMaxToBeBetween,
-    ExpectColumnMeanToBeBetween,
-    ExpectColumnMedianToBeBetween,
-    ExpectColumnMinToBeBetween,
-    ExpectColumnMostCommonValueToBeInSet,
-    ExpectColumnPairValuesAToBeGreaterThanB,
-    ExpectColumnPairValuesToBeEqual,
-    ExpectColumnPairValuesToBeInSet,
-    ExpectColumnProportionOfUniqueValuesToBeBetween,
-    ExpectColumnQuantileValuesToBeBetween,
-    ExpectColumnStdevToBeBetween,
-    ExpectColumnSumToBeBetween,
-    ExpectColumnToExist,
-    ExpectColumnUniqueValueCountToBeBetween,
-    ExpectColumnValueLengthsToBeBetween,
-    ExpectColumnValueLengthsToEqual,
-    ExpectColumnValuesToBeBetween,
-    ExpectColumnValuesToBeDateutilParseable,
-    ExpectColumnValuesToBeDecreasing,
-    ExpectColumnValuesToBeIncreasing,
-    ExpectColumnValuesToBeInSet,
-    ExpectColumnValuesToBeInTypeList,
-    ExpectColumnValuesToBeJsonParseable,
-    ExpectColumnValuesToBeNull,
-    ExpectColumnValuesToBeOfType,
-    ExpectColumnValuesToBeUnique,
-    ExpectColumnValuesToMatchJsonSchema,
-    ExpectColumnValuesToMatchLikePattern,
-    ExpectColumnValuesToMatchLikePatternList,
-    ExpectColumnValuesToMatchRegex,
-    ExpectColumnValuesToMatchRegexList,
-    ExpectColumnValuesToMatchStrftimeFormat,
-    ExpectColumnValuesToNotBeInSet,
-    ExpectColumnValuesToNotBeNull,
-    ExpectColumnValuesToNotMatchLikePattern,
-    ExpectColumnValuesToNotMatchLikePatternList,
-    ExpectColumnValuesToNotMatchRegex,
-    ExpectColumnValuesToNotMatchRegexList,
-    ExpectColumnValueZScoresToBeLessThan,
-    ExpectCompoundColumnsToBeUnique,
-    ExpectMulticolumnSumToEqual,
-    ExpectMulticolumnValuesToBeUnique,
-    ExpectSelectColumnValuesToBeUniqueWithinRecord,
-    ExpectTableColumnCountToBeBetween,
-    ExpectTableColumnCountToEqual,
-    ExpectTableColumnsToMatchOrderedList,
-    ExpectTableColumnsToMatchSet,
-    ExpectTableRowCountToBeBetween,
-    ExpectTableRowCountToEqual,
-    ExpectTableRowCountToEqualOtherTable,
-    UnexpectedRowsExpectation,
-)
+if TYPE_CHECKING:
+    from .core import (
+        ExpectColumnDistinctValuesToBeInSet,
+        ExpectColumnDistinctValuesToContainSet,
+        ExpectColumnDistinctValuesToEqualSet,
+        ExpectColumnKLDivergenceToBeLessThan,
+        ExpectColumnMaxToBeBetween,
+        ExpectColumnMeanToBeBetween,
+        ExpectColumnMedianToBeBetween,
+        ExpectColumnMinToBeBetween,
+        ExpectColumnMostCommonValueToBeInSet,
+        ExpectColumnPairValuesAToBeGreaterThanB,
+        ExpectColumnPairValuesToBeEqual,
+        ExpectColumnPairValuesToBeInSet,
+        ExpectColumnProportionOfUniqueValuesToBeBetween,
+        ExpectColumnQuantileValuesToBeBetween,
+        ExpectColumnStdevToBeBetween,
+        ExpectColumnSumToBeBetween,
+        ExpectColumnToExist,
+        ExpectColumnUniqueValueCountToBeBetween,
+        ExpectColumnValueLengthsToBeBetween,
+        ExpectColumnValueLengthsToEqual,
+        ExpectColumnValuesToBeBetween,
+        ExpectColumnValuesToBeDateutilParseable,
+        ExpectColumnValuesToBeDecreasing,
+        ExpectColumnValuesToBeIncreasing,
+        ExpectColumnValuesToBeInSet,
+        ExpectColumnValuesToBeInTypeList,
+        ExpectColumnValuesToBeJsonParseable,
+        ExpectColumnValuesToBeNull,
+        ExpectColumnValuesToBeOfType,
+        ExpectColumnValuesToBeUnique,
+        ExpectColumnValuesToMatchJsonSchema,
+        ExpectColumnValuesToMatchLikePattern,
+        ExpectColumnValuesToMatchLikePatternList,
+        ExpectColumnValuesToMatchRegex,
+        ExpectColumnValuesToMatchRegexList,
+        ExpectColumnValuesToMatchStrftimeFormat,
+        ExpectColumnValuesToNotBeInSet,
+        ExpectColumnValuesToNotBeNull,
+        ExpectColumnValuesToNotMatchLikePattern,
+        ExpectColumnValuesToNotMatchLikePatternList,
+        ExpectColumnValuesToNotMatchRegex,
+        ExpectColumnValuesToNotMatchRegexList,
+        ExpectColumnValueZScoresToBeLessThan,
+        ExpectCompoundColumnsToBeUnique,
+        ExpectMulticolumnSumToEqual,
+        ExpectMulticolumnValuesToBeUnique,
+        ExpectSelectColumnValuesToBeUniqueWithinRecord,
+        ExpectTableColumnCountToBeBetween,
+        ExpectTableColumnCountToEqual,
+        ExpectTableColumnsToMatchOrderedList,
+        ExpectTableColumnsToMatchSet,
+        ExpectTableRowCountToBeBetween,
+        ExpectTableRowCountToEqual,
+        ExpectTableRowCountToEqualOtherTable,
+        UnexpectedRowsExpectation,
+    )
+
+# Core Expectations are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "ExpectColumnDistinctValuesToBeInSet": ".core",
+    "ExpectColumnDistinctValuesToContainSet": ".core",
+    "ExpectColumnDistinctValuesToEqualSet": ".core",
+    "ExpectColumnKLDivergenceToBeLessThan": ".core",
+    "ExpectColumnMaxToBeBetween": ".core",
+    "ExpectColumnMeanToBeBetween": ".core",
+    "ExpectColumnMedianToBeBetween": ".core",
+    "ExpectColumnMinToBeBetween": ".core",
+    "ExpectColumnMostCommonValueToBeInSet": ".core",
+    "ExpectColumnPairValuesAToBeGreaterThanB": ".core",
+    "ExpectColumnPairValuesToBeEqual": ".core",
+    "ExpectColumnPairValuesToBeInSet": ".core",
+    "ExpectColumnProportionOfUniqueValuesToBeBetween": ".core",
+    "ExpectColumnQuantileValuesToBeBetween": ".core",
+    "ExpectColumnStdevToBeBetween": ".core",
+    "ExpectColumnSumToBeBetween": ".core",
+    "ExpectColumnToExist": ".core",
+    "ExpectColumnUniqueValueCountToBeBetween": ".core",
+    "ExpectColumnValueLengthsToBeBetween": ".core",
+    "ExpectColumnValueLengthsToEqual": ".core",
+    "ExpectColumnValuesToBeBetween": ".core",
+    "ExpectColumnValuesToBeDateutilParseable": ".core",
+    "ExpectColumnValuesToBeDecreasing": ".core",
+    "ExpectColumnValuesToBeIncreasing": ".core",
+    "ExpectColumnValuesToBeInSet": ".core",
+    "ExpectColumnValuesToBeInTypeList": ".core",
+    "ExpectColumnValuesToBeJsonParseable": ".core",
+    "ExpectColumnValuesToBeNull": ".core",
+    "ExpectColumnValuesToBeOfType": ".core",
+    "ExpectColumnValuesToBeUnique": ".core",
+    "ExpectColumnValuesToMatchJsonSchema": ".core",
+    "ExpectColumnValuesToMatchLikePattern": ".core",
+    "ExpectColumnValuesToMatchLikePatternList": ".core",
+    "ExpectColumnValuesToMatchRegex": ".core",
+    "ExpectColumnValuesToMatchRegexList": ".core",
+    "ExpectColumnValuesToMatchStrftimeFormat": ".core",
+    "ExpectColumnValuesToNotBeInSet": ".core",
+    "ExpectColumnValuesToNotBeNull": ".core",
+    "ExpectColumnValuesToNotMatchLikePattern": ".core",
+    "ExpectColumnValuesToNotMatchLikePatternList": ".core",
+    "ExpectColumnValuesToNotMatchRegex": ".core",
+    "ExpectColumnValuesToNotMatchRegexList": ".core",
+    "ExpectColumnValueZScoresToBeLessThan": ".core",
+    "ExpectCompoundColumnsToBeUnique": ".core",
+    "ExpectMulticolumnSumToEqual": ".core",
+    "ExpectMulticolumnValuesToBeUnique": ".core",
+    "ExpectSelectColumnValuesToBeUniqueWithinRecord": ".core",
+    "ExpectTableColumnCountToBeBetween": ".core",
+    "ExpectTableColumnCountToEqual": ".core",
+    "ExpectTableColumnsToMatchOrderedList": ".core",
+    "ExpectTableColumnsToMatchSet": ".core",
+    "ExpectTableRowCountToBeBetween": ".core",
+    "ExpectTableRowCountToEqual": ".core",
+    "ExpectTableRowCountToEqualOtherTable": ".core",
+    "UnexpectedRowsExpectation": ".core",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+
+def get_lazy_export_functions(
+    package_name: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns "__getattr__" and "__dir__" of package, whose exports are imported on first access.
+
+    Args:
+        package_name: Name of package ("__name__" of its "__init__" module).
+        exports: Names of exported objects, mapped to (relative) names of modules that define them.
+
+    Returns:
+        Module-level "__getattr__" (importing module of exported object, when first accessed) and "__dir__" functions.
+    """  # noqa: E501
+
+    def __getattr__(name: str) -> Any:
+        module_name: str | None = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")  # noqa: TRY003
+
+        value: Any = getattr(importlib.import_module(module_name, package_name), name)
+        # Once imported, object is found by regular attribute lookup (bypassing "__getattr__").
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def iter_lazy_export_modules(package_name: str) -> Iterator[str]:
+    """Imports modules of all lazy exports of package, one at a time (recursing into lazily exporting subpackages).
+
+    Args:
+        package_name: Name of package, whose "__init__" module maps its exports to modules in "_EXPORTS".
+
+    Yields:
+        Name of every (non-package) module, right after importing it.
+    """  # noqa: E501
+    package = importlib.import_module(package_name)
+    module_names: Dict[str, None] = dict.fromkeys(
+        importlib.util.resolve_name(module_name, package_name)
+        for module_name in package._EXPORTS.values()
+    )
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        if hasattr(module, "__path__") and hasattr(module, "_EXPORTS"):
+            yield from iter_lazy_export_modules(module_name)
+        else:
+            yield module_name
+
+
+def import_lazy_exports(package_name: str) -> List[str]:
+    """Imports modules of all lazy exports of package; returns their names (in order of import)."""
+    return list(iter_lazy_export_modules(package_name))
@@ -1,101 +1,167 @@
-from .expect_column_distinct_values_to_be_in_set import (
-    ExpectColumnDistinctValuesToBeInSet,
-)
-from .expect_column_distinct_values_to_contain_set import (
-    ExpectColumnDistinctValuesToContainSet,
-)
-from .expect_column_distinct_values_to_equal_set import (
-    ExpectColumnDistinctValuesToEqualSet,
-)
-from .expect_column_kl_divergence_to_be_less_than import (
-    ExpectColumnKLDivergenceToBeLessThan,
-)
-from .expect_column_max_to_be_between import ExpectColumnMaxToBeBetween
-from .expect_column_mean_to_be_between import ExpectColumnMeanToBeBetween
-from .expect_column_median_to_be_between import ExpectColumnMedianToBeBetween
-from .expect_column_min_to_be_between import ExpectColumnMinToBeBetween
-from .expect_column_most_common_value_to_be_in_set import (
-    ExpectColumnMostCommonValueToBeInSet,
-)
-from .expect_column_pair_values_a_to_be_greater_than_b import (
-    ExpectColumnPairValuesAToBeGreaterThanB,
-)
-from .expect_column_pair_values_to_be_equal import ExpectColumnPairValuesToBeEqual
-from .expect_column_pair_values_to_be_in_set import ExpectColumnPairValuesToBeInSet
-from .expect_column_proportion_of_unique_values_to_be_between import (
-    ExpectColumnProportionOfUniqueValuesToBeBetween,
-)
-from .expect_column_quantile_values_to_be_between import (
-    ExpectColumnQuantileValuesToBeBetween,
-)
-from .expect_column_stdev_to_be_between import ExpectColumnStdevToBeBetween
-from .expect_column_sum_to_be_between import ExpectColumnSumToBeBetween
-from .expect_column_to_exist import ExpectColumnToExist
-from .expect_column_unique_value_count_to_be_between import (
-    ExpectColumnUniqueValueCountToBeBetween,
-)
-from .expect_column_value_lengths_to_be_between import (
-    ExpectColumnValueLengthsToBeBetween,
-)
-from .expect_column_value_lengths_to_equal import ExpectColumnValueLengthsToEqual
-from .expect_column_value_z_scores_to_be_less_than import (
-    ExpectColumnValueZScoresToBeLessThan,
-)
-from .expect_column_values_to_be_between import ExpectColumnValuesToBeBetween
-from .expect_column_values_to_be_dateutil_parseable import (
-    ExpectColumnValuesToBeDateutilParseable,
-)
-from .expect_column_values_to_be_decreasing import ExpectColumnValuesToBeDecreasing
-from .expect_column_values_to_be_in_set import ExpectColumnValuesToBeInSet
-from .expect_column_values_to_be_in_type_list import ExpectColumnValuesToBeInTypeList
-from .expect_column_values_to_be_increasing import ExpectColumnValuesToBeIncreasing
-from .expect_column_values_to_be_json_parseable import (
-    ExpectColumnValuesToBeJsonParseable,
-)
-from .expect_column_values_to_be_null import ExpectColumnValuesToBeNull
-from .expect_column_values_to_be_of_type import ExpectColumnValuesToBeOfType
-from .expect_column_values_to_be_unique import ExpectColumnValuesToBeUnique
-from .expect_column_values_to_match_json_schema import (
-    ExpectColumnValuesToMatchJsonSchema,
-)
-from .expect_column_values_to_match_like_pattern import (
-    ExpectColumnValuesToMatchLikePattern,
-)
-from .expect_column_values_to_match_like_pattern_list import (
-    ExpectColumnValuesToMatchLikePatternList,
-)
-from .expect_column_values_to_match_regex import ExpectColumnValuesToMatchRegex
-from .expect_column_values_to_match_regex_list import ExpectColumnValuesToMatchRegexList
-from .expect_column_values_to_match_strftime_format import (
-    ExpectColumnValuesToMatchStrftimeFormat,
-)
-from .expect_column_values_to_not_be_in_set import ExpectColumnValuesToNotBeInSet
-from .expect_column_values_to_not_be_null import ExpectColumnValuesToNotBeNull
-from .expect_column_values_to_not_match_like_pattern import (
-    ExpectColumnValuesToNotMatchLikePattern,
-)
-from .expect_column_values_to_not_match_like_pattern_list import (
-    ExpectColumnValuesToNotMatchLikePatternList,
-)
-from .expect_column_values_to_not_match_regex import ExpectColumnValuesToNotMatchRegex
-from .expect_column_values_to_not_match_regex_list import (
-    ExpectColumnValuesToNotMatchRegexList,
-)
-from .expect_compound_columns_to_be_unique import ExpectCompoundColumnsToBeUnique
-from .expect_multicolumn_sum_to_equal import ExpectMulticolumnSumToEqual
-from .expect_multicolumn_values_to_be_unique import ExpectMulticolumnValuesToBeUnique
-from .expect_select_column_values_to_be_unique_within_record import (
-    ExpectSelectColumnValuesToBeUniqueWithinRecord,
-)
-from .expect_table_column_count_to_be_between import ExpectTableColumnCountToBeBetween
-from .expect_table_column_count_to_equal import ExpectTableColumnCountToEqual
-from .expect_table_columns_to_match_ordered_list import (
-    ExpectTableColumnsToMatchOrderedList,
-)
-from .expect_table_columns_to_match_set import ExpectTableColumnsToMatchSet
-from .expect_table_row_count_to_be_between import ExpectTableRowCountToBeBetween
-from .expect_table_row_count_to_equal import ExpectTableRowCountToEqual
-from .expect_table_row_count_to_equal_other_table import (
-    ExpectTableRowCountToEqualOtherTable,
-)
-from .unexpected_rows_expectation import UnexpectedRowsExpectation
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
+if TYPE_CHECKING:
+    from .expect_column_distinct_values_to_be_in_set import (
+        ExpectColumnDistinctValuesToBeInSet,
+    )
+    from .expect_column_distinct_values_to_contain_set import (
+        ExpectColumnDistinctValuesToContainSet,
+    )
+    from .expect_column_distinct_values_to_equal_set import (
+        ExpectColumnDistinctValuesToEqualSet,
+    )
+    from .expect_column_kl_divergence_to_be_less_than import (
+        ExpectColumnKLDivergenceToBeLessThan,
+    )
+    from .expect_column_max_to_be_between import ExpectColumnMaxToBeBetween
+    from .expect_column_mean_to_be_between import ExpectColumnMeanToBeBetween
+    from .expect_column_median_to_be_between import ExpectColumnMedianToBeBetween
+    from .expect_column_min_to_be_between import ExpectColumnMinToBeBetween
+    from .expect_column_most_common_value_to_be_in_set import (
+        ExpectColumnMostCommonValueToBeInSet,
+    )
+    from .expect_column_pair_values_a_to_be_greater_than_b import (
+        ExpectColumnPairValuesAToBeGreaterThanB,
+    )
+    from .expect_column_pair_values_to_be_equal import ExpectColumnPairValuesToBeEqual
+    from .expect_column_pair_values_to_be_in_set import ExpectColumnPairValuesToBeInSet
+    from .expect_column_proportion_of_unique_values_to_be_between import (
+        ExpectColumnProportionOfUniqueValuesToBeBetween,
+    )
+    from .expect_column_quantile_values_to_be_between import (
+        ExpectColumnQuantileValuesToBeBetween,
+    )
+    from .expect_column_stdev_to_be_between import ExpectColumnStdevToBeBetween
+    from .expect_column_sum_to_be_between import ExpectColumnSumToBeBetween
+    from .expect_column_to_exist import ExpectColumnToExist
+    from .expect_column_unique_value_count_to_be_between import (
+        ExpectColumnUniqueValueCountToBeBetween,
+    )
+    from .expect_column_value_lengths_to_be_between import (
+        ExpectColumnValueLengthsToBeBetween,
+    )
+    from .expect_column_value_lengths_to_equal import ExpectColumnValueLengthsToEqual
+    from .expect_column_value_z_scores_to_be_less_than import (
+        ExpectColumnValueZScoresToBeLessThan,
+    )
+    from .expect_column_values_to_be_between import ExpectColumnValuesToBeBetween
+    from .expect_column_values_to_be_dateutil_parseable import (
+        ExpectColumnValuesToBeDateutilParseable,
+    )
+    from .expect_column_values_to_be_decreasing import ExpectColumnValuesToBeDecreasing
+    from .expect_column_values_to_be_in_set import ExpectColumnValuesToBeInSet
+    from .expect_column_values_to_be_in_type_list import ExpectColumnValuesToBeInTypeList
+    from .expect_column_values_to_be_increasing import ExpectColumnValuesToBeIncreasing
+    from .expect_column_values_to_be_json_parseable import (
+        ExpectColumnValuesToBeJsonParseable,
+    )
+    from .expect_column_values_to_be_null import ExpectColumnValuesToBeNull
+    from .expect_column_values_to_be_of_type import ExpectColumnValuesToBeOfType
+    from .expect_column_values_to_be_unique import ExpectColumnValuesToBeUnique
+    from .expect_column_values_to_match_json_schema import (
+        ExpectColumnValuesToMatchJsonSchema,
+    )
+    from .expect_column_values_to_match_like_pattern import (
+        ExpectColumnValuesToMatchLikePattern,
+    )
+    from .expect_column_values_to_match_like_pattern_list import (
+        ExpectColumnValuesToMatchLikePatternList,
+    )
+    from .expect_column_values_to_match_regex import ExpectColumnValuesToMatchRegex
+    from .expect_column_values_to_match_regex_list import ExpectColumnValuesToMatchRegexList
+    from .expect_column_values_to_match_strftime_format import (
+        ExpectColumnValuesToMatchStrftimeFormat,
+    )
+    from .expect_column_values_to_not_be_in_set import ExpectColumnValuesToNotBeInSet
+    from .expect_column_values_to_not_be_null import ExpectColumnValuesToNotBeNull
+    from .expect_column_values_to_not_match_like_pattern import (
+        ExpectColumnValuesToNotMatchLikePattern,
+    )
+    from .expect_column_values_to_not_match_like_pattern_list import (
+        ExpectColumnValuesToNotMatchLikePatternList,
+    )
+    from .expect_column_values_to_not_match_regex import ExpectColumnValuesToNotMatchRegex
+    from .expect_column_values_to_not_match_regex_list import (
+        ExpectColumnValuesToNotMatchRegexList,
+    )
+    from .expect_compound_columns_to_be_unique import ExpectCompoundColumnsToBeUnique
+    from .expect_multicolumn_sum_to_equal import ExpectMulticolumnSumToEqual
+    from .expect_multicolumn_values_to_be_unique import ExpectMulticolumnValuesToBeUnique
+    from .expect_select_column_values_to_be_unique_within_record import (
+        ExpectSelectColumnValuesToBeUniqueWithinRecord,
+    )
+    from .expect_table_column_count_to_be_between import ExpectTableColumnCountToBeBetween
+    from .expect_table_column_count_to_equal import ExpectTableColumnCountToEqual
+    from .expect_table_columns_to_match_ordered_list import (
+        ExpectTableColumnsToMatchOrderedList,
+    )
+    from .expect_table_columns_to_match_set import ExpectTableColumnsToMatchSet
+    from .expect_table_row_count_to_be_between import ExpectTableRowCountToBeBetween
+    from .expect_table_row_count_to_equal import ExpectTableRowCountToEqual
+    from .expect_table_row_count_to_equal_other_table import (
+        ExpectTableRowCountToEqualOtherTable,
+    )
+    from .unexpected_rows_expectation import UnexpectedRowsExpectation
+
+# Expectations are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "ExpectColumnDistinctValuesToBeInSet": ".expect_column_distinct_values_to_be_in_set",
+    "ExpectColumnDistinctValuesToContainSet": ".expect_column_distinct_values_to_contain_set",
+    "ExpectColumnDistinctValuesToEqualSet": ".expect_column_distinct_values_to_equal_set",
+    "ExpectColumnKLDivergenceToBeLessThan": ".expect_column_kl_divergence_to_be_less_than",
+    "ExpectColumnMaxToBeBetween": ".expect_column_max_to_be_between",
+    "ExpectColumnMeanToBeBetween": ".expect_column_mean_to_be_between",
+    "ExpectColumnMedianToBeBetween": ".expect_column_median_to_be_between",
+    "ExpectColumnMinToBeBetween": ".expect_column_min_to_be_between",
+    "ExpectColumnMostCommonValueToBeInSet": ".expect_column_most_common_value_to_be_in_set",
+    "ExpectColumnPairValuesAToBeGreaterThanB": ".expect_column_pair_values_a_to_be_greater_than_b",
+    "ExpectColumnPairValuesToBeEqual": ".expect_column_pair_values_to_be_equal",
+    "ExpectColumnPairValuesToBeInSet": ".expect_column_pair_values_to_be_in_set",
+    "ExpectColumnProportionOfUniqueValuesToBeBetween": ".expect_column_proportion_of_unique_values_to_be_between",  # noqa: E501
+    "ExpectColumnQuantileValuesToBeBetween": ".expect_column_quantile_values_to_be_between",
+    "ExpectColumnStdevToBeBetween": ".expect_column_stdev_to_be_between",
+    "ExpectColumnSumToBeBetween": ".expect_column_sum_to_be_between",
+    "ExpectColumnToExist": ".expect_column_to_exist",
+    "ExpectColumnUniqueValueCountToBeBetween": ".expect_column_unique_value_count_to_be_between",
+    "ExpectColumnValueLengthsToBeBetween": ".expect_column_value_lengths_to_be_between",
+    "ExpectColumnValueLengthsToEqual": ".expect_column_value_lengths_to_equal",
+    "ExpectColumnValueZScoresToBeLessThan": ".expect_column_value_z_scores_to_be_less_than",
+    "ExpectColumnValuesToBeBetween": ".expect_column_values_to_be_between",
+    "ExpectColumnValuesToBeDateutilParseable": ".expect_column_values_to_be_dateutil_parseable",
+    "ExpectColumnValuesToBeDecreasing": ".expect_column_values_to_be_decreasing",
+    "ExpectColumnValuesToBeInSet": ".expect_column_values_to_be_in_set",
+    "ExpectColumnValuesToBeInTypeList": ".expect_column_values_to_be_in_type_list",
+    "ExpectColumnValuesToBeIncreasing": ".expect_column_values_to_be_increasing",
+    "ExpectColumnValuesToBeJsonParseable": ".expect_column_values_to_be_json_parseable",
+    "ExpectColumnValuesToBeNull": ".expect_column_values_to_be_null",
+    "ExpectColumnValuesToBeOfType": ".expect_column_values_to_be_of_type",
+    "ExpectColumnValuesToBeUnique": ".expect_column_values_to_be_unique",
+    "ExpectColumnValuesToMatchJsonSchema": ".expect_column_values_to_match_json_schema",
+    "ExpectColumnValuesToMatchLikePattern": ".expect_column_values_to_match_like_pattern",
+    "ExpectColumnValuesToMatchLikePatternList": ".expect_column_values_to_match_like_pattern_list",
+    "ExpectColumnValuesToMatchRegex": ".expect_column_values_to_match_regex",
+    "ExpectColumnValuesToMatchRegexList": ".expect_column_values_to_match_regex_list",
+    "ExpectColumnValuesToMatchStrftimeFormat": ".expect_column_values_to_match_strftime_format",
+    "ExpectColumnValuesToNotBeInSet": ".expect_column_values_to_not_be_in_set",
+    "ExpectColumnValuesToNotBeNull": ".expect_column_values_to_not_be_null",
+    "ExpectColumnValuesToNotMatchLikePattern": ".expect_column_values_to_not_match_like_pattern",
+    "ExpectColumnValuesToNotMatchLikePatternList": ".expect_column_values_to_not_match_like_pattern_list",  # noqa: E501
+    "ExpectColumnValuesToNotMatchRegex": ".expect_column_values_to_not_match_regex",
+    "ExpectColumnValuesToNotMatchRegexList": ".expect_column_values_to_not_match_regex_list",
+    "ExpectCompoundColumnsToBeUnique": ".expect_compound_columns_to_be_unique",
+    "ExpectMulticolumnSumToEqual": ".expect_multicolumn_sum_to_equal",
+    "ExpectMulticolumnValuesToBeUnique": ".expect_multicolumn_values_to_be_unique",
+    "ExpectSelectColumnValuesToBeUniqueWithinRecord": ".expect_select_column_values_to_be_unique_within_record",  # noqa: E501
+    "ExpectTableColumnCountToBeBetween": ".expect_table_column_count_to_be_between",
+    "ExpectTableColumnCountToEqual": ".expect_table_column_count_to_equal",
+    "ExpectTableColumnsToMatchOrderedList": ".expect_table_columns_to_match_ordered_list",
+    "ExpectTableColumnsToMatchSet": ".expect_table_columns_to_match_set",
+    "ExpectTableRowCountToBeBetween": ".expect_table_row_count_to_be_between",
+    "ExpectTableRowCountToEqual": ".expect_table_row_count_to_equal",
+    "ExpectTableRowCountToEqualOtherTable": ".expect_table_row_count_to_equal_other_table",
+    "UnexpectedRowsExpectation": ".unexpected_rows_expectation",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
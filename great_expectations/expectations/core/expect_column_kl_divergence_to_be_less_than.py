@@ -400,6 +400,13 @@ class ExpectColumnKLDivergenceToBeLessThan(ColumnAggregateExpectation):
                 }
             )
 
+    def _get_validation_dependencies_depend_on_batch_data(self) -> bool:
+        # Histogram bins are computed from Batch data, unless "partition_object" is given.
+        configuration = self.configuration
+        return configuration.kwargs.get("partition_object") is None and bool(
+            configuration.kwargs.get("bucketize_data", self._get_default_value("bucketize_data"))
+        )
+
     def get_validation_dependencies(
         self,
         execution_engine: Optional[ExecutionEngine] = None,
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Type, Union
 
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.quantile_sketch import QUANTILE_SKETCH_RELATIVE_ERROR
 from great_expectations.core.suite_parameters import (
     SuiteParameterDict,  # noqa: TCH001
 )
@@ -24,16 +25,21 @@ from great_expectations.render.util import (
     parse_row_condition_string_pandas_engine,
     substitute_none_for_missing,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.core import (
         ExpectationValidationResult,
     )
+    from great_expectations.core.quantile_sketch import KLLSketch
     from great_expectations.execution_engine import ExecutionEngine
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
     from great_expectations.render.renderer_configuration import AddParamArgs
+    from great_expectations.validator.validator import (
+        ValidationDependencies,
+    )
 
 EXPECTATION_SHORT_DESCRIPTION = (
     "Expect the column median to be between a minimum value and a maximum value."
@@ -46,6 +52,13 @@ STRICT_MIN_DESCRIPTION = (
 STRICT_MAX_DESCRIPTION = (
     "If True, the column median must be strictly smaller than max_value, default=False"
 )
+ALLOW_RELATIVE_ERROR_DESCRIPTION = (
+    "If 'sketch', the median of a numeric column is approximated (on every backend) by a "
+    "mergeable quantile sketch, built in one pass over the column, as the lower median; the bound "
+    "on its rank error is reported. On SQL backends, every non-null value is streamed to the "
+    "client to be sketched, which can be slower than computing the exact median in the database. "
+    "Otherwise, the exact median is computed, default=False"
+)
 SUPPORTED_DATA_SOURCES = [
     "Pandas",
     "Spark",
@@ -81,6 +94,8 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             {STRICT_MIN_DESCRIPTION}
         strict_max (boolean): \
             {STRICT_MAX_DESCRIPTION}
+        allow_relative_error (boolean or string): \
+            {ALLOW_RELATIVE_ERROR_DESCRIPTION}
 
     Other Parameters:
         result_format (str or None): \
@@ -184,6 +199,9 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
     )
     strict_min: bool = pydantic.Field(default=False, description=STRICT_MAX_DESCRIPTION)
     strict_max: bool = pydantic.Field(default=False, description=STRICT_MIN_DESCRIPTION)
+    allow_relative_error: Union[bool, str] = pydantic.Field(
+        default=False, description=ALLOW_RELATIVE_ERROR_DESCRIPTION
+    )
 
     library_metadata: ClassVar[Dict[str, Union[str, list, bool]]] = {
         "maturity": "production",
@@ -197,11 +215,13 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\  # noqa: E501
     metric_dependencies = ("column.median",)
+    _validation_dependencies_depend_on_batch_data: ClassVar[Optional[bool]] = False
     success_keys = (
         "min_value",
         "strict_min",
         "max_value",
         "strict_max",
+        "allow_relative_error",
     )
 
     args_keys = (
@@ -210,6 +230,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "max_value",
         "strict_min",
         "strict_max",
+        "allow_relative_error",
     )
 
     class Config:
@@ -357,6 +378,33 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             )
         ]
 
+    @override
+    def get_validation_dependencies(
+        self,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationDependencies:
+        validation_dependencies: ValidationDependencies = super().get_validation_dependencies(
+            execution_engine, runtime_configuration
+        )
+        median_metric: MetricConfiguration = validation_dependencies.get_metric_configuration(
+            metric_name="column.median"
+        )
+        # sketch itself is needed for its bound on rank error of median
+        if (
+            median_metric.metric_value_kwargs.get("allow_relative_error")
+            == QUANTILE_SKETCH_RELATIVE_ERROR
+        ):
+            validation_dependencies.set_metric_configuration(
+                metric_name="column.quantile_sketch",
+                metric_configuration=MetricConfiguration(
+                    metric_name="column.quantile_sketch",
+                    metric_domain_kwargs=median_metric.metric_domain_kwargs,
+                ),
+            )
+
+        return validation_dependencies
+
     @override
     def _validate(
         self,
@@ -364,9 +412,20 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
+        validation_result: Dict[str, Any] = self._validate_metric_value_between(
             metric_name="column.median",
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+
+        sketch: Optional[KLLSketch] = metrics.get("column.quantile_sketch")
+        if sketch is not None:
+            validation_result["result"]["details"] = {
+                "quantile_sketch": {
+                    "normalized_rank_error": sketch.normalized_rank_error,
+                    "n": sketch.n,
+                }
+            }
+
+        return validation_result
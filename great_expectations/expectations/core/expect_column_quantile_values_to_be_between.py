@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Type, Uni
 import numpy as np
 
 from great_expectations.compatibility import pydantic
+from great_expectations.core.quantile_sketch import QUANTILE_SKETCH_RELATIVE_ERROR
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.expectations.expectation import (
     COLUMN_DESCRIPTION,
@@ -35,11 +36,13 @@ from great_expectations.render.util import (
     substitute_none_for_missing,
 )
 from great_expectations.util import isclose
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.core import (
         ExpectationValidationResult,
     )
+    from great_expectations.core.quantile_sketch import KLLSketch
     from great_expectations.execution_engine import ExecutionEngine
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
@@ -66,7 +69,11 @@ QUANTILE_RANGES_DESCRIPTION = (
 )
 ALLOW_RELATIVE_ERROR_DESCRIPTION = (
     "Whether to allow relative error in quantile "
-    "communications on backends that support or require it."
+    "communications on backends that support or require it. "
+    "If 'sketch', quantiles of a numeric column are approximated (on every backend) by a mergeable "
+    "quantile sketch, built in one pass over the column, and the bound on their rank error is "
+    "reported. On SQL backends, every non-null value is streamed to the client to be sketched, "
+    "which can be slower than computing exact quantiles in the database."
 )
 SUPPORTED_DATA_SOURCES = ["Pandas", "Spark", "SQLite", "PostgreSQL", "MySQL", "MSSQL", "Redshift"]
 DATA_QUALITY_ISSUES = ["Numerical data"]
@@ -253,6 +260,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
     _library_metadata = library_metadata
 
     metric_dependencies = ("column.quantile_values",)
+    _validation_dependencies_depend_on_batch_data: ClassVar[Optional[bool]] = False
     success_keys = (
         "quantile_ranges",
         "allow_relative_error",
@@ -706,10 +714,26 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             execution_engine, runtime_configuration
         )
         configuration = self.configuration
+        quantile_values_metric: MetricConfiguration = (
+            validation_dependencies.get_metric_configuration(metric_name="column.quantile_values")
+        )
         # column.quantile_values expects a "quantiles" key
-        validation_dependencies.get_metric_configuration(
-            metric_name="column.quantile_values"
-        ).metric_value_kwargs["quantiles"] = configuration.kwargs["quantile_ranges"]["quantiles"]
+        quantile_values_metric.metric_value_kwargs["quantiles"] = configuration.kwargs[
+            "quantile_ranges"
+        ]["quantiles"]
+        # sketch itself is needed for its bound on rank error of quantiles
+        if (
+            quantile_values_metric.metric_value_kwargs.get("allow_relative_error")
+            == QUANTILE_SKETCH_RELATIVE_ERROR
+        ):
+            validation_dependencies.set_metric_configuration(
+                metric_name="column.quantile_sketch",
+                metric_configuration=MetricConfiguration(
+                    metric_name="column.quantile_sketch",
+                    metric_domain_kwargs=quantile_values_metric.metric_domain_kwargs,
+                ),
+            )
+
         return validation_dependencies
 
     def _validate(
@@ -746,10 +770,18 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details: dict = {"success_details": success_details}
+        sketch: Optional[KLLSketch] = metrics.get("column.quantile_sketch")
+        if sketch is not None:
+            details["quantile_sketch"] = {
+                "normalized_rank_error": sketch.normalized_rank_error,
+                "n": sketch.n,
+            }
+
         return {
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": details,
             },
         }
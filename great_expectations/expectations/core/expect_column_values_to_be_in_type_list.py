@@ -235,6 +235,8 @@ class ExpectColumnValuesToBeInTypeList(ColumnMapExpectation):
         "column",
         "type_list",
     )
+    # Map (rather than aggregate) version of metric is used with pandas if column dtype is "object".
+    _validation_dependencies_depend_on_batch_data: ClassVar[Optional[bool]] = True
 
     class Config:
         title = "Expect column values to be in type list"
@@ -189,6 +189,7 @@ class ExpectColumnValuesToBeNull(ColumnMapExpectation):
 
     map_metric = "column_values.null"
     args_keys = ("column",)
+    _validation_dependencies_depend_on_batch_data: ClassVar[Optional[bool]] = False
 
     class Config:
         title = "Expect column values to be null"
@@ -163,6 +163,7 @@ class ExpectTableRowCountToEqualOtherTable(BatchExpectation):
     metric_dependencies = ("table.row_count",)
     success_keys = ("other_table_name",)
     args_keys = ("other_table_name",)
+    _validation_dependencies_depend_on_batch_data: ClassVar[Optional[bool]] = False
 
     class Config:
         title = "Expect table row count to equal other table"
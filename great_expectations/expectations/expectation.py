@@ -331,6 +331,9 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
 
     expectation_type: ClassVar[str]
     examples: ClassVar[List[dict]] = []
+    # Whether or not metrics required for validation depend on Batch data (e.g., on column types);
+    # if None, it is inferred by "_get_validation_dependencies_depend_on_batch_data()".
+    _validation_dependencies_depend_on_batch_data: ClassVar[Optional[bool]] = None
 
     _save_callback: Union[Callable[[Expectation], Expectation], None] = pydantic.PrivateAttr(
         default=None
@@ -359,6 +362,12 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
             raise ValueError(  # noqa: TRY003
                 "If configuring result format with a dictionary, the key 'result_format' must be present."  # noqa: E501
             )
+        if isinstance(result_format, dict) and not isinstance(
+            result_format.get("return_unexpected_index_list_as_columns", False), bool
+        ):
+            raise TypeError(  # noqa: TRY003
+                "`return_unexpected_index_list_as_columns` must be either True or False"
+            )
         return result_format
 
     @classmethod
@@ -1063,15 +1072,19 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
         metrics: dict,
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
+        validation_dependencies: Optional[ValidationDependencies] = None,
         **kwargs: dict,
     ) -> ExpectationValidationResult:
         if runtime_configuration is None:
             runtime_configuration = {}
 
-        validation_dependencies: ValidationDependencies = self.get_validation_dependencies(
-            execution_engine=execution_engine,
-            runtime_configuration=runtime_configuration,
-        )
+        # Validation dependencies can be supplied (e.g., by "ValidationPlan"), if already computed.
+        if validation_dependencies is None:
+            validation_dependencies = self.get_validation_dependencies(
+                execution_engine=execution_engine,
+                runtime_configuration=runtime_configuration,
+            )
+
         runtime_configuration["result_format"] = validation_dependencies.result_format
 
         validation_dependencies_metric_configurations: List[MetricConfiguration] = (
@@ -1145,6 +1158,17 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
         result_format = parse_result_format(result_format=result_format)
         return ValidationDependencies(metric_configurations={}, result_format=result_format)
 
+    def _get_validation_dependencies_depend_on_batch_data(self) -> bool:
+        """Returns whether or not metrics required for validation depend on Batch data (e.g., on column types).
+
+        Unless declared by "_validation_dependencies_depend_on_batch_data", Expectations, which override
+        "get_validation_dependencies()" of base classes (e.g., custom ones), are assumed to inspect Batch data.
+        """  # noqa: E501
+        if self._validation_dependencies_depend_on_batch_data is not None:
+            return self._validation_dependencies_depend_on_batch_data
+
+        return type(self).get_validation_dependencies.__module__ != __name__
+
     def _get_default_value(self, key: str) -> Any:
         field = self.__fields__.get(key)
 
@@ -1562,11 +1586,12 @@ class BatchExpectation(Expectation, ABC):
             runtime_configuration=runtime_configuration,
         )
 
+        configuration = self.configuration
         metric_name: str
         for metric_name in self.metric_dependencies:
             metric_kwargs = get_metric_kwargs(
                 metric_name=metric_name,
-                configuration=self.configuration,
+                configuration=configuration,
                 runtime_configuration=runtime_configuration,
             )
             validation_dependencies.set_metric_configuration(
@@ -1874,9 +1899,11 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs: dict
 
+        configuration = self.configuration
+
         metric_kwargs = get_metric_kwargs(
             metric_name=f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1890,7 +1917,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1904,7 +1931,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name="table.row_count",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1928,7 +1955,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1943,7 +1970,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
         if include_unexpected_rows:
             metric_kwargs = get_metric_kwargs(
                 metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
-                configuration=self.configuration,
+                configuration=configuration,
                 runtime_configuration=runtime_configuration,
             )
             validation_dependencies.set_metric_configuration(
@@ -1960,7 +1987,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
 
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -1973,7 +2000,7 @@ class ColumnMapExpectation(BatchExpectation, ABC):
         )
         metric_kwargs = get_metric_kwargs(
             metric_name=f"{self.map_metric}.{SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value}",
-            configuration=self.configuration,
+            configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
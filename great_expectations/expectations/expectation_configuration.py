@@ -60,6 +60,13 @@ def parse_result_format(result_format: Union[str, dict]) -> dict:
                 "When using `include_unexpected_rows`, `result_format` must be explicitly specified"
             )
 
+        if not isinstance(
+            result_format.get("return_unexpected_index_list_as_columns", False), bool
+        ):
+            raise TypeError(  # noqa: TRY003
+                "`return_unexpected_index_list_as_columns` must be either True or False"
+            )
+
         if "partial_unexpected_count" not in result_format:
             result_format["partial_unexpected_count"] = 20
 
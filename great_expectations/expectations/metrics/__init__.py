@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
 from .meta_metric_provider import (  # isort:skip
     MetaMetricProvider,
     DeprecatedMetaMetricProvider,
@@ -8,15 +12,153 @@ from .column_aggregate_metric_provider import (
     column_aggregate_partial,
     column_aggregate_value,
 )
-from .column_aggregate_metrics import *
-from .column_map_metrics import *
-from .column_pair_map_metrics import *
 from .map_metric_provider import (
     ColumnMapMetricProvider,
     MapMetricProvider,
     column_condition_partial,
     column_function_partial,
 )
-from .multicolumn_map_metrics import *
-from .query_metrics import *
-from .table_metrics import *
+
+if TYPE_CHECKING:
+    from .column_aggregate_metrics import (
+        ColumnDistinctValues,
+        ColumnDistinctValuesCount,
+        ColumnDistinctValuesCountUnderThreshold,
+        ColumnHistogram,
+        ColumnMax,
+        ColumnMean,
+        ColumnMedian,
+        ColumnMin,
+        ColumnMostCommonValue,
+        ColumnParameterizedDistributionKSTestPValue,
+        ColumnPartition,
+        ColumnQuantileSketch,
+        ColumnQuantileValues,
+        ColumnStandardDeviation,
+        ColumnSum,
+        ColumnUniqueProportion,
+        ColumnValueCounts,
+        ColumnValuesBetweenCount,
+        ColumnValuesLengthMax,
+        ColumnValuesLengthMin,
+    )
+    from .column_map_metrics import (
+        ColumnValuesBetween,
+        ColumnValuesDateutilParseable,
+        ColumnValuesDecreasing,
+        ColumnValuesIncreasing,
+        ColumnValuesInSet,
+        ColumnValuesInTypeList,
+        ColumnValuesJsonParseable,
+        ColumnValuesMatchJsonSchema,
+        ColumnValuesMatchLikePattern,
+        ColumnValuesMatchLikePatternList,
+        ColumnValuesMatchRegex,
+        ColumnValuesMatchRegexList,
+        ColumnValuesMatchStrftimeFormat,
+        ColumnValuesNonNull,
+        ColumnValuesNotInSet,
+        ColumnValuesNotMatchLikePattern,
+        ColumnValuesNotMatchLikePatternList,
+        ColumnValuesNotMatchRegex,
+        ColumnValuesNotMatchRegexList,
+        ColumnValuesNull,
+        ColumnValuesOfType,
+        ColumnValuesUnique,
+        ColumnValuesValueLength,
+        ColumnValuesValueLengthEquals,
+        ColumnValuesZScore,
+    )
+    from .column_pair_map_metrics import (
+        ColumnPairValuesAGreaterThanB,
+        ColumnPairValuesEqual,
+        ColumnPairValuesInSet,
+    )
+    from .multicolumn_map_metrics import (
+        CompoundColumnsUnique,
+        MulticolumnSumEqual,
+        SelectColumnValuesUniqueWithinRecord,
+    )
+    from .query_metrics import (
+        QueryColumn,
+        QueryColumnPair,
+        QueryMultipleColumns,
+        QueryTable,
+        QueryTemplateValues,
+        UnexpectedRowsQueryTable,
+    )
+    from .table_metrics import (
+        ColumnTypes,
+        TableColumnCount,
+        TableColumns,
+        TableHead,
+        TableRowCount,
+    )
+
+# Core metrics are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "ColumnDistinctValues": ".column_aggregate_metrics",
+    "ColumnDistinctValuesCount": ".column_aggregate_metrics",
+    "ColumnDistinctValuesCountUnderThreshold": ".column_aggregate_metrics",
+    "ColumnHistogram": ".column_aggregate_metrics",
+    "ColumnMax": ".column_aggregate_metrics",
+    "ColumnMean": ".column_aggregate_metrics",
+    "ColumnMedian": ".column_aggregate_metrics",
+    "ColumnMin": ".column_aggregate_metrics",
+    "ColumnMostCommonValue": ".column_aggregate_metrics",
+    "ColumnParameterizedDistributionKSTestPValue": ".column_aggregate_metrics",
+    "ColumnPartition": ".column_aggregate_metrics",
+    "ColumnUniqueProportion": ".column_aggregate_metrics",
+    "ColumnQuantileSketch": ".column_aggregate_metrics",
+    "ColumnQuantileValues": ".column_aggregate_metrics",
+    "ColumnStandardDeviation": ".column_aggregate_metrics",
+    "ColumnSum": ".column_aggregate_metrics",
+    "ColumnValueCounts": ".column_aggregate_metrics",
+    "ColumnValuesBetweenCount": ".column_aggregate_metrics",
+    "ColumnValuesLengthMax": ".column_aggregate_metrics",
+    "ColumnValuesLengthMin": ".column_aggregate_metrics",
+    "ColumnValuesValueLength": ".column_map_metrics",
+    "ColumnValuesValueLengthEquals": ".column_map_metrics",
+    "ColumnValuesBetween": ".column_map_metrics",
+    "ColumnValuesDateutilParseable": ".column_map_metrics",
+    "ColumnValuesDecreasing": ".column_map_metrics",
+    "ColumnValuesInSet": ".column_map_metrics",
+    "ColumnValuesInTypeList": ".column_map_metrics",
+    "ColumnValuesIncreasing": ".column_map_metrics",
+    "ColumnValuesJsonParseable": ".column_map_metrics",
+    "ColumnValuesMatchJsonSchema": ".column_map_metrics",
+    "ColumnValuesMatchLikePattern": ".column_map_metrics",
+    "ColumnValuesMatchLikePatternList": ".column_map_metrics",
+    "ColumnValuesMatchRegex": ".column_map_metrics",
+    "ColumnValuesMatchRegexList": ".column_map_metrics",
+    "ColumnValuesMatchStrftimeFormat": ".column_map_metrics",
+    "ColumnValuesNonNull": ".column_map_metrics",
+    "ColumnValuesNotInSet": ".column_map_metrics",
+    "ColumnValuesNotMatchLikePattern": ".column_map_metrics",
+    "ColumnValuesNotMatchLikePatternList": ".column_map_metrics",
+    "ColumnValuesNotMatchRegex": ".column_map_metrics",
+    "ColumnValuesNotMatchRegexList": ".column_map_metrics",
+    "ColumnValuesNull": ".column_map_metrics",
+    "ColumnValuesOfType": ".column_map_metrics",
+    "ColumnValuesUnique": ".column_map_metrics",
+    "ColumnValuesZScore": ".column_map_metrics",
+    "ColumnPairValuesEqual": ".column_pair_map_metrics",
+    "ColumnPairValuesAGreaterThanB": ".column_pair_map_metrics",
+    "ColumnPairValuesInSet": ".column_pair_map_metrics",
+    "CompoundColumnsUnique": ".multicolumn_map_metrics",
+    "MulticolumnSumEqual": ".multicolumn_map_metrics",
+    "SelectColumnValuesUniqueWithinRecord": ".multicolumn_map_metrics",
+    "QueryColumn": ".query_metrics",
+    "QueryColumnPair": ".query_metrics",
+    "QueryMultipleColumns": ".query_metrics",
+    "QueryTable": ".query_metrics",
+    "QueryTemplateValues": ".query_metrics",
+    "UnexpectedRowsQueryTable": ".query_metrics",
+    "TableColumnCount": ".table_metrics",
+    "ColumnTypes": ".table_metrics",
+    "TableColumns": ".table_metrics",
+    "TableHead": ".table_metrics",
+    "TableRowCount": ".table_metrics",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
@@ -1,23 +1,55 @@
-from .column_distinct_values import (
-    ColumnDistinctValues,
-    ColumnDistinctValuesCount,
-    ColumnDistinctValuesCountUnderThreshold,
-)
-from .column_histogram import ColumnHistogram
-from .column_max import ColumnMax
-from .column_mean import ColumnMean
-from .column_median import ColumnMedian
-from .column_min import ColumnMin
-from .column_most_common_value import ColumnMostCommonValue
-from .column_parameterized_distribution_ks_test_p_value import (
-    ColumnParameterizedDistributionKSTestPValue,
-)
-from .column_partition import ColumnPartition
-from .column_proportion_of_unique_values import ColumnUniqueProportion
-from .column_quantile_values import ColumnQuantileValues
-from .column_standard_deviation import ColumnStandardDeviation
-from .column_sum import ColumnSum
-from .column_value_counts import ColumnValueCounts
-from .column_values_between_count import ColumnValuesBetweenCount
-from .column_values_length_max import ColumnValuesLengthMax
-from .column_values_length_min import ColumnValuesLengthMin
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
+if TYPE_CHECKING:
+    from .column_distinct_values import (
+        ColumnDistinctValues,
+        ColumnDistinctValuesCount,
+        ColumnDistinctValuesCountUnderThreshold,
+    )
+    from .column_histogram import ColumnHistogram
+    from .column_max import ColumnMax
+    from .column_mean import ColumnMean
+    from .column_median import ColumnMedian
+    from .column_min import ColumnMin
+    from .column_most_common_value import ColumnMostCommonValue
+    from .column_parameterized_distribution_ks_test_p_value import (
+        ColumnParameterizedDistributionKSTestPValue,
+    )
+    from .column_partition import ColumnPartition
+    from .column_proportion_of_unique_values import ColumnUniqueProportion
+    from .column_quantile_sketch import ColumnQuantileSketch
+    from .column_quantile_values import ColumnQuantileValues
+    from .column_standard_deviation import ColumnStandardDeviation
+    from .column_sum import ColumnSum
+    from .column_value_counts import ColumnValueCounts
+    from .column_values_between_count import ColumnValuesBetweenCount
+    from .column_values_length_max import ColumnValuesLengthMax
+    from .column_values_length_min import ColumnValuesLengthMin
+
+# Metrics are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "ColumnDistinctValues": ".column_distinct_values",
+    "ColumnDistinctValuesCount": ".column_distinct_values",
+    "ColumnDistinctValuesCountUnderThreshold": ".column_distinct_values",
+    "ColumnHistogram": ".column_histogram",
+    "ColumnMax": ".column_max",
+    "ColumnMean": ".column_mean",
+    "ColumnMedian": ".column_median",
+    "ColumnMin": ".column_min",
+    "ColumnMostCommonValue": ".column_most_common_value",
+    "ColumnParameterizedDistributionKSTestPValue": ".column_parameterized_distribution_ks_test_p_value",  # noqa: E501
+    "ColumnPartition": ".column_partition",
+    "ColumnUniqueProportion": ".column_proportion_of_unique_values",
+    "ColumnQuantileSketch": ".column_quantile_sketch",
+    "ColumnQuantileValues": ".column_quantile_values",
+    "ColumnStandardDeviation": ".column_standard_deviation",
+    "ColumnSum": ".column_sum",
+    "ColumnValueCounts": ".column_value_counts",
+    "ColumnValuesBetweenCount": ".column_values_between_count",
+    "ColumnValuesLengthMax": ".column_values_length_max",
+    "ColumnValuesLengthMin": ".column_values_length_min",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
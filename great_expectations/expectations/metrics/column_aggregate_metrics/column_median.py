@@ -7,6 +7,7 @@ import numpy as np
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.quantile_sketch import QUANTILE_SKETCH_RELATIVE_ERROR
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -23,19 +24,29 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 if TYPE_CHECKING:
     import pandas as pd
 
+    from great_expectations.core.quantile_sketch import KLLSketch
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
 
 
 class ColumnMedian(ColumnAggregateMetricProvider):
-    """MetricProvider Class for Aggregate Mean MetricProvider"""
+    """MetricProvider Class for Aggregate Mean MetricProvider
+
+    With "allow_relative_error" of "sketch", median is approximated by quantile sketch (as lower median, rather than
+    average of two middle values).
+    """  # noqa: E501
 
     metric_name = "column.median"
+    value_keys = ("allow_relative_error",)
+    default_kwarg_values = {"allow_relative_error": False}
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    def _pandas(cls, column, _metrics, allow_relative_error=False, **kwargs):
         """Pandas Median Implementation"""
+        if allow_relative_error == QUANTILE_SKETCH_RELATIVE_ERROR:
+            return _get_column_median_from_sketch(metrics=_metrics)
+
         column_null_elements_cond: pd.Series = column.isnull()
         column_nonnull_elements: pd.Series = column[~column_null_elements_cond]
         return column_nonnull_elements.median()
@@ -57,6 +68,9 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         column_name = accessor_domain_kwargs["column"]
         column = sa.column(column_name)  # type: ignore[var-annotated]
         """SqlAlchemy Median Implementation"""
+        if metric_value_kwargs.get("allow_relative_error") == QUANTILE_SKETCH_RELATIVE_ERROR:
+            return _get_column_median_from_sketch(metrics=metrics)
+
         nonnull_count = metrics.get("column_values.nonnull.count")
         if not nonnull_count:
             return None
@@ -117,6 +131,9 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         # in the degenerate case when n_values = 0
 
         """Spark Median Implementation"""
+        if metric_value_kwargs.get("allow_relative_error") == QUANTILE_SKETCH_RELATIVE_ERROR:
+            return _get_column_median_from_sketch(metrics=metrics)
+
         table_row_count = metrics["table.row_count"]
         result = df.approxQuantile(column, [0.5, 0.5 + (1 / (2 + (2 * table_row_count)))], 0)
         return np.mean(result)
@@ -143,10 +160,20 @@ class ColumnMedian(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+        if metric.metric_value_kwargs.get("allow_relative_error") == QUANTILE_SKETCH_RELATIVE_ERROR:
+            dependencies["column.quantile_sketch"] = MetricConfiguration(
+                metric_name="column.quantile_sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+            )
+        elif isinstance(execution_engine, SqlAlchemyExecutionEngine):
             dependencies["column_values.nonnull.count"] = MetricConfiguration(
                 metric_name="column_values.nonnull.count",
                 metric_domain_kwargs=metric.metric_domain_kwargs,
             )
 
         return dependencies
+
+
+def _get_column_median_from_sketch(metrics: Dict[str, Any]) -> Optional[float]:
+    sketch: KLLSketch = metrics["column.quantile_sketch"]
+    return sketch.get_quantiles([0.5])[0]
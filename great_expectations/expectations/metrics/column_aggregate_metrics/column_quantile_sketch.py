@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import functools
+import numbers
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.quantile_sketch import KLLSketch
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.metric_provider import metric_value
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Number of column values added to quantile sketch (and fetched from database) at a time.
+QUANTILE_SKETCH_CHUNK_SIZE = 100_000
+# Sketches are seeded, so that quantiles computed from them do not vary from one run to the next.
+QUANTILE_SKETCH_SEED = 0
+
+
+class ColumnQuantileSketch(ColumnAggregateMetricProvider):
+    """Mergeable quantile sketch ("KLLSketch") of non-null values of column, built in one pass over them.
+
+    Quantiles and medians with "allow_relative_error" of "sketch" are computed from it (so that all of them share one
+    pass over column values, instead of sorting them).  Only numeric columns can be sketched.
+
+    Cost differs by backend: Pandas sketches column in memory; Spark sketches every partition on its executor (only
+    sketches reach the driver).  SQL databases have no portable way to build this sketch in the database, so every
+    non-null value of column is streamed to the client (in chunks of "QUANTILE_SKETCH_CHUNK_SIZE" values) and sketched
+    there: client memory stays bounded, but network transfer and client CPU time grow with number of rows, and can
+    exceed the cost of computing exact quantiles (or median) in the database, which only returns the values asked for.
+    """  # noqa: E501
+
+    metric_name = "column.quantile_sketch"
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column: pd.Series, **kwargs) -> KLLSketch:
+        values: np.ndarray = _to_float_array(values=column[column.notnull()].to_numpy())
+        sketch = KLLSketch(seed=QUANTILE_SKETCH_SEED)
+        for start in range(0, len(values), QUANTILE_SKETCH_CHUNK_SIZE):
+            sketch.update(values[start : start + QUANTILE_SKETCH_CHUNK_SIZE])
+
+        return sketch
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> KLLSketch:
+        (
+            selectable,
+            _compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(metric_domain_kwargs, MetricDomainTypes.COLUMN)
+        column = sa.column(accessor_domain_kwargs["column"])  # type: ignore[var-annotated]
+        query = (
+            sa.select(column)
+            .where(column != None)  # noqa: E711
+            .select_from(selectable)  # type: ignore[arg-type]
+        )
+
+        sketch = KLLSketch(seed=QUANTILE_SKETCH_SEED)
+        # Column values are streamed (rather than sorted, or loaded all at once) in chunks.
+        with execution_engine.get_connection() as connection:
+            result = connection.execution_options(stream_results=True).execute(query)
+            for rows in result.partitions(QUANTILE_SKETCH_CHUNK_SIZE):
+                sketch.update(_to_float_array(values=[row[0] for row in rows]))
+
+        return sketch
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> KLLSketch:
+        (
+            df,
+            _compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(metric_domain_kwargs, MetricDomainTypes.COLUMN)
+        column_name: str = accessor_domain_kwargs["column"]
+        # Every partition is sketched by its executor; only sketches (not values) reach the driver.
+        partition_sketches: List[Dict[str, Any]] = (
+            df.select(column_name)
+            .where(df[column_name].isNotNull())
+            .rdd.mapPartitions(_sketch_partition)
+            .collect()
+        )
+        return functools.reduce(
+            lambda sketch, partition_sketch: sketch.merge(
+                KLLSketch.from_json_dict(partition_sketch, seed=QUANTILE_SKETCH_SEED)
+            ),
+            partition_sketches,
+            KLLSketch(seed=QUANTILE_SKETCH_SEED),
+        )
+
+
+def _sketch_partition(rows: Iterator[Any]) -> Iterator[Dict[str, Any]]:
+    sketch = KLLSketch(seed=QUANTILE_SKETCH_SEED)
+    chunk: List[Any] = []
+    for row in rows:
+        chunk.append(row[0])
+        if len(chunk) == QUANTILE_SKETCH_CHUNK_SIZE:
+            sketch.update(_to_float_array(values=chunk))
+            chunk = []
+
+    sketch.update(_to_float_array(values=chunk))
+    yield sketch.to_json_dict()
+
+
+def _to_float_array(values: Sequence[Any]) -> np.ndarray:
+    """Converts non-null column values to floats, which sketch orders; dates, strings, etc. are rejected.
+
+    Values of one column share their type, so only first value is checked (otherwise, numeric strings, for instance,
+    would silently be sketched as numbers, and dates would fail with unrelated conversion error).
+    """  # noqa: E501
+    if len(values) > 0 and not isinstance(values[0], (numbers.Number, np.number, np.bool_)):
+        raise TypeError(  # noqa: TRY003
+            f"Expected numeric column type for quantile sketch. Received type: {type(values[0]).__name__}"  # noqa: E501
+        )
+
+    return np.asarray(values, dtype=np.float64)
@@ -5,7 +5,7 @@ import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
@@ -13,8 +13,11 @@ from great_expectations.compatibility import sqlalchemy, trino
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.quantile_sketch import QUANTILE_SKETCH_RELATIVE_ERROR
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
@@ -27,6 +30,13 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.core.quantile_sketch import KLLSketch
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +46,11 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
     value_keys = ("quantiles", "allow_relative_error")
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
+    def _pandas(cls, column, quantiles, allow_relative_error, _metrics, **kwargs):
         """Quantile Function"""
+        if allow_relative_error == QUANTILE_SKETCH_RELATIVE_ERROR:
+            return _get_column_quantiles_from_sketch(quantiles=quantiles, metrics=_metrics)
+
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
         if not allow_relative_error:
@@ -73,7 +86,9 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         table_row_count = metrics.get("table.row_count")
-        if dialect_name == GXSqlDialect.MSSQL:
+        if allow_relative_error == QUANTILE_SKETCH_RELATIVE_ERROR:
+            return _get_column_quantiles_from_sketch(quantiles=quantiles, metrics=metrics)
+        elif dialect_name == GXSqlDialect.MSSQL:
             return _get_column_quantiles_mssql(
                 column=column,
                 quantiles=quantiles,
@@ -168,6 +183,9 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         column = accessor_domain_kwargs["column"]
 
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
+        if allow_relative_error == QUANTILE_SKETCH_RELATIVE_ERROR:
+            return _get_column_quantiles_from_sketch(quantiles=quantiles, metrics=metrics)
+
         if not allow_relative_error:
             allow_relative_error = 0.0
 
@@ -182,6 +200,35 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
 
         return df.approxQuantile(column, list(quantiles), allow_relative_error)  # type: ignore[attr-defined]
 
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if metric.metric_value_kwargs.get("allow_relative_error") == QUANTILE_SKETCH_RELATIVE_ERROR:
+            dependencies["column.quantile_sketch"] = MetricConfiguration(
+                metric_name="column.quantile_sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+            )
+
+        return dependencies
+
+
+def _get_column_quantiles_from_sketch(quantiles: Iterable, metrics: dict[str, Any]) -> list:
+    sketch: KLLSketch = metrics["column.quantile_sketch"]
+    return sketch.get_quantiles(quantiles)
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
@@ -1,26 +1,62 @@
-from .column_value_lengths import ColumnValuesValueLength, ColumnValuesValueLengthEquals
-from .column_values_between import ColumnValuesBetween
-from .column_values_dateutil_parseable import ColumnValuesDateutilParseable
-from .column_values_decreasing import ColumnValuesDecreasing
-from .column_values_in_set import ColumnValuesInSet
-from .column_values_in_type_list import ColumnValuesInTypeList
-from .column_values_increasing import ColumnValuesIncreasing
-from .column_values_json_parseable import ColumnValuesJsonParseable
-from .column_values_match_json_schema import ColumnValuesMatchJsonSchema
-from .column_values_match_like_pattern import ColumnValuesMatchLikePattern
-from .column_values_match_like_pattern_list import ColumnValuesMatchLikePatternList
-from .column_values_match_regex import ColumnValuesMatchRegex
-from .column_values_match_regex_list import ColumnValuesMatchRegexList
-from .column_values_match_strftime_format import ColumnValuesMatchStrftimeFormat
-from .column_values_non_null import ColumnValuesNonNull
-from .column_values_not_in_set import ColumnValuesNotInSet
-from .column_values_not_match_like_pattern import ColumnValuesNotMatchLikePattern
-from .column_values_not_match_like_pattern_list import (
-    ColumnValuesNotMatchLikePatternList,
-)
-from .column_values_not_match_regex import ColumnValuesNotMatchRegex
-from .column_values_not_match_regex_list import ColumnValuesNotMatchRegexList
-from .column_values_null import ColumnValuesNull
-from .column_values_of_type import ColumnValuesOfType
-from .column_values_unique import ColumnValuesUnique
-from .column_values_z_score import ColumnValuesZScore
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
+if TYPE_CHECKING:
+    from .column_value_lengths import ColumnValuesValueLength, ColumnValuesValueLengthEquals
+    from .column_values_between import ColumnValuesBetween
+    from .column_values_dateutil_parseable import ColumnValuesDateutilParseable
+    from .column_values_decreasing import ColumnValuesDecreasing
+    from .column_values_in_set import ColumnValuesInSet
+    from .column_values_in_type_list import ColumnValuesInTypeList
+    from .column_values_increasing import ColumnValuesIncreasing
+    from .column_values_json_parseable import ColumnValuesJsonParseable
+    from .column_values_match_json_schema import ColumnValuesMatchJsonSchema
+    from .column_values_match_like_pattern import ColumnValuesMatchLikePattern
+    from .column_values_match_like_pattern_list import ColumnValuesMatchLikePatternList
+    from .column_values_match_regex import ColumnValuesMatchRegex
+    from .column_values_match_regex_list import ColumnValuesMatchRegexList
+    from .column_values_match_strftime_format import ColumnValuesMatchStrftimeFormat
+    from .column_values_non_null import ColumnValuesNonNull
+    from .column_values_not_in_set import ColumnValuesNotInSet
+    from .column_values_not_match_like_pattern import ColumnValuesNotMatchLikePattern
+    from .column_values_not_match_like_pattern_list import (
+        ColumnValuesNotMatchLikePatternList,
+    )
+    from .column_values_not_match_regex import ColumnValuesNotMatchRegex
+    from .column_values_not_match_regex_list import ColumnValuesNotMatchRegexList
+    from .column_values_null import ColumnValuesNull
+    from .column_values_of_type import ColumnValuesOfType
+    from .column_values_unique import ColumnValuesUnique
+    from .column_values_z_score import ColumnValuesZScore
+
+# Metrics are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "ColumnValuesValueLength": ".column_value_lengths",
+    "ColumnValuesValueLengthEquals": ".column_value_lengths",
+    "ColumnValuesBetween": ".column_values_between",
+    "ColumnValuesDateutilParseable": ".column_values_dateutil_parseable",
+    "ColumnValuesDecreasing": ".column_values_decreasing",
+    "ColumnValuesInSet": ".column_values_in_set",
+    "ColumnValuesInTypeList": ".column_values_in_type_list",
+    "ColumnValuesIncreasing": ".column_values_increasing",
+    "ColumnValuesJsonParseable": ".column_values_json_parseable",
+    "ColumnValuesMatchJsonSchema": ".column_values_match_json_schema",
+    "ColumnValuesMatchLikePattern": ".column_values_match_like_pattern",
+    "ColumnValuesMatchLikePatternList": ".column_values_match_like_pattern_list",
+    "ColumnValuesMatchRegex": ".column_values_match_regex",
+    "ColumnValuesMatchRegexList": ".column_values_match_regex_list",
+    "ColumnValuesMatchStrftimeFormat": ".column_values_match_strftime_format",
+    "ColumnValuesNonNull": ".column_values_non_null",
+    "ColumnValuesNotInSet": ".column_values_not_in_set",
+    "ColumnValuesNotMatchLikePattern": ".column_values_not_match_like_pattern",
+    "ColumnValuesNotMatchLikePatternList": ".column_values_not_match_like_pattern_list",
+    "ColumnValuesNotMatchRegex": ".column_values_not_match_regex",
+    "ColumnValuesNotMatchRegexList": ".column_values_not_match_regex_list",
+    "ColumnValuesNull": ".column_values_null",
+    "ColumnValuesOfType": ".column_values_of_type",
+    "ColumnValuesUnique": ".column_values_unique",
+    "ColumnValuesZScore": ".column_values_z_score",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
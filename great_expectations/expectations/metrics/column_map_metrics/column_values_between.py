@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import datetime
+import decimal
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
@@ -17,6 +19,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import is_pandas_string_column
+
+# Inferred types of object columns, values of which compare with numeric bounds without errors.
+_NUMERIC_INFERRED_TYPES = ("integer", "floating", "mixed-integer-float", "decimal")
 
 
 class ColumnValuesBetween(ColumnMapMetricProvider):
@@ -59,6 +65,16 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
                 max_value = parse(max_value)
 
             return cls._pandas_vectorized(temp_column, min_value, max_value, strict_min, strict_max)
+        elif cls._is_comparable_without_errors(column, min_value, max_value):
+            # NumPy compares values (as Python objects), rather than "is_between()" one at a time.
+            return pd.Series(
+                cls._pandas_vectorized(
+                    column.to_numpy(dtype=object), min_value, max_value, strict_min, strict_max
+                ),
+                index=column.index,
+                name=column.name,
+                dtype=bool,
+            )
 
         def is_between(val):  # noqa: C901, PLR0911, PLR0912
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).  # noqa: E501
@@ -121,9 +137,33 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
         return temp_column.map(is_between)
 
     @classmethod
-    def _pandas_vectorized(  # noqa: C901, PLR0911
+    def _is_comparable_without_errors(
         cls,
         column: pd.Series,
+        min_value: object,
+        max_value: object,
+    ) -> bool:
+        """Returns True, if every value of "column" compares with (non-None) "min_value" and "max_value" without errors.
+
+        That is the case, if values and bounds are all strings, or are all numbers (other than booleans).
+        """  # noqa: E501
+        bounds = [bound for bound in (min_value, max_value) if bound is not None]
+        if all(isinstance(bound, str) for bound in bounds):
+            return is_pandas_string_column(column)
+
+        if all(
+            isinstance(bound, (int, float, decimal.Decimal, np.integer, np.floating))
+            and not isinstance(bound, (bool, np.bool_))
+            for bound in bounds
+        ):
+            return pd.api.types.infer_dtype(column, skipna=False) in _NUMERIC_INFERRED_TYPES
+
+        return False
+
+    @classmethod
+    def _pandas_vectorized(  # noqa: C901, PLR0911
+        cls,
+        column: Union[pd.Series, np.ndarray],
         min_value: Optional[Union[int, float, datetime.datetime]],
         max_value: Optional[Union[int, float, datetime.datetime]],
         strict_min: bool,
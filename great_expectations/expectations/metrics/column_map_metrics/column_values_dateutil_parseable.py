@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List
+
 from dateutil.parser import parse
 
 from great_expectations.execution_engine import PandasExecutionEngine
@@ -7,6 +9,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    is_pandas_string_column,
+    map_pandas_string_values,
+)
 
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
@@ -14,17 +20,27 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
-        def is_parseable(val):
-            try:
-                if type(val) != str:  # noqa: E721
-                    raise TypeError(  # noqa: TRY003
-                        "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."  # noqa: E501
-                    )
+        if is_pandas_string_column(column):
+            return map_pandas_string_values(
+                column=column, evaluate_values=_are_parseable, use_process_pool=True
+            )
+
+        return column.map(_is_parseable)
+
+
+def _is_parseable(val) -> bool:
+    try:
+        if type(val) != str:  # noqa: E721
+            raise TypeError(  # noqa: TRY003
+                "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."  # noqa: E501
+            )
+
+        parse(val)
+        return True
 
-                parse(val)
-                return True
+    except (ValueError, OverflowError):
+        return False
 
-            except (ValueError, OverflowError):
-                return False
 
-        return column.map(is_parseable)
+def _are_parseable(values: List[str]) -> List[bool]:
+    return [_is_parseable(val) for val in values]
@@ -45,4 +45,17 @@ class ColumnValuesInTypeList(ColumnMapMetricProvider):
         if len(comp_types) < 1:
             raise ValueError(f"No recognized numpy/python type in list: {type_list}")  # noqa: TRY003
 
-        return column.map(lambda x: isinstance(x, tuple(comp_types)))
+        # Type of every value is looked up (by builtin "type()"), but checked once per type.
+        comp_types_tuple = tuple(comp_types)
+        value_types = column.map(type)
+        matching_types = [
+            value_type
+            for value_type in pd.unique(value_types)
+            if issubclass(value_type, comp_types_tuple)
+        ]
+        return pd.Series(
+            value_types.isin(matching_types).to_numpy(dtype=bool),
+            index=column.index,
+            name=column.name,
+            dtype=bool,
+        )
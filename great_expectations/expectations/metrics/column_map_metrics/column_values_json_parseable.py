@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from typing import List
 
 from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.pyspark import functions as F
@@ -12,6 +13,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    is_pandas_string_column,
+    map_pandas_string_values,
+)
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
@@ -19,14 +24,11 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except Exception:
-                return False
+        if is_pandas_string_column(column):
+            # Parsing JSON is fast enough for pickling values (to other processes) not to pay off.
+            return map_pandas_string_values(column=column, evaluate_values=_are_json)
 
-        return column.map(is_json)
+        return column.map(_is_json)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
@@ -40,3 +42,15 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
         is_json_udf = F.udf(is_json, pyspark.types.BooleanType())
 
         return is_json_udf(column)
+
+
+def _is_json(val) -> bool:
+    try:
+        json.loads(val)
+        return True
+    except Exception:
+        return False
+
+
+def _are_json(values: List[str]) -> List[bool]:
+    return [_is_json(val) for val in values]
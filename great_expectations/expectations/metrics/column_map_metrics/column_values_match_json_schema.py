@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
+from typing import List
 
 import jsonschema
 
@@ -14,6 +16,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    is_pandas_string_column,
+    map_pandas_string_values,
+)
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 
@@ -23,6 +29,13 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
+        if is_pandas_string_column(column):
+            return map_pandas_string_values(
+                column=column,
+                evaluate_values=functools.partial(_match_json_schema, json_schema=json_schema),
+                use_process_pool=True,
+            )
+
         def matches_json_schema(val):
             try:
                 val_json = json.loads(val)
@@ -65,3 +78,14 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
         )
 
         return matches_json_schema_udf(column)
+
+
+def _match_json_schema(values: List[str], json_schema: dict) -> List[bool]:
+    """Returns whether or not every JSON string of "values" matches "json_schema" (as "jsonschema.validate()" would).
+
+    Schema is checked (raising "jsonschema.SchemaError", if invalid) and compiled into validator once for all values.
+    """  # noqa: E501
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    validator = validator_class(json_schema)
+    return [validator.is_valid(json.loads(val)) for val in values]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 from datetime import datetime
+from typing import List
 
 from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.pyspark import functions as F
@@ -12,6 +14,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    is_pandas_string_column,
+    map_pandas_string_values,
+)
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
@@ -20,18 +26,18 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, strftime_format, **kwargs):
-        def is_parseable_by_format(val):
-            try:
-                datetime.strptime(val, strftime_format)  # noqa: DTZ007
-                return True
-            except TypeError:
-                raise TypeError(  # noqa: TRY003
-                    "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."  # noqa: E501
-                )
-            except ValueError:
-                return False
+        if is_pandas_string_column(column):
+            return map_pandas_string_values(
+                column=column,
+                evaluate_values=functools.partial(
+                    _are_parseable_by_format, strftime_format=strftime_format
+                ),
+                use_process_pool=True,
+            )
 
-        return column.map(is_parseable_by_format)
+        return column.map(
+            functools.partial(_is_parseable_by_format, strftime_format=strftime_format)
+        )
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
@@ -60,3 +66,19 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
 
         success_udf = F.udf(is_parseable_by_format, pyspark.types.BooleanType())
         return success_udf(column)
+
+
+def _is_parseable_by_format(val, strftime_format: str) -> bool:
+    try:
+        datetime.strptime(val, strftime_format)  # noqa: DTZ007
+        return True
+    except TypeError:
+        raise TypeError(  # noqa: TRY003
+            "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."  # noqa: E501
+        )
+    except ValueError:
+        return False
+
+
+def _are_parseable_by_format(values: List[str], strftime_format: str) -> List[bool]:
+    return [_is_parseable_by_format(val, strftime_format=strftime_format) for val in values]
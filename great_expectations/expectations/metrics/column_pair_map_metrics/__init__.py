@@ -1,3 +1,17 @@
-from .column_pair_values_equal import ColumnPairValuesEqual
-from .column_pair_values_greater import ColumnPairValuesAGreaterThanB
-from .column_pair_values_in_set import ColumnPairValuesInSet
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
+if TYPE_CHECKING:
+    from .column_pair_values_equal import ColumnPairValuesEqual
+    from .column_pair_values_greater import ColumnPairValuesAGreaterThanB
+    from .column_pair_values_in_set import ColumnPairValuesInSet
+
+# Metrics are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "ColumnPairValuesEqual": ".column_pair_values_equal",
+    "ColumnPairValuesAGreaterThanB": ".column_pair_values_greater",
+    "ColumnPairValuesInSet": ".column_pair_values_in_set",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import itertools
 import logging
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Union,
 )
 
@@ -50,6 +54,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of result rows fetched (and transposed into columns) at a time, while building "unexpected_index_list".  # noqa: E501
+UNEXPECTED_INDEX_LIST_FETCH_SIZE: int = 10000
+
+# Registry key of temporary table, which holds per-row conditions while computing unexpected count.
+_UNEXPECTED_COUNT_TEMP_TABLE_KEY = "map_condition_unexpected_count"
+
 
 def _pandas_map_condition_unexpected_count(
     cls,
@@ -308,22 +318,12 @@ def _sqlalchemy_map_condition_unexpected_count_value(
 
     try:
         if execution_engine.dialect_name == GXSqlDialect.MSSQL:
-            with execution_engine.get_connection() as connection:
-                if not connection.closed:
-                    temp_table_obj = _generate_temp_table(
-                        connection=connection,
-                        metric_domain_kwargs=metric_domain_kwargs,
-                        metric_value_kwargs=metric_value_kwargs,
-                        metrics=metrics,
-                    )
-                else:
-                    with connection.begin():
-                        temp_table_obj = _generate_temp_table(
-                            connection=connection,
-                            metric_domain_kwargs=metric_domain_kwargs,
-                            metric_value_kwargs=metric_value_kwargs,
-                            metrics=metrics,
-                        )
+            temp_table_obj: sa.Table = execution_engine.get_or_create_temp_table(
+                key=_UNEXPECTED_COUNT_TEMP_TABLE_KEY,
+                create_fn=_generate_temp_table,
+            )
+            # The temporary table is shared by all map metrics computed on this connection.
+            execution_engine.execute_query_in_transaction(temp_table_obj.delete())  # type: ignore[arg-type]
             inner_case_query: sqlalchemy.Insert = temp_table_obj.insert().from_select(
                 [count_case_statement],  # type: ignore[list-item]
                 count_selectable,
@@ -563,17 +563,21 @@ def _sqlalchemy_map_condition_index(  # noqa: C901 - too complex
     final_query: sa.select = unexpected_condition_query_with_selected_columns.select_from(  # type: ignore[valid-type,attr-defined]
         domain_records_as_selectable
     ).limit(result_format["partial_unexpected_count"])
-    query_result: List[sqlalchemy.Row] = execution_engine.execute_query(final_query).fetchall()  # type: ignore[assignment]
-
     exclude_unexpected_values: bool = result_format.get("exclude_unexpected_values", False)
-
-    return _get_sqlalchemy_customized_unexpected_index_list(
-        exclude_unexpected_values=exclude_unexpected_values,
-        unexpected_index_column_names=unexpected_index_column_names,
-        query_result=query_result,
-        domain_column_name_list=domain_column_name_list,
+    return_unexpected_index_list_as_columns: bool = result_format.get(
+        "return_unexpected_index_list_as_columns", False
     )
 
+    with execution_engine.get_connection() as connection:
+        query_result: sqlalchemy.CursorResult = connection.execute(final_query)  # type: ignore[call-overload]
+        return _get_sqlalchemy_customized_unexpected_index_list(
+            exclude_unexpected_values=exclude_unexpected_values,
+            unexpected_index_column_names=unexpected_index_column_names,
+            query_result=query_result,
+            domain_column_name_list=domain_column_name_list,
+            return_unexpected_index_list_as_columns=return_unexpected_index_list_as_columns,
+        )
+
 
 def _spark_map_condition_unexpected_count_aggregate_fn(
     cls,
@@ -716,6 +720,9 @@ def _spark_map_condition_index(  # noqa: C901 - too complex
         F.col("__unexpected")
     )
     exclude_unexpected_values: bool = result_format.get("exclude_unexpected_values", False)
+    return_unexpected_index_list_as_columns: bool = result_format.get(
+        "return_unexpected_index_list_as_columns", False
+    )
 
     unexpected_index_column_names: List[str] = result_format["unexpected_index_column_names"]
     columns_to_keep: List[str] = [column for column in unexpected_index_column_names]
@@ -739,6 +746,7 @@ def _spark_map_condition_index(  # noqa: C901 - too complex
         unexpected_index_column_names=unexpected_index_column_names,
         filtered=filtered,
         columns_to_keep=columns_to_keep,
+        return_unexpected_index_list_as_columns=return_unexpected_index_list_as_columns,
     )
 
 
@@ -784,57 +792,97 @@ def _spark_map_condition_query(
     return f"df.filter(F.expr({unexpected_condition_filtered}))"
 
 
-def _generate_temp_table(
-    connection: sa.engine.base.Connection,
-    metric_domain_kwargs: Dict,
-    metric_value_kwargs: Dict,
-    metrics: Dict[str, Any],
-    **kwargs,
-) -> sa.Table:
+def _generate_temp_table(connection: sa.engine.base.Connection) -> sa.Table:
     temp_table_name: str = generate_temporary_table_name(default_table_name_prefix="#ge_temp_")
-    metadata: sa.MetaData = sa.MetaData()
-    metadata.reflect(bind=connection)
+    # The table is described explicitly; hence, no other part of database schema needs to be reflected.  # noqa: E501
     temp_table_obj: sa.Table = sa.Table(
         temp_table_name,
-        metadata,
+        sa.MetaData(),
         sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
     )
-    temp_table_obj.create(bind=connection, checkfirst=True)
+    if connection.in_transaction():
+        temp_table_obj.create(bind=connection, checkfirst=True)
+    else:
+        with connection.begin():
+            temp_table_obj.create(bind=connection, checkfirst=True)
     return temp_table_obj
 
 
+def _build_unexpected_index_list(
+    row_chunks: Iterable[Sequence[Sequence[Any]]],
+    column_names: List[str],
+    unexpected_index_column_names: List[str],
+    exclude_unexpected_values: bool,
+    return_unexpected_index_list_as_columns: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Builds "unexpected_index_list" out of result rows, which are consumed chunk by chunk and accumulated column-wise.
+
+    Args:
+        row_chunks: chunks of rows, whose values are positionally aligned with "column_names"
+        column_names: unexpected_index_column_names, followed by domain column names
+        unexpected_index_column_names: column_names for indices (ID/PK columns)
+        exclude_unexpected_values: if True, only values of ID/PK columns are returned
+        return_unexpected_index_list_as_columns: if True, all values are returned in column-oriented form
+
+    Returns:
+        Either one Dict (mapping column name to list of values) per row or, in column-oriented form (also used when
+        "exclude_unexpected_values" is True), single Dict mapping column name to list of values of all rows.
+    """  # noqa: E501
+    exclude_domain_columns: bool = (
+        exclude_unexpected_values and len(unexpected_index_column_names) != 0
+    )
+    if exclude_domain_columns:
+        column_names = unexpected_index_column_names
+
+    column_values: List[List[Any]] = [[] for _ in column_names]
+    num_rows: int = 0
+    chunk: Sequence[Sequence[Any]]
+    for chunk in row_chunks:
+        num_rows += len(chunk)
+        # Transposing entire chunk at once (using "zip") avoids per-cell work in Python.
+        values: List[Any]
+        chunk_values: Sequence[Any]
+        for values, chunk_values in zip(column_values, zip(*chunk)):
+            values.extend(chunk_values)
+
+    if num_rows == 0:
+        return []
+
+    if exclude_domain_columns or return_unexpected_index_list_as_columns:
+        return [dict(zip(column_names, column_values))]
+
+    return [dict(zip(column_names, row_values)) for row_values in zip(*column_values)]
+
+
+def _iterate_in_chunks(rows: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator: Iterator[Any] = iter(rows)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
 def _get_sqlalchemy_customized_unexpected_index_list(
     exclude_unexpected_values: bool,
     unexpected_index_column_names: List[str],
-    query_result: List[sqlalchemy.Row],
+    query_result: sqlalchemy.CursorResult | List[sqlalchemy.Row],
     domain_column_name_list: List[Union[str, sqlalchemy.quoted_name]],
+    return_unexpected_index_list_as_columns: bool = False,
 ) -> Union[List[Dict[str, Any]], None]:
-    unexpected_index_list: List[Dict[str, Any]] = []
-
-    if (
-        exclude_unexpected_values
-        and len(query_result) != 0
-        and len(unexpected_index_column_names) != 0
-    ):
-        primary_key_dict_list: dict[str, List[Any]] = {
-            idx_col: [] for idx_col in unexpected_index_column_names
-        }
-        for row in query_result:
-            for index in range(len(unexpected_index_column_names)):
-                primary_key_dict_list[unexpected_index_column_names[index]].append(row[index])
-        unexpected_index_list.append(primary_key_dict_list)
-
+    row_chunks: Iterable[Sequence[sqlalchemy.Row]]
+    if isinstance(query_result, list):
+        row_chunks = _iterate_in_chunks(
+            rows=query_result, chunk_size=UNEXPECTED_INDEX_LIST_FETCH_SIZE
+        )
     else:
-        for row in query_result:
-            primary_key_dict: Dict[str, Any] = {}
-            # add the actual unexpected value
-            all_columns = unexpected_index_column_names + domain_column_name_list
-            for index in range(len(all_columns)):
-                name: str = all_columns[index]
-                primary_key_dict[name] = row[index]
-            unexpected_index_list.append(primary_key_dict)
+        row_chunks = query_result.partitions(UNEXPECTED_INDEX_LIST_FETCH_SIZE)
 
-    return unexpected_index_list
+    return _build_unexpected_index_list(
+        row_chunks=row_chunks,
+        column_names=unexpected_index_column_names + domain_column_name_list,
+        unexpected_index_column_names=unexpected_index_column_names,
+        exclude_unexpected_values=exclude_unexpected_values,
+        return_unexpected_index_list_as_columns=return_unexpected_index_list_as_columns,
+    )
 
 
 def _get_spark_customized_unexpected_index_list(
@@ -842,23 +890,15 @@ def _get_spark_customized_unexpected_index_list(
     unexpected_index_column_names: List[str],
     filtered: pyspark.sql.dataframe.DataFrame,
     columns_to_keep: List[str],
+    return_unexpected_index_list_as_columns: bool = False,
 ) -> Union[List[Dict[str, Any]], None]:
-    unexpected_index_list: List[Dict[str, Any]] = []
-
-    if exclude_unexpected_values and not filtered.isEmpty():
-        dict_list_to_add: dict[str, List[Any]] = {
-            idx_col: [] for idx_col in unexpected_index_column_names
-        }
-        for row in filtered.collect():
-            for col_name in unexpected_index_column_names:
-                dict_list_to_add[col_name].append(row[col_name])
-        unexpected_index_list.append(dict_list_to_add)
-
-    else:
-        for row in filtered.collect():
-            dict_to_add: dict = {}
-            for col_name in columns_to_keep:
-                dict_to_add[col_name] = row[col_name]
-            unexpected_index_list.append(dict_to_add)
-
-    return unexpected_index_list
+    # "filtered" holds exactly "columns_to_keep" (in this order); hence, rows are read positionally.
+    return _build_unexpected_index_list(
+        row_chunks=_iterate_in_chunks(
+            rows=filtered.toLocalIterator(), chunk_size=UNEXPECTED_INDEX_LIST_FETCH_SIZE
+        ),
+        column_names=columns_to_keep,
+        unexpected_index_column_names=unexpected_index_column_names,
+        exclude_unexpected_values=exclude_unexpected_values,
+        return_unexpected_index_list_as_columns=return_unexpected_index_list_as_columns,
+    )
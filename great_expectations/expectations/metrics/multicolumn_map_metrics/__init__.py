@@ -1,5 +1,19 @@
-from .compound_columns_unique import CompoundColumnsUnique
-from .multicolumn_sum_equal import MulticolumnSumEqual
-from .select_column_values_unique_within_record import (
-    SelectColumnValuesUniqueWithinRecord,
-)
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
+if TYPE_CHECKING:
+    from .compound_columns_unique import CompoundColumnsUnique
+    from .multicolumn_sum_equal import MulticolumnSumEqual
+    from .select_column_values_unique_within_record import (
+        SelectColumnValuesUniqueWithinRecord,
+    )
+
+# Metrics are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "CompoundColumnsUnique": ".compound_columns_unique",
+    "MulticolumnSumEqual": ".multicolumn_sum_equal",
+    "SelectColumnValuesUniqueWithinRecord": ".select_column_values_unique_within_record",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
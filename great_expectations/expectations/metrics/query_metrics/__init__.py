@@ -1,6 +1,23 @@
-from .query_column import QueryColumn
-from .query_column_pair import QueryColumnPair
-from .query_multiple_columns import QueryMultipleColumns
-from .query_table import QueryTable
-from .query_template_values import QueryTemplateValues
-from .unexpected_rows_query_table import UnexpectedRowsQueryTable
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
+if TYPE_CHECKING:
+    from .query_column import QueryColumn
+    from .query_column_pair import QueryColumnPair
+    from .query_multiple_columns import QueryMultipleColumns
+    from .query_table import QueryTable
+    from .query_template_values import QueryTemplateValues
+    from .unexpected_rows_query_table import UnexpectedRowsQueryTable
+
+# Metrics are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "QueryColumn": ".query_column",
+    "QueryColumnPair": ".query_column_pair",
+    "QueryMultipleColumns": ".query_multiple_columns",
+    "QueryTable": ".query_table",
+    "QueryTemplateValues": ".query_template_values",
+    "UnexpectedRowsQueryTable": ".unexpected_rows_query_table",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
@@ -1,5 +1,21 @@
-from .table_column_count import TableColumnCount
-from .table_column_types import ColumnTypes
-from .table_columns import TableColumns
-from .table_head import TableHead
-from .table_row_count import TableRowCount
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.expectations._lazy_exports import get_lazy_export_functions
+
+if TYPE_CHECKING:
+    from .table_column_count import TableColumnCount
+    from .table_column_types import ColumnTypes
+    from .table_columns import TableColumns
+    from .table_head import TableHead
+    from .table_row_count import TableRowCount
+
+# Metrics are only imported (and registered) once accessed.
+_EXPORTS: Dict[str, str] = {
+    "TableColumnCount": ".table_column_count",
+    "ColumnTypes": ".table_column_types",
+    "TableColumns": ".table_columns",
+    "TableHead": ".table_head",
+    "TableRowCount": ".table_row_count",
+}
+
+__getattr__, __dir__ = get_lazy_export_functions(__name__, _EXPORTS)
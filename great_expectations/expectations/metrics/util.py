@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import re
 from collections import UserDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from types import ModuleType
 from typing import (
-    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -19,6 +24,7 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
@@ -76,9 +82,6 @@ _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
 from great_expectations.compatibility import bigquery as sqla_bigquery
 from great_expectations.compatibility.bigquery import bigquery_types_tuple
 
-if TYPE_CHECKING:
-    import pandas as pd
-
 try:
     import teradatasqlalchemy.dialect
     import teradatasqlalchemy.types as teradatatypes
@@ -1242,11 +1245,59 @@ def get_sqlalchemy_source_table_and_schema(
         return engine.batch_manager.active_batch_data.selectable
 
 
-def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
+def _interleave_domain_and_index_column_values(
+    domain_column_values: Dict[str, List[Any]],
+    index_column_values: Dict[str, List[Any]],
+) -> Dict[str, List[Any]]:
+    """
+    Combines column-wise values of Expectation domain columns and of index columns.
+
+    Keys are ordered as the first domain column, followed by index columns, followed by the remaining domain columns
+    (the order "unexpected_index_list" records have always had); index columns always take precedence over domain
+    columns that share their names.  Without domain columns, there is nothing to combine.
+    """  # noqa: E501
+    domain_column_items: Iterator[Tuple[str, List[Any]]] = iter(domain_column_values.items())
+    first_domain_column_item: Optional[Tuple[str, List[Any]]] = next(domain_column_items, None)
+    if first_domain_column_item is None:
+        return {}
+
+    values_by_column_name: Dict[str, List[Any]] = dict([first_domain_column_item])
+    values_by_column_name.update(index_column_values)
+    for domain_column_name, values in domain_column_items:
+        values_by_column_name.setdefault(domain_column_name, values)
+
+    return values_by_column_name
+
+
+def _get_unexpected_index_records(
+    values_by_column_name: Dict[str, List[Any]],
+    as_columns: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Transposes column-wise lists of values, positionally aligned with unexpected rows, into one Dict per row.
+
+    Args:
+        values_by_column_name: list of values of each ID/PK or domain column
+        as_columns: if True, values are kept in column-oriented form (single Dict of all rows)
+
+    Returns:
+        List of Dicts that contain ID/PK values
+    """  # noqa: E501
+    if as_columns:
+        return [values_by_column_name]
+
+    column_names: List[str] = list(values_by_column_name.keys())
+    return [
+        dict(zip(column_names, row_values)) for row_values in zip(*values_by_column_name.values())
+    ]
+
+
+def get_unexpected_indices_for_multiple_pandas_named_indices(
     domain_records_df: pd.DataFrame,
     unexpected_index_column_names: List[str],
     expectation_domain_column_list: List[str],
     exclude_unexpected_values: bool = False,
+    return_unexpected_index_list_as_columns: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Builds unexpected_index list for Pandas Dataframe in situation where the named
@@ -1255,6 +1306,8 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
         domain_records_df: reference to Pandas dataframe
         unexpected_index_column_names: column_names for indices, either named index or unexpected_index_columns
         expectation_domain_column_list: list of columns that Expectation is being run on.
+        exclude_unexpected_values: if True, only values of ID/PK columns are returned
+        return_unexpected_index_list_as_columns: if True, values are returned in column-oriented form
 
     Returns:
         List of Dicts that contain ID/PK values
@@ -1266,7 +1319,6 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
         )
 
     domain_records_df_index_names: List[str] = domain_records_df.index.names
-    unexpected_indices: List[tuple[int | str, ...]] = list(domain_records_df.index)
 
     tuple_index: Dict[str, int] = dict()
     for column_name in unexpected_index_column_names:
@@ -1279,30 +1331,27 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
         else:
             tuple_index[column_name] = domain_records_df_index_names.index(column_name, 0)
 
-    unexpected_index_list: List[Dict[str, Any]] = list()
-
-    if exclude_unexpected_values and len(unexpected_indices) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {
-            idx_col: [] for idx_col in unexpected_index_column_names
-        }
-        for index in unexpected_indices:
-            for column_name in unexpected_index_column_names:
-                primary_key_dict_list[column_name].append(index[tuple_index[column_name]])
-
-        unexpected_index_list.append(primary_key_dict_list)
-
-    else:
-        for index in unexpected_indices:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column_name in expectation_domain_column_list:
-                primary_key_dict[domain_column_name] = domain_records_df.at[
-                    index, domain_column_name
-                ]
-                for column_name in unexpected_index_column_names:
-                    primary_key_dict[column_name] = index[tuple_index[column_name]]
-            unexpected_index_list.append(primary_key_dict)
+    if len(domain_records_df.index) == 0:
+        return []
 
-    return unexpected_index_list
+    index_column_values: Dict[str, List[Any]] = {
+        column_name: domain_records_df.index.get_level_values(tuple_index[column_name]).tolist()
+        for column_name in unexpected_index_column_names
+    }
+
+    if exclude_unexpected_values:
+        return [index_column_values]
+
+    return _get_unexpected_index_records(
+        values_by_column_name=_interleave_domain_and_index_column_values(
+            domain_column_values={
+                domain_column_name: domain_records_df[domain_column_name].tolist()
+                for domain_column_name in expectation_domain_column_list
+            },
+            index_column_values=index_column_values,
+        ),
+        as_columns=return_unexpected_index_list_as_columns,
+    )
 
 
 def get_unexpected_indices_for_single_pandas_named_index(
@@ -1310,6 +1359,7 @@ def get_unexpected_indices_for_single_pandas_named_index(
     unexpected_index_column_names: List[str],
     expectation_domain_column_list: List[str],
     exclude_unexpected_values: bool = False,
+    return_unexpected_index_list_as_columns: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Builds unexpected_index list for Pandas Dataframe in situation where the named
@@ -1318,6 +1368,8 @@ def get_unexpected_indices_for_single_pandas_named_index(
         domain_records_df: reference to Pandas dataframe
         unexpected_index_column_names: column_names for indices, either named index or unexpected_index_columns
         expectation_domain_column_list: list of columns that Expectation is being run on.
+        exclude_unexpected_values: if True, only values of ID/PK columns are returned
+        return_unexpected_index_list_as_columns: if True, values are returned in column-oriented form
 
     Returns:
         List of Dicts that contain ID/PK values
@@ -1325,8 +1377,6 @@ def get_unexpected_indices_for_single_pandas_named_index(
     """  # noqa: E501
     if not expectation_domain_column_list:
         return []
-    unexpected_index_values_by_named_index: List[int | str] = list(domain_records_df.index)
-    unexpected_index_list: List[Dict[str, Any]] = list()
     if not (
         len(unexpected_index_column_names) == 1
         and unexpected_index_column_names[0] == domain_records_df.index.name
@@ -1336,25 +1386,30 @@ def get_unexpected_indices_for_single_pandas_named_index(
             failed_metrics=["unexpected_index_list"],
         )
 
-    if exclude_unexpected_values and len(unexpected_index_values_by_named_index) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {unexpected_index_column_names[0]: []}
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict_list[unexpected_index_column_names[0]].append(index)
-        unexpected_index_list.append(primary_key_dict_list)
-
-    else:
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column in expectation_domain_column_list:
-                primary_key_dict[domain_column] = domain_records_df.at[index, domain_column]
-            column_name: str = unexpected_index_column_names[0]
-            primary_key_dict[column_name] = index
-            unexpected_index_list.append(primary_key_dict)
+    if len(domain_records_df.index) == 0:
+        return []
 
-    return unexpected_index_list
+    index_column_values: Dict[str, List[Any]] = {
+        unexpected_index_column_names[0]: domain_records_df.index.tolist()
+    }
+
+    if exclude_unexpected_values:
+        return [index_column_values]
+
+    # The named index follows all domain columns (rather than being interleaved with them).
+    return _get_unexpected_index_records(
+        values_by_column_name={
+            **{
+                domain_column: domain_records_df[domain_column].tolist()
+                for domain_column in expectation_domain_column_list
+            },
+            **index_column_values,
+        },
+        as_columns=return_unexpected_index_list_as_columns,
+    )
 
 
-def compute_unexpected_pandas_indices(  # noqa: C901
+def compute_unexpected_pandas_indices(
     domain_records_df: pd.DataFrame,
     expectation_domain_column_list: List[str],
     result_format: Dict[str, Any],
@@ -1374,11 +1429,16 @@ def compute_unexpected_pandas_indices(  # noqa: C901
 
     Returns:
         list of unexpected_index_list values. It can either be a list of dicts or a list of numbers (if using default index).
+        If "return_unexpected_index_list_as_columns" is True, list of dicts consists of single dict, which maps every
+        ID/PK and domain column name to list of values of all unexpected rows (it has no effect on default index).
 
     """  # noqa: E501
     unexpected_index_column_names: List[str]
     unexpected_index_list: List[Dict[str, Any]]
     exclude_unexpected_values: bool = result_format.get("exclude_unexpected_values", False)
+    return_unexpected_index_list_as_columns: bool = result_format.get(
+        "return_unexpected_index_list_as_columns", False
+    )
 
     if domain_records_df.index.name is not None:
         unexpected_index_column_names = result_format.get(
@@ -1389,6 +1449,7 @@ def compute_unexpected_pandas_indices(  # noqa: C901
             unexpected_index_column_names=unexpected_index_column_names,
             expectation_domain_column_list=expectation_domain_column_list,
             exclude_unexpected_values=exclude_unexpected_values,
+            return_unexpected_index_list_as_columns=return_unexpected_index_list_as_columns,
         )
     # multiple named indices
     elif domain_records_df.index.names[0] is not None:
@@ -1400,53 +1461,117 @@ def compute_unexpected_pandas_indices(  # noqa: C901
             unexpected_index_column_names=unexpected_index_column_names,
             expectation_domain_column_list=expectation_domain_column_list,
             exclude_unexpected_values=exclude_unexpected_values,
+            return_unexpected_index_list_as_columns=return_unexpected_index_list_as_columns,
         )
     # named columns
     elif result_format.get("unexpected_index_column_names"):
         unexpected_index_column_names = result_format["unexpected_index_column_names"]
-        unexpected_index_list = []
-        unexpected_indices: List[int | str] = list(domain_records_df.index)
-
-        if (
-            exclude_unexpected_values
-            and len(unexpected_indices) != 0
-            and len(unexpected_index_column_names) != 0
-        ):
-            primary_key_dict_list: dict[str, List[Any]] = {
-                idx_col: [] for idx_col in unexpected_index_column_names
-            }
-            for index in unexpected_indices:
-                for column_name in unexpected_index_column_names:
-                    column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
-                        column_names=column_name,
-                        batch_columns_list=metrics["table.columns"],
-                        error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
-                    )
-                    primary_key_dict_list[column_name].append(
-                        domain_records_df.at[index, column_name]
-                    )
-            unexpected_index_list.append(primary_key_dict_list)
+        if len(domain_records_df.index) == 0:
+            return []
 
+        unexpected_index_column_names = get_dbms_compatible_column_names(
+            column_names=list(unexpected_index_column_names),
+            batch_columns_list=metrics["table.columns"],
+            error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
+        )
+        index_column_values: Dict[str, List[Any]] = {
+            column_name: domain_records_df[column_name].tolist()
+            for column_name in unexpected_index_column_names
+        }
+        if exclude_unexpected_values:
+            unexpected_index_list = [index_column_values]
         else:
-            for index in unexpected_indices:
-                primary_key_dict: Dict[str, Any] = dict()
-                assert (
-                    expectation_domain_column_list
-                ), "`expectation_domain_column_list` was not provided"
-                for domain_column_name in expectation_domain_column_list:
-                    primary_key_dict[domain_column_name] = domain_records_df.at[
-                        index, domain_column_name
-                    ]
-                    for column_name in unexpected_index_column_names:
-                        column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
-                            column_names=column_name,
-                            batch_columns_list=metrics["table.columns"],
-                            error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
-                        )
-                        primary_key_dict[column_name] = domain_records_df.at[index, column_name]
-                unexpected_index_list.append(primary_key_dict)
+            assert (
+                expectation_domain_column_list
+            ), "`expectation_domain_column_list` was not provided"
+            unexpected_index_list = _get_unexpected_index_records(
+                values_by_column_name=_interleave_domain_and_index_column_values(
+                    domain_column_values={
+                        domain_column_name: domain_records_df[domain_column_name].tolist()
+                        for domain_column_name in expectation_domain_column_list
+                    },
+                    index_column_values=index_column_values,
+                ),
+                as_columns=return_unexpected_index_list_as_columns,
+            )
 
     else:
-        unexpected_index_list = list(domain_records_df.index)
+        unexpected_index_list = domain_records_df.index.tolist()
 
     return unexpected_index_list
+
+
+# Number of distinct values, from which on conditions evaluated in Python (one value at a time) are
+# evaluated in pool of processes (in chunks of "PANDAS_PROCESS_POOL_CHUNK_SIZE" values); for fewer
+# values, starting processes costs more than it saves.
+PANDAS_PROCESS_POOL_MIN_VALUES = 200_000
+PANDAS_PROCESS_POOL_CHUNK_SIZE = 25_000
+
+
+def is_pandas_string_column(column: pd.Series) -> bool:
+    """Returns True, if every value of "column" is a string (i.e., column has no nulls), whatever its dtype is."""  # noqa: E501
+    return pd.api.types.infer_dtype(column, skipna=False) == "string" and not column.isna().any()
+
+
+def map_pandas_string_values(
+    column: pd.Series,
+    evaluate_values: Callable[[List[str]], Sequence[bool]],
+    use_process_pool: bool = False,
+) -> pd.Series:
+    """Evaluates condition for string column once per distinct value (rather than once per row).
+
+    Equal strings satisfy same conditions; hence, results are identical to those of "column.map()", while evaluation
+    scales with number of distinct values (which are evaluated in pool of processes, if "use_process_pool" is set and
+    there are at least "PANDAS_PROCESS_POOL_MIN_VALUES" of them).
+
+    Args:
+        column: Column, all values of which are strings (see "is_pandas_string_column()").
+        evaluate_values: Module-level (i.e., picklable) function, evaluating condition for list of strings.
+        use_process_pool: Whether or not condition is worth evaluating in several processes.
+
+    Returns:
+        Boolean Series (with index and name of "column").
+    """  # noqa: E501
+    codes, distinct_values = pd.factorize(column.to_numpy(dtype=object))
+    distinct_value_list: List[str] = distinct_values.tolist()
+
+    distinct_results: np.ndarray | None = None
+    if use_process_pool and len(distinct_value_list) >= PANDAS_PROCESS_POOL_MIN_VALUES:
+        distinct_results = _evaluate_values_in_process_pool(
+            values=distinct_value_list, evaluate_values=evaluate_values
+        )
+
+    if distinct_results is None:
+        distinct_results = np.asarray(evaluate_values(distinct_value_list), dtype=bool)
+
+    return pd.Series(distinct_results[codes], index=column.index, name=column.name, dtype=bool)
+
+
+def _evaluate_values_in_process_pool(
+    values: List[str], evaluate_values: Callable[[List[str]], Sequence[bool]]
+) -> np.ndarray | None:
+    # Daemonic processes (e.g., workers of some task queues) cannot start processes of their own.
+    if multiprocessing.current_process().daemon:
+        return None
+
+    chunks: List[List[str]] = [
+        values[start : start + PANDAS_PROCESS_POOL_CHUNK_SIZE]
+        for start in range(0, len(values), PANDAS_PROCESS_POOL_CHUNK_SIZE)
+    ]
+    # Forking process, which may run other threads (holding locks), can deadlock its children.
+    mp_context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(chunks)), mp_context=mp_context
+        ) as executor:
+            # Results (and error of first failed chunk, if any) are returned in order of chunks.
+            chunk_results: List[Sequence[bool]] = list(executor.map(evaluate_values, chunks))
+    except BrokenProcessPool as e:
+        logger.warning(
+            f"Unable to evaluate values in pool of processes; evaluating them serially: {e}"
+        )
+        return None
+
+    return np.concatenate([np.asarray(result, dtype=bool) for result in chunk_results])
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import contextlib
+import copy
+import importlib
+import json
 import logging
+import pathlib
+import threading
 from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterator,
     List,
     NamedTuple,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -15,6 +23,7 @@ from typing import (
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.id_dict import IDDict
+from great_expectations.expectations._lazy_exports import import_lazy_exports
 
 if TYPE_CHECKING:
     from great_expectations.core.metric_function_types import (
@@ -42,6 +51,15 @@ _registered_expectations: dict = {}
 _registered_metrics: dict = {}
 _registered_renderers: dict = {}
 
+# Maps name of every core Expectation, Metric, and renderer object to modules, which register it
+# (core modules are only imported once their objects are looked up).
+# Generated by "python -m great_expectations.expectations.registry_manifest".
+REGISTRY_MANIFEST_FILE = pathlib.Path(__file__).parent / "registry_manifest.json"
+
+_registry_manifest: Optional[Dict[str, Dict[str, List[str]]]] = None
+_registry_manifest_lock = threading.RLock()
+_imported_registry_entries: Set[Tuple[str, str]] = set()
+
 """
 {
   "metric_name"
@@ -97,6 +115,36 @@ def register_renderer(
         return
 
 
+def _get_registry_manifest() -> Dict[str, Dict[str, List[str]]]:
+    global _registry_manifest  # noqa: PLW0603
+    if _registry_manifest is None:
+        with _registry_manifest_lock:
+            if _registry_manifest is None:
+                _registry_manifest = json.loads(REGISTRY_MANIFEST_FILE.read_text())
+
+    return _registry_manifest
+
+
+def _import_registering_modules(registry_name: str, object_name: str) -> None:
+    """Imports core modules (listed by registry manifest), which register "object_name" in given registry.
+
+    Args:
+        registry_name: One of "expectations", "metrics", or "renderers".
+        object_name: Name of Expectation or Metric (or, for "renderers", of object, which renderers belong to).
+    """  # noqa: E501
+    registry_entry: Tuple[str, str] = (registry_name, object_name)
+    if registry_entry in _imported_registry_entries:
+        return
+
+    module_names: List[str] = _get_registry_manifest()[registry_name].get(object_name, [])
+    with _registry_manifest_lock:
+        module_name: str
+        for module_name in module_names:
+            importlib.import_module(module_name)
+
+        _imported_registry_entries.add(registry_entry)
+
+
 def get_renderer_names(expectation_or_metric_type: str) -> List[str]:
     """Gets renderer names for a given Expectation or Metric.
 
@@ -106,6 +154,7 @@ def get_renderer_names(expectation_or_metric_type: str) -> List[str]:
     Returns:
         A list of renderer names for the Expectation or Metric.
     """  # noqa: E501
+    _import_registering_modules(registry_name="renderers", object_name=expectation_or_metric_type)
     return list(_registered_renderers.get(expectation_or_metric_type, {}).keys())
 
 
@@ -132,10 +181,12 @@ def get_renderer_names_with_renderer_types(
 
 
 def get_renderer_impls(object_name: str) -> List[str]:
+    _import_registering_modules(registry_name="renderers", object_name=object_name)
     return list(_registered_renderers.get(object_name, {}).values())
 
 
 def get_renderer_impl(object_name: str, renderer_type: str) -> Optional[RendererImpl]:
+    _import_registering_modules(registry_name="renderers", object_name=object_name)
     renderer_tuple: Optional[tuple] = _registered_renderers.get(object_name, {}).get(renderer_type)
     renderer_impl: Optional[RendererImpl] = None
     if renderer_tuple:
@@ -170,9 +221,9 @@ def register_core_metrics() -> None:
     """
     before_count = len(_registered_metrics)
 
-    # Implicitly calls MetaMetricProvider.__new__ as Metrics are loaded from metrics.__init__.py
+    # Implicitly calls MetaMetricProvider.__new__ as Metrics are loaded (from metrics.__init__.py)
     # As __new__ calls upon register_metric this import builds our core registry
-    from great_expectations.expectations import metrics  # noqa: F401
+    import_lazy_exports("great_expectations.expectations.metrics")
 
     after_count = len(_registered_metrics)
 
@@ -196,9 +247,9 @@ def register_core_expectations() -> None:
     """
     before_count = len(_registered_expectations)
 
-    # Implicitly calls MetaExpectation.__new__ as Expectations are loaded from core.__init__.py
+    # Implicitly calls MetaExpectation.__new__ as Expectations are loaded (from core.__init__.py)
     # As __new__ calls upon register_expectation, this import builds our core registry
-    from great_expectations.expectations import core  # noqa: F401
+    import_lazy_exports("great_expectations.expectations.core")
 
     after_count = len(_registered_expectations)
 
@@ -310,6 +361,7 @@ def register_metric(  # noqa: PLR0913
 def get_metric_provider(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Tuple[MetricProvider, Callable]:
+    _import_registering_modules(registry_name="metrics", object_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -322,6 +374,7 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Optional[Union[MetricPartialFunctionTypes, MetricFunctionTypes]]:
+    _import_registering_modules(registry_name="metrics", object_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, _provider_class = metric_definition["providers"][
@@ -334,11 +387,85 @@ def get_metric_function_type(
         )
 
 
+class _ConfigurationKwargsMemoEntry(NamedTuple):
+    # Entry holds its configuration, so that "id()" of configuration is not reused while memo lasts.
+    configuration: ExpectationConfiguration
+    runtime_configuration: Optional[dict]
+    configuration_kwargs: dict
+
+
+_configuration_kwargs_memo_state = threading.local()
+
+_IMMUTABLE_CONFIGURATION_KWARG_TYPES: Tuple[type, ...] = (str, int, float, bool, type(None))
+
+
+@contextlib.contextmanager
+def memoize_metric_kwargs() -> Iterator[None]:
+    """Memoizes runtime kwargs of Expectation configurations, used by "get_metric_kwargs()" calls within scope.
+
+    Expectations call "get_metric_kwargs()" once per metric dependency, and every call builds the Expectation of the
+    configuration (and its runtime kwargs) all over again; within scope (e.g., while validation graph of suite is built),
+    they are built once per configuration object (and runtime configuration).  Memo is kept per thread, and nested
+    scopes share memo of outermost one.
+    """  # noqa: E501
+    if getattr(_configuration_kwargs_memo_state, "memo", None) is not None:
+        yield
+        return
+
+    _configuration_kwargs_memo_state.memo = {}
+    try:
+        yield
+    finally:
+        _configuration_kwargs_memo_state.memo = None
+
+
+def _get_configuration_kwargs(
+    configuration: ExpectationConfiguration,
+    runtime_configuration: Optional[dict] = None,
+) -> dict:
+    memo: Optional[Dict[int, _ConfigurationKwargsMemoEntry]] = getattr(
+        _configuration_kwargs_memo_state, "memo", None
+    )
+    if memo is not None:
+        memo_entry: Optional[_ConfigurationKwargsMemoEntry] = memo.get(id(configuration))
+        if memo_entry is not None and memo_entry.runtime_configuration == runtime_configuration:
+            return _copy_configuration_kwargs(memo_entry.configuration_kwargs)
+
+    expectation = configuration.to_domain_obj()
+    configuration_kwargs: dict = expectation._get_runtime_kwargs(
+        runtime_configuration=runtime_configuration
+    )
+    if memo is not None:
+        memo[id(configuration)] = _ConfigurationKwargsMemoEntry(
+            configuration=configuration,
+            runtime_configuration=copy.deepcopy(runtime_configuration),
+            configuration_kwargs=configuration_kwargs,
+        )
+        return _copy_configuration_kwargs(configuration_kwargs)
+
+    return configuration_kwargs
+
+
+def _copy_configuration_kwargs(configuration_kwargs: dict) -> dict:
+    """Copies memoized runtime kwargs, so that callers (which put values into metric kwargs) never share them.
+
+    Scalar values are immutable and are shared; every other value (e.g., "value_set" list, "result_format" dict) is
+    deep-copied, exactly as if runtime kwargs were built all over again.
+    """  # noqa: E501
+    return {
+        key: value
+        if isinstance(value, _IMMUTABLE_CONFIGURATION_KWARG_TYPES)
+        else copy.deepcopy(value)
+        for key, value in configuration_kwargs.items()
+    }
+
+
 def get_metric_kwargs(
     metric_name: str,
     configuration: Optional[ExpectationConfiguration] = None,
     runtime_configuration: Optional[dict] = None,
 ) -> dict:
+    _import_registering_modules(registry_name="metrics", object_name=metric_name)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -349,9 +476,8 @@ def get_metric_kwargs(
             "metric_value_keys": metric_definition["metric_value_keys"],
         }
         if configuration:
-            expectation = configuration.to_domain_obj()
-            configuration_kwargs = expectation._get_runtime_kwargs(
-                runtime_configuration=runtime_configuration
+            configuration_kwargs = _get_configuration_kwargs(
+                configuration=configuration, runtime_configuration=runtime_configuration
             )
             if len(metric_kwargs["metric_domain_keys"]) > 0:
                 metric_domain_kwargs = IDDict(
@@ -391,6 +517,7 @@ def get_domain_metrics_dict_by_name(
 
 
 def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
+    _import_registering_modules(registry_name="expectations", object_name=expectation_name)
     expectation: Type[Expectation] | None = _registered_expectations.get(expectation_name)
     if not expectation:
         raise gx_exceptions.ExpectationNotFoundError(f"{expectation_name} not found")  # noqa: TRY003
@@ -401,6 +528,7 @@ def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
 def list_registered_expectation_implementations(
     expectation_root: Optional[Type[Expectation]] = None,
 ) -> List[str]:
+    register_core_expectations()
     registered_expectation_implementations = []
     for (
         expectation_name,
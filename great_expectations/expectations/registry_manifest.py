@@ -0,0 +1,85 @@
+"""Generates registry manifest ("registry_manifest.json"), from which core modules are imported on first lookup.
+
+Every core Metric and Expectation module is imported, one at a time, and whatever it adds to (or overwrites in) the
+Expectation, Metric, and renderer registries is attributed to it.  Objects registered by "import great_expectations"
+itself are always available, and so are left out.  Manifest has to be generated in a fresh interpreter:
+
+    python -m great_expectations.expectations.registry_manifest
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from great_expectations.expectations import registry
+from great_expectations.expectations._lazy_exports import iter_lazy_export_modules
+
+# Imported in the same order as by "register_core_metrics()" and "register_core_expectations()".
+CORE_PACKAGE_NAMES: Tuple[str, ...] = (
+    "great_expectations.expectations.metrics",
+    "great_expectations.expectations.core",
+)
+
+
+def _get_registrations() -> Dict[Tuple[str, ...], Any]:
+    """Returns every registered object, keyed by its registry name, object name (and engine or renderer type)."""  # noqa: E501
+    registrations: Dict[Tuple[str, ...], Any] = {}
+    for expectation_type, expectation in registry._registered_expectations.items():
+        registrations[("expectations", expectation_type)] = expectation
+
+    for metric_name, metric_definition in registry._registered_metrics.items():
+        for engine_name, provider in metric_definition["providers"].items():
+            registrations[("metrics", metric_name, engine_name)] = provider
+
+    for object_name, renderers in registry._registered_renderers.items():
+        for renderer_type, renderer in renderers.items():
+            registrations[("renderers", object_name, renderer_type)] = renderer
+
+    return registrations
+
+
+def build_registry_manifest() -> Dict[str, Dict[str, List[str]]]:
+    """Imports every core module, and maps name of every object it registers to it.
+
+    Returns:
+        Dictionary of "expectations", "metrics", and "renderers" registries, each mapping name of registered object to
+        names of modules, which register it (in order of import).
+    """  # noqa: E501
+    if registry._registered_expectations:
+        raise RuntimeError(  # noqa: TRY003
+            "Registry manifest must be built in a fresh interpreter (before any Expectation is registered)."  # noqa: E501
+        )
+
+    manifest: Dict[str, Dict[str, List[str]]] = {
+        "expectations": {},
+        "metrics": {},
+        "renderers": {},
+    }
+    registrations: Dict[Tuple[str, ...], Any] = _get_registrations()
+    for package_name in CORE_PACKAGE_NAMES:
+        for module_name in iter_lazy_export_modules(package_name):
+            module_registrations: Dict[Tuple[str, ...], Any] = _get_registrations()
+            for key, registered in module_registrations.items():
+                if key in registrations and registrations[key] is registered:
+                    continue
+
+                registry_name, object_name = key[:2]
+                module_names: List[str] = manifest[registry_name].setdefault(object_name, [])
+                if module_name not in module_names:
+                    module_names.append(module_name)
+
+            registrations = module_registrations
+
+    return {
+        registry_name: dict(sorted(objects.items())) for registry_name, objects in manifest.items()
+    }
+
+
+def write_registry_manifest() -> None:
+    manifest: Dict[str, Dict[str, List[str]]] = build_registry_manifest()
+    registry.REGISTRY_MANIFEST_FILE.write_text(json.dumps(manifest, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    write_registry_manifest()
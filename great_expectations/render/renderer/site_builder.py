@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import itertools
+import json
 import logging
+import multiprocessing
 import os
 import pathlib
 import traceback
 import urllib
-from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.util import nested_update
@@ -17,6 +25,9 @@ from great_expectations.data_context.store.html_site_store import (
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.store.validation_results_store import (
+    ValidationResultsStore,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
@@ -26,9 +37,6 @@ from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.render.util import resource_key_passes_run_name_filter
 
 if TYPE_CHECKING:
-    from great_expectations.core.expectation_validation_result import (
-        ExpectationValidationResult,
-    )
     from great_expectations.data_context import AbstractDataContext
 
 logger = logging.getLogger(__name__)
@@ -64,6 +72,8 @@ class SiteBuilder:
         (filesystem or S3)
         * where the HTML files should be written (filesystem or S3)
         * which renderer and view class should be used to render each section
+        * how many worker processes should render pages (max_render_processes; by default, pages
+        are rendered by the building process itself)
 
     Here is an example of a minimal configuration for a site::
 
@@ -132,12 +142,14 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_render_processes: Optional[int] = None,
         **kwargs,
     ) -> None:
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.max_render_processes = max_render_processes
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -236,6 +248,7 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "max_render_processes": self.max_render_processes,
                 },
                 config_defaults={
                     "name": site_section_name,
@@ -314,7 +327,17 @@ class SiteBuilder:
         if self.cloud_mode:
             return
 
-        self.target_store.copy_static_assets()
+        # Static assets only change with GX version (and "clean_site()" removes them with manifest).
+        if (
+            self.target_store.get_manifest_entry(HtmlSiteStore.STATIC_ASSETS_MANIFEST_ENTRY)
+            != ge_version
+        ):
+            self.target_store.copy_static_assets()
+            self.target_store.set_manifest_entry(
+                HtmlSiteStore.STATIC_ASSETS_MANIFEST_ENTRY, ge_version
+            )
+
+        self.target_store.save_manifest()
 
         _, index_links_dict = self.site_index_builder.build(build_index=build_index)
         return (
@@ -340,6 +363,12 @@ class SiteBuilder:
 
 
 class DefaultSiteSectionBuilder:
+    # Number of resources retrieved from source store (concurrently, if supported) before rendering.
+    RESOURCE_FETCH_CHUNK_SIZE = 64
+    # Starting worker processes only pays off for sections with at least this many pages.
+    MIN_RESOURCES_TO_RENDER_IN_PROCESSES = 8
+    MAX_PENDING_RESOURCES_PER_PROCESS = 4
+
     def __init__(  # noqa: PLR0913
         self,
         name,
@@ -357,11 +386,13 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_render_processes: Optional[int] = None,
         **kwargs,
     ) -> None:
         self.name = name
         self.data_context = data_context
         self.source_store = data_context.stores[source_store_name]
+        self.max_render_processes = max_render_processes
         self.target_store = target_store
         self.run_name_filter = run_name_filter
         self.validation_results_limit = validation_results_limit
@@ -410,13 +441,204 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: C901, PLR0912
+        # Worker processes (see "max_render_processes") instantiate renderer and view of their own.
+        self._renderer_config: dict = renderer
+        self._view_config: dict = view
+        self._custom_styles_directory = custom_styles_directory
+        self._custom_views_directory = custom_views_directory
+
+        # computed when first needed (i.e., only if target store keeps manifest)
+        self._renderer_fingerprint: Optional[str] = None
+        self._existing_page_key_tuples: Optional[Set[tuple]] = None
+
+    def build(self, resource_identifiers=None) -> None:
+        """Builds pages of resources (of source store) that are new or changed since they were last built.
+
+        Pages, whose fingerprints (content hash of resource, and version of renderer and templates) are recorded in
+        manifest of target store, and which still exist, are skipped.  If "max_render_processes" is greater than 1,
+        pages are rendered in pool of worker processes (and written to target store, in order, by this process).
+
+        Args:
+            resource_identifiers: Identifiers of resources to build pages for (if None, all resources are considered).
+        """  # noqa: E501
+        resource_keys = self._get_resource_keys(resource_identifiers=resource_identifiers)
+        changed_resources = self._get_changed_resources(resource_keys=resource_keys)
+        if self._should_render_in_processes(num_resources=len(resource_keys)):
+            self._build_pages_in_processes(
+                resource_keys=resource_keys, changed_resources=changed_resources
+            )
+            return
+
+        for resource_key, retrieved_resource, fingerprint in changed_resources:
+            if retrieved_resource is None:
+                logger.warning(
+                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+                )
+                continue
+
+            self._log_rendering(resource_key=resource_key)
+            try:
+                if self.cloud_mode:
+                    self.target_store.set(
+                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
+                        self.renderer_class.render(
+                            _get_renderable_resource(
+                                resource_key=resource_key, resource=retrieved_resource
+                            )
+                        ),
+                        source_type=resource_key.resource_type,
+                        source_id=resource_key.id,
+                    )
+                else:
+                    self._write_page(
+                        resource_key=resource_key,
+                        viewable_content=_render_page(
+                            renderer=self.renderer_class,
+                            view=self.view_class,
+                            resource_key=resource_key,
+                            resource=retrieved_resource,
+                            data_context_id=self.data_context_id,
+                            show_how_to_buttons=self.show_how_to_buttons,
+                        ),
+                        fingerprint=fingerprint,
+                    )
+            except Exception as e:
+                _log_rendering_error(e)
+
+    def _should_render_in_processes(self, num_resources: int) -> bool:
+        # Daemonic processes (e.g., workers of task queues) cannot start processes of their own.
+        return (
+            not self.cloud_mode
+            and (self.max_render_processes or 1) > 1
+            and num_resources >= self.MIN_RESOURCES_TO_RENDER_IN_PROCESSES
+            and not multiprocessing.current_process().daemon
+        )
+
+    def _build_pages_in_processes(
+        self, resource_keys: list, changed_resources: Iterator[Tuple[Any, Any, Optional[str]]]
+    ) -> None:
+        """Renders pages in pool of worker processes (each with its own renderer and view), writing them in order.
+
+        Only rendering is distributed: pages are written to target store (and recorded in its manifest) by this
+        process, in order of resources, so that output is the same as that of serial build.
+        """  # noqa: E501
+        # Worker processes are only started, once there is page to render.
+        first_changed_resource = next(changed_resources, None)
+        if first_changed_resource is None:
+            return
+
+        max_processes: int = self.max_render_processes or 1
+        # Resources are submitted lazily, so only few of them (per process) are in memory at once.
+        max_pending: int = max_processes * self.MAX_PENDING_RESOURCES_PER_PROCESS
+        pending: Deque[Tuple[Any, Optional[str], Future]] = deque()
+        # "spawn" does not inherit state (e.g., threads, or open connections) of this process.
+        with ProcessPoolExecutor(
+            max_workers=max_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_page_render_process,
+            initargs=(
+                self._renderer_config,
+                self._view_config,
+                self._custom_styles_directory,
+                self._custom_views_directory,
+                self.data_context_id,
+                self.show_how_to_buttons,
+                self._get_expectation_suite_metas(resource_keys=resource_keys),
+            ),
+        ) as executor:
+            for resource_key, retrieved_resource, fingerprint in itertools.chain(
+                [first_changed_resource], changed_resources
+            ):
+                if retrieved_resource is None:
+                    logger.warning(
+                        f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+                    )
+                    continue
+
+                self._log_rendering(resource_key=resource_key)
+                pending.append(
+                    (
+                        resource_key,
+                        fingerprint,
+                        executor.submit(_render_page_in_process, resource_key, retrieved_resource),
+                    )
+                )
+                if len(pending) >= max_pending:
+                    self._write_rendered_page(*pending.popleft())
+
+            while pending:
+                self._write_rendered_page(*pending.popleft())
+
+    def _write_rendered_page(
+        self, resource_key: Any, fingerprint: Optional[str], future: Future
+    ) -> None:
+        try:
+            self._write_page(
+                resource_key=resource_key, viewable_content=future.result(), fingerprint=fingerprint
+            )
+        except Exception as e:
+            _log_rendering_error(e)
+
+    def _write_page(
+        self, resource_key: Any, viewable_content: str, fingerprint: Optional[str]
+    ) -> None:
+        page_key = SiteSectionIdentifier(
+            site_section_name=self.name,
+            resource_identifier=resource_key,
+        )
+        self.target_store.set(page_key, viewable_content)
+        if fingerprint is not None:
+            self.target_store.set_manifest_entry(
+                HtmlSiteStore.get_manifest_entry_name(page_key), fingerprint
+            )
+
+    def _get_expectation_suite_metas(self, resource_keys: list) -> Dict[str, dict]:
+        """Returns meta of Expectation Suites of validation results (which renderers of worker processes, having no Data Context, read)."""  # noqa: E501
+        expectation_suite_metas: Dict[str, dict] = {}
+        for expectation_suite_name in sorted(
+            {
+                resource_key.expectation_suite_identifier.name
+                for resource_key in resource_keys
+                if isinstance(resource_key, ValidationResultIdentifier)
+            }
+        ):
+            try:
+                expectation_suite_metas[expectation_suite_name] = copy.deepcopy(
+                    self.data_context.suites.get(expectation_suite_name).meta
+                )
+            except Exception as e:
+                logger.debug(
+                    f"Unable to retrieve Expectation Suite {expectation_suite_name}: {e!r}"
+                )
+
+        return expectation_suite_metas
+
+    def _log_rendering(self, resource_key: Any) -> None:
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.name
+            logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = resource_key.expectation_suite_identifier.name
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                )
+
+    def _get_resource_keys(self, resource_identifiers=None) -> list:
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -429,68 +651,88 @@ class DefaultSiteSectionBuilder:
             if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
                 if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
-                )
-                continue
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.name
-                logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = resource_key.expectation_suite_identifier.name
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
-                    )
+            resource_keys.append(resource_key)
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
+        return resource_keys
 
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
-An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
-not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
-diagnose and repair the underlying issue.  Detailed information follows:
-                """  # noqa: E501
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+    def _get_changed_resources(
+        self, resource_keys: list
+    ) -> Iterator[Tuple[Any, Any, Optional[str]]]:
+        """Yields (key, resource, fingerprint) triples of resources, whose pages are new or changed.
+
+        Serialized resources are fingerprinted (and only those of changed pages are deserialized).  If target store
+        keeps no manifest, all resources are yielded (with fingerprints of None).
+        """  # noqa: E501
+        if not (
+            isinstance(self.target_store, HtmlSiteStore) and self.target_store.supports_manifest
+        ):
+            for resource_key, resource in self._get_resources(resource_keys=resource_keys):
+                yield resource_key, resource, None
+
+            return
+
+        # Pages are listed once per build (and only if any of them might be skipped).
+        self._existing_page_key_tuples = None
+        num_skipped = 0
+        for idx in range(0, len(resource_keys), self.RESOURCE_FETCH_CHUNK_SIZE):
+            chunk = resource_keys[idx : idx + self.RESOURCE_FETCH_CHUNK_SIZE]
+            serialized_resources = self.source_store.store_backend.get_many(
+                [self.source_store.key_to_tuple(resource_key) for resource_key in chunk]
+            )
+            for resource_key, serialized_resource in zip(chunk, serialized_resources):
+                if not serialized_resource:
+                    yield resource_key, None, None
+                    continue
+
+                fingerprint: str = self._get_fingerprint(serialized_resource=serialized_resource)
+                if self._is_page_up_to_date(resource_key=resource_key, fingerprint=fingerprint):
+                    num_skipped += 1
+                    continue
+
+                yield (
+                    resource_key,
+                    self.source_store.deserialize(serialized_resource),
+                    fingerprint,
                 )
-                logger.error(exception_message)  # noqa: TRY400
+
+        logger.debug(f"Skipped {num_skipped} unchanged pages of site section {self.name}")
+
+    def _is_page_up_to_date(self, resource_key: Any, fingerprint: str) -> bool:
+        manifest_entry_name: str = HtmlSiteStore.get_manifest_entry_name(
+            SiteSectionIdentifier(site_section_name=self.name, resource_identifier=resource_key)
+        )
+        if self.target_store.get_manifest_entry(manifest_entry_name) != fingerprint:
+            return False
+
+        if self._existing_page_key_tuples is None:
+            self._existing_page_key_tuples = self.target_store.list_page_key_tuples(
+                type(resource_key)
+            )
+
+        return resource_key.to_tuple() in self._existing_page_key_tuples
+
+    def _get_fingerprint(self, serialized_resource: Any) -> str:
+        if self._renderer_fingerprint is None:
+            self._renderer_fingerprint = _get_renderer_fingerprint(
+                renderer=self.renderer_class,
+                view=self.view_class,
+                renderer_config=self._renderer_config,
+                view_config=self._view_config,
+                render_options=[self.name, self.data_context_id, self.show_how_to_buttons],
+            )
+
+        content_hash = hashlib.sha256(_to_bytes(serialized_resource)).hexdigest()
+        return f"{self._renderer_fingerprint}:{content_hash}"
+
+    def _get_resources(self, resource_keys: list) -> Iterator[Tuple[Any, Any]]:
+        """Yields (key, resource) pairs, fetching resources from source store in bulk, one chunk at a time.
+
+        Resources, which could not be retrieved, are yielded as None.
+        """  # noqa: E501
+        for idx in range(0, len(resource_keys), self.RESOURCE_FETCH_CHUNK_SIZE):
+            chunk = resource_keys[idx : idx + self.RESOURCE_FETCH_CHUNK_SIZE]
+            yield from zip(chunk, self.source_store.get_many(chunk))
 
 
 class DefaultSiteIndexBuilder:
@@ -852,17 +1094,20 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
-            for profiling_result_key in profiling_result_site_keys:
+            for profiling_result_key, summary in zip(
+                profiling_result_site_keys,
+                self._get_validation_result_summaries(
+                    validation_result_keys=profiling_result_site_keys, section_name="profiling"
+                ),
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("profiling"),
-                    )
+                    if summary is None:
+                        summary = self._get_validation_result_summary(  # noqa: PLW2901
+                            validation_result_key=profiling_result_key, section_name="profiling"
+                        )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = summary["meta"].get("batch_kwargs", {})
+                    batch_spec = summary["meta"].get("batch_spec", {})
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -872,7 +1117,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         run_id=profiling_result_key.run_id,
                         run_time=profiling_result_key.run_id.run_time,
                         run_name=profiling_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
+                        asset_name=_resolve_asset_name(summary["meta"]),
                         batch_kwargs=batch_kwargs,
                         batch_spec=batch_spec,
                     )
@@ -906,18 +1151,21 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
-            for validation_result_key in validation_result_site_keys:
+            for validation_result_key, summary in zip(
+                validation_result_site_keys,
+                self._get_validation_result_summaries(
+                    validation_result_keys=validation_result_site_keys, section_name="validations"
+                ),
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("validations"),
-                    )
+                    if summary is None:
+                        summary = self._get_validation_result_summary(  # noqa: PLW2901
+                            validation_result_key=validation_result_key, section_name="validations"
+                        )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = summary["success"]
+                    batch_kwargs = summary["meta"].get("batch_kwargs", {})
+                    batch_spec = summary["meta"].get("batch_spec", {})
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -928,7 +1176,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         validation_success=validation_success,
                         run_time=validation_result_key.run_id.run_time,
                         run_name=validation_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
+                        asset_name=_resolve_asset_name(summary["meta"]),
                         batch_kwargs=batch_kwargs,
                         batch_spec=batch_spec,
                     )
@@ -936,21 +1184,200 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
                     logger.warning(error_msg)
 
+    def _get_validation_result_summaries(
+        self,
+        validation_result_keys: List[ValidationResultIdentifier],
+        section_name: str,
+    ) -> List[Optional[dict]]:
+        """Retrieves stored summaries of Validation Results in bulk (None for each result without one)."""  # noqa: E501
+        store_name: str = (
+            self.source_stores.get(section_name) or self.data_context.validation_results_store_name
+        )
+        source_store = self.data_context.stores.get(store_name)
+        if not isinstance(source_store, ValidationResultsStore):
+            return [None] * len(validation_result_keys)
+
+        return source_store.get_summaries(validation_result_keys)
+
+    def _get_validation_result_summary(
+        self, validation_result_key: ValidationResultIdentifier, section_name: str
+    ) -> dict:
+        # Results without stored summary are retrieved in full (and summarized).
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
+            run_id=validation_result_key.run_id,
+            validation_results_store_name=self.source_stores.get(section_name),
+        )
+        return ValidationResultsStore.get_summary(validation)
+
+
+# Renderer and view of worker process (see "DefaultSiteSectionBuilder.max_render_processes").
+_page_render_process_state: Optional[Tuple[Any, Any, Optional[str], bool]] = None
+
+
+class _ExpectationSuiteMetas:
+    """Stands in for Data Context of worker process, from which renderers only read meta of Expectation Suites."""  # noqa: E501
+
+    def __init__(self, expectation_suite_metas: Dict[str, dict]) -> None:
+        self._expectation_suite_metas = expectation_suite_metas
+
+    @property
+    def suites(self) -> _ExpectationSuiteMetas:
+        return self
+
+    def get(self, name: str) -> SimpleNamespace:
+        if name not in self._expectation_suite_metas:
+            raise exceptions.DataContextError(f"Expectation Suite {name} was not found.")  # noqa: TRY003
+
+        return SimpleNamespace(meta=copy.deepcopy(self._expectation_suite_metas[name]))
+
+
+def _init_page_render_process(  # noqa: PLR0913
+    renderer_config: dict,
+    view_config: dict,
+    custom_styles_directory: Optional[str],
+    custom_views_directory: Optional[str],
+    data_context_id: Optional[str],
+    show_how_to_buttons: bool,
+    expectation_suite_metas: Dict[str, dict],
+) -> None:
+    global _page_render_process_state  # noqa: PLW0603
+    renderer = instantiate_class_from_config(
+        config=renderer_config,
+        runtime_environment={"data_context": _ExpectationSuiteMetas(expectation_suite_metas)},
+        config_defaults={
+            "module_name": renderer_config.get("module_name")
+            or "great_expectations.render.renderer"
+        },
+    )
+    view = instantiate_class_from_config(
+        config=view_config,
+        runtime_environment={
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        },
+        config_defaults={"module_name": "great_expectations.render.view"},
+    )
+    _page_render_process_state = (renderer, view, data_context_id, show_how_to_buttons)
+
+
+def _render_page_in_process(resource_key: Any, resource: Any) -> str:
+    assert _page_render_process_state is not None, "Worker process was not initialized."
+    renderer, view, data_context_id, show_how_to_buttons = _page_render_process_state
+    return _render_page(
+        renderer=renderer,
+        view=view,
+        resource_key=resource_key,
+        resource=resource,
+        data_context_id=data_context_id,
+        show_how_to_buttons=show_how_to_buttons,
+    )
+
+
+def _render_page(  # noqa: PLR0913
+    renderer: Any,
+    view: Any,
+    resource_key: Any,
+    resource: Any,
+    data_context_id: Optional[str],
+    show_how_to_buttons: bool,
+) -> str:
+    rendered_content = renderer.render(
+        _get_renderable_resource(resource_key=resource_key, resource=resource)
+    )
+    return view.render(
+        rendered_content,
+        data_context_id=data_context_id,
+        show_how_to_buttons=show_how_to_buttons,
+    )
+
+
+def _get_renderable_resource(resource_key: Any, resource: Any) -> Any:
+    if isinstance(resource_key, ExpectationSuiteIdentifier):
+        return ExpectationSuite(**resource)
+
+    return resource
+
+
+def _log_rendering_error(e: Exception) -> None:
+    exception_message = """\
+An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
+not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
+diagnose and repair the underlying issue.  Detailed information follows:
+                """  # noqa: E501
+    exception_traceback = traceback.format_exc()
+    exception_message += f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+    logger.error(exception_message)
+
+
+def _get_renderer_fingerprint(
+    renderer: Any, view: Any, renderer_config: dict, view_config: dict, render_options: list
+) -> str:
+    """Returns hash of GX version, renderer and view classes (and their configurations), custom templates and styles,
+    and render options.
+    """  # noqa: E501
+    custom_files: List[Tuple[str, int, int]] = []
+    for directory in (
+        getattr(view, "custom_styles_directory", None),
+        getattr(view, "custom_views_directory", None),
+    ):
+        if not directory:
+            continue
+
+        # Custom templates and styles are identified by their paths, sizes, and modification times.
+        for path in sorted(pathlib.Path(directory).rglob("*")):
+            if path.is_file():
+                stat = path.stat()
+                custom_files.append((str(path), stat.st_size, stat.st_mtime_ns))
+
+    return hashlib.sha256(
+        json.dumps(
+            [
+                ge_version,
+                f"{type(renderer).__module__}.{type(renderer).__qualname__}",
+                f"{type(view).__module__}.{type(view).__qualname__}",
+                # Nested configuration (e.g., "column_section_renderer") affects pages, too.
+                _normalize_class_config(config=renderer_config),
+                _normalize_class_config(config=view_config),
+                custom_files,
+                render_options,
+            ],
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def _normalize_class_config(config: dict) -> dict:
+    # Module and class names are fingerprinted (as resolved) by instantiated class.
+    return {key: value for key, value in config.items() if key not in ("module_name", "class_name")}
+
+
+def _to_bytes(serialized_resource: Any) -> bytes:
+    if isinstance(serialized_resource, bytes):
+        return serialized_resource
+
+    if isinstance(serialized_resource, str):
+        return serialized_resource.encode("utf-8")
+
+    return json.dumps(serialized_resource, sort_keys=True, default=str).encode("utf-8")
+
 
-def _resolve_asset_name(validation_results: ExpectationValidationResult) -> str | None:
+def _resolve_asset_name(meta: dict) -> str | None:
     """
-    Resolve the asset name from the validation results meta data.
+    Resolve the asset name from the validation results meta data (or that of their summary).
     FDS does not store data_asset_name in batch_kwargs or batch_spec and it must be
     pulled from the active batch definition.
     """
-    batch_kwargs = validation_results.meta.get("batch_kwargs", {})
-    batch_spec = validation_results.meta.get("batch_spec", {})
+    batch_kwargs = meta.get("batch_kwargs", {})
+    batch_spec = meta.get("batch_spec", {})
 
     asset_name = batch_kwargs.get("data_asset_name") or batch_spec.get("data_asset_name")
     if asset_name:
         return asset_name
     # FDS does not store data_asset_name in batch_kwargs or batch_spec
-    active_batch = validation_results.meta.get("active_batch_definition", {})
+    active_batch = meta.get("active_batch_definition", {})
     return active_batch.get("data_asset_name")
 
 
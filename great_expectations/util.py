@@ -1207,6 +1207,14 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     Raises:
         TypeError: A non-JSON-serializable field was found.
     """
+    # Most values (and elements of containers) are of few common types, which are converted without
+    # walking through the chain of "isinstance()" checks below (subclasses still go through it).
+    converter: Callable[[Any], JSONValues] | None = _JSON_SERIALIZABLE_CONVERTERS_BY_TYPE.get(
+        type(data)
+    )
+    if converter is not None:
+        return converter(data)
+
     if isinstance(data, pydantic.BaseModel):
         return json.loads(data.json())
 
@@ -1225,25 +1233,13 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
         return list(data)
 
     if isinstance(data, dict):
-        new_dict = {}
-        for key in data:
-            # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string  # noqa: E501
-            new_dict[str(key)] = convert_to_json_serializable(data[key])
-
-        return new_dict
+        return _convert_dict_to_json_serializable(data)
 
     if isinstance(data, (list, tuple, set)):
-        new_list: List[JSONValues] = []
-        for val in data:
-            new_list.append(convert_to_json_serializable(val))
-
-        return new_list
+        return _convert_collection_to_json_serializable(data)
 
     if isinstance(data, (np.ndarray, pd.Index)):
-        # test_obj[key] = test_obj[key].tolist()
-        # If we have an array or index, convert it first to a list--causing coercion to float--and then round  # noqa: E501
-        # to the number of digits for which the string representation will equal the float representation  # noqa: E501
-        return [convert_to_json_serializable(x) for x in data.tolist()]
+        return _convert_array_to_json_serializable(data)
 
     if isinstance(data, np.int64):
         return int(data)
@@ -1302,20 +1298,10 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
         pass
 
     if isinstance(data, pd.Series):
-        # Converting a series is tricky since the index may not be a string, but all json
-        # keys must be strings. So, we use a very ugly serialization strategy
-        index_name = data.index.name or "index"
-        value_name = data.name or "value"
-        return [
-            {
-                index_name: convert_to_json_serializable(idx),  # type: ignore[call-overload]
-                value_name: convert_to_json_serializable(val),  # type: ignore[dict-item]
-            }
-            for idx, val in data.items()
-        ]
+        return _convert_series_to_json_serializable(data)
 
     if isinstance(data, pd.DataFrame):
-        return convert_to_json_serializable(data.to_dict(orient="records"))
+        return _convert_dataframe_to_json_serializable(data)
 
     if pyspark.DataFrame and isinstance(data, pyspark.DataFrame):  # type: ignore[truthy-function]
         # using StackOverflow suggestion for converting pyspark df into dictionary
@@ -1359,6 +1345,144 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     raise TypeError(f"{data!s} is of type {type(data).__name__} which cannot be serialized.")  # noqa: TRY003
 
 
+def _return_unchanged(data: JSONValues) -> JSONValues:
+    # No problem to encode json
+    return data
+
+
+def _convert_float_to_json_serializable(data: float) -> float | None:
+    # Handling "float(nan)" separately is required by Python-3.6 and Pandas-0.23 versions.
+    if np.isnan(data):
+        return None
+
+    return data
+
+
+def _convert_numpy_floating_to_json_serializable(data: np.floating) -> float:
+    return float(round(data, sys.float_info.dig))
+
+
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    new_dict = {}
+    for key in data:
+        # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string  # noqa: E501
+        new_dict[str(key)] = convert_to_json_serializable(data[key])
+
+    return new_dict
+
+
+def _convert_collection_to_json_serializable(data: Union[list, tuple, set, range]) -> list:
+    return [convert_to_json_serializable(val) for val in data]
+
+
+def _convert_numpy_values_to_json_serializable(values: np.ndarray) -> list | None:
+    """Converts homogeneous boolean, numeric, or string arrays with vectorized operations.
+
+    Each element of the result is identical to element-wise conversion of "values.tolist()" (which
+    turns NumPy scalars into built-in Python scalars); "None" is returned for other kinds of arrays.
+    """
+    if values.ndim == 0:
+        return None
+
+    kind: str = values.dtype.kind
+    if kind in "biuU":
+        return values.tolist()
+
+    # Extended precision floats are not converted to Python floats by "tolist()" (and are rounded).
+    if kind == "f" and values.dtype.itemsize <= np.dtype(np.float64).itemsize:
+        nan_mask: np.ndarray = np.isnan(values)
+        if not nan_mask.any():
+            return values.tolist()
+
+        objects: np.ndarray = values.astype(object)
+        objects[nan_mask] = None
+        return objects.tolist()
+
+    return None
+
+
+def _convert_array_to_json_serializable(data: Union[np.ndarray, pd.Index]) -> list:
+    if isinstance(data.dtype, np.dtype):
+        new_list: list | None = _convert_numpy_values_to_json_serializable(values=np.asarray(data))
+        if new_list is not None:
+            return new_list
+
+    return _convert_collection_to_json_serializable(data.tolist())
+
+
+def _convert_series_to_json_serializable(data: pd.Series) -> list:
+    # Converting a series is tricky since the index may not be a string, but all json
+    # keys must be strings. So, we use a very ugly serialization strategy
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+
+    values: list | None = None
+    if isinstance(data.dtype, np.dtype):
+        values = _convert_numpy_values_to_json_serializable(values=data.to_numpy())
+
+    if values is None:
+        values = _convert_collection_to_json_serializable(data)
+
+    return [
+        {index_name: idx, value_name: val}
+        for idx, val in zip(_convert_array_to_json_serializable(data.index), values)
+    ]
+
+
+def _convert_dataframe_to_json_serializable(data: pd.DataFrame) -> list:
+    return convert_to_json_serializable(data.to_dict(orient="records"))
+
+
+def _convert_datetime_to_json_serializable(data: datetime.date) -> str:
+    return data.isoformat()
+
+
+# Converters of (exact) types, conversions of which by "convert_to_json_serializable()" do not
+# depend on anything except type; each converter returns what the "isinstance()" chain would.
+_JSON_SERIALIZABLE_CONVERTERS_BY_TYPE: Dict[type, Callable[[Any], JSONValues]] = {
+    type(None): _return_unchanged,
+    str: _return_unchanged,
+    int: _return_unchanged,
+    bool: _return_unchanged,
+    float: _convert_float_to_json_serializable,
+    np.float64: _convert_float_to_json_serializable,
+    np.float32: _convert_numpy_floating_to_json_serializable,
+    np.longdouble: _convert_numpy_floating_to_json_serializable,
+    np.bool_: bool,
+    **{
+        numpy_integer_type: int
+        for numpy_integer_type in (
+            np.int8,
+            np.int16,
+            np.int32,
+            np.int64,
+            np.longlong,
+            np.uint8,
+            np.uint16,
+            np.uint32,
+            np.uint64,
+            np.ulonglong,
+        )
+    },
+    np.datetime64: np.datetime_as_string,
+    datetime.datetime: _convert_datetime_to_json_serializable,
+    datetime.date: _convert_datetime_to_json_serializable,
+    pd.Timestamp: _convert_datetime_to_json_serializable,
+    uuid.UUID: str,
+    bytes: str,
+    dict: _convert_dict_to_json_serializable,
+    list: _convert_collection_to_json_serializable,
+    tuple: _convert_collection_to_json_serializable,
+    set: _convert_collection_to_json_serializable,
+    range: _convert_collection_to_json_serializable,
+    np.ndarray: _convert_array_to_json_serializable,
+    pd.Index: _convert_array_to_json_serializable,
+    pd.RangeIndex: _convert_array_to_json_serializable,
+    pd.Series: _convert_series_to_json_serializable,
+    pd.DataFrame: _convert_dataframe_to_json_serializable,
+}
+
+
 def ensure_json_serializable(data: Any) -> None:  # noqa: C901, PLR0911, PLR0912
     """
     Helper function to convert an object to one that is json serializable
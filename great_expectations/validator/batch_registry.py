@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from great_expectations.core.batch_definition import BatchDefinition
+    from great_expectations.datasource.fluent.batch_request import BatchParameters
+    from great_expectations.datasource.fluent.interfaces import Batch
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRegistry:
+    """Run-scoped registry of loaded Batches, so that every distinct Batch (BatchDefinition and batch parameters) is loaded once.
+
+    Validators of all Expectation Suites validated against registered Batch share it (and, since its data stays loaded
+    in the same ExecutionEngine, metrics already computed for it).  Registry is released at the end of the run, which
+    releases data (and cached metrics) of registered Batches from their ExecutionEngines.
+
+    Registry is not meant for loading the same Batch in several threads at once (since Batches share ExecutionEngines,
+    users of the same Batch are run in the same thread).
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._batches: Dict[Hashable, Batch] = {}
+
+    @staticmethod
+    def get_key(
+        batch_definition: BatchDefinition,
+        batch_parameters: Optional[BatchParameters] = None,
+    ) -> Hashable:
+        """Returns key, identifying Batch of "batch_definition" for "batch_parameters".
+
+        Args:
+            batch_definition: BatchDefinition, whose Batch is identified
+            batch_parameters: parameters, selecting Batch (e.g., "year" and "month", or "dataframe")
+
+        Returns:
+            Hashable key (unhashable parameter values, such as DataFrames, are identified by object identity).
+        """  # noqa: E501
+        data_asset = batch_definition.data_asset
+        return (
+            data_asset.datasource.name,
+            data_asset.name,
+            batch_definition.name,
+            tuple(
+                (name, _get_parameter_key(value))
+                for name, value in sorted((batch_parameters or {}).items())
+            ),
+        )
+
+    def get_batch(
+        self,
+        batch_definition: BatchDefinition,
+        batch_parameters: Optional[BatchParameters] = None,
+    ) -> Optional[Batch]:
+        """Returns registered Batch of "batch_definition" for "batch_parameters" (or None, if not loaded yet)."""  # noqa: E501
+        key: Hashable = self.get_key(
+            batch_definition=batch_definition, batch_parameters=batch_parameters
+        )
+        with self._lock:
+            return self._batches.get(key)
+
+    def register_batch(
+        self,
+        batch_definition: BatchDefinition,
+        batch_parameters: Optional[BatchParameters],
+        batch: Batch,
+    ) -> None:
+        """Registers loaded Batch of "batch_definition" for "batch_parameters" (for the rest of the run)."""  # noqa: E501
+        key: Hashable = self.get_key(
+            batch_definition=batch_definition, batch_parameters=batch_parameters
+        )
+        with self._lock:
+            self._batches.setdefault(key, batch)
+
+    def release(self) -> None:
+        """Releases data (and cached metrics) of registered Batches from their ExecutionEngines, and empties registry."""  # noqa: E501
+        with self._lock:
+            batches: Tuple[Batch, ...] = tuple(self._batches.values())
+            self._batches.clear()
+
+        batch: Batch
+        for batch in batches:
+            try:
+                batch.data.execution_engine.release_batch(batch_id=batch.id)
+            except Exception as e:
+                logger.debug(f"Unable to release Batch {batch.id}: {e!r}")
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+
+def _get_parameter_key(value: Any) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+
+    return value
@@ -5,7 +5,7 @@ from typing import Optional, Tuple, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.domain import Domain
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import IDDict, _intern_id
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.experimental.metric_repository.metrics import MetricTypes
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
@@ -51,6 +51,8 @@ class MetricConfiguration:
 
         self._metric_dependencies: IDDict = IDDict({})
 
+        self._id: Optional[Tuple[str, str, str]] = None
+
     def __repr__(self):  # type: ignore[explicit-override] # FIXME
         return json.dumps(self.to_json_dict(), indent=2)
 
@@ -153,11 +155,23 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
-        return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
-        )
+        metric_domain_kwargs_id: str = self.metric_domain_kwargs_id
+        metric_value_kwargs_id: str = self.metric_value_kwargs_id
+        # Kwargs IDs are cached by "IDDict" and are the same objects, unless kwargs have been modified since.  # noqa: E501
+        if (
+            self._id is None
+            or self._id[1] is not metric_domain_kwargs_id
+            or self._id[2] is not metric_value_kwargs_id
+        ):
+            self._id = _intern_id(
+                (
+                    self.metric_name,
+                    metric_domain_kwargs_id,
+                    metric_value_kwargs_id,
+                )
+            )
+
+        return self._id
 
     def to_json_dict(self) -> dict:
         """Returns a JSON-serializable dict representation of this MetricConfiguration.
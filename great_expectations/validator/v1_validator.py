@@ -21,17 +21,23 @@ if TYPE_CHECKING:
     from great_expectations.core import ExpectationSuite
     from great_expectations.core.batch_definition import BatchDefinition
     from great_expectations.core.result_format import ResultFormatUnion
-    from great_expectations.datasource.fluent.batch_request import BatchParameters
+    from great_expectations.datasource.fluent.batch_request import BatchParameters, BatchRequest
+    from great_expectations.datasource.fluent.interfaces import Batch
     from great_expectations.expectations.expectation import (
         Expectation,
         ExpectationConfiguration,
     )
+    from great_expectations.validator.batch_registry import BatchRegistry
+    from great_expectations.validator.validation_plan import ValidationPlan
 
 
 class Validator:
     """Validator.
 
     Responsible for running expectations on a batch definition.
+
+    If a batch registry is given, the batch is taken from (or, once loaded, added to) it, so that
+    validators of the same batch definition and batch parameters share a single loaded batch.
     """
 
     def __init__(
@@ -39,10 +45,12 @@ class Validator:
         batch_definition: BatchDefinition,
         result_format: ResultFormatUnion = DEFAULT_RESULT_FORMAT,
         batch_parameters: Optional[BatchParameters] = None,
+        batch_registry: Optional[BatchRegistry] = None,
     ) -> None:
         self._batch_definition = batch_definition
         self._batch_parameters = batch_parameters
         self.result_format = result_format
+        self._batch_registry = batch_registry
 
         self._get_validator = project_manager.get_validator
 
@@ -61,12 +69,20 @@ class Validator:
         self,
         expectation_suite: ExpectationSuite,
         expectation_parameters: Optional[dict[str, Any]] = None,
+        validation_plan: Optional[ValidationPlan] = None,
     ) -> ExpectationSuiteValidationResult:
-        """Run an expectation suite against the batch definition"""
-        results = self._validate_expectation_configs(
-            expectation_suite.expectation_configurations,
-            expectation_parameters,
-        )
+        """Run an expectation suite against the batch definition
+
+        If "validation_plan" (compiled from the same suite and parameters) is given, it is reused.
+        """
+        results: list[ExpectationValidationResult]
+        if validation_plan is None:
+            results = self._validate_expectation_configs(
+                expectation_suite.expectation_configurations,
+                expectation_parameters,
+            )
+        else:
+            results = self._run_validation_plan(validation_plan)
         statistics = calc_validation_statistics(results)
 
         return ExpectationSuiteValidationResult(
@@ -94,6 +110,24 @@ class Validator:
             batch_id=self.active_batch_id,
         )
 
+    def compile_validation_plan(
+        self,
+        expectation_suite: ExpectationSuite,
+        expectation_parameters: Optional[dict[str, Any]] = None,
+    ) -> ValidationPlan:
+        """Compile an expectation suite into a validation plan, reusable for other batches
+
+        The plan can be passed to "validate_expectation_suite" of validators of other batches (of
+        the same kind of data asset), which then skip building expectations and metric graphs.
+        """
+        processed_expectation_configs = self._wrapped_validator.process_expectations_for_validation(
+            expectation_suite.expectation_configurations, expectation_parameters
+        )
+        return self._wrapped_validator.compile_validation_plan(
+            configurations=processed_expectation_configs,
+            runtime_configuration=self._get_runtime_configuration(),
+        )
+
     @property
     def active_batch_id(self) -> Optional[str]:
         return self._wrapped_validator.active_batch_id
@@ -104,10 +138,25 @@ class Validator:
 
     @cached_property
     def _wrapped_validator(self) -> OldValidator:
-        batch_request = self._batch_definition.build_batch_request(
-            batch_parameters=self._batch_parameters
+        if self._batch_registry is None:
+            return self._get_validator(batch_request=self._build_batch_request())
+
+        batch: Optional[Batch] = self._batch_registry.get_batch(
+            batch_definition=self._batch_definition, batch_parameters=self._batch_parameters
+        )
+        if batch is not None:
+            return self._get_validator(batch_list=[batch])
+
+        validator = self._get_validator(batch_request=self._build_batch_request())
+        self._batch_registry.register_batch(
+            batch_definition=self._batch_definition,
+            batch_parameters=self._batch_parameters,
+            batch=validator.active_batch,
         )
-        return self._get_validator(batch_request=batch_request)
+        return validator
+
+    def _build_batch_request(self) -> BatchRequest:
+        return self._batch_definition.build_batch_request(batch_parameters=self._batch_parameters)
 
     def _validate_expectation_configs(
         self,
@@ -119,15 +168,9 @@ class Validator:
             expectation_configs, expectation_parameters
         )
 
-        runtime_configuration: dict
-        if isinstance(self.result_format, ResultFormat):
-            runtime_configuration = {"result_format": self.result_format.value}
-        else:
-            runtime_configuration = {"result_format": self.result_format}
-
         results = self._wrapped_validator.graph_validate(
             configurations=processed_expectation_configs,
-            runtime_configuration=runtime_configuration,
+            runtime_configuration=self._get_runtime_configuration(),
         )
 
         if self._include_rendered_content:
@@ -135,3 +178,21 @@ class Validator:
                 result.render()
 
         return results
+
+    def _run_validation_plan(
+        self, validation_plan: ValidationPlan
+    ) -> list[ExpectationValidationResult]:
+        """Run a compiled validation plan against the batch definition"""
+        results = self._wrapped_validator.run_validation_plan(validation_plan=validation_plan)
+
+        if self._include_rendered_content:
+            for result in results:
+                result.render()
+
+        return results
+
+    def _get_runtime_configuration(self) -> dict:
+        if isinstance(self.result_format, ResultFormat):
+            return {"result_format": self.result_format.value}
+
+        return {"result_format": self.result_format}
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import logging
 import traceback
+from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Callable,
+    DefaultDict,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -74,6 +77,116 @@ class MetricEdge:
         return f"<{self._left.__repr__()}|{self._right.__repr__()}>"
 
 
+class _MetricDependencyIndex:
+    """Indexes "MetricEdge" objects of a "ValidationGraph" for scheduling metric resolution in topological waves.
+
+    Every metric appearing on the left side of an edge is a vertex; a vertex is "ready" when all of its dependencies
+    (right sides of its edges) have been resolved, and "needed" otherwise.  Counters of unresolved dependencies are
+    decremented as metrics get resolved, so that finding the next wave only touches dependents of resolved metrics.
+
+    The index must be built from a fully constructed graph, because "MetricConfiguration" IDs can change while the
+    graph is being built (default domain/value kwargs are filled in as dependencies are expanded).
+    """  # noqa: E501
+
+    def __init__(self, edges: Iterable[MetricEdge]) -> None:
+        self._metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        self._dependency_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+        # Dependents are kept in insertion order (as keys of dictionaries), so that waves are
+        # deterministic.
+        self._dependent_ids: DefaultDict[_MetricKey, Dict[_MetricKey, None]] = defaultdict(dict)
+
+        self._ready_metrics: Dict[_MetricKey, MetricConfiguration] = {}
+        self._num_unresolved_dependencies: Dict[_MetricKey, int] = {}
+        # Number of unresolved metrics depending on every pending dependency.
+        self._num_pending_dependents: Dict[_MetricKey, int] = {}
+
+        edge: MetricEdge
+        left_id: _MetricKey
+        right_id: _MetricKey
+        for edge in edges:
+            left_id = edge.left.id
+            if left_id not in self._metric_configurations:
+                self._metric_configurations[left_id] = edge.left
+                self._dependency_ids[left_id] = set()
+
+            if edge.right is not None:
+                right_id = edge.right.id
+                self._dependency_ids[left_id].add(right_id)
+                self._dependent_ids[right_id][left_id] = None
+
+    @property
+    def ready_metrics(self) -> List[MetricConfiguration]:
+        """Unresolved metrics, all of whose dependencies have been resolved."""
+        return list(self._ready_metrics.values())
+
+    @property
+    def needed_metrics(self) -> List[MetricConfiguration]:
+        """Unresolved metrics, which still have unresolved dependencies."""
+        return [
+            self._metric_configurations[metric_id]
+            for metric_id in self._num_unresolved_dependencies
+        ]
+
+    @property
+    def num_needed_metrics(self) -> int:
+        return len(self._num_unresolved_dependencies)
+
+    @property
+    def pending_dependency_ids(self) -> Set[_MetricKey]:
+        """IDs of metrics, on which unresolved (ready or needed) metrics depend."""
+        return set(self._num_pending_dependents)
+
+    def initialize(self, metrics: Dict[_MetricKey, MetricValue]) -> None:
+        """Computes ready and needed metrics, given metrics that have already been resolved."""
+        self._ready_metrics = {}
+        self._num_unresolved_dependencies = {}
+        self._num_pending_dependents = {}
+
+        metric_id: _MetricKey
+        dependency_id: _MetricKey
+        dependency_ids: Set[_MetricKey]
+        num_unresolved_dependencies: int
+        for metric_id, dependency_ids in self._dependency_ids.items():
+            if metric_id in metrics:
+                continue
+
+            for dependency_id in dependency_ids:
+                self._num_pending_dependents[dependency_id] = (
+                    self._num_pending_dependents.get(dependency_id, 0) + 1
+                )
+
+            num_unresolved_dependencies = sum(
+                1 for dependency_id in dependency_ids if dependency_id not in metrics
+            )
+            if num_unresolved_dependencies == 0:
+                self._ready_metrics[metric_id] = self._metric_configurations[metric_id]
+            else:
+                self._num_unresolved_dependencies[metric_id] = num_unresolved_dependencies
+
+    def mark_resolved(self, metric_ids: Iterable[_MetricKey]) -> None:
+        """Updates ready and needed metrics, given IDs of metrics that have just been resolved (for the first time)."""  # noqa: E501
+        metric_id: _MetricKey
+        dependency_id: _MetricKey
+        dependent_id: _MetricKey
+        for metric_id in metric_ids:
+            if metric_id in self._ready_metrics or metric_id in self._num_unresolved_dependencies:
+                for dependency_id in self._dependency_ids[metric_id]:
+                    self._num_pending_dependents[dependency_id] -= 1
+                    if self._num_pending_dependents[dependency_id] == 0:
+                        del self._num_pending_dependents[dependency_id]
+
+            self._ready_metrics.pop(metric_id, None)
+            self._num_unresolved_dependencies.pop(metric_id, None)
+            for dependent_id in self._dependent_ids.get(metric_id, ()):
+                if dependent_id not in self._num_unresolved_dependencies:
+                    continue
+
+                self._num_unresolved_dependencies[dependent_id] -= 1
+                if self._num_unresolved_dependencies[dependent_id] == 0:
+                    del self._num_unresolved_dependencies[dependent_id]
+                    self._ready_metrics[dependent_id] = self._metric_configurations[dependent_id]
+
+
 class ValidationGraph:
     def __init__(
         self,
@@ -82,12 +195,12 @@ class ValidationGraph:
     ) -> None:
         self._execution_engine = execution_engine
 
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges: List[MetricEdge] = []
+        self._edge_ids: Set[Tuple[str, str]] = set()
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        edge: MetricEdge
+        for edge in edges or []:
+            self.add(edge=edge)
 
     @override
     def __eq__(self, other) -> bool:
@@ -232,16 +345,26 @@ class ValidationGraph:
         failed_metric_info: _AbortedMetricsInfoDict = {}
         aborted_metrics_info: _AbortedMetricsInfoDict = {}
 
-        ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        ready_metrics: List[MetricConfiguration]
+        num_needed_metrics: int
 
         exception_info: ExceptionInfo
 
         progress_bar: Optional[tqdm] = None
 
+        # Only bounded in-memory metric cache evicts metrics still needed by unresolved edges.
+        protect_cached_metrics: bool = self._execution_engine.has_bounded_metric_cache
+
+        # Dependency bookkeeping is indexed once, so that each subsequent wave of ready metrics is
+        # found in time proportional to the number of metrics resolved by the previous wave (rather
+        # than to the size of the graph).
+        metric_dependency_index = _MetricDependencyIndex(edges=self._edges)
+        metric_dependency_index.initialize(metrics=metrics)
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = metric_dependency_index.ready_metrics
+            num_needed_metrics = metric_dependency_index.num_needed_metrics
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -251,7 +374,7 @@ class ValidationGraph:
             if progress_bar is None:
                 # noinspection PyProtectedMember,SpellCheckingInspection
                 progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
+                    total=len(ready_metrics) + num_needed_metrics,
                     desc="Calculating Metrics",
                     disable=disable,
                 )
@@ -270,15 +393,26 @@ class ValidationGraph:
                 else:
                     computable_metrics.add(metric)
 
+            if protect_cached_metrics:
+                # Metrics still needed by unresolved edges must survive eviction from bounded metric cache.  # noqa: E501
+                self._execution_engine.protect_cached_metrics(
+                    metric_ids=metric_dependency_index.pending_dependency_ids
+                )
+
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.  # noqa: E501
-                metrics.update(
+                newly_resolved_metrics: Dict[_MetricKey, MetricValue] = (
                     self._execution_engine.resolve_metrics(
                         metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
                         metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
                         runtime_configuration=runtime_configuration,
                     )
                 )
+                newly_resolved_metric_ids: List[_MetricKey] = [
+                    metric_id for metric_id in newly_resolved_metrics if metric_id not in metrics
+                ]
+                metrics.update(newly_resolved_metrics)
+                metric_dependency_index.mark_resolved(metric_ids=newly_resolved_metric_ids)
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -312,13 +446,16 @@ class ValidationGraph:
                 else:
                     raise e  # noqa: TRY201
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
+            if (len(ready_metrics) + num_needed_metrics == 0) or (
                 len(ready_metrics) == len(aborted_metrics_info)
             ):
                 done = True
 
         progress_bar.close()  # type: ignore[union-attr]  # Incorrect flagging of 'Item "None" of "Optional[Any]" has no attribute "close"' in external package.
 
+        if protect_cached_metrics:
+            self._execution_engine.protect_cached_metrics(metric_ids=())
+
         return aborted_metrics_info
 
     def _parse(
@@ -327,23 +464,12 @@ class ValidationGraph:
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""  # noqa: E501
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        metric_dependency_index = _MetricDependencyIndex(edges=self._edges)
+        metric_dependency_index.initialize(metrics=metrics)
+        return (
+            set(metric_dependency_index.ready_metrics),
+            set(metric_dependency_index.needed_metrics),
+        )
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -414,13 +540,13 @@ class ExpectationValidationGraph:
         self,
         metric_info: _AbortedMetricsInfoDict,
     ) -> _AbortedMetricsInfoDict:
-        graph_metric_ids: List[_MetricKey] = []
+        graph_metric_ids: Set[_MetricKey] = set()
         edge: MetricEdge
         vertex: MetricConfiguration
         for edge in self.graph.edges:
             for vertex in [edge.left, edge.right]:
                 if vertex is not None:
-                    graph_metric_ids.append(vertex.id)
+                    graph_metric_ids.add(vertex.id)
 
         metric_id: _MetricKey
         metric_info_item: Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]]
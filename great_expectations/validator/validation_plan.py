@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import traceback
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from great_expectations.core.expectation_validation_result import ExpectationValidationResult
+from great_expectations.exceptions import InvalidExpectationConfigurationError
+from great_expectations.expectations.registry import memoize_metric_kwargs
+from great_expectations.validator.exception_info import ExceptionInfo
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    ExpectationValidationGraph,
+    MetricEdge,
+    ValidationGraph,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.expectations.expectation import Expectation
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+    from great_expectations.validator.metrics_calculator import _MetricKey
+    from great_expectations.validator.validator import ValidationDependencies
+
+
+@dataclass(frozen=True)
+class PlannedExpectation:
+    """Expectation of "ValidationPlan", together with metrics (and their dependency graph) needed to validate it.
+
+    If metric dependency graph could not be built, "exception_info" describes the failure (and "edges" is empty).
+    """  # noqa: E501
+
+    configuration: ExpectationConfiguration
+    expectation: Expectation
+    validation_dependencies: ValidationDependencies
+    edges: Tuple[MetricEdge, ...]
+    exception_info: Optional[ExceptionInfo] = None
+
+
+@dataclass(frozen=True)
+class BoundExpectation:
+    """Expectation of "ValidationPlan", bound to Batch (i.e., ready for its metrics to be resolved and validated)."""  # noqa: E501
+
+    expectation: Expectation
+    validation_dependencies: ValidationDependencies
+    expectation_validation_graph: ExpectationValidationGraph
+
+    @property
+    def configuration(self) -> ExpectationConfiguration:
+        return self.expectation_validation_graph.configuration
+
+
+class ValidationPlan:
+    """Expectations of Expectation Suite, compiled (once) into Expectation objects, metric configurations, and metric dependency graphs.
+
+    Validating same Expectation Suite against many Batches (e.g., partitions of Data Asset) repeats identical planning
+    work for every Batch: copying Expectation configurations, building Expectation objects, and building metric
+    dependency graphs.  "ValidationPlan" does this work once, and "bind()" then substitutes "batch_id" of new Batch into
+    copies of its metric configurations (keeping graph topology intact).
+
+    Plan is not modified once compiled.  Expectations, validation dependencies of which depend on data of Batch (as
+    indicated by their "_get_validation_dependencies_depend_on_batch_data()" method), are planned anew for every Batch.
+
+    Args:
+        planned_expectations: Expectations and their metric dependency graphs (in order of validation).
+        batch_id: Identifier of Batch, against which plan was compiled.
+        runtime_configuration: Run-time settings (e.g., "result_format"), with which plan was compiled.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        planned_expectations: List[PlannedExpectation],
+        batch_id: Optional[str],
+        runtime_configuration: dict,
+    ) -> None:
+        self._planned_expectations: Tuple[PlannedExpectation, ...] = tuple(planned_expectations)
+        self._batch_id: Optional[str] = batch_id
+        self._runtime_configuration: dict = runtime_configuration
+
+    @classmethod
+    def compile(
+        cls,
+        configurations: List[ExpectationConfiguration],
+        execution_engine: ExecutionEngine,
+        batch_id: Optional[str],
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationPlan:
+        """Compiles Expectation configurations into "ValidationPlan" for Batch with "batch_id".
+
+        Args:
+            configurations: Expectation configurations (with Suite Parameters already substituted).
+            execution_engine: ExecutionEngine, which will resolve metrics.
+            batch_id: Identifier of (active) Batch, against which plan is compiled.
+            runtime_configuration: Run-time settings (e.g., "result_format" and "catch_exceptions").
+
+        Returns:
+            Compiled "ValidationPlan" object.
+        """
+        runtime_configuration = copy.deepcopy(runtime_configuration or {})
+        catch_exceptions: bool = bool(runtime_configuration.get("catch_exceptions", True))
+
+        planned_expectations: List[PlannedExpectation] = []
+        configuration: ExpectationConfiguration
+        with memoize_metric_kwargs():
+            for configuration in configurations:
+                if configuration.type is None:
+                    raise InvalidExpectationConfigurationError(  # noqa: TRY003
+                        "Given configuration should include expectation type"
+                    )
+
+                evaluated_config: ExpectationConfiguration = copy.deepcopy(configuration)
+                if batch_id:
+                    evaluated_config.kwargs.update({"batch_id": batch_id})
+
+                planned_expectations.append(
+                    _plan_expectation(
+                        configuration=evaluated_config,
+                        execution_engine=execution_engine,
+                        runtime_configuration=runtime_configuration,
+                        catch_exceptions=catch_exceptions,
+                    )
+                )
+
+        return cls(
+            planned_expectations=planned_expectations,
+            batch_id=batch_id,
+            runtime_configuration=runtime_configuration,
+        )
+
+    @property
+    def batch_id(self) -> Optional[str]:
+        return self._batch_id
+
+    @property
+    def runtime_configuration(self) -> dict:
+        return copy.deepcopy(self._runtime_configuration)
+
+    @property
+    def planned_expectations(self) -> Tuple[PlannedExpectation, ...]:
+        return self._planned_expectations
+
+    def __len__(self) -> int:
+        return len(self._planned_expectations)
+
+    def bind(
+        self,
+        execution_engine: ExecutionEngine,
+        batch_id: Optional[str],
+    ) -> Tuple[List[BoundExpectation], List[ExpectationValidationResult]]:
+        """Binds plan to Batch, identified by "batch_id" (whose data must be loaded into "execution_engine").
+
+        Args:
+            execution_engine: ExecutionEngine, which will resolve metrics.
+            batch_id: Identifier of Batch, against which to validate Expectations.
+
+        Returns:
+            Expectations, ready for validation, and unsuccessful validation results of Expectations, metric dependency
+            graphs of which could not be built.
+        """  # noqa: E501
+        if batch_id != self._batch_id and not (batch_id and self._batch_id):
+            raise ValueError(  # noqa: TRY003
+                f"""ValidationPlan compiled for batch_id "{self._batch_id}" cannot be bound to batch_id "{batch_id}"."""  # noqa: E501
+            )
+
+        binder = _BatchBinder(source_batch_id=self._batch_id, target_batch_id=batch_id)
+        # Expectations planned anew already refer to new Batch (yet their objects are copied).
+        replanned_binder = _BatchBinder(source_batch_id=batch_id, target_batch_id=batch_id)
+        catch_exceptions: bool = bool(self._runtime_configuration.get("catch_exceptions", True))
+
+        bound_expectations: List[BoundExpectation] = []
+        evrs: List[ExpectationValidationResult] = []
+        planned_expectation: PlannedExpectation
+        expectation_binder: _BatchBinder
+        for planned_expectation in self._planned_expectations:
+            if planned_expectation.expectation._get_validation_dependencies_depend_on_batch_data():
+                planned_expectation = _plan_expectation(  # noqa: PLW2901
+                    configuration=binder.bind_configuration(planned_expectation.configuration),
+                    execution_engine=execution_engine,
+                    runtime_configuration=self._runtime_configuration,
+                    catch_exceptions=catch_exceptions,
+                )
+                expectation_binder = replanned_binder
+            else:
+                expectation_binder = binder
+
+            if planned_expectation.exception_info is None:
+                bound_expectations.append(
+                    expectation_binder.bind_expectation(
+                        planned_expectation=planned_expectation,
+                        execution_engine=execution_engine,
+                    )
+                )
+            else:
+                evrs.append(
+                    ExpectationValidationResult(
+                        success=False,
+                        exception_info=planned_expectation.exception_info,
+                        expectation_config=expectation_binder.bind_configuration(
+                            planned_expectation.configuration
+                        ),
+                    )
+                )
+
+        return bound_expectations, evrs
+
+
+def _plan_expectation(
+    configuration: ExpectationConfiguration,
+    execution_engine: ExecutionEngine,
+    runtime_configuration: dict,
+    catch_exceptions: bool,
+) -> PlannedExpectation:
+    expectation: Expectation = configuration.to_domain_obj()
+    validation_dependencies: ValidationDependencies = expectation.get_validation_dependencies(
+        execution_engine=execution_engine,
+        runtime_configuration=runtime_configuration,
+    )
+
+    graph = ValidationGraph(execution_engine=execution_engine)
+    try:
+        metric_configuration: MetricConfiguration
+        for metric_configuration in validation_dependencies.get_metric_configurations():
+            graph.build_metric_dependency_graph(
+                metric_configuration=metric_configuration,
+                runtime_configuration=runtime_configuration,
+            )
+    except Exception as err:
+        if not catch_exceptions:
+            raise
+
+        return PlannedExpectation(
+            configuration=configuration,
+            expectation=expectation,
+            validation_dependencies=validation_dependencies,
+            edges=(),
+            exception_info=ExceptionInfo(
+                exception_traceback=traceback.format_exc(),
+                exception_message=str(err),
+            ),
+        )
+
+    return PlannedExpectation(
+        configuration=configuration,
+        expectation=expectation,
+        validation_dependencies=validation_dependencies,
+        edges=tuple(graph.edges),
+    )
+
+
+class _BatchBinder:
+    """Copies planned objects, replacing "batch_id" of Batch, for which plan was compiled, with that of new Batch.
+
+    Metric configurations are copied once per metric ID (IDs of planned metric configurations are computed once, and
+    then cached), so that metrics shared by several Expectations share their copies, too.
+    """  # noqa: E501
+
+    def __init__(self, source_batch_id: Optional[str], target_batch_id: Optional[str]) -> None:
+        self._source_batch_id = source_batch_id
+        self._target_batch_id = target_batch_id
+        self._bound_metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+
+    def bind_configuration(
+        self, configuration: ExpectationConfiguration
+    ) -> ExpectationConfiguration:
+        bound_configuration: ExpectationConfiguration = copy.copy(configuration)
+        bound_configuration.kwargs = self._bind_kwargs(configuration.kwargs)
+        return bound_configuration
+
+    def bind_expectation(
+        self,
+        planned_expectation: PlannedExpectation,
+        execution_engine: ExecutionEngine,
+    ) -> BoundExpectation:
+        expectation: Expectation = planned_expectation.expectation
+        if getattr(expectation, "batch_id", None) == self._source_batch_id:
+            expectation = expectation.copy(update={"batch_id": self._target_batch_id})
+
+        validation_dependencies: ValidationDependencies = dataclasses.replace(
+            planned_expectation.validation_dependencies,
+            metric_configurations={
+                metric_name: self._bind_metric_configuration(metric_configuration)
+                for metric_name, metric_configuration in (
+                    planned_expectation.validation_dependencies.metric_configurations.items()
+                )
+            },
+        )
+        edge: MetricEdge
+        graph = ValidationGraph(
+            execution_engine=execution_engine,
+            edges=[
+                MetricEdge(
+                    left=self._bind_metric_configuration(edge.left),
+                    right=None
+                    if edge.right is None
+                    else self._bind_metric_configuration(edge.right),
+                )
+                for edge in planned_expectation.edges
+            ],
+        )
+        return BoundExpectation(
+            expectation=expectation,
+            validation_dependencies=validation_dependencies,
+            expectation_validation_graph=ExpectationValidationGraph(
+                configuration=self.bind_configuration(planned_expectation.configuration),
+                graph=graph,
+            ),
+        )
+
+    def _bind_kwargs(self, kwargs: dict) -> dict:
+        bound_kwargs: dict = dict(kwargs)
+        if "batch_id" in bound_kwargs and bound_kwargs["batch_id"] == self._source_batch_id:
+            bound_kwargs["batch_id"] = self._target_batch_id
+
+        return bound_kwargs
+
+    def _bind_metric_configuration(
+        self, metric_configuration: MetricConfiguration
+    ) -> MetricConfiguration:
+        metric_id: _MetricKey = metric_configuration.id
+        bound_metric_configuration: Optional[MetricConfiguration] = (
+            self._bound_metric_configurations.get(metric_id)
+        )
+        if bound_metric_configuration is not None:
+            return bound_metric_configuration
+
+        bound_metric_configuration = MetricConfiguration(
+            metric_name=metric_configuration.metric_name,
+            metric_domain_kwargs=self._bind_kwargs(metric_configuration.metric_domain_kwargs),
+            metric_value_kwargs=dict(metric_configuration.metric_value_kwargs),
+        )
+        self._bound_metric_configurations[metric_id] = bound_metric_configuration
+        if metric_configuration.metric_dependencies:
+            bound_metric_configuration.metric_dependencies = {
+                metric_name: self._bind_metric_configuration(metric_dependency)
+                for metric_name, metric_dependency in (
+                    metric_configuration.metric_dependencies.items()
+                )
+            }
+
+        return bound_metric_configuration
@@ -51,6 +51,7 @@ from great_expectations.expectations.expectation_configuration import (
 from great_expectations.expectations.registry import (
     get_expectation_impl,
     list_registered_expectation_implementations,
+    memoize_metric_kwargs,
 )
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 from great_expectations.validator.exception_info import ExceptionInfo
@@ -65,6 +66,7 @@ from great_expectations.validator.validation_graph import (
     MetricEdge,
     ValidationGraph,
 )
+from great_expectations.validator.validation_plan import BoundExpectation, ValidationPlan
 from great_expectations.validator.validation_statistics import (
     calc_validation_statistics,
 )
@@ -595,16 +597,17 @@ class Validator:
 
         processed_configurations: List[ExpectationConfiguration] = []
 
-        (
-            expectation_validation_graphs,
-            evrs,
-            processed_configurations,
-        ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
-            expectation_configurations=configurations,
-            processed_configurations=processed_configurations,
-            catch_exceptions=catch_exceptions,
-            runtime_configuration=runtime_configuration,
-        )
+        with memoize_metric_kwargs():
+            (
+                expectation_validation_graphs,
+                evrs,
+                processed_configurations,
+            ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                expectation_configurations=configurations,
+                processed_configurations=processed_configurations,
+                catch_exceptions=catch_exceptions,
+                runtime_configuration=runtime_configuration,
+            )
 
         graph: ValidationGraph = self._generate_suite_level_graph_from_expectation_level_sub_graphs(
             expectation_validation_graphs=expectation_validation_graphs
@@ -642,28 +645,148 @@ class Validator:
 
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
-        for configuration in processed_configurations:
-            try:
-                runtime_configuration_default = copy.deepcopy(runtime_configuration)
+        with memoize_metric_kwargs():
+            for configuration in processed_configurations:
+                try:
+                    runtime_configuration_default = copy.deepcopy(runtime_configuration)
 
-                expectation = configuration.to_domain_obj()
-                result = expectation.metrics_validate(
-                    metrics=resolved_metrics,
-                    execution_engine=self._execution_engine,
-                    runtime_configuration=runtime_configuration_default,
+                    expectation = configuration.to_domain_obj()
+                    result = expectation.metrics_validate(
+                        metrics=resolved_metrics,
+                        execution_engine=self._execution_engine,
+                        runtime_configuration=runtime_configuration_default,
+                    )
+                    evrs.append(result)
+                except Exception as err:
+                    if catch_exceptions:
+                        exception_traceback = traceback.format_exc()
+                        evrs = self._catch_exceptions_in_failing_expectation_validations(
+                            exception_traceback=exception_traceback,
+                            exception=err,
+                            failing_expectation_configurations=[configuration],
+                            evrs=evrs,
+                        )
+                    else:
+                        raise err  # noqa: TRY201
+
+        return evrs
+
+    def compile_validation_plan(
+        self,
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationPlan:
+        """Compiles Expectation configurations into "ValidationPlan", reusable for validating other Batches.
+
+        Expectation objects, metric configurations, and metric dependency graphs are built once (for the active Batch);
+        "run_validation_plan()" then only binds them to the active Batch of the Validator, on which it is called.
+
+        Args:
+            configurations: A list of Expectation Configurations (with Suite Parameters already substituted).
+            runtime_configuration: A dictionary of runtime keyword arguments, controlling semantics, such as the
+            result_format.
+
+        Returns:
+            Compiled "ValidationPlan" object.
+        """  # noqa: E501
+        return ValidationPlan.compile(
+            configurations=configurations,
+            execution_engine=self._execution_engine,
+            batch_id=self.active_batch_id,
+            runtime_configuration=runtime_configuration,
+        )
+
+    def run_validation_plan(
+        self,
+        validation_plan: ValidationPlan,
+    ) -> List[ExpectationValidationResult]:
+        """Validates Expectations of "ValidationPlan" against the active Batch (results equal those of "graph_validate()").
+
+        Args:
+            validation_plan: "ValidationPlan" object, compiled by "compile_validation_plan()" (of any Validator of
+            the same kind of ExecutionEngine).
+
+        Returns:
+            A list of Validations, validating that all necessary metrics are available.
+        """  # noqa: E501
+        runtime_configuration: dict = validation_plan.runtime_configuration
+        catch_exceptions: bool = bool(runtime_configuration.get("catch_exceptions", True))
+
+        bound_expectations: List[BoundExpectation]
+        evrs: List[ExpectationValidationResult]
+        bound_expectations, evrs = validation_plan.bind(
+            execution_engine=self._execution_engine, batch_id=self.active_batch_id
+        )
+
+        graph: ValidationGraph = self._generate_suite_level_graph_from_expectation_level_sub_graphs(
+            expectation_validation_graphs=[
+                bound_expectation.expectation_validation_graph
+                for bound_expectation in bound_expectations
+            ]
+        )
+
+        resolved_metrics: _MetricsDict
+        aborted_metrics_info: _AbortedMetricsInfoDict
+        try:
+            resolved_metrics, aborted_metrics_info = (
+                self._metrics_calculator.resolve_validation_graph(
+                    graph=graph,
+                    runtime_configuration=runtime_configuration,
+                    min_graph_edges_pbar_enable=0,
                 )
-                evrs.append(result)
-            except Exception as err:
-                if catch_exceptions:
-                    exception_traceback = traceback.format_exc()
-                    evrs = self._catch_exceptions_in_failing_expectation_validations(
-                        exception_traceback=exception_traceback,
-                        exception=err,
-                        failing_expectation_configurations=[configuration],
-                        evrs=evrs,
+            )
+        except Exception as err:
+            if not catch_exceptions:
+                raise
+
+            return self._catch_exceptions_in_failing_expectation_validations(
+                exception_traceback=traceback.format_exc(),
+                exception=err,
+                failing_expectation_configurations=[
+                    bound_expectation.configuration for bound_expectation in bound_expectations
+                ],
+                evrs=evrs,
+            )
+
+        validated_expectations: List[BoundExpectation] = []
+        bound_expectation: BoundExpectation
+        for bound_expectation in bound_expectations:
+            metric_exception_info: Dict[str, Union[MetricConfiguration, ExceptionInfo, int]] = (
+                bound_expectation.expectation_validation_graph.get_exception_info(
+                    metric_info=aborted_metrics_info
+                )
+            )
+            if len(metric_exception_info) > 0:
+                evrs.append(
+                    ExpectationValidationResult(
+                        success=False,
+                        exception_info=metric_exception_info,
+                        expectation_config=bound_expectation.configuration,
                     )
-                else:
-                    raise err  # noqa: TRY201
+                )
+            else:
+                validated_expectations.append(bound_expectation)
+
+        for bound_expectation in validated_expectations:
+            try:
+                evrs.append(
+                    bound_expectation.expectation.metrics_validate(
+                        metrics=resolved_metrics,
+                        execution_engine=self._execution_engine,
+                        runtime_configuration=copy.deepcopy(runtime_configuration),
+                        validation_dependencies=bound_expectation.validation_dependencies,
+                    )
+                )
+            except Exception as err:
+                if not catch_exceptions:
+                    raise
+
+                evrs = self._catch_exceptions_in_failing_expectation_validations(
+                    exception_traceback=traceback.format_exc(),
+                    exception=err,
+                    failing_expectation_configurations=[bound_expectation.configuration],
+                    evrs=evrs,
+                )
 
         return evrs
 
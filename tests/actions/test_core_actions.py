@@ -360,7 +360,7 @@ class TestV1ActionRun:
         url = "http://www.example.com"
         action = APINotificationAction(name="my_action", url=url)
 
-        with mock.patch.object(requests, "post") as mock_post:
+        with mock.patch.object(Session, "post") as mock_post:
             action.run(checkpoint_result=checkpoint_result)
 
         mock_post.assert_called_once_with(
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import http.server
 import json
 import pathlib
+import threading
+import time
 import uuid
-from typing import TYPE_CHECKING, List, Type
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Type
 from unittest import mock
 
 import pandas as pd
@@ -26,6 +29,7 @@ from great_expectations.checkpoint.checkpoint import (
     CheckpointAction,
     CheckpointResult,
 )
+from great_expectations.checkpoint.util import get_notification_session
 from great_expectations.compatibility.pydantic import ValidationError
 from great_expectations.constants import DATAFRAME_REPLACEMENT_STR
 from great_expectations.core.batch_definition import BatchDefinition
@@ -65,6 +69,7 @@ from great_expectations.exceptions.exceptions import (
     ValidationDefinitionNotFoundError,
 )
 from great_expectations.exceptions.resource_freshness import ResourceFreshnessAggregateError
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
 from tests.test_utils import working_directory
 
@@ -687,6 +692,7 @@ class TestCheckpointResult:
             expectation_parameters=expectation_parameters,
             result_format=ResultFormat.SUMMARY,
             run_id=mock.ANY,
+            batch_registry=mock.ANY,
         )
 
     @pytest.mark.unit
@@ -1448,3 +1454,425 @@ class TestCheckpointPydanticSerializationMethods:
             ExpectationSuiteNotAddedError,
             ValidationDefinitionNotAddedError,
         ]
+
+
+class TestCheckpointConcurrentValidationDefinitions:
+    datasource_name: str = "my_pandas_ds"
+    column_name: str = "passenger_count"
+    num_validation_definitions: int = 4
+
+    @pytest.fixture
+    def context(self) -> AbstractDataContext:
+        return gx.get_context(mode="ephemeral")
+
+    @pytest.fixture
+    def validation_definitions(self, context: AbstractDataContext) -> List[ValidationDefinition]:
+        ds = context.data_sources.add_pandas(self.datasource_name)
+
+        validation_definitions: List[ValidationDefinition] = []
+        for idx in range(self.num_validation_definitions):
+            asset = ds.add_dataframe_asset(name=f"my_asset_{idx}")
+            batch_definition = asset.add_batch_definition_whole_dataframe(f"my_bd_{idx}")
+            suite = context.suites.add(
+                ExpectationSuite(
+                    name=f"my_suite_{idx}",
+                    expectations=[
+                        gxe.ExpectColumnValuesToBeBetween(
+                            column=self.column_name, min_value=0, max_value=idx
+                        )
+                    ],
+                )
+            )
+            validation_definitions.append(
+                context.validation_definitions.add(
+                    ValidationDefinition(name=f"my_vd_{idx}", data=batch_definition, suite=suite)
+                )
+            )
+
+        return validation_definitions
+
+    @pytest.mark.unit
+    def test_concurrent_run_matches_sequential_run(
+        self, validation_definitions: List[ValidationDefinition]
+    ):
+        df = pd.DataFrame({self.column_name: [0, 1, 2]})
+
+        sequential_result = Checkpoint(
+            name="my_sequential_checkpoint",
+            validation_definitions=validation_definitions,
+        ).run(batch_parameters={"dataframe": df})
+        concurrent_result = Checkpoint(
+            name="my_concurrent_checkpoint",
+            validation_definitions=validation_definitions,
+            max_concurrent_validation_definitions=3,
+        ).run(batch_parameters={"dataframe": df})
+
+        expected_suite_names = [f"my_suite_{idx}" for idx in range(self.num_validation_definitions)]
+        for result in (sequential_result, concurrent_result):
+            assert [
+                key.expectation_suite_identifier.name for key in result.run_results
+            ] == expected_suite_names
+            assert [
+                validation_result.success for validation_result in result.run_results.values()
+            ] == [False, False, True, True]
+            assert result.success is False
+
+        assert [
+            validation_result.statistics
+            for validation_result in concurrent_result.run_results.values()
+        ] == [
+            validation_result.statistics
+            for validation_result in sequential_result.run_results.values()
+        ]
+
+    @pytest.mark.unit
+    def test_concurrent_run_raises_error_of_first_failed_validation_definition(
+        self,
+        validation_definitions: List[ValidationDefinition],
+        mocker: MockerFixture,
+    ):
+        second_validation_definition_failed = threading.Event()
+
+        def run(validation_definition: ValidationDefinition, **kwargs):
+            if validation_definition.name == "my_vd_0":
+                # Fails only after second validation definition has failed (i.e., concurrently).
+                assert second_validation_definition_failed.wait(timeout=10)
+                raise ValueError("my_vd_0 failed")
+
+            second_validation_definition_failed.set()
+            raise ValueError(f"{validation_definition.name} failed")
+
+        mock_run = mocker.patch.object(ValidationDefinition, "run", autospec=True, side_effect=run)
+        checkpoint = Checkpoint(
+            name="my_checkpoint",
+            validation_definitions=validation_definitions,
+            max_concurrent_validation_definitions=2,
+        )
+
+        with pytest.raises(ValueError, match="my_vd_0 failed"):
+            checkpoint.run()
+
+        assert mock_run.call_count >= 2
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("max_concurrent_validation_definitions", [1, 3])
+    def test_validation_definitions_of_same_batch_definition_share_batch(
+        self,
+        context: AbstractDataContext,
+        validation_definitions: List[ValidationDefinition],
+        max_concurrent_validation_definitions: int,
+        mocker: MockerFixture,
+    ):
+        suite = context.suites.add(
+            ExpectationSuite(
+                name="my_other_suite",
+                expectations=[gxe.ExpectColumnMaxToBeBetween(column=self.column_name, max_value=2)],
+            )
+        )
+        validation_definitions.insert(
+            2,
+            context.validation_definitions.add(
+                ValidationDefinition(
+                    name="my_other_vd", data=validation_definitions[0].batch_definition, suite=suite
+                )
+            ),
+        )
+        load_batch_spy = mocker.spy(PandasExecutionEngine, "get_batch_data_and_markers")
+        release_batch_spy = mocker.spy(PandasExecutionEngine, "release_batch")
+
+        result = Checkpoint(
+            name="my_checkpoint",
+            validation_definitions=validation_definitions,
+            max_concurrent_validation_definitions=max_concurrent_validation_definitions,
+        ).run(batch_parameters={"dataframe": pd.DataFrame({self.column_name: [0, 1, 2]})})
+
+        assert load_batch_spy.call_count == release_batch_spy.call_count == 4
+        assert [key.expectation_suite_identifier.name for key in result.run_results] == [
+            "my_suite_0",
+            "my_suite_1",
+            "my_other_suite",
+            "my_suite_2",
+            "my_suite_3",
+        ]
+        assert [validation_result.success for validation_result in result.run_results.values()] == [
+            False,
+            False,
+            True,
+            True,
+            True,
+        ]
+        datasource = validation_definitions[0].batch_definition.data_asset.datasource
+        assert datasource.get_execution_engine().batch_manager.loaded_batch_ids == []
+
+    @pytest.mark.unit
+    def test_max_concurrent_validation_definitions_is_serialized_only_if_set(
+        self, validation_definitions: List[ValidationDefinition]
+    ):
+        checkpoint = Checkpoint(name="my_checkpoint", validation_definitions=validation_definitions)
+        assert "max_concurrent_validation_definitions" not in checkpoint.dict()
+        assert "max_concurrent_validation_definitions" not in json.loads(checkpoint.json())
+
+        checkpoint = Checkpoint(
+            name="my_checkpoint",
+            validation_definitions=validation_definitions,
+            max_concurrent_validation_definitions=8,
+        )
+        assert checkpoint.dict()["max_concurrent_validation_definitions"] == 8
+        assert Checkpoint.parse_raw(checkpoint.json()) == checkpoint
+
+    @pytest.mark.unit
+    def test_max_concurrent_validation_definitions_must_be_positive(
+        self, validation_definitions: List[ValidationDefinition]
+    ):
+        with pytest.raises(ValidationError):
+            Checkpoint(
+                name="my_checkpoint",
+                validation_definitions=validation_definitions,
+                max_concurrent_validation_definitions=0,
+            )
+
+
+class _NotificationStubHandler(http.server.BaseHTTPRequestHandler):
+    """Local stand-in for notification endpoints (behavior of which is determined by request path)."""  # noqa: E501
+
+    protocol_version = "HTTP/1.1"  # keeps connections alive, so that their reuse is observable
+    server: _NotificationStubServer
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests.append((self.path, self.client_address[1]))
+            num_requests = sum(path == self.path for path, _ in self.server.requests)
+
+        status = 200
+        if self.path == "/slow":
+            self.server.release_slow_requests.wait(timeout=10)
+        elif self.path == "/concurrent":
+            # Both requests must be in flight at once for either of them to succeed.
+            try:
+                self.server.concurrent_requests.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                status = 500
+        elif self.path == "/rate_limited" and num_requests == 1:
+            status = 429
+        elif self.path == "/unavailable":
+            status = 503
+
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class _NotificationStubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _NotificationStubHandler)
+        self.lock = threading.Lock()
+        self.requests: List[Tuple[str, int]] = []
+        self.release_slow_requests = threading.Event()
+        self.concurrent_requests = threading.Barrier(2)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def paths(self) -> List[str]:
+        with self.lock:
+            return [path for path, _ in self.requests]
+
+
+@pytest.mark.unit
+class TestCheckpointConcurrentActions:
+    column_name: str = "passenger_count"
+
+    @pytest.fixture
+    def stub_server(self) -> Iterator[_NotificationStubServer]:
+        server = _NotificationStubServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield server
+        finally:
+            server.release_slow_requests.set()
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=5)
+
+    @pytest.fixture
+    def validation_definition(self) -> ValidationDefinition:
+        context = gx.get_context(mode="ephemeral")
+        batch_definition = (
+            context.data_sources.add_pandas("my_pandas_ds")
+            .add_dataframe_asset(name="my_asset")
+            .add_batch_definition_whole_dataframe("my_bd")
+        )
+        suite = context.suites.add(
+            ExpectationSuite(
+                name="my_suite",
+                expectations=[gxe.ExpectColumnValuesToNotBeNull(column=self.column_name)],
+            )
+        )
+        return context.validation_definitions.add(
+            ValidationDefinition(name="my_vd", data=batch_definition, suite=suite)
+        )
+
+    def _run_checkpoint(
+        self, validation_definition: ValidationDefinition, **kwargs
+    ) -> CheckpointResult:
+        return Checkpoint(
+            name="my_checkpoint", validation_definitions=[validation_definition], **kwargs
+        ).run(batch_parameters={"dataframe": pd.DataFrame({self.column_name: [1, 2]})})
+
+    @pytest.mark.unit
+    def test_actions_run_concurrently_after_data_docs_actions(
+        self,
+        stub_server: _NotificationStubServer,
+        validation_definition: ValidationDefinition,
+        mocker: MockerFixture,
+    ):
+        data_docs_paths: List[List[str]] = []
+
+        def update_data_docs(*args, **kwargs) -> dict:
+            data_docs_paths.append(stub_server.paths)
+            return {}
+
+        mocker.patch.object(UpdateDataDocsAction, "run", side_effect=update_data_docs)
+        result = self._run_checkpoint(
+            validation_definition,
+            actions=[
+                SlackNotificationAction(
+                    name=f"my_slack_action_{idx}", slack_webhook=f"{stub_server.url}/concurrent"
+                )
+                for idx in range(2)
+            ]
+            + [UpdateDataDocsAction(name="my_docs_action")],
+            max_concurrent_actions=2,
+        )
+
+        assert result.success
+        assert data_docs_paths == [[]]
+        assert stub_server.paths == ["/concurrent", "/concurrent"]
+        assert not stub_server.concurrent_requests.broken
+
+    @pytest.mark.unit
+    def test_action_that_times_out_does_not_hold_up_other_actions(
+        self,
+        stub_server: _NotificationStubServer,
+        validation_definition: ValidationDefinition,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        start = time.monotonic()
+        self._run_checkpoint(
+            validation_definition,
+            actions=[
+                SlackNotificationAction(
+                    name="my_slow_action", slack_webhook=f"{stub_server.url}/slow"
+                ),
+                SlackNotificationAction(name="my_fast_action", slack_webhook=f"{stub_server.url}/"),
+            ],
+            action_timeout=0.5,
+        )
+
+        assert time.monotonic() - start < 5
+        assert sorted(stub_server.paths) == ["/", "/slow"]
+        assert 'Action "my_slow_action" did not finish within 0.5 seconds' in caplog.text
+
+    @pytest.mark.unit
+    def test_notifications_are_retried_over_reused_connection(
+        self,
+        stub_server: _NotificationStubServer,
+        validation_definition: ValidationDefinition,
+        mocker: MockerFixture,
+    ):
+        run_spy = mocker.spy(SlackNotificationAction, "run")
+
+        self._run_checkpoint(
+            validation_definition,
+            actions=[
+                SlackNotificationAction(
+                    name="my_rate_limited_action", slack_webhook=f"{stub_server.url}/rate_limited"
+                ),
+                SlackNotificationAction(
+                    name="my_other_action", slack_webhook=f"{stub_server.url}/"
+                ),
+            ],
+        )
+
+        assert run_spy.call_count == 2
+        assert run_spy.spy_return == {"slack_notification_result": "Slack notification succeeded."}
+        assert stub_server.paths == ["/rate_limited", "/rate_limited", "/"]
+        with stub_server.lock:
+            assert len({client_port for _, client_port in stub_server.requests}) == 1
+
+    @pytest.mark.unit
+    def test_notifications_are_not_retried_after_gateway_errors(
+        self,
+        stub_server: _NotificationStubServer,
+        validation_definition: ValidationDefinition,
+        mocker: MockerFixture,
+    ):
+        run_spy = mocker.spy(SlackNotificationAction, "run")
+
+        self._run_checkpoint(
+            validation_definition,
+            actions=[
+                SlackNotificationAction(
+                    name="my_unavailable_action", slack_webhook=f"{stub_server.url}/unavailable"
+                ),
+            ],
+        )
+
+        # Server may have processed request (and posted notification) before failing to respond.
+        assert run_spy.spy_return == {"slack_notification_result": None}
+        assert stub_server.paths == ["/unavailable"]
+
+    @pytest.mark.unit
+    def test_notification_sessions_are_not_shared_across_threads(self):
+        sessions: List[Session] = []
+        thread = threading.Thread(target=lambda: sessions.append(get_notification_session()))
+        thread.start()
+        thread.join()
+
+        assert get_notification_session() is get_notification_session()
+        assert sessions[0] is not get_notification_session()
+
+    @pytest.mark.unit
+    def test_concurrent_action_settings_are_serialized_only_if_set(
+        self, validation_definition: ValidationDefinition
+    ):
+        checkpoint = Checkpoint(
+            name="my_checkpoint", validation_definitions=[validation_definition]
+        )
+        assert "max_concurrent_actions" not in checkpoint.dict()
+        assert "action_timeout" not in checkpoint.dict()
+
+        checkpoint = Checkpoint(
+            name="my_checkpoint",
+            validation_definitions=[validation_definition],
+            max_concurrent_actions=4,
+            action_timeout=2.5,
+        )
+        assert checkpoint.dict()["max_concurrent_actions"] == 4
+        assert checkpoint.dict()["action_timeout"] == 2.5
+        assert Checkpoint.parse_raw(checkpoint.json()) == checkpoint
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "settings",
+        [{"max_concurrent_actions": 0}, {"action_timeout": 0}],
+        ids=["workers", "timeout"],
+    )
+    def test_concurrent_action_settings_must_be_positive(
+        self, validation_definition: ValidationDefinition, settings: dict
+    ):
+        with pytest.raises(ValidationError):
+            Checkpoint(
+                name="my_checkpoint", validation_definitions=[validation_definition], **settings
+            )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import functools
+import json
+from typing import List
+
+import numpy as np
+import pytest
+
+from great_expectations.core.quantile_sketch import KLLSketch
+
+QUANTILES: List[float] = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def _get_rank_errors(values: np.ndarray, sketch: KLLSketch) -> List[float]:
+    sorted_values: np.ndarray = np.sort(values)
+    approximate_values = sketch.get_quantiles(QUANTILES)
+    # Rank error is distance from quantile to nearest (normalized) rank that value occupies.
+    return [
+        max(
+            0.0,
+            np.searchsorted(sorted_values, value, side="left") / len(values) - quantile,
+            quantile - np.searchsorted(sorted_values, value, side="right") / len(values),
+        )
+        for quantile, value in zip(QUANTILES, approximate_values)
+    ]
+
+
+@pytest.mark.unit
+def test_quantiles_of_small_sketch_are_exact():
+    sketch = KLLSketch()
+    sketch.update([4, 1, None, 3, 2, float("nan")])
+
+    assert sketch.n == 4
+    assert sketch.is_exact
+    assert sketch.normalized_rank_error == 0.0
+    # same as "percentile_disc" (i.e., lower median of even number of values)
+    assert sketch.get_quantiles([0.0, 0.25, 0.5, 0.75, 1.0]) == [1.0, 1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.unit
+def test_quantiles_of_empty_sketch_are_none():
+    sketch = KLLSketch()
+    sketch.update([])
+
+    assert sketch.is_empty
+    assert sketch.get_quantiles([0.0, 0.5]) == [None, None]
+
+
+@pytest.mark.unit
+def test_quantiles_are_within_rank_error_bound():
+    values: np.ndarray = np.random.default_rng(seed=7).lognormal(size=200_000)
+    sketch = KLLSketch(seed=7)
+    for chunk in np.array_split(values, 20):
+        sketch.update(chunk)
+
+    assert sketch.n == len(values)
+    assert not sketch.is_exact
+    # space does not grow with number of values
+    assert sum(len(level) for level in sketch._levels) < 3 * sketch.k
+    assert max(_get_rank_errors(values=values, sketch=sketch)) <= sketch.normalized_rank_error
+    assert sketch.get_quantiles([0.0, 1.0]) == [values.min(), values.max()]
+
+
+@pytest.mark.unit
+def test_merged_sketches_are_within_rank_error_bound():
+    values: np.ndarray = np.random.default_rng(seed=11).normal(size=200_000)
+    partition_sketches: List[KLLSketch] = []
+    for seed, partition in enumerate(np.array_split(values, 8)):
+        partition_sketch = KLLSketch(seed=seed)
+        partition_sketch.update(partition)
+        partition_sketches.append(partition_sketch)
+
+    sketch: KLLSketch = functools.reduce(
+        lambda merged, partition_sketch: merged.merge(partition_sketch),
+        partition_sketches,
+        KLLSketch(seed=0),
+    )
+
+    assert sketch.n == len(values)
+    assert max(_get_rank_errors(values=values, sketch=sketch)) <= sketch.normalized_rank_error
+
+
+@pytest.mark.unit
+def test_sketch_round_trips_through_json():
+    sketch = KLLSketch(k=50, seed=3)
+    sketch.update(np.arange(10_000))
+
+    restored = KLLSketch.from_json_dict(json.loads(json.dumps(sketch.to_json_dict())))
+
+    assert restored.k == sketch.k
+    assert restored.n == sketch.n
+    assert restored.get_quantiles(QUANTILES) == sketch.get_quantiles(QUANTILES)
+
+
+@pytest.mark.unit
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        KLLSketch(k=4)
+
+    with pytest.raises(ValueError):
+        KLLSketch().get_quantiles([1.5])
@@ -163,3 +163,31 @@ def test_HtmlSiteStore_S3_backend(aws_credentials):
         .decode("utf-8")
     )
     assert index_content == "index_html_string_content"
+
+
+@pytest.mark.filesystem
+def test_HtmlSiteStore_manifest_round_trip(tmp_path):
+    store_backend = {"class_name": "TupleFilesystemStoreBackend", "base_directory": "my_store"}
+    runtime_environment = {"root_directory": str(tmp_path)}
+    page_key = SiteSectionIdentifier(
+        site_section_name="expectations",
+        resource_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+    )
+    entry_name = HtmlSiteStore.get_manifest_entry_name(page_key)
+
+    my_store = HtmlSiteStore(store_backend=store_backend, runtime_environment=runtime_environment)
+    assert my_store.get_manifest_entry(entry_name) is None
+    my_store.set(page_key, "aaa")
+    my_store.set_manifest_entry(entry_name, "fingerprint")
+    my_store.save_manifest()
+
+    my_store = HtmlSiteStore(store_backend=store_backend, runtime_environment=runtime_environment)
+    assert my_store.get_manifest_entry(entry_name) == "fingerprint"
+    assert my_store.list_page_key_tuples(ExpectationSuiteIdentifier) == {("my_suite",)}
+
+    # manifest of other version is discarded
+    (tmp_path / "my_store" / HtmlSiteStore.MANIFEST_KEY[0]).write_text(
+        '{"version": 0, "entries": {"expectations/my_suite": "fingerprint"}}'
+    )
+    my_store = HtmlSiteStore(store_backend=store_backend, runtime_environment=runtime_environment)
+    assert my_store.get_manifest_entry(entry_name) is None
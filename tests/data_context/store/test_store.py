@@ -94,6 +94,19 @@ def test_store_add_success():
     assert store.has_key(key)
 
 
+@pytest.mark.unit
+def test_store_get_many():
+    store = Store()
+    store.add(key=StringKey("foo"), value="bar")
+    store.add(key=StringKey("baz"), value="qux")
+
+    assert store.get_many(keys=[StringKey("baz"), StringKey("missing"), StringKey("foo")]) == [
+        "qux",
+        None,
+        "bar",
+    ]
+
+
 @pytest.mark.unit
 @mock.patch.object(InMemoryStoreBackend, "add")
 def test_store_add_success__adds_id(mock_store_backend_add):
@@ -11,6 +11,7 @@ import pytest
 from moto import mock_s3
 from pytest_mock import MockerFixture
 
+import great_expectations.data_context.store.tuple_store_backend
 from great_expectations.core.data_context_key import DataContextVariableKey
 from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.run_identifier import RunIdentifier
@@ -456,6 +457,57 @@ def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     assert set(my_store.list_keys()) == {(".ge_store_backend_id",), ("AAA",)}
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_with_key_index(tmp_path_factory, mocker: MockerFixture):
+    project_path = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend__dir"))
+    base_directory = os.path.join(project_path, "dummy_str")  # noqa: PTH118
+
+    # Files present before the index is created are picked up by its initial build.
+    TupleFilesystemStoreBackend(
+        base_directory=base_directory, filepath_suffix=".json", suppress_store_backend_id=True
+    ).set(("a", "pre_existing"), "x")
+
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=base_directory, filepath_suffix=".json", use_key_index=True
+    )
+    assert my_store.config["use_key_index"] is True
+    assert os.path.isfile(my_store.key_index_path)  # noqa: PTH113
+
+    my_store.set(("a", "one"), "1")
+    my_store.set(("a", "two"), "2")
+    my_store.set(("ab", "three"), "3")
+    my_store.move(("a", "two"), ("b", "two"))
+    my_store.remove_key(("a", "one"))
+
+    mock_walk = mocker.patch(
+        "great_expectations.data_context.store.tuple_store_backend.os.walk",
+        side_effect=AssertionError("index must be used"),
+    )
+    assert my_store.list_keys() == [("a", "pre_existing"), ("ab", "three"), ("b", "two")]
+    assert my_store.list_keys(prefix=("a",)) == [("a", "pre_existing")]
+    assert my_store.has_key(("b", "two"))
+    assert not my_store.has_key(("a", "one"))
+    # The store_backend_id file is not listed (it lacks the suffix), but it exists.
+    assert my_store.has_key(my_store.STORE_BACKEND_ID_KEY)
+    mocker.stop(mock_walk)
+
+    # Keys written around the store backend drift from the index until it is rebuilt.
+    with open(os.path.join(base_directory, "c.json"), "w") as outfile:  # noqa: PTH118
+        outfile.write("4")
+    assert not my_store.has_key(("c",))
+
+    assert my_store.rebuild_key_index() == 5
+    assert my_store.list_keys() == [("a", "pre_existing"), ("ab", "three"), ("b", "two"), ("c",)]
+    assert sorted(my_store.list_keys()) == sorted(
+        TupleFilesystemStoreBackend(
+            base_directory=base_directory, filepath_suffix=".json"
+        ).list_keys()
+    )
+
+    with pytest.raises(StoreBackendError):
+        TupleFilesystemStoreBackend(base_directory=base_directory).rebuild_key_index()
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_TupleS3StoreBackend_with_prefix(aws_credentials):
@@ -593,6 +645,35 @@ def test_TupleS3StoreBackend_get_all(aws_credentials):
     assert sorted(result) == [val_a, val_b]
 
 
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_get_many(aws_credentials, mocker: MockerFixture):
+    bucket = "leakybucket"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(filepath_template="my_file_{0}", bucket=bucket)
+    keys = [(f"key_{idx}",) for idx in range(40)]
+    for key in keys:
+        my_store.set(key, f"value of {key[0]}")
+
+    create_client = mocker.spy(my_store, "_create_client")
+    executor = mocker.spy(
+        great_expectations.data_context.store.tuple_store_backend, "ThreadPoolExecutor"
+    )
+
+    result = my_store.get_many([*keys, ("missing",)])
+
+    assert result == [f"value of {key[0]}" for key in keys] + [None]
+    # A single client is shared by all (concurrent) downloads.
+    assert create_client.call_count == 1
+    assert executor.call_args.kwargs["max_workers"] == TupleS3StoreBackend.MAX_CONCURRENT_GETS
+    with pytest.raises(TypeError):
+        my_store.get_many(["not_a_tuple"])
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_tuple_s3_store_backend_slash_conditions(aws_credentials):  # noqa: PLR0915
@@ -1238,6 +1319,36 @@ def test_TupleAzureBlobStoreBackend_get_all(mocker: MockerFixture):
         assert sorted(result) == [val_a, val_b]
 
 
+@pytest.mark.unit
+def test_TupleAzureBlobStoreBackend_get_many_with_missing_key(mocker: MockerFixture):
+    pytest.importorskip("azure.storage.blob")
+    pytest.importorskip("azure.identity")
+    from azure.core.exceptions import ResourceNotFoundError
+
+    prefix = "this_is_a_test_prefix"
+    values = {f"{prefix}/foo.json": "aaa", f"{prefix}/bar.json": "bbb"}
+
+    def mock_get_blob(object_key):
+        if object_key not in values:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        return mocker.Mock(readall=mocker.Mock(return_value=values[object_key].encode("utf-8")))
+
+    my_store = TupleAzureBlobStoreBackend(
+        credential="this_is_a_test_credential_string",
+        account_url="this_is_a_test_account_url",
+        prefix=prefix,
+        filepath_suffix=".json",
+        container="dummy-container",
+    )
+
+    with mock.patch("great_expectations.compatibility.azure.BlobServiceClient", autospec=True):
+        my_store._container_client.download_blob.side_effect = mock_get_blob
+
+        result = my_store.get_many([("foo",), ("missing",), ("bar",)])
+
+        assert result == ["aaa", None, "bbb"]
+
+
 @mock_s3
 @pytest.mark.slow  # 14.36s
 @pytest.mark.aws_deps
@@ -82,7 +82,9 @@ def test_ValidationResultsStore_with_TupleS3StoreBackend(aws_credentials):
     } == {
         "test/prefix/.ge_store_backend_id",
         "test/prefix/asset/quarantine/20191007T151224.1234Z_prod_100/20190926T134241.000000Z/batch_id.json",
+        "test/prefix/asset/quarantine/20191007T151224.1234Z_prod_100/20190926T134241.000000Z/batch_id.json.summary",
         "test/prefix/asset/quarantine/20191007T151224.1234Z_prod_200/20190926T134241.000000Z/batch_id.json",
+        "test/prefix/asset/quarantine/20191007T151224.1234Z_prod_200/20190926T134241.000000Z/batch_id.json.summary",
     }
 
     print(my_store.list_keys())
@@ -235,9 +237,11 @@ def test_ValidationResultsStore_with_TupleFileSystemStoreBackend(tmp_path_factor
                 prod-100/
                     20190926T134241.000000Z/
                         batch_id.json
+                        batch_id.json.summary
                 prod-20/
                     20190926T134241.000000Z/
                         batch_id.json
+                        batch_id.json.summary
 """
     )
 
@@ -263,6 +267,91 @@ def test_ValidationResultsStore_with_TupleFileSystemStoreBackend(tmp_path_factor
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@pytest.mark.filesystem
+def test_ValidationResultsStore_stores_summaries_of_validation_results(tmp_path):
+    my_store = ValidationResultsStore(
+        store_backend={
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+        },
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    summarized_key = ValidationResultIdentifier.from_tuple(
+        ("my_suite", "run_1", "20240101T000000.000000Z", "batch_1")
+    )
+    unsummarized_key = ValidationResultIdentifier.from_tuple(
+        ("my_suite", "run_2", "20240102T000000.000000Z", "batch_1")
+    )
+    my_store.store_validation_results(
+        suite_validation_result=ExpectationSuiteValidationResult(
+            success=False,
+            results=[],
+            suite_name="my_suite",
+            statistics={"evaluated_expectations": 1},
+            meta={
+                "active_batch_definition": {"data_asset_name": "my_asset"},
+                "batch_spec": {"path": "data.csv"},
+                "validation_time": "20240101T000000.000000Z",
+            },
+        ),
+        suite_validation_result_identifier=summarized_key,
+    )
+    # e.g., result stored before summaries were introduced
+    my_store.store_backend.set(
+        my_store.key_to_tuple(unsummarized_key),
+        my_store.serialize(
+            ExpectationSuiteValidationResult(success=True, results=[], suite_name="my_suite")
+        ),
+    )
+
+    # summaries are not listed among validation results
+    assert set(my_store.list_keys()) == {summarized_key, unsummarized_key}
+    assert my_store.get_summaries([summarized_key, unsummarized_key]) == [
+        {
+            "success": False,
+            "statistics": {"evaluated_expectations": 1},
+            "meta": {
+                "active_batch_definition": {"data_asset_name": "my_asset"},
+                "batch_spec": {"path": "data.csv"},
+            },
+        },
+        None,
+    ]
+
+
+@pytest.mark.filesystem
+def test_ValidationResultsStore_rewrites_and_removes_summaries_with_validation_results(tmp_path):
+    my_store = ValidationResultsStore(
+        store_backend={
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+        },
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    key = ValidationResultIdentifier.from_tuple(
+        ("my_suite", "run_1", "20240101T000000.000000Z", "batch_1")
+    )
+
+    my_store.set(
+        key, ExpectationSuiteValidationResult(success=False, results=[], suite_name="my_suite")
+    )
+    assert my_store.get_summaries([key])[0]["success"] is False
+
+    my_store.set(
+        key, ExpectationSuiteValidationResult(success=True, results=[], suite_name="my_suite")
+    )
+    assert my_store.get_summaries([key])[0]["success"] is True
+
+    my_store.remove_key(key)
+    assert not my_store.has_key(key)
+    assert my_store.get_summaries([key]) == [None]
+    assert [path.name for path in (tmp_path / "my_store").rglob("*") if path.is_file()] == [
+        ".ge_store_backend_id"
+    ]
+
+
 @pytest.mark.filterwarnings(
     "ignore:String run_ids are deprecated*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"  # noqa: E501
 )
@@ -5,6 +5,7 @@ import inspect
 import logging
 import pathlib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pformat as pf
 from typing import TYPE_CHECKING, Any, Callable, Type
 
@@ -16,7 +17,7 @@ import great_expectations.execution_engine.pandas_execution_engine
 from great_expectations.compatibility import pydantic
 from great_expectations.datasource.fluent import PandasDatasource
 from great_expectations.datasource.fluent.dynamic_pandas import PANDAS_VERSION
-from great_expectations.datasource.fluent.interfaces import Batch
+from great_expectations.datasource.fluent.interfaces import Batch, isolated_execution_engines
 from great_expectations.datasource.fluent.pandas_datasource import (
     _DYNAMIC_ASSET_TYPES,
     CSVAsset,
@@ -537,3 +538,27 @@ def test_build_batch_request_raises_if_missing_dataframe(
         dataframe_asset.build_batch_request()
 
     assert str(e.value).startswith("Bad input to build_batch_request:")
+
+
+@pytest.mark.unit
+def test_isolated_execution_engines_are_private_to_block_and_thread(
+    pandas_datasource: PandasDatasource,
+):
+    shared_execution_engine = pandas_datasource.get_execution_engine()
+
+    with isolated_execution_engines():
+        isolated_execution_engine = pandas_datasource.get_execution_engine()
+        assert isolated_execution_engine is not shared_execution_engine
+        assert pandas_datasource.get_execution_engine() is isolated_execution_engine
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Other threads are unaffected by block of this thread.
+            assert executor.submit(pandas_datasource.get_execution_engine).result() is (
+                shared_execution_engine
+            )
+
+        with isolated_execution_engines():
+            assert pandas_datasource.get_execution_engine() is isolated_execution_engine
+
+    assert pandas_datasource.get_execution_engine() is shared_execution_engine
+    assert pandas_datasource._execution_engine is shared_execution_engine
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch import BatchData, BatchMarkers
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.execution_engine import MetricComputationConfiguration
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -315,3 +319,149 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(gx_exceptions.GreatExpectationsError):
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+@pytest.fixture
+def concurrent_pandas_execution_engine() -> PandasExecutionEngine:
+    class ConcurrentPandasExecutionEngine(PandasExecutionEngine):
+        @property
+        @override
+        def max_concurrent_metric_computations(self) -> int:
+            return 4
+
+    return ConcurrentPandasExecutionEngine()
+
+
+def _build_direct_metric_computation_configuration(
+    metric_name: str, metric_fn: Callable
+) -> MetricComputationConfiguration:
+    return MetricComputationConfiguration(
+        metric_configuration=MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={},
+            metric_value_kwargs=None,
+        ),
+        metric_fn=metric_fn,
+        metric_provider_kwargs={},
+    )
+
+
+@pytest.mark.unit
+def test_process_direct_metric_computation_configurations_concurrently(
+    concurrent_pandas_execution_engine: PandasExecutionEngine,
+):
+    # Every metric function waits for all others to start, which can only succeed if they run concurrently.  # noqa: E501
+    barrier = threading.Barrier(parties=3, timeout=5)
+
+    def _metric_fn(value: int) -> Callable:
+        def _fn() -> int:
+            barrier.wait()
+            return value
+
+        return _fn
+
+    configurations = [
+        _build_direct_metric_computation_configuration(
+            metric_name=f"metric_{idx}", metric_fn=_metric_fn(idx)
+        )
+        for idx in range(3)
+    ]
+
+    resolved_metrics = concurrent_pandas_execution_engine._process_direct_and_bundled_metric_computation_configurations(  # noqa: E501
+        metric_fn_direct_configurations=configurations,
+        metric_fn_bundle_configurations=[],
+    )
+
+    assert list(resolved_metrics.items()) == [
+        (configuration.metric_configuration.id, idx)
+        for idx, configuration in enumerate(configurations)
+    ]
+
+
+@pytest.mark.unit
+def test_process_direct_metric_computation_configurations_concurrently_reports_failed_metric(
+    concurrent_pandas_execution_engine: PandasExecutionEngine,
+):
+    def _failing_metric_fn() -> int:
+        raise ValueError("metric computation failed")
+
+    configurations = [
+        _build_direct_metric_computation_configuration(
+            metric_name="metric_ok", metric_fn=lambda: 1
+        ),
+        _build_direct_metric_computation_configuration(
+            metric_name="metric_failing", metric_fn=_failing_metric_fn
+        ),
+        _build_direct_metric_computation_configuration(
+            metric_name="metric_also_ok", metric_fn=lambda: 2
+        ),
+    ]
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        concurrent_pandas_execution_engine._process_direct_and_bundled_metric_computation_configurations(
+            metric_fn_direct_configurations=configurations,
+            metric_fn_bundle_configurations=[],
+        )
+
+    assert e.value.failed_metrics == (configurations[1].metric_configuration,)
+    assert "metric computation failed" in str(e.value)
+
+
+@pytest.mark.unit
+def test_process_direct_metric_computation_configurations_concurrently_cancels_pending_metrics(
+    concurrent_pandas_execution_engine: PandasExecutionEngine,
+):
+    started_metric_names: List[str] = []
+
+    def _failing_metric_fn() -> int:
+        raise ValueError("metric computation failed")
+
+    def _slow_metric_fn(metric_name: str) -> Callable:
+        def _fn() -> int:
+            started_metric_names.append(metric_name)
+            time.sleep(0.2)
+            return 1
+
+        return _fn
+
+    configurations = [
+        _build_direct_metric_computation_configuration(
+            metric_name="metric_failing", metric_fn=_failing_metric_fn
+        )
+    ] + [
+        _build_direct_metric_computation_configuration(
+            metric_name=f"metric_{idx}", metric_fn=_slow_metric_fn(f"metric_{idx}")
+        )
+        for idx in range(1, 12)
+    ]
+
+    with pytest.raises(gx_exceptions.MetricResolutionError):
+        concurrent_pandas_execution_engine._process_direct_and_bundled_metric_computation_configurations(
+            metric_fn_direct_configurations=configurations,
+            metric_fn_bundle_configurations=[],
+        )
+
+    # Only metric functions, picked up by one of 4 worker threads before failure was seen, have run.
+    assert set(started_metric_names) <= {f"metric_{idx}" for idx in range(1, 5)}
+
+
+@pytest.mark.unit
+def test_release_batch_releases_batch_data_and_then_cached_metrics():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"batch_1": df, "batch_2": df.copy()})
+    batch_data = engine.batch_manager.batch_data_cache["batch_1"]
+
+    engine.load_batch_data(batch_id="batch_1", batch_data=batch_data)
+    assert engine.batch_manager.active_batch_data_id == "batch_1"
+
+    _, results = get_table_columns_metric(execution_engine=engine)
+    assert len(engine._metric_cache) == len(results) > 0
+
+    engine.release_batch(batch_id="batch_1")
+    assert engine.batch_manager.loaded_batch_ids == ["batch_2"]
+    assert engine.batch_manager.active_batch_data_id == "batch_2"
+    assert len(engine._metric_cache) == len(results)
+
+    engine.release_batch(batch_id="batch_2")
+    assert engine.batch_manager.loaded_batch_ids == []
+    assert len(engine._metric_cache) == 0
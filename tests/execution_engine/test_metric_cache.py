@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.exceptions import InvalidConfigError
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.metric_cache import (
+    BoundedMetricValueCache,
+    InMemoryMetricCache,
+    MetricValueCacheStats,
+    SqliteMetricCache,
+    estimate_metric_value_size,
+)
+from great_expectations.execution_engine.sqlalchemy_batch_data import (
+    SqlAlchemyBatchData,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+def _build_column_max_metric(
+    execution_engine: PandasExecutionEngine | SqlAlchemyExecutionEngine,
+    column_name: str,
+    batch_id: str,
+) -> List[MetricConfiguration]:
+    """Returns "table.columns" and "column.max" metrics, with dependencies already resolved."""
+    table_columns_metric: MetricConfiguration
+    table_columns_metric, _ = get_table_columns_metric(execution_engine=execution_engine)
+    metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": column_name, "batch_id": batch_id},
+        metric_value_kwargs=None,
+    )
+    metric.metric_dependencies = {"table.columns": table_columns_metric}
+    return [metric]
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_evicts_least_recently_used_entries():
+    cache = InMemoryMetricCache(max_entries=2)
+    cache.set(key=("b", "fp", ("m1", "d", "v")), value=1)
+    cache.set(key=("b", "fp", ("m2", "d", "v")), value=2)
+    assert cache.get(key=("b", "fp", ("m1", "d", "v"))) == (True, 1)
+
+    cache.set(key=("b", "fp", ("m3", "d", "v")), value=3)
+
+    assert len(cache) == 2
+    assert ("b", "fp", ("m1", "d", "v")) in cache
+    assert ("b", "fp", ("m2", "d", "v")) not in cache
+    assert cache.get(key=("b", "fp", ("m2", "d", "v"))) == (False, None)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cache_class", [InMemoryMetricCache, SqliteMetricCache])
+def test_metric_cache_max_entries_must_be_positive(cache_class, tmp_path):
+    kwargs: dict = {"path": tmp_path / "metrics.db"} if cache_class is SqliteMetricCache else {}
+    with pytest.raises(InvalidConfigError):
+        cache_class(max_entries=0, **kwargs)
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_persists_values_across_instances(tmp_path):
+    path = tmp_path / "cache" / "metrics.db"
+    cache = SqliteMetricCache(path=path, max_entries=2)
+    cache.set(key=("b", "fp", ("m1", "d", "v")), value={"a": [1, 2.5, None]})
+    cache.set(key=("b", "fp", ("m2", "d", "v")), value=2)
+    # Unpicklable values are not persisted.
+    cache.set(key=("b", "fp", ("m3", "d", "v")), value=threading.Lock())
+    cache.close()
+
+    reopened_cache = SqliteMetricCache(path=path, max_entries=2)
+    assert len(reopened_cache) == 2
+    assert reopened_cache.get(key=("b", "fp", ("m1", "d", "v"))) == (True, {"a": [1, 2.5, None]})
+    assert ("b", "fp", ("m3", "d", "v")) not in reopened_cache
+
+    reopened_cache.set(key=("b", "fp", ("m4", "d", "v")), value=4)
+    assert len(reopened_cache) == 2
+    assert ("b", "fp", ("m4", "d", "v")) in reopened_cache
+
+    reopened_cache.clear()
+    assert len(reopened_cache) == 0
+    reopened_cache.close()
+
+
+@pytest.mark.unit
+def test_pandas_execution_engines_share_metrics_computed_on_identical_data(mocker):
+    cache = InMemoryMetricCache()
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+    first_engine = PandasExecutionEngine(metric_cache=cache)
+    first_engine.load_batch_data(batch_id="my_id", batch_data=df.copy())
+    metrics = _build_column_max_metric(
+        execution_engine=first_engine, column_name="a", batch_id="my_id"
+    )
+    num_cached_dependencies: int = len(cache)
+    results = first_engine.resolve_metrics(metrics_to_resolve=metrics)
+    assert results[metrics[0].id] == 3
+    assert len(cache) == num_cached_dependencies + 1
+
+    second_engine = PandasExecutionEngine(metric_cache=cache)
+    second_engine.load_batch_data(batch_id="my_id", batch_data=df.copy())
+    metrics = _build_column_max_metric(
+        execution_engine=second_engine, column_name="a", batch_id="my_id"
+    )
+    spy = mocker.spy(second_engine, "_build_direct_and_bundled_metric_computation_configurations")
+    results = second_engine.resolve_metrics(metrics_to_resolve=metrics)
+    assert results[metrics[0].id] == 3
+    assert spy.call_count == 0
+    assert len(cache) == num_cached_dependencies + 1
+
+    # Once data change, so does their fingerprint; hence, the metric is computed anew.
+    second_engine.load_batch_data(batch_id="my_id", batch_data=df * 10)
+    metrics = _build_column_max_metric(
+        execution_engine=second_engine, column_name="a", batch_id="my_id"
+    )
+    spy.reset_mock()
+    results = second_engine.resolve_metrics(metrics_to_resolve=metrics)
+    assert results[metrics[0].id] == 30
+    assert spy.call_count == 1
+
+
+@pytest.mark.unit
+def test_estimate_metric_value_size_dispatches_on_value_type():
+    df = pd.DataFrame({"a": range(1000), "b": ["x" * 10] * 1000})
+    assert estimate_metric_value_size(df) == df.memory_usage(deep=True).sum()
+    assert estimate_metric_value_size(np.zeros(1000)) >= 8000
+    # Unexpected-row lists and value counts are estimated from their elements.
+    assert estimate_metric_value_size([{"a": i} for i in range(10000)]) > 10000 * 100
+    assert estimate_metric_value_size(df["b"].value_counts()) > estimate_metric_value_size(1)
+
+
+@pytest.mark.unit
+def test_bounded_metric_value_cache_evicts_least_recently_used_unprotected_metrics():
+    cache = BoundedMetricValueCache(max_bytes=3 * estimate_metric_value_size(np.zeros(100)))
+    for idx in range(3):
+        cache[(f"m{idx}", "d", "v")] = np.zeros(100)
+
+    assert ("m0", "d", "v") in cache
+    cache[("m0", "d", "v")]
+    cache.protect(metric_ids=[("m1", "d", "v")])
+    cache[("m3", "d", "v")] = np.zeros(100)
+
+    # "m1" is protected and "m0" was used most recently; hence, "m2" gets evicted.
+    assert ("m2", "d", "v") not in cache
+    assert ("m1", "d", "v") in cache
+    assert ("m0", "d", "v") in cache
+
+    # Values larger than entire budget are not cached.
+    cache[("m4", "d", "v")] = np.zeros(1000)
+    assert ("m4", "d", "v") not in cache
+
+    assert cache.stats == MetricValueCacheStats(
+        hits=3,
+        misses=2,
+        evictions=1,
+        num_entries=3,
+        size_bytes=3 * estimate_metric_value_size(np.zeros(100)),
+        max_bytes=3 * estimate_metric_value_size(np.zeros(100)),
+    )
+
+
+@pytest.mark.unit
+def test_bounded_metric_value_cache_exceeds_budget_only_while_entries_are_protected():
+    size: int = estimate_metric_value_size(np.zeros(100))
+    cache = BoundedMetricValueCache(max_bytes=size)
+    cache.protect(metric_ids=[("m0", "d", "v"), ("m1", "d", "v")])
+    cache.update({("m0", "d", "v"): np.zeros(100), ("m1", "d", "v"): np.zeros(100)})
+    assert len(cache) == 2
+    assert cache.stats.size_bytes == 2 * size
+
+    cache.protect(metric_ids=())
+    assert len(cache) == 1
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.unit
+def test_execution_engine_bounds_metric_cache_when_configured():
+    assert PandasExecutionEngine().metric_cache_stats is None
+
+    execution_engine = PandasExecutionEngine(metric_cache_max_bytes=1_000_000)
+    execution_engine.load_batch_data(
+        batch_id="my_id", batch_data=pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    )
+    metrics = _build_column_max_metric(
+        execution_engine=execution_engine, column_name="a", batch_id="my_id"
+    )
+    execution_engine.resolve_metrics(metrics_to_resolve=metrics)
+
+    stats = execution_engine.metric_cache_stats
+    assert stats is not None
+    assert stats.max_bytes == 1_000_000
+    assert stats.num_entries > 0
+    assert 0 < stats.size_bytes <= 1_000_000
+    assert execution_engine.config["metric_cache_max_bytes"] == 1_000_000
+
+
+@pytest.mark.sqlite
+def test_sqlalchemy_batch_fingerprint_tracks_row_count(sa, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name="test", con=engine, index=False)
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=engine, metric_cache=SqliteMetricCache(path=tmp_path / "metrics.db")
+    )
+    batch_data = SqlAlchemyBatchData(execution_engine=execution_engine, table_name="test")
+    execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    fingerprint = execution_engine.get_batch_fingerprint(batch_id="my_id")
+    assert fingerprint is not None
+
+    execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    assert execution_engine.get_batch_fingerprint(batch_id="my_id") == fingerprint
+
+    with engine.begin() as connection:
+        connection.execute(sa.text("INSERT INTO test (a) VALUES (4)"))
+    execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    assert execution_engine.get_batch_fingerprint(batch_id="my_id") != fingerprint
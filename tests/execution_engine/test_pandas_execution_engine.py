@@ -360,6 +360,59 @@ def test_get_compute_domain_with_unmeetable_row_condition():
     assert accessor_kwargs == {"column": "a"}, "Accessor kwargs have been modified"
 
 
+@pytest.mark.unit
+def test_get_domain_records_evaluates_each_row_condition_once_per_batch(mocker):
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None], "c": [1, None, 3, 4]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    expected_df = df.query("b<4", parser="pandas")
+    expected_different_condition_df = df.query("b>2", parser="pandas")
+
+    eval_spy = mocker.spy(pd.DataFrame, "eval")
+
+    domain_records = [
+        engine.get_domain_records(
+            domain_kwargs={
+                "column": column,
+                "row_condition": "b<4",
+                "condition_parser": "pandas",
+            }
+        )
+        for column in ["a", "c"]
+    ]
+
+    # domains on different columns, sharing the same row condition, share the same filtered records
+    assert domain_records[0] is domain_records[1]
+    assert domain_records[0].equals(expected_df)
+    assert eval_spy.call_count == 1
+
+    different_condition_records = engine.get_domain_records(
+        domain_kwargs={"column": "a", "row_condition": "b>2", "condition_parser": "pandas"}
+    )
+    assert different_condition_records.equals(expected_different_condition_df)
+    assert eval_spy.call_count == 2
+
+    # rows satisfying every filter are the loaded batch itself, rather than a copy of it
+    assert (
+        engine.get_domain_records(
+            domain_kwargs={
+                "column_list": ["a", "b", "c"],
+                "ignore_row_if": "all_values_are_missing",
+            }
+        )
+        is df
+    )
+
+    # loading batch data again invalidates cached rows
+    reloaded_df = pd.DataFrame({"a": [5, 6], "b": [1, 9], "c": [7, 8]})
+    engine.load_batch_data(batch_data=reloaded_df, batch_id="1234")
+    reloaded_records = engine.get_domain_records(
+        domain_kwargs={"column": "a", "row_condition": "b<4", "condition_parser": "pandas"}
+    )
+    assert reloaded_records.equals(reloaded_df.iloc[:1])
+    assert eval_spy.call_count == 3
+
+
 # Just checking that the Pandas Execution Engine can perform these in sequence
 @pytest.mark.unit
 def test_resolve_metric_bundle():
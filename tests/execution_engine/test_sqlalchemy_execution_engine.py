@@ -28,6 +28,11 @@ from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
     _dialect_requires_persisted_connection,
+    _restrict_metric_fn_to_row_filter,
+)
+from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
+from great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods import (  # noqa: E501
+    _generate_temp_table,
 )
 
 # Function to test for spark dataframe equality
@@ -376,6 +381,282 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+def _build_row_condition_max_metrics(
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> Tuple[Tuple[MetricConfiguration, ...], Dict[Tuple[str, str, str], MetricValue]]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    metrics.update(results)
+
+    aggregate_fn_metrics = []
+    for threshold in range(4):
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs={
+                "column": "a",
+                "row_condition": f'col("b")>{threshold}',
+                "condition_parser": "great_expectations__experimental__",
+            },
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        aggregate_fn_metrics.append(aggregate_fn_metric)
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=tuple(aggregate_fn_metrics), metrics=metrics
+    )
+    metrics.update(results)
+
+    desired_metrics = []
+    for aggregate_fn_metric in aggregate_fn_metrics:
+        desired_metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=aggregate_fn_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics.append(desired_metric)
+
+    return tuple(desired_metrics), metrics
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_with_max_concurrent_queries(sa, tmp_path, mocker):
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'concurrent.db'}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [0, 1, 2, 3, 1, 0]}),
+        name="test",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+    batch_data_dict = {
+        "my_id": SqlAlchemyBatchData(
+            execution_engine=SqlAlchemyExecutionEngine(engine=sqlalchemy_engine),
+            table_name="test",
+        )
+    }
+    # File-backed sqlite databases do not need a single persisted connection, so allow concurrency here.  # noqa: E501
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    serial_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, batch_data_dict=batch_data_dict
+    )
+    concurrent_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        batch_data_dict=batch_data_dict,
+        max_concurrent_queries=4,
+    )
+    assert concurrent_engine.config["max_concurrent_queries"] == 4
+
+    execute_bundle_query_spy = mocker.spy(concurrent_engine, "_execute_bundle_query")
+
+    serial_metrics, serial_resolved = _build_row_condition_max_metrics(serial_engine)
+    concurrent_metrics, concurrent_resolved = _build_row_condition_max_metrics(concurrent_engine)
+
+    serial_results = serial_engine.resolve_metrics(
+        metrics_to_resolve=serial_metrics, metrics=serial_resolved
+    )
+    concurrent_results = concurrent_engine.resolve_metrics(
+        metrics_to_resolve=concurrent_metrics, metrics=concurrent_resolved
+    )
+
+    assert concurrent_results == serial_results
+    assert list(concurrent_results.values()) == [5, 4, 4, None]
+    # every distinct row_condition is a separate domain, and therefore a separate query
+    assert execute_bundle_query_spy.call_count == 4
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_fuses_row_filtered_domains(sa, mocker):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [0, 1, 2, 3, 1, 0]}), sa
+    )
+    mocker.patch.object(execution_engine, "_fuse_row_filtered_domains", True)
+
+    execute_bundle_query_spy = mocker.spy(execution_engine, "_execute_bundle_query")
+
+    metrics, resolved = _build_row_condition_max_metrics(execution_engine)
+    results = execution_engine.resolve_metrics(metrics_to_resolve=metrics, metrics=resolved)
+
+    assert list(results.values()) == [5, 4, 4, None]
+    # domains, which differ only in their row conditions, are computed in one scan of the table
+    assert execute_bundle_query_spy.call_count == 1
+
+
+@pytest.mark.sqlite
+def test_fused_row_filtered_domains_match_separately_computed_domains(sa, mocker):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None, 4, 5, None],
+            "b": [1, 1, 2, 2, 3, 3],
+            "c": ["x", None, "y", "z", None, "w"],
+        }
+    )
+    configurations = []
+    for row_condition in [None, 'col("b")==1', 'col("b")>1', 'col("b")==9', 'col("c").notnull()']:
+        condition_kwargs = {}
+        if row_condition is not None:
+            condition_kwargs = {
+                "row_condition": row_condition,
+                "condition_parser": "great_expectations__experimental__",
+            }
+
+        configurations.extend(
+            [
+                ExpectationConfiguration(
+                    type="expect_column_values_to_not_be_null",
+                    kwargs={"column": "a", **condition_kwargs},
+                ),
+                ExpectationConfiguration(
+                    type="expect_column_values_to_not_be_null",
+                    kwargs={"column": "c", **condition_kwargs},
+                ),
+                ExpectationConfiguration(
+                    type="expect_column_max_to_be_between",
+                    kwargs={"column": "a", "min_value": 0, **condition_kwargs},
+                ),
+                ExpectationConfiguration(
+                    type="expect_column_mean_to_be_between",
+                    kwargs={"column": "a", "min_value": 0, **condition_kwargs},
+                ),
+                ExpectationConfiguration(
+                    type="expect_table_row_count_to_be_between",
+                    kwargs={"min_value": 0, **condition_kwargs},
+                ),
+            ]
+        )
+
+    fused_engine = build_sa_execution_engine(df, sa)
+    mocker.patch.object(fused_engine, "_fuse_row_filtered_domains", True)
+    fused_query_spy = mocker.spy(fused_engine, "_execute_bundle_query")
+    fused_results = Validator(fused_engine).graph_validate(configurations=configurations)
+
+    separate_engine = build_sa_execution_engine(df, sa)
+    separate_query_spy = mocker.spy(separate_engine, "_execute_bundle_query")
+    separate_results = Validator(separate_engine).graph_validate(configurations=configurations)
+
+    assert [result.to_json_dict() for result in fused_results] == [
+        result.to_json_dict() for result in separate_results
+    ]
+    assert fused_query_spy.call_count < separate_query_spy.call_count
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_fn,use_filter_clause,expected_sql",
+    [
+        pytest.param(
+            "sum",
+            False,
+            "sum(CASE WHEN (b = 1) THEN CASE WHEN (a IS NULL) THEN 1 ELSE 0 END END)",
+            id="case_when",
+        ),
+        pytest.param(
+            "sum",
+            True,
+            "sum(CASE WHEN (a IS NULL) THEN 1 ELSE 0 END) FILTER (WHERE b = 1)",
+            id="filter_clause",
+        ),
+        pytest.param(
+            "count_star",
+            False,
+            "count(CASE WHEN (b = 1) THEN 1 END)",
+            id="count_star",
+        ),
+        pytest.param(
+            "count_distinct",
+            False,
+            "count(DISTINCT CASE WHEN (b = 1) THEN a END)",
+            id="count_distinct",
+        ),
+        pytest.param("column", False, None, id="column_outside_of_aggregate"),
+        pytest.param("unsupported_aggregate", False, None, id="unsupported_aggregate"),
+    ],
+)
+def test_restrict_metric_fn_to_row_filter(sa, metric_fn, use_filter_clause, expected_sql):
+    metric_fns = {
+        "sum": sa.func.sum(sa.case((sa.column("a").is_(None), 1), else_=0)),
+        "count_star": sa.func.count(),
+        "count_distinct": sa.func.count(sa.distinct(sa.column("a"))),
+        "column": sa.func.max(sa.column("a")) - sa.column("a"),
+        "unsupported_aggregate": sa.func.approx_count_distinct(sa.column("a")),
+    }
+
+    restricted_metric_fn = _restrict_metric_fn_to_row_filter(
+        metric_fn=metric_fns[metric_fn],
+        condition=sa.column("b") == 1,
+        use_filter_clause=use_filter_clause,
+    )
+
+    if expected_sql is None:
+        assert restricted_metric_fn is None
+    else:
+        assert (
+            str(restricted_metric_fn.compile(compile_kwargs={"literal_binds": True}))
+            == expected_sql
+        )
+
+
+@pytest.mark.unit
+def test_max_concurrent_queries_must_be_positive(sa):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            engine=sa.create_engine("sqlite://"),
+            max_concurrent_queries=0,
+        )
+
+
+@pytest.mark.sqlite
+def test_temp_tables_are_reused_per_connection_and_dropped_on_close(sa, mocker):
+    execution_engine = SqlAlchemyExecutionEngine(engine=sa.create_engine("sqlite://"))
+
+    def _create_temp_table(connection: Connection) -> sa.Table:
+        temp_table = sa.Table(
+            "gx_temp_condition",
+            sa.MetaData(),
+            sa.Column("condition", sa.Integer),
+            prefixes=["TEMPORARY"],
+        )
+        temp_table.create(bind=connection)
+        return temp_table
+
+    create_fn = mocker.Mock(side_effect=_create_temp_table)
+    # Schema reflection of the whole database must never be needed to create temporary tables.
+    mocker.patch.object(sa.MetaData, "reflect", side_effect=AssertionError("must not reflect"))
+
+    temp_table = execution_engine.get_or_create_temp_table(key="my_key", create_fn=create_fn)
+    assert (
+        execution_engine.get_or_create_temp_table(key="my_key", create_fn=create_fn) is temp_table
+    )
+    assert create_fn.call_count == 1
+
+    drop_spy = mocker.spy(temp_table, "drop")
+    execution_engine.close()
+    assert drop_spy.call_count == 1
+    assert len(execution_engine._temp_table_registry) == 0
+
+
+@pytest.mark.sqlite
+def test_generate_temp_table_does_not_reflect_database_schema(sa, mocker):
+    execution_engine = SqlAlchemyExecutionEngine(engine=sa.create_engine("sqlite://"))
+    mocker.patch.object(sa.MetaData, "reflect", side_effect=AssertionError("must not reflect"))
+
+    with execution_engine.get_connection() as connection:
+        temp_table = _generate_temp_table(connection=connection)
+        assert sa.inspect(connection).has_table(temp_table.name)
+
+
 @pytest.mark.sqlite
 def test_get_domain_records_with_column_domain(sa):
     df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]})
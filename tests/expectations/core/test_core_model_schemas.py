@@ -6,7 +6,8 @@ from great_expectations.expectations import core
 from great_expectations.expectations.core import schemas
 from great_expectations.expectations.expectation import MetaExpectation
 
-expectation_dictionary = dict(core.__dict__)
+# Expectations are lazily exported (so are only found in "core.__dict__" once accessed).
+expectation_dictionary = {name: getattr(core, name) for name in dir(core)}
 
 
 @pytest.mark.unit
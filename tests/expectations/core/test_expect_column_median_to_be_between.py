@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.self_check.util import get_test_validator_with_data
+from great_expectations.util import build_in_memory_runtime_context
+
+
+@pytest.fixture
+def uniform_df() -> pd.DataFrame:
+    return pd.DataFrame({"a": np.random.default_rng(seed=1).uniform(0, 100, size=50_000)})
+
+
+@pytest.mark.unit
+def test_pandas_expect_column_median_to_be_between_with_sketch(uniform_df: pd.DataFrame):
+    validator = get_test_validator_with_data(
+        execution_engine="pandas",
+        data=uniform_df,
+        context=build_in_memory_runtime_context(),
+    )
+
+    result = validator.expect_column_median_to_be_between(
+        column="a", min_value=47, max_value=53, allow_relative_error="sketch"
+    )
+
+    assert result.success
+    assert abs(result.result["observed_value"] - uniform_df["a"].median()) < 2
+    sketch_details: dict = result.result["details"]["quantile_sketch"]
+    assert sketch_details["n"] == len(uniform_df)
+    assert 0.0 < sketch_details["normalized_rank_error"] < 0.02
+
+
+@pytest.mark.unit
+def test_pandas_expect_column_median_to_be_between_without_sketch(uniform_df: pd.DataFrame):
+    validator = get_test_validator_with_data(
+        execution_engine="pandas",
+        data=uniform_df,
+        context=build_in_memory_runtime_context(),
+    )
+
+    result = validator.expect_column_median_to_be_between(column="a", min_value=47, max_value=53)
+
+    assert result.success
+    assert result.result["observed_value"] == uniform_df["a"].median()
+    assert "details" not in result.result
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.self_check.util import get_test_validator_with_data
+from great_expectations.util import build_in_memory_runtime_context
+
+
+@pytest.mark.unit
+def test_pandas_expect_column_quantile_values_to_be_between_with_sketch():
+    df = pd.DataFrame({"a": np.random.default_rng(seed=1).uniform(0, 100, size=50_000)})
+
+    validator = get_test_validator_with_data(
+        execution_engine="pandas",
+        data=df,
+        context=build_in_memory_runtime_context(),
+    )
+
+    result = validator.expect_column_quantile_values_to_be_between(
+        column="a",
+        quantile_ranges={
+            "quantiles": [0.0, 0.25, 0.5, 0.75, 1.0],
+            "value_ranges": [[0, 1], [22, 28], [47, 53], [72, 78], [99, 100]],
+        },
+        allow_relative_error="sketch",
+    )
+
+    assert result.success
+    assert result.result["observed_value"]["values"][0] == df["a"].min()
+    sketch_details: dict = result.result["details"]["quantile_sketch"]
+    assert sketch_details["n"] == len(df)
+    assert 0.0 < sketch_details["normalized_rank_error"] < 0.02
@@ -0,0 +1,172 @@
+"""Pandas conditions, evaluated per distinct value (or vectorized), match evaluation of one value at a time."""  # noqa: E501
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+from typing import Any, Callable, Dict, List
+
+import jsonschema
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.parser import parse
+
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypeSuffixes
+from great_expectations.exceptions import MetricResolutionError
+from great_expectations.self_check.util import build_pandas_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+STRINGS: List[str] = [
+    "2024-01-31",
+    "2024-02-30",
+    "31/01/2024",
+    "not a date",
+    "2024-01-31",
+    '{"a": 1}',
+    '{"a": "1"}',
+    "[1, 2",
+    "",
+    "123",
+]
+
+
+def _resolve_unexpected_condition(
+    values: list, metric_name: str, metric_value_kwargs: Dict[str, Any]
+) -> List[bool]:
+    engine = build_pandas_engine(pd.DataFrame({"a": values}))
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+    condition_metric = MetricConfiguration(
+        metric_name=f"{metric_name}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=metric_value_kwargs,
+    )
+    condition_metric.metric_dependencies = {"table.columns": table_columns_metric}
+    results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
+    return results[condition_metric.id][0].tolist()
+
+
+def _succeeds(fn: Callable[[Any], Any], exceptions: tuple) -> Callable[[Any], bool]:
+    def succeeds(val: Any) -> bool:
+        try:
+            return fn(val) is not False
+        except exceptions:
+            return False
+
+    return succeeds
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values,metric_name,metric_value_kwargs,is_expected",
+    [
+        pytest.param(
+            STRINGS,
+            "column_values.dateutil_parseable",
+            {},
+            _succeeds(parse, (ValueError, OverflowError)),
+            id="dateutil_parseable",
+        ),
+        pytest.param(
+            STRINGS,
+            "column_values.json_parseable",
+            {},
+            _succeeds(json.loads, (Exception,)),
+            id="json_parseable",
+        ),
+        pytest.param(
+            STRINGS,
+            "column_values.match_strftime_format",
+            {"strftime_format": "%Y-%m-%d"},
+            _succeeds(
+                lambda val: datetime.datetime.strptime(val, "%Y-%m-%d"),  # noqa: DTZ007
+                (ValueError,),
+            ),
+            id="match_strftime_format",
+        ),
+        pytest.param(
+            ['{"a": 1}', '{"a": "1"}', "{}", '{"a": 1}', "[]"],
+            "column_values.match_json_schema",
+            {"json_schema": {"type": "object", "properties": {"a": {"type": "integer"}}}},
+            _succeeds(
+                lambda val: jsonschema.validate(
+                    json.loads(val),
+                    {"type": "object", "properties": {"a": {"type": "integer"}}},
+                ),
+                (jsonschema.ValidationError,),
+            ),
+            id="match_json_schema",
+        ),
+        pytest.param(
+            STRINGS,
+            "column_values.between",
+            {"min_value": "2024-01-01", "max_value": "31", "strict_max": True},
+            lambda val: "2024-01-01" <= val < "31",
+            id="between_strings",
+        ),
+        pytest.param(
+            [1, 2.5, decimal.Decimal("3.5"), np.nan, 7, 2],
+            "column_values.between",
+            {"min_value": 2, "max_value": decimal.Decimal("3.5"), "strict_min": True},
+            lambda val: 2 < val <= decimal.Decimal("3.5"),
+            id="between_numeric_objects",
+        ),
+        pytest.param(
+            [1, "a", 2.0, True, np.int64(3), datetime.date(2024, 1, 1), b"a"],
+            "column_values.in_type_list",
+            {"type_list": ["int", "str", "date"]},
+            lambda val: isinstance(val, (int, np.int64, str, datetime.date)),
+            id="in_type_list",
+        ),
+    ],
+)
+def test_pandas_condition_matches_evaluation_of_one_value_at_a_time(
+    values: list,
+    metric_name: str,
+    metric_value_kwargs: Dict[str, Any],
+    is_expected: Callable[[Any], bool],
+):
+    unexpected_condition: List[bool] = _resolve_unexpected_condition(
+        values=values, metric_name=metric_name, metric_value_kwargs=metric_value_kwargs
+    )
+
+    assert unexpected_condition == [
+        not is_expected(val) for val in pd.Series(values).dropna().tolist()
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_name,metric_value_kwargs,error_message",
+    [
+        pytest.param(
+            "column_values.match_json_schema",
+            {"json_schema": {"type": "object"}},
+            "Expecting ',' delimiter",
+            id="invalid_json",
+        ),
+        pytest.param(
+            "column_values.match_json_schema",
+            {"json_schema": {"type": 12}},
+            "is not valid under any of the given schemas",
+            id="invalid_schema",
+        ),
+        pytest.param(
+            "column_values.between",
+            {"min_value": 0, "max_value": 5},
+            "must either be None or of the same type",
+            id="between_numbers_and_strings",
+        ),
+    ],
+)
+def test_pandas_condition_raises_error_of_evaluation_of_one_value_at_a_time(
+    metric_name: str, metric_value_kwargs: Dict[str, Any], error_message: str
+):
+    with pytest.raises(MetricResolutionError, match=error_message):
+        _resolve_unexpected_condition(
+            values=['{"a": 1}', "[1, 2"],
+            metric_name=metric_name,
+            metric_value_kwargs=metric_value_kwargs,
+        )
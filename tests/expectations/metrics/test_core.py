@@ -819,6 +819,147 @@ def test_quantiles_metric_spark(spark_session):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+def _resolve_quantile_sketch_metrics(
+    engine, metric_name: str, metric_value_kwargs: dict
+) -> Tuple[MetricValue, MetricValue]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    sketch_metric = MetricConfiguration(
+        metric_name="column.quantile_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    sketch_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,), metrics=metrics)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name=metric_name,
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=metric_value_kwargs,
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+        "column.quantile_sketch": sketch_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    return metrics[sketch_metric.id], results[desired_metric.id]
+
+
+@pytest.mark.unit
+def test_quantiles_metric_sketch_pd():
+    engine = build_pandas_engine(pd.DataFrame({"a": [4, 1, None, 3, 2]}))
+
+    sketch, quantiles = _resolve_quantile_sketch_metrics(
+        engine=engine,
+        metric_name="column.quantile_values",
+        metric_value_kwargs={
+            "quantiles": [0.0, 2.5e-1, 5.0e-1, 7.5e-1, 1.0],
+            "allow_relative_error": "sketch",
+        },
+    )
+
+    assert sketch.n == 4
+    # small columns are sketched exactly (with "percentile_disc" semantics)
+    assert quantiles == [1.0, 1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.unit
+def test_column_median_metric_sketch_pd():
+    values: np.ndarray = np.random.default_rng(seed=5).normal(size=100_000)
+    engine = build_pandas_engine(pd.DataFrame({"a": values}))
+
+    sketch, median = _resolve_quantile_sketch_metrics(
+        engine=engine,
+        metric_name="column.median",
+        metric_value_kwargs={"allow_relative_error": "sketch"},
+    )
+
+    assert not sketch.is_exact
+    rank: float = np.searchsorted(np.sort(values), median) / len(values)
+    assert abs(rank - 0.5) <= sketch.normalized_rank_error
+
+
+@pytest.mark.unit
+def test_column_median_metric_sketch_is_reproducible_pd():
+    values: np.ndarray = np.random.default_rng(seed=7).normal(size=50_000)
+
+    medians = [
+        _resolve_quantile_sketch_metrics(
+            engine=build_pandas_engine(pd.DataFrame({"a": values})),
+            metric_name="column.median",
+            metric_value_kwargs={"allow_relative_error": "sketch"},
+        )[1]
+        for _ in range(2)
+    ]
+
+    assert medians[0] == medians[1]
+
+
+@pytest.mark.sqlite
+def test_quantiles_metric_sketch_sa(sa):
+    values: np.ndarray = np.random.default_rng(seed=9).integers(0, 1_000, size=5_000)
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+
+    sketch, quantiles = _resolve_quantile_sketch_metrics(
+        engine=engine,
+        metric_name="column.quantile_values",
+        metric_value_kwargs={
+            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
+            "allow_relative_error": "sketch",
+        },
+    )
+
+    assert sketch.n == len(values)
+    sorted_values: np.ndarray = np.sort(values)
+    for quantile, value in zip([2.5e-1, 5.0e-1, 7.5e-1], quantiles):
+        lowest_rank: float = np.searchsorted(sorted_values, value, side="left") / len(values)
+        highest_rank: float = np.searchsorted(sorted_values, value, side="right") / len(values)
+        assert lowest_rank - sketch.normalized_rank_error <= quantile
+        assert quantile <= highest_rank + sketch.normalized_rank_error
+
+
+@pytest.mark.unit
+def test_quantile_sketch_metric_rejects_datetime_column_pd():
+    engine = build_pandas_engine(
+        pd.DataFrame({"a": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"])})
+    )
+
+    with pytest.raises(
+        gx_exceptions.MetricResolutionError,
+        match="Expected numeric column type for quantile sketch",
+    ):
+        _resolve_quantile_sketch_metrics(
+            engine=engine,
+            metric_name="column.median",
+            metric_value_kwargs={"allow_relative_error": "sketch"},
+        )
+
+
+@pytest.mark.sqlite
+def test_quantile_sketch_metric_rejects_string_column_sa(sa):
+    # numeric strings must not be sketched as numbers
+    engine = build_sa_execution_engine(pd.DataFrame({"a": ["1", "2", "10"]}), sa)
+
+    with pytest.raises(
+        gx_exceptions.MetricResolutionError,
+        match="Expected numeric column type for quantile sketch",
+    ):
+        _resolve_quantile_sketch_metrics(
+            engine=engine,
+            metric_name="column.median",
+            metric_value_kwargs={"allow_relative_error": "sketch"},
+        )
+
+
 @pytest.mark.unit
 def test_column_histogram_metric_pd():
     engine = build_pandas_engine(
@@ -645,6 +645,48 @@ def test_pandas_unexpected_rows_complete_result_format_with_id_pk(
     }
 
 
+@pytest.mark.unit
+def test_pandas_unexpected_rows_complete_result_format_with_id_pk_as_columns(
+    in_memory_runtime_context,
+    pandas_animals_dataframe_for_unexpected_rows_and_index: pd.DataFrame,
+):
+    expectation_configuration = ExpectationConfiguration(
+        type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "unexpected_index_column_names": ["pk_1"],
+                "return_unexpected_index_list_as_columns": True,
+            },
+        },
+    )
+    # result_format configuration at ExpectationConfiguration-level will emit warning
+    with pytest.warns(UserWarning):
+        result: ExpectationValidationResult = _expecation_configuration_to_validation_result_pandas(
+            expectation_configuration=expectation_configuration,
+            dataframe=pandas_animals_dataframe_for_unexpected_rows_and_index,
+            context=in_memory_runtime_context,
+        )
+    assert convert_to_json_serializable(result.result["unexpected_index_list"]) == [
+        {"animals": ["giraffe", "lion", "zebra"], "pk_1": [3, 4, 5]}
+    ]
+
+
+@pytest.mark.unit
+def test_return_unexpected_index_list_as_columns_must_be_boolean():
+    with pytest.raises(ValidationError):
+        gxe.ExpectColumnValuesToBeInSet(
+            column="animals",
+            value_set=["cat", "fish", "dog"],
+            result_format={
+                "result_format": "COMPLETE",
+                "return_unexpected_index_list_as_columns": "yes",
+            },
+        )
+
+
 @pytest.mark.unit
 def test_pandas_default_to_not_include_unexpected_rows(
     in_memory_runtime_context,
@@ -1040,6 +1082,46 @@ def test_sqlite_single_column_complete_result_format_id_pk(
     }
 
 
+@pytest.mark.sqlite
+def test_sqlite_single_column_complete_result_format_id_pk_as_columns(
+    sa,
+    in_memory_runtime_context,
+    sqlite_table_for_unexpected_rows_with_index,
+    monkeypatch,
+):
+    # Query result is consumed in chunks smaller than number of unexpected rows.
+    monkeypatch.setattr(
+        "great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods.UNEXPECTED_INDEX_LIST_FETCH_SIZE",
+        2,
+    )
+    expectation_configuration = ExpectationConfiguration(
+        type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "unexpected_index_column_names": ["pk_1", "pk_2"],
+                "return_unexpected_index_list_as_columns": True,
+            },
+        },
+    )
+
+    # result_format configuration at ExpectationConfiguration-level will emit warning
+    with pytest.warns(UserWarning):
+        result: ExpectationValidationResult = _expecation_configuration_to_validation_result_sql(
+            expectation_configuration=expectation_configuration,
+            context=in_memory_runtime_context,
+        )
+    assert convert_to_json_serializable(result.result["unexpected_index_list"]) == [
+        {
+            "pk_1": [3, 4, 5],
+            "pk_2": ["three", "four", "five"],
+            "animals": ["giraffe", "lion", "zebra"],
+        }
+    ]
+
+
 @pytest.mark.sqlite
 def test_sqlite_single_column_summary_result_format(
     sa, in_memory_runtime_context, sqlite_table_for_unexpected_rows_with_index
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import json
 import random
 from typing import TYPE_CHECKING, Final, List, Union
 
+import pandas as pd
 import pytest
 from _pytest import monkeypatch
 
@@ -13,12 +15,22 @@ from great_expectations.compatibility.sqlalchemy import (
 )
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import MetricResolutionError
-from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics import util as metrics_util
+from great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable import (  # noqa: E501
+    _are_json,
+)
 from great_expectations.expectations.metrics.util import (
     CaseInsensitiveString,
+    compute_unexpected_pandas_indices,
     get_dbms_compatible_metric_domain_kwargs,
     get_unexpected_indices_for_multiple_pandas_named_indices,
     get_unexpected_indices_for_single_pandas_named_index,
+    is_pandas_string_column,
+    map_pandas_string_values,
     sql_statement_with_post_compile_to_string,
 )
 from tests.test_utils import (
@@ -33,7 +45,7 @@ from tests.test_utils import (
 )
 
 if TYPE_CHECKING:
-    import pandas as pd
+    from pytest_mock import MockerFixture
 
 # The following class allows for declarative instantiation of base class for SqlAlchemy. Adopted from  # noqa: E501
 # https://docs.sqlalchemy.org/en/14/faq/sqlexpressions.html#rendering-postcompile-parameters-as-bound-parameters
@@ -276,6 +288,46 @@ def test_get_unexpected_indices_for_multiple_pandas_named_indices_without_column
     assert unexpected_index_list == unexpected_index_list_two_index_columns_without_column_values
 
 
+@pytest.mark.unit
+def test_interleave_domain_and_index_column_values():
+    values_by_column_name = metrics_util._interleave_domain_and_index_column_values(
+        domain_column_values={"a": [1], "pk_2": ["domain"], "b": [2]},
+        index_column_values={"pk_1": [10], "pk_2": ["index"]},
+    )
+
+    # first domain column leads; index columns (which take precedence) precede remaining ones
+    assert list(values_by_column_name.items()) == [
+        ("a", [1]),
+        ("pk_1", [10]),
+        ("pk_2", ["index"]),
+        ("b", [2]),
+    ]
+
+
+@pytest.mark.unit
+def test_get_unexpected_indices_for_multiple_pandas_named_indices_as_columns(
+    pandas_animals_dataframe_for_unexpected_rows_and_index,
+    unexpected_index_list_two_index_columns,
+):
+    dataframe: pd.DataFrame = pandas_animals_dataframe_for_unexpected_rows_and_index
+    updated_dataframe: pd.DataFrame = dataframe.set_index(["pk_1", "pk_2"])
+    expectation_domain_column_list: List[str] = ["animals"]
+    unexpected_index_column_names: List[str] = list(updated_dataframe.index.names)
+
+    unexpected_index_list = get_unexpected_indices_for_multiple_pandas_named_indices(
+        domain_records_df=updated_dataframe,
+        unexpected_index_column_names=unexpected_index_column_names,
+        expectation_domain_column_list=expectation_domain_column_list,
+        return_unexpected_index_list_as_columns=True,
+    )
+    assert unexpected_index_list == [
+        {
+            column_name: [record[column_name] for record in unexpected_index_list_two_index_columns]
+            for column_name in unexpected_index_list_two_index_columns[0]
+        }
+    ]
+
+
 @pytest.mark.unit
 def test_get_unexpected_indices_for_multiple_pandas_named_indices_named_unexpected_index_columns(
     pandas_animals_dataframe_for_unexpected_rows_and_index,
@@ -389,6 +441,59 @@ def test_get_unexpected_indices_for_multiple_pandas_named_indices_named_unexpect
     )
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exclude_unexpected_values,expected_unexpected_index_list",
+    [
+        pytest.param(
+            False,
+            [
+                {"animals": "fish", "pk_1": 1, "pk_2": "one"},
+                {"animals": "lion", "pk_1": 4, "pk_2": "four"},
+            ],
+            id="with_column_values",
+        ),
+        pytest.param(
+            True,
+            [{"pk_1": [1, 4], "pk_2": ["one", "four"]}],
+            id="without_column_values",
+        ),
+    ],
+)
+def test_compute_unexpected_pandas_indices_named_unexpected_index_columns(
+    pandas_animals_dataframe_for_unexpected_rows_and_index,
+    exclude_unexpected_values: bool,
+    expected_unexpected_index_list: List[dict],
+):
+    dataframe: pd.DataFrame = pandas_animals_dataframe_for_unexpected_rows_and_index
+    unexpected_rows: pd.DataFrame = dataframe[dataframe["animals"].isin(["fish", "lion"])]
+
+    unexpected_index_list = compute_unexpected_pandas_indices(
+        domain_records_df=unexpected_rows,
+        expectation_domain_column_list=["animals"],
+        result_format={
+            "unexpected_index_column_names": ["pk_1", "pk_2"],
+            "exclude_unexpected_values": exclude_unexpected_values,
+        },
+        execution_engine=PandasExecutionEngine(),
+        metrics={"table.columns": list(dataframe.columns)},
+    )
+    assert unexpected_index_list == expected_unexpected_index_list
+    assert [list(element.keys()) for element in unexpected_index_list] == [
+        list(element.keys()) for element in expected_unexpected_index_list
+    ]
+
+    # Unknown index columns are reported even though they are looked up once for all rows.
+    with pytest.raises(gx_exceptions.InvalidMetricAccessorDomainKwargsKeyError):
+        compute_unexpected_pandas_indices(
+            domain_records_df=unexpected_rows,
+            expectation_domain_column_list=["animals"],
+            result_format={"unexpected_index_column_names": ["pk_3"]},
+            execution_engine=PandasExecutionEngine(),
+            metrics={"table.columns": list(dataframe.columns)},
+        )
+
+
 @pytest.fixture
 def column_names_all_lowercase() -> list[str]:
     return [
@@ -621,5 +726,53 @@ class TestCaseInsensitiveString:
             assert input_case_insensitive != other
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column,expected",
+    [
+        pytest.param(pd.Series(["a", "b"]), True, id="object"),
+        pytest.param(pd.Series(["a", "b"], dtype="string"), True, id="string_dtype"),
+        pytest.param(pd.Series(["a", None]), False, id="object_with_null"),
+        pytest.param(pd.Series(["a", None], dtype="string"), False, id="string_dtype_with_null"),
+        pytest.param(pd.Series(["a", 1]), False, id="mixed"),
+        pytest.param(pd.Series([], dtype=object), False, id="empty"),
+    ],
+)
+def test_is_pandas_string_column(column: pd.Series, expected: bool):
+    assert is_pandas_string_column(column) is expected
+
+
+@pytest.mark.unit
+def test_map_pandas_string_values_evaluates_every_distinct_value_once(mocker: MockerFixture):
+    column = pd.Series(["1", "x", "1", "[1]", "x"], index=[10, 11, 12, 13, 14], name="my_column")
+    evaluate_values = mocker.Mock(side_effect=_are_json)
+
+    result = map_pandas_string_values(column=column, evaluate_values=evaluate_values)
+
+    evaluate_values.assert_called_once_with(["1", "x", "[1]"])
+    pd.testing.assert_series_equal(result, column.map(lambda val: _are_json([val])[0]))
+
+
+@pytest.mark.unit
+def test_map_pandas_string_values_in_process_pool(
+    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+):
+    process_pool_executor = mocker.spy(metrics_util, "ProcessPoolExecutor")
+    monkeypatch.setattr(metrics_util, "PANDAS_PROCESS_POOL_MIN_VALUES", 2)
+    monkeypatch.setattr(metrics_util, "PANDAS_PROCESS_POOL_CHUNK_SIZE", 3)
+    column = pd.Series([json.dumps(idx) if idx % 3 else f"not json {idx}" for idx in range(20)])
+
+    result = map_pandas_string_values(
+        column=column, evaluate_values=_are_json, use_process_pool=True
+    )
+
+    pd.testing.assert_series_equal(
+        result, map_pandas_string_values(column=column, evaluate_values=_are_json)
+    )
+    assert result.tolist() == [bool(idx % 3) for idx in range(20)]
+    # Worker processes are not forked from (possibly multi-threaded) calling process.
+    assert process_pool_executor.call_args.kwargs["mp_context"].get_start_method() != "fork"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
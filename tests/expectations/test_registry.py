@@ -1,3 +1,7 @@
+import json
+import subprocess
+import sys
+
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
@@ -5,7 +9,12 @@ import great_expectations.expectations as gxe
 from great_expectations.expectations.expectation_configuration import (
     ExpectationConfiguration,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.registry import (
+    REGISTRY_MANIFEST_FILE,
+    get_expectation_impl,
+    get_metric_kwargs,
+    memoize_metric_kwargs,
+)
 
 # module level markers
 pytestmark = pytest.mark.unit
@@ -27,3 +36,129 @@ def test_registry_from_configuration():
 def test_registry_raises_error_when_invalid_expectation_requested():
     with pytest.raises(gx_exceptions.ExpectationNotFoundError):
         get_expectation_impl("expect_something_in_beta")
+
+
+def _run_in_fresh_interpreter(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+
+def test_registry_manifest_is_in_sync_with_core_modules():
+    manifest: dict = json.loads(
+        _run_in_fresh_interpreter(
+            "import json; "
+            "from great_expectations.expectations.registry_manifest import build_registry_manifest; "  # noqa: E501
+            "print(json.dumps(build_registry_manifest()))"
+        )
+    )
+
+    assert manifest == json.loads(REGISTRY_MANIFEST_FILE.read_text()), (
+        "Registry manifest is out of sync with core Expectations and Metrics. "
+        "Run `python -m great_expectations.expectations.registry_manifest`."
+    )
+
+
+def test_core_modules_are_imported_on_first_lookup():
+    imported_modules: dict = json.loads(
+        _run_in_fresh_interpreter(
+            "import json, sys; "
+            "import great_expectations as gx; "
+            "from great_expectations.execution_engine import PandasExecutionEngine; "
+            "from great_expectations.expectations.registry import get_expectation_impl, get_metric_provider; "  # noqa: E501
+            "expectation = 'great_expectations.expectations.core.expect_column_max_to_be_between'; "
+            "metric = 'great_expectations.expectations.metrics.column_aggregate_metrics.column_max'; "  # noqa: E501
+            "before = [expectation in sys.modules, metric in sys.modules]; "
+            "get_expectation_impl('expect_column_max_to_be_between'); "
+            "get_metric_provider('column.max', PandasExecutionEngine()); "
+            "print(json.dumps({'before': before, 'after': [expectation in sys.modules, metric in sys.modules]}))"  # noqa: E501
+        )
+    )
+
+    assert imported_modules == {"before": [False, False], "after": [True, True]}
+
+
+def test_lazy_exports_resolve_to_registered_core_objects():
+    assert gxe.ExpectColumnMaxToBeBetween is get_expectation_impl("expect_column_max_to_be_between")
+    assert gxe.core.ExpectColumnMaxToBeBetween is gxe.ExpectColumnMaxToBeBetween
+    assert "ExpectColumnMaxToBeBetween" in dir(gxe)
+    with pytest.raises(AttributeError):
+        _ = gxe.ExpectSomethingInBeta
+
+
+def test_metric_kwargs_are_memoized_per_configuration_within_scope(mocker):
+    configuration = ExpectationConfiguration(
+        type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3], "mostly": 0.9},
+    )
+    metric_names = [
+        "column_values.nonnull.unexpected_count",
+        "column_values.in_set.unexpected_count",
+        "column_values.in_set.unexpected_values",
+        "table.row_count",
+    ]
+    runtime_configuration = {"result_format": "SUMMARY"}
+    expected_metric_kwargs = [
+        get_metric_kwargs(
+            metric_name=metric_name,
+            configuration=configuration,
+            runtime_configuration=runtime_configuration,
+        )
+        for metric_name in metric_names
+    ]
+    to_domain_obj = mocker.spy(ExpectationConfiguration, "to_domain_obj")
+
+    with memoize_metric_kwargs():
+        metric_kwargs = [
+            get_metric_kwargs(
+                metric_name=metric_name,
+                configuration=configuration,
+                runtime_configuration=runtime_configuration,
+            )
+            for metric_name in metric_names
+        ]
+        assert to_domain_obj.call_count == 1
+
+        # different runtime configuration is not served from memo
+        get_metric_kwargs(
+            metric_name="table.row_count",
+            configuration=configuration,
+            runtime_configuration={"result_format": "COMPLETE"},
+        )
+        assert to_domain_obj.call_count == 2
+
+    assert metric_kwargs == expected_metric_kwargs
+    # every call gets its own (mutable) Domain and value kwargs
+    assert metric_kwargs[1]["metric_domain_kwargs"] is not metric_kwargs[2]["metric_domain_kwargs"]
+
+    get_metric_kwargs(
+        metric_name="table.row_count",
+        configuration=configuration,
+        runtime_configuration=runtime_configuration,
+    )
+    assert to_domain_obj.call_count == 3
+
+
+def test_memoized_metric_kwargs_do_not_share_mutable_values():
+    configuration = ExpectationConfiguration(
+        type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3]},
+    )
+
+    with memoize_metric_kwargs():
+        first_metric_kwargs = get_metric_kwargs(
+            metric_name="column_values.in_set.unexpected_count",
+            configuration=configuration,
+        )
+        first_metric_kwargs["metric_value_kwargs"]["value_set"].append(4)
+
+        second_metric_kwargs = get_metric_kwargs(
+            metric_name="column_values.in_set.unexpected_count",
+            configuration=configuration,
+        )
+
+    assert second_metric_kwargs["metric_value_kwargs"]["value_set"] == [1, 2, 3]
+    assert configuration.kwargs["value_set"] == [1, 2, 3]
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def skip_unless_performance_tests_requested(request: pytest.FixtureRequest) -> None:
+    # Benchmarks are slow and their timings are only meaningful when run deliberately.
+    if not request.config.getoption("--performance-tests"):
+        pytest.skip("need --performance-tests option to run")
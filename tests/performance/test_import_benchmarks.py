@@ -0,0 +1,49 @@
+"""Time of "import great_expectations" in a fresh interpreter.
+
+Core Expectations and Metrics are imported on first lookup in the registry; "eager" also imports and
+registers all of them up front, as "import great_expectations" used to.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Every round starts a new interpreter; fewer rounds keep the benchmarks reasonably short.
+NUM_ROUNDS = 3
+
+
+def _import_in_fresh_interpreter(register_core_modules: bool) -> None:
+    code = "import great_expectations"
+    if register_core_modules:
+        code += (
+            "; from great_expectations.expectations.registry import "
+            "register_core_expectations, register_core_metrics"
+            "; register_core_metrics(); register_core_expectations()"
+        )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.performance
+def test_import_lazy(benchmark):
+    benchmark.group = "import great_expectations"
+    benchmark.pedantic(
+        _import_in_fresh_interpreter,
+        kwargs={"register_core_modules": False},
+        rounds=NUM_ROUNDS,
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.performance
+def test_import_eager(benchmark):
+    benchmark.group = "import great_expectations"
+    benchmark.pedantic(
+        _import_in_fresh_interpreter,
+        kwargs={"register_core_modules": True},
+        rounds=NUM_ROUNDS,
+        warmup_rounds=1,
+    )
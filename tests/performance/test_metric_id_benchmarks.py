@@ -0,0 +1,103 @@
+"""Accessing "MetricConfiguration.id" (and so "IDDict.to_id()") of metrics of a 5,000-Expectation suite.
+
+Validation graph, metric cache lookups, and "resolve_metric_bundle" access metric IDs many times over; "cached"
+reads IDs as computed once, "recomputed" serializes and digests Domain and value kwargs on every access.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import Callable, List, Tuple
+
+import pytest
+
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+NUM_EXPECTATIONS = 5_000
+NUM_COLUMNS = 500
+# Number of times the ID of every metric is accessed while validation graph is built and resolved.
+NUM_ID_ACCESSES = 20
+
+
+def _build_metric_configurations() -> List[MetricConfiguration]:
+    """Mimics metric configurations of "expect_column_values_to_be_in_set" (with row conditions)."""
+    metric_configurations: List[MetricConfiguration] = []
+    for expectation_index in range(NUM_EXPECTATIONS):
+        domain_kwargs: dict = {
+            "batch_id": "my_datasource-my_asset-year_2024",
+            "column": f"column_{expectation_index % NUM_COLUMNS}",
+            "row_condition": f'col("status")=="{expectation_index % 7}"',
+            "condition_parser": "great_expectations__experimental__",
+        }
+        value_kwargs: dict = {
+            "value_set": list(range(expectation_index % 50)),
+            "parse_strings_as_datetimes": False,
+        }
+        metric_configurations.extend(
+            [
+                MetricConfiguration("column_values.in_set.condition", domain_kwargs, value_kwargs),
+                MetricConfiguration(
+                    "column_values.in_set.unexpected_count", domain_kwargs, value_kwargs
+                ),
+                MetricConfiguration("column_values.nonnull.count", domain_kwargs),
+            ]
+        )
+
+    return metric_configurations
+
+
+def _get_cached_id(metric_configuration: MetricConfiguration) -> Tuple[str, str, str]:
+    return metric_configuration.id
+
+
+def _get_recomputed_id(metric_configuration: MetricConfiguration) -> Tuple[str, str, str]:
+    # Passing "id_keys" explicitly bypasses cached IDs (i.e., reproduces uncached behavior).
+    return (
+        metric_configuration.metric_name,
+        metric_configuration.metric_domain_kwargs.to_id(
+            id_keys=metric_configuration.metric_domain_kwargs.keys()
+        ),
+        metric_configuration.metric_value_kwargs.to_id(
+            id_keys=metric_configuration.metric_value_kwargs.keys()
+        ),
+    )
+
+
+def _access_ids(
+    metric_configurations: List[MetricConfiguration],
+    get_id: Callable[[MetricConfiguration], Tuple[str, str, str]],
+) -> int:
+    ids: set = set()
+    for _ in range(NUM_ID_ACCESSES):
+        for metric_configuration in metric_configurations:
+            ids.add(get_id(metric_configuration))
+
+    return len(ids)
+
+
+@pytest.fixture(scope="module")
+def metric_configurations() -> List[MetricConfiguration]:
+    return _build_metric_configurations()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "get_id",
+    [
+        pytest.param(_get_cached_id, id="cached"),
+        pytest.param(_get_recomputed_id, id="recomputed"),
+    ],
+)
+def test_access_metric_ids_for_large_suite(
+    benchmark,
+    metric_configurations: List[MetricConfiguration],
+    get_id: Callable[[MetricConfiguration], Tuple[str, str, str]],
+):
+    benchmark.group = "metric ids"
+    num_ids: int = benchmark.pedantic(
+        _access_ids,
+        kwargs={"metric_configurations": metric_configurations, "get_id": get_id},
+        rounds=3,
+    )
+
+    # cached and recomputed IDs identify exactly the same metrics
+    assert num_ids == len({_get_recomputed_id(metric) for metric in metric_configurations})
@@ -0,0 +1,103 @@
+# Builds metric dependency graphs of a big suite within "memoize_metric_kwargs()" scope and without
+# it (every "get_metric_kwargs()" call then builds the Expectation and its runtime kwargs again).
+# Compare the two timings with "--benchmark-group-by=func".
+
+from __future__ import annotations
+
+import contextlib
+from typing import Callable, ContextManager, List
+
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.expectations.registry import memoize_metric_kwargs
+from great_expectations.validator.validation_plan import (
+    PlannedExpectation,
+    _plan_expectation,
+)
+
+NUM_EXPECTATIONS = 1_000
+NUM_COLUMNS = 100
+RUNTIME_CONFIGURATION: dict = {"result_format": "COMPLETE", "catch_exceptions": False}
+
+
+def _build_expectation_configurations() -> List[ExpectationConfiguration]:
+    configurations: List[ExpectationConfiguration] = []
+    for expectation_index in range(NUM_EXPECTATIONS):
+        column: str = f"column_{expectation_index % NUM_COLUMNS}"
+        if expectation_index % 2:
+            configuration = ExpectationConfiguration(
+                type="expect_column_values_to_be_in_set",
+                kwargs={
+                    "column": column,
+                    "value_set": list(range(expectation_index % 50)),
+                    "mostly": 0.95,
+                    "batch_id": "my_batch",
+                },
+            )
+        else:
+            configuration = ExpectationConfiguration(
+                type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": column,
+                    "min_value": 0,
+                    "max_value": expectation_index,
+                    "batch_id": "my_batch",
+                },
+            )
+
+        configurations.append(configuration)
+
+    return configurations
+
+
+def _build_graphs(
+    configurations: List[ExpectationConfiguration],
+    scope: ContextManager,
+) -> int:
+    execution_engine = PandasExecutionEngine()
+    planned_expectations: List[PlannedExpectation] = []
+    with scope:
+        for configuration in configurations:
+            planned_expectations.append(
+                _plan_expectation(
+                    configuration=configuration,
+                    execution_engine=execution_engine,
+                    runtime_configuration=RUNTIME_CONFIGURATION,
+                    catch_exceptions=False,
+                )
+            )
+
+    return sum(len(planned_expectation.edges) for planned_expectation in planned_expectations)
+
+
+@pytest.fixture(scope="module")
+def expectation_configurations() -> List[ExpectationConfiguration]:
+    return _build_expectation_configurations()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "scope_factory",
+    [
+        pytest.param(memoize_metric_kwargs, id="memoized"),
+        pytest.param(contextlib.nullcontext, id="recomputed"),
+    ],
+)
+def test_build_graphs(
+    benchmark,
+    expectation_configurations: List[ExpectationConfiguration],
+    scope_factory: Callable[[], ContextManager],
+):
+    num_edges: int = benchmark.pedantic(
+        lambda: _build_graphs(configurations=expectation_configurations, scope=scope_factory()),
+        rounds=3,
+    )
+
+    # memo must not change graphs, only how fast they are built
+    assert num_edges == _build_graphs(
+        configurations=expectation_configurations, scope=contextlib.nullcontext()
+    )
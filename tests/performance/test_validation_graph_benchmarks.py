@@ -0,0 +1,134 @@
+"""Benchmarks of "ValidationGraph" bookkeeping overhead (graph build and resolution) for big suites.
+
+Metric computation itself is stubbed out, so that timings reflect graph construction and scheduling.
+
+Run with:
+    pytest tests/performance/test_validation_graph_benchmarks.py --performance-tests \
+        --benchmark-json=tests/performance/results/validation_graph.json
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import pytest
+
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    ExpectationValidationGraph,
+    MetricEdge,
+    ValidationGraph,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+
+NUM_EXPECTATIONS = 10_000
+NUM_COLUMNS = 500
+
+
+class _InstantExecutionEngine:
+    """Stands in for an "ExecutionEngine", resolving every requested metric immediately."""
+
+    has_bounded_metric_cache: bool = False
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], int]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], int]:
+        return {metric.id: 0 for metric in metrics_to_resolve}
+
+
+def _column_name(expectation_index: int) -> str:
+    return f"column_{expectation_index % NUM_COLUMNS}"
+
+
+def _build_expectation_edges(expectation_index: int) -> List[MetricEdge]:
+    """Mimics the metric dependency graph of a "ColumnMapExpectation" (shared table metrics, per-column map metrics)."""  # noqa: E501
+    column: str = _column_name(expectation_index=expectation_index)
+    value_kwargs: dict = {"value_set": [expectation_index]}
+
+    table_column_types = MetricConfiguration("table.column_types", {}, {"include_nested": True})
+    table_columns = MetricConfiguration("table.columns", {})
+    table_row_count = MetricConfiguration("table.row_count", {})
+    condition = MetricConfiguration(
+        "column_values.in_set.condition", {"column": column}, value_kwargs
+    )
+    unexpected_count = MetricConfiguration(
+        "column_values.in_set.unexpected_count", {"column": column}, value_kwargs
+    )
+    nonnull_count = MetricConfiguration("column_values.nonnull.count", {"column": column})
+
+    return [
+        MetricEdge(left=table_column_types),
+        MetricEdge(left=table_columns, right=table_column_types),
+        MetricEdge(left=table_row_count, right=table_columns),
+        MetricEdge(left=condition, right=table_columns),
+        MetricEdge(left=unexpected_count, right=condition),
+        MetricEdge(left=nonnull_count, right=table_row_count),
+    ]
+
+
+def _build_suite_level_graph(execution_engine: ExecutionEngine) -> ValidationGraph:
+    expectation_validation_graphs: List[ExpectationValidationGraph] = []
+    for expectation_index in range(NUM_EXPECTATIONS):
+        expectation_validation_graph = ExpectationValidationGraph(
+            configuration=ExpectationConfiguration(
+                type="expect_column_values_to_be_in_set",
+                kwargs={
+                    "column": _column_name(expectation_index=expectation_index),
+                    "value_set": [expectation_index],
+                },
+            ),
+            graph=ValidationGraph(execution_engine=execution_engine),
+        )
+        expectation_validation_graph.update(
+            graph=ValidationGraph(
+                execution_engine=execution_engine,
+                edges=_build_expectation_edges(expectation_index=expectation_index),
+            )
+        )
+        expectation_validation_graphs.append(expectation_validation_graph)
+
+    edges: List[MetricEdge] = [
+        edge
+        for expectation_validation_graph in expectation_validation_graphs
+        for edge in expectation_validation_graph.graph.edges
+    ]
+    return ValidationGraph(execution_engine=execution_engine, edges=edges)
+
+
+@pytest.fixture
+def execution_engine() -> ExecutionEngine:
+    return _InstantExecutionEngine()  # type: ignore[return-value]
+
+
+@pytest.mark.performance
+def test_build_validation_graph_for_large_suite(benchmark, execution_engine: ExecutionEngine):
+    graph: ValidationGraph = benchmark.pedantic(
+        _build_suite_level_graph,
+        kwargs={"execution_engine": execution_engine},
+        rounds=3,
+    )
+
+    # shared table-level edges, one "nonnull.count" edge per column, two edges per expectation
+    assert len(graph.edges) == 3 + NUM_COLUMNS + 2 * NUM_EXPECTATIONS
+
+
+@pytest.mark.performance
+def test_resolve_validation_graph_for_large_suite(benchmark, execution_engine: ExecutionEngine):
+    graph: ValidationGraph = _build_suite_level_graph(execution_engine=execution_engine)
+
+    resolved_metrics, aborted_metrics_info = benchmark.pedantic(
+        graph.resolve,
+        kwargs={"show_progress_bars": False},
+        rounds=3,
+    )
+
+    assert not aborted_metrics_info
+    assert len(resolved_metrics) == 3 + NUM_COLUMNS + 2 * NUM_EXPECTATIONS
@@ -1,18 +1,35 @@
 import os
+import pathlib
+import re
 import shutil
 from typing import Dict
 
 import pytest
 
+import great_expectations.expectations as gxe
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationResultsStore
+from great_expectations.data_context.store.html_site_store import HtmlSiteStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.render.renderer import ExpectationSuitePageRenderer
+from great_expectations.render.renderer.site_builder import (
+    DefaultSiteSectionBuilder,
+    _get_renderer_fingerprint,
+)
+from great_expectations.render.view import DefaultJinjaPageView
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -125,3 +142,204 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+def test_site_builder_only_builds_new_or_changed_pages(tmp_path_factory, mocker):
+    project_dir = str(tmp_path_factory.mktemp("project_dir"))
+    context = get_context(context_root_dir=os.path.join(project_dir, FileDataContext.GX_DIR))  # noqa: PTH118
+    suite_a = context.suites.add(ExpectationSuite(name="suite_a"))
+    context.suites.add(ExpectationSuite(name="suite_b"))
+    data_docs_dir = os.path.join(context.root_directory, "uncommitted", "data_docs", "local_site")  # noqa: PTH118
+
+    render_spy = mocker.spy(ExpectationSuitePageRenderer, "render")
+    copy_static_assets_spy = mocker.spy(HtmlSiteStore, "copy_static_assets")
+    context.build_data_docs()
+    assert render_spy.call_count == 2
+    assert copy_static_assets_spy.called
+    assert os.path.isfile(os.path.join(data_docs_dir, *HtmlSiteStore.MANIFEST_KEY))  # noqa: PTH113, PTH118
+
+    # manifest is read back by new site builder (and nothing is rendered again)
+    render_spy.reset_mock()
+    copy_static_assets_spy.reset_mock()
+    context.build_data_docs()
+    assert render_spy.call_count == 0
+    assert not copy_static_assets_spy.called
+    assert os.path.isfile(os.path.join(data_docs_dir, "index.html"))  # noqa: PTH113, PTH118
+
+    # changed suite is rendered again, and so is deleted page of unchanged one
+    suite_a.add_expectation(gxe.ExpectColumnToExist(column="a"))
+    suite_a.save()
+    suite_b_page = os.path.join(data_docs_dir, "expectations", "suite_b.html")  # noqa: PTH118
+    os.remove(suite_b_page)  # noqa: PTH107
+    render_spy.reset_mock()
+    context.build_data_docs()
+    assert sorted(call.args[1].name for call in render_spy.call_args_list) == [
+        "suite_a",
+        "suite_b",
+    ]
+    assert os.path.isfile(suite_b_page)  # noqa: PTH113
+
+    # cleaned site is built from scratch
+    render_spy.reset_mock()
+    context.build_data_docs(site_names=["local_site"])
+    assert render_spy.call_count == 0
+    context.clean_data_docs()
+    context.build_data_docs()
+    assert render_spy.call_count == 2
+
+
+def test_renderer_fingerprint_includes_renderer_and_view_configuration():
+    renderer = ExpectationSuitePageRenderer()
+    view = DefaultJinjaPageView()
+
+    def get_fingerprint(renderer_config: dict, view_config: dict) -> str:
+        return _get_renderer_fingerprint(
+            renderer=renderer,
+            view=view,
+            renderer_config=renderer_config,
+            view_config=view_config,
+            render_options=["my_site", None, True],
+        )
+
+    renderer_config = {
+        "class_name": "ExpectationSuitePageRenderer",
+        "column_section_renderer": {"class_name": "ExpectationSuiteColumnSectionRenderer"},
+    }
+    view_config = {"class_name": "DefaultJinjaPageView"}
+    fingerprint = get_fingerprint(renderer_config=renderer_config, view_config=view_config)
+
+    # normalized: default module names and order of keys do not matter
+    assert (
+        get_fingerprint(
+            renderer_config={
+                "column_section_renderer": {"class_name": "ExpectationSuiteColumnSectionRenderer"},
+                "module_name": "great_expectations.render.renderer",
+                "class_name": "ExpectationSuitePageRenderer",
+            },
+            view_config={
+                "module_name": "great_expectations.render.view",
+                "class_name": "DefaultJinjaPageView",
+            },
+        )
+        == fingerprint
+    )
+    assert (
+        get_fingerprint(
+            renderer_config={
+                "class_name": "ExpectationSuitePageRenderer",
+                "column_section_renderer": {"class_name": "MyColumnSectionRenderer"},
+            },
+            view_config=view_config,
+        )
+        != fingerprint
+    )
+    assert (
+        get_fingerprint(
+            renderer_config=renderer_config,
+            view_config={"class_name": "DefaultJinjaPageView", "my_option": 1},
+        )
+        != fingerprint
+    )
+
+
+def test_site_builder_renders_pages_in_worker_processes(tmp_path_factory, mocker):
+    project_dir = str(tmp_path_factory.mktemp("project_dir"))
+    context = get_context(context_root_dir=os.path.join(project_dir, FileDataContext.GX_DIR))  # noqa: PTH118
+    for idx in range(3):
+        suite = context.suites.add(ExpectationSuite(name=f"suite_{idx}"))
+        suite.add_expectation(gxe.ExpectColumnToExist(column=f"column_{idx}"))
+        context.validation_results_store.store_validation_results(
+            suite_validation_result=ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name=suite.name,
+                meta={"run_id": {"run_name": "my_run", "run_time": "20240101T000000.000000Z"}},
+            ),
+            suite_validation_result_identifier=ValidationResultIdentifier.from_tuple(
+                (suite.name, "my_run", "20240101T000000.000000Z", "my_batch")
+            ),
+        )
+    data_docs_dir = os.path.join(context.root_directory, "uncommitted", "data_docs", "local_site")  # noqa: PTH118
+
+    def read_pages() -> Dict[str, str]:
+        # (time of rendering, in logo URL, and random IDs of collapsible content blocks vary anyway)
+        return {
+            str(path.relative_to(data_docs_dir)): re.sub(
+                r"\?d=[^&]+&|-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+                "",
+                path.read_text(),
+            )
+            for path in pathlib.Path(data_docs_dir).rglob("*.html")
+            if path.name != "index.html"
+        }
+
+    context.build_data_docs()
+    serially_built_pages = read_pages()
+    assert len(serially_built_pages) == 6
+
+    context.clean_data_docs()
+    data_docs_sites = context.variables.data_docs_sites
+    data_docs_sites["local_site"]["max_render_processes"] = 2
+    context.variables.data_docs_sites = data_docs_sites
+    mocker.patch.object(DefaultSiteSectionBuilder, "MIN_RESOURCES_TO_RENDER_IN_PROCESSES", 1)
+    build_pages_in_processes_spy = mocker.spy(
+        DefaultSiteSectionBuilder, "_build_pages_in_processes"
+    )
+    context.build_data_docs()
+
+    assert build_pages_in_processes_spy.call_count == 2
+    assert read_pages() == serially_built_pages
+
+
+def test_site_index_is_built_from_validation_result_summaries(tmp_path_factory, mocker):
+    project_dir = str(tmp_path_factory.mktemp("project_dir"))
+    context = get_context(context_root_dir=os.path.join(project_dir, FileDataContext.GX_DIR))  # noqa: PTH118
+    summarized_key = ValidationResultIdentifier.from_tuple(
+        ("my_suite", "run_1", "20240101T000000.000000Z", "batch_1")
+    )
+    unsummarized_key = ValidationResultIdentifier.from_tuple(
+        ("my_suite", "run_2", "20240102T000000.000000Z", "batch_1")
+    )
+    context.validation_results_store.store_validation_results(
+        suite_validation_result=ExpectationSuiteValidationResult(
+            success=True,
+            results=[],
+            suite_name="my_suite",
+            meta={
+                "active_batch_definition": {"data_asset_name": "summarized_asset"},
+                "run_id": summarized_key.run_id,
+            },
+        ),
+        suite_validation_result_identifier=summarized_key,
+    )
+    # e.g., result stored before summaries were introduced
+    validation_results_store = context.validation_results_store
+    validation_results_store.store_backend.set(
+        validation_results_store.key_to_tuple(unsummarized_key),
+        validation_results_store.serialize(
+            ExpectationSuiteValidationResult(
+                success=False,
+                results=[],
+                suite_name="my_suite",
+                meta={
+                    "active_batch_definition": {"data_asset_name": "unsummarized_asset"},
+                    "run_id": unsummarized_key.run_id,
+                },
+            )
+        ),
+    )
+
+    get_validation_result_spy = mocker.spy(context, "get_validation_result")
+    context.build_data_docs()
+
+    # only result without summary is retrieved in full
+    assert [call.kwargs["run_id"] for call in get_validation_result_spy.call_args_list] == [
+        unsummarized_key.run_id
+    ]
+    with open(
+        os.path.join(context.root_directory, "uncommitted", "data_docs", "local_site", "index.html")  # noqa: PTH118
+    ) as f:
+        index_page = f.read()
+
+    assert "summarized_asset" in index_page
+    assert "unsummarized_asset" in index_page
@@ -1,6 +1,12 @@
+import datetime
+import decimal
+import json
+import pathlib
 import re
+import uuid
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.util import convert_to_json_serializable
@@ -63,3 +69,232 @@ def test_serialization_of_pattern():
     pattern_to_test = r"data_(?P<year>\d{4})-(?P<month>\d{2}).csv"
     data = re.compile(pattern_to_test)
     assert convert_to_json_serializable(data) == pattern_to_test
+
+
+# Golden outputs of "convert_to_json_serializable()" (serialized with "json.dumps()"); they must
+# stay byte-for-byte identical, regardless of how (vectorized or element-wise) values are converted.
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data,expected_json",
+    [
+        pytest.param(7, "7", id="int"),
+        pytest.param(0.1, "0.1", id="float"),
+        pytest.param(float("nan"), "null", id="float_nan"),
+        pytest.param(float("inf"), "Infinity", id="float_inf"),
+        pytest.param(True, "true", id="bool"),
+        pytest.param(None, "null", id="none"),
+        pytest.param("hello", '"hello"', id="str"),
+        pytest.param(np.int8(-3), "-3", id="np_int8"),
+        pytest.param(np.int64(2**40), "1099511627776", id="np_int64"),
+        pytest.param(np.uint64(2**63), "9223372036854775808", id="np_uint64"),
+        pytest.param(np.bool_(False), "false", id="np_bool"),
+        pytest.param(np.float32(0.1), "0.10000000149011612", id="np_float32"),
+        pytest.param(np.float32("nan"), "NaN", id="np_float32_nan"),
+        pytest.param(np.float64(1 / 3), "0.3333333333333333", id="np_float64"),
+        pytest.param(np.float64("nan"), "null", id="np_float64_nan"),
+        pytest.param(np.longdouble(1) / 3, "0.333333333333333", id="np_longdouble"),
+        pytest.param(
+            np.datetime64("2022-12-08T12:56:23.423"),
+            '"2022-12-08T12:56:23.423"',
+            id="np_datetime64",
+        ),
+        pytest.param(
+            datetime.datetime(2022, 1, 2, 3, 4, 5, 6),  # noqa: DTZ001
+            '"2022-01-02T03:04:05.000006"',
+            id="datetime",
+        ),
+        pytest.param(datetime.date(2022, 1, 2), '"2022-01-02"', id="date"),
+        pytest.param(
+            pd.Timestamp("2022-01-02 03:04:05", tz="UTC"),
+            '"2022-01-02T03:04:05+00:00"',
+            id="pd_timestamp",
+        ),
+        pytest.param(pd.NaT, '"NaT"', id="pd_nat"),
+        pytest.param(
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            '"12345678-1234-5678-1234-567812345678"',
+            id="uuid",
+        ),
+        pytest.param(b"\xc0\xa8\x00\x01", "\"b'\\\\xc0\\\\xa8\\\\x00\\\\x01'\"", id="bytes"),
+        pytest.param(slice(1, 10, 2), '"slice(1, 10, 2)"', id="slice"),
+        pytest.param(pathlib.PurePosixPath("/a/b.csv"), '"/a/b.csv"', id="path"),
+        pytest.param(decimal.Decimal("1.10"), "1.1", id="decimal"),
+        pytest.param(range(3), "[0, 1, 2]", id="range"),
+        pytest.param(
+            {1: {"a": [np.int32(1), np.float32(2.5), None]}, (1, 2): float("nan")},
+            '{"1": {"a": [1, 2.5, null]}, "(1, 2)": null}',
+            id="dict_nested",
+        ),
+        pytest.param(
+            [1, "a", np.float64(0.5), np.nan, datetime.date(2020, 1, 1), [np.bool_(True)]],
+            '[1, "a", 0.5, null, "2020-01-01", [true]]',
+            id="list_mixed",
+        ),
+        pytest.param((np.uint8(1), b"x"), "[1, \"b'x'\"]", id="tuple"),
+        pytest.param({3}, "[3]", id="set"),
+        pytest.param(np.arange(-3, 3), "[-3, -2, -1, 0, 1, 2]", id="array_int"),
+        pytest.param(np.array([0, 255], dtype=np.uint8), "[0, 255]", id="array_uint8"),
+        pytest.param(np.array([True, False]), "[true, false]", id="array_bool"),
+        pytest.param(
+            np.array([0.1, np.nan, np.inf, -np.inf, 1e300, -0.0]),
+            "[0.1, null, Infinity, -Infinity, 1e+300, -0.0]",
+            id="array_float",
+        ),
+        pytest.param(
+            np.array([0.1, 2.0 / 3]), "[0.1, 0.6666666666666666]", id="array_float_no_nan"
+        ),
+        pytest.param(
+            np.array([0.1, np.nan], dtype=np.float32),
+            "[0.10000000149011612, null]",
+            id="array_float32",
+        ),
+        pytest.param(
+            np.array([0.1, np.nan], dtype=np.float16),
+            "[0.0999755859375, null]",
+            id="array_float16",
+        ),
+        pytest.param(
+            np.array([1, np.nan], dtype=np.longdouble) / 3,
+            "[0.333333333333333, NaN]",
+            id="array_longdouble",
+        ),
+        pytest.param(
+            np.array([[1.5, np.nan], [np.nan, 2.5]]),
+            "[[1.5, null], [null, 2.5]]",
+            id="array_2d_float",
+        ),
+        pytest.param(np.arange(6).reshape(2, 3), "[[0, 1, 2], [3, 4, 5]]", id="array_2d_int"),
+        pytest.param(np.array([], dtype=float), "[]", id="array_empty_float"),
+        pytest.param(np.array(["a", "bc"]), '["a", "bc"]', id="array_str"),
+        pytest.param(np.array([b"a", b"bc"]), "[\"b'a'\", \"b'bc'\"]", id="array_bytes"),
+        pytest.param(
+            np.array(["a", 1, None, np.nan, 2.5], dtype=object),
+            '["a", 1, null, null, 2.5]',
+            id="array_object",
+        ),
+        pytest.param(
+            np.array(["2020-01-01", "NaT"], dtype="M8[ns]"),
+            "[1577836800000000000, null]",
+            id="array_datetime64_ns",
+        ),
+        pytest.param(
+            np.array(["2020-01-01T01:02:03", "NaT"], dtype="M8[us]"),
+            '["2020-01-01T01:02:03", null]',
+            id="array_datetime64_us",
+        ),
+        pytest.param(
+            np.array(["2020-01-01", "NaT"], dtype="M8[D]"),
+            '["2020-01-01", null]',
+            id="array_datetime64_d",
+        ),
+        pytest.param(pd.Index([3, 1, 2]), "[3, 1, 2]", id="index_int"),
+        pytest.param(pd.Index([0.5, np.nan]), "[0.5, null]", id="index_float"),
+        pytest.param(pd.RangeIndex(3), "[0, 1, 2]", id="index_range"),
+        pytest.param(pd.Index(["a", None, 1]), '["a", null, 1]', id="index_object"),
+        pytest.param(
+            pd.DatetimeIndex(["2020-01-01", None]),
+            '["2020-01-01T00:00:00", "NaT"]',
+            id="index_datetime",
+        ),
+        pytest.param(
+            pd.CategoricalIndex(["a", "b", "a"]), '["a", "b", "a"]', id="index_categorical"
+        ),
+        pytest.param(
+            pd.Series([1, 2], index=pd.Index(["x", "y"], name="key"), name="count"),
+            '[{"key": "x", "count": 1}, {"key": "y", "count": 2}]',
+            id="series_int",
+        ),
+        pytest.param(
+            pd.Series([0.1, np.nan, 3.0]),
+            '[{"index": 0, "value": 0.1}, {"index": 1, "value": null}, {"index": 2, "value": 3.0}]',
+            id="series_float",
+        ),
+        pytest.param(
+            pd.Series([0.1, np.nan], dtype=np.float32),
+            '[{"index": 0, "value": 0.10000000149011612}, {"index": 1, "value": null}]',
+            id="series_float32",
+        ),
+        pytest.param(
+            pd.Series([True, False], index=[2.5, np.nan]),
+            '[{"index": 2.5, "value": true}, {"index": null, "value": false}]',
+            id="series_bool",
+        ),
+        pytest.param(
+            pd.Series([1, None], dtype="Int64"),
+            '[{"index": 0, "value": 1}, {"index": 1, "value": null}]',
+            id="series_nullable_int",
+        ),
+        pytest.param(
+            pd.Series([1.5, None], dtype="Float64"),
+            '[{"index": 0, "value": 1.5}, {"index": 1, "value": null}]',
+            id="series_nullable_float",
+        ),
+        pytest.param(
+            pd.Series(["a", None], dtype="string"),
+            '[{"index": 0, "value": "a"}, {"index": 1, "value": null}]',
+            id="series_string",
+        ),
+        pytest.param(
+            pd.Series(pd.to_datetime(["2020-01-01", None])),
+            '[{"index": 0, "value": "2020-01-01T00:00:00"}, {"index": 1, "value": "NaT"}]',
+            id="series_datetime",
+        ),
+        pytest.param(
+            pd.Series(pd.Categorical(["a", "b", None])),
+            '[{"index": 0, "value": "a"}, {"index": 1, "value": "b"}, {"index": 2, "value": null}]',
+            id="series_categorical",
+        ),
+        pytest.param(
+            pd.Series(["a", 1, None, {"b": np.int16(2)}]),
+            '[{"index": 0, "value": "a"}, {"index": 1, "value": 1}, {"index": 2, "value": null}, {"index": 3, "value": {"b": 2}}]',  # noqa: E501
+            id="series_object",
+        ),
+        pytest.param(
+            pd.Series(["b", "a", "b", None]).value_counts(dropna=False),
+            '[{"index": "b", "count": 2}, {"index": "a", "count": 1}, {"index": null, "count": 1}]',
+            id="series_value_counts",
+        ),
+        pytest.param(
+            pd.Series([1], index=pd.Index([0], name="v"), name="v"),
+            '[{"v": 1}]',
+            id="series_same_names",
+        ),
+        pytest.param(pd.Series([1], name=0), '[{"index": 0, "value": 1}]', id="series_zero_name"),
+        pytest.param(
+            pd.DataFrame(
+                {
+                    "a": [1, 2],
+                    "b": [0.5, np.nan],
+                    "c": ["x", None],
+                    "d": pd.to_datetime(["2020-01-01", None]),
+                }
+            ),
+            '[{"a": 1, "b": 0.5, "c": "x", "d": "2020-01-01T00:00:00"}, {"a": 2, "b": null, "c": null, "d": "NaT"}]',  # noqa: E501
+            id="dataframe",
+        ),
+    ],
+)
+def test_convert_to_json_serializable_golden_output(data, expected_json: str):
+    assert json.dumps(convert_to_json_serializable(data)) == expected_json
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dtype",
+    [np.float64, np.float32, np.int64, np.uint16, np.bool_, np.str_],
+)
+def test_vectorized_conversion_of_large_arrays_matches_element_wise_conversion(dtype):
+    rng = np.random.default_rng(seed=42)
+    values = rng.normal(size=100_000) * 1_000
+    values[rng.random(size=values.size) < 0.1] = np.nan
+    if dtype not in (np.float64, np.float32):
+        values = np.nan_to_num(values)
+
+    array = values.astype(dtype)
+    element_wise = [convert_to_json_serializable(value) for value in array.tolist()]
+    series = pd.Series(array, index=array)
+
+    assert json.dumps(convert_to_json_serializable(array)) == json.dumps(element_wise)
+    assert json.dumps(convert_to_json_serializable(series)) == json.dumps(
+        [{"index": value, "value": value} for value in element_wise]
+    )
@@ -1,7 +1,11 @@
+import copy
+
 import pytest
 
 from great_expectations.core import Domain
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.types.attributes import Attributes
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -63,3 +67,78 @@ def test_metric_configuration_get_domain(
             "column": "my_column",
         },
     )
+
+
+@pytest.mark.unit
+def test_metric_configuration_id_is_cached_and_follows_kwargs_modifications(
+    column_histogram_metric_config: MetricConfiguration,
+) -> None:
+    metric_id = column_histogram_metric_config.id
+    assert column_histogram_metric_config.id is metric_id
+
+    column_histogram_metric_config.metric_value_kwargs["bins"] = [0, 5, 10]
+    modified_metric_id = column_histogram_metric_config.id
+    assert modified_metric_id != metric_id
+    assert (
+        modified_metric_id
+        == MetricConfiguration(
+            metric_name=column_histogram_metric_config.metric_name,
+            metric_domain_kwargs=dict(column_histogram_metric_config.metric_domain_kwargs),
+            metric_value_kwargs=dict(column_histogram_metric_config.metric_value_kwargs),
+        ).id
+    )
+
+    copied_metric_config = copy.deepcopy(column_histogram_metric_config)
+    copied_metric_config.metric_domain_kwargs["column"] = "other_column"
+    assert copied_metric_config.id != modified_metric_id
+    assert column_histogram_metric_config.id is modified_metric_id
+
+
+@pytest.mark.unit
+def test_identical_metric_configurations_share_interned_id(
+    column_histogram_metric_config: MetricConfiguration,
+) -> None:
+    identical_metric_config = MetricConfiguration(
+        metric_name=column_histogram_metric_config.metric_name,
+        metric_domain_kwargs=dict(column_histogram_metric_config.metric_domain_kwargs),
+        metric_value_kwargs=dict(column_histogram_metric_config.metric_value_kwargs),
+    )
+
+    assert identical_metric_config.id is column_histogram_metric_config.id
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "modify",
+    [
+        pytest.param(lambda kwargs: kwargs.__setitem__("b", 3), id="setitem"),
+        pytest.param(lambda kwargs: kwargs.__delitem__("a"), id="delitem"),
+        pytest.param(lambda kwargs: kwargs.update({"a": 3}), id="update"),
+        pytest.param(lambda kwargs: kwargs.setdefault("c", 3), id="setdefault"),
+        pytest.param(lambda kwargs: kwargs.pop("a"), id="pop"),
+        pytest.param(lambda kwargs: kwargs.popitem(), id="popitem"),
+        pytest.param(lambda kwargs: kwargs.clear(), id="clear"),
+        pytest.param(lambda kwargs: kwargs.__ior__({"a": 3}), id="ior"),
+    ],
+)
+def test_id_dict_cached_id_is_invalidated_by_modifications(modify) -> None:
+    kwargs = IDDict({"a": 1, "b": 2})
+    original_id = kwargs.to_id()
+
+    modify(kwargs)
+
+    assert kwargs.to_id() == IDDict(dict(kwargs)).to_id()
+    assert kwargs.to_id() != original_id
+
+
+@pytest.mark.unit
+def test_attributes_id_is_cached_without_adding_keys() -> None:
+    attributes = Attributes({"x": 1})
+
+    assert attributes.to_id() == "x=1"
+    assert attributes.to_id() is attributes.to_id()
+    assert dict(attributes) == {"x": 1}
+
+    attributes["y"] = 2
+    assert attributes.to_id() == IDDict({"x": 1, "y": 2}).to_id()
+    assert attributes.to_json_dict() == {"x": 1, "y": 2}
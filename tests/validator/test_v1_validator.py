@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pprint import pformat as pf
+from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
@@ -14,9 +15,14 @@ from great_expectations.data_context.data_context.abstract_data_context import (
     AbstractDataContext,
 )
 from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 from great_expectations.expectations.expectation import Expectation
+from great_expectations.validator.batch_registry import BatchRegistry
 from great_expectations.validator.v1_validator import Validator
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 @pytest.fixture
 def failing_expectation() -> Expectation:
@@ -261,3 +267,71 @@ def test_cloud_validate_renders_results_when_appropriate(
 
     assert len(result.results) == 1
     assert result.results[0].rendered_content
+
+
+@pytest.mark.unit
+def test_validate_expectation_suite_with_compiled_validation_plan(
+    fds_data_context: AbstractDataContext,
+    batch_definition_with_event_type_partitioner: BatchDefinition,
+    expectation_suite: ExpectationSuite,
+):
+    # column type dependent Expectation is planned anew for every batch
+    expectation_suite.add_expectation_configuration(
+        gxe.ExpectColumnValuesToBeOfType(column="event_type", type_="str").configuration
+    )
+    validation_plan = Validator(
+        batch_definition=batch_definition_with_event_type_partitioner,
+        batch_parameters={"event_type": "start"},
+    ).compile_validation_plan(expectation_suite)
+
+    for event_type in ("start", "stop"):
+        validator = Validator(
+            batch_definition=batch_definition_with_event_type_partitioner,
+            batch_parameters={"event_type": event_type},
+        )
+        planned_result = validator.validate_expectation_suite(
+            expectation_suite, validation_plan=validation_plan
+        )
+        result = validator.validate_expectation_suite(expectation_suite)
+
+        assert planned_result.batch_id == result.batch_id
+        assert [evr.expectation_config.kwargs["batch_id"] for evr in planned_result.results] == [
+            validator.active_batch_id
+        ] * 3
+        assert [evr.to_json_dict() for evr in planned_result.results] == [
+            evr.to_json_dict() for evr in result.results
+        ]
+        assert planned_result.statistics == result.statistics
+
+
+@pytest.mark.unit
+def test_validators_with_batch_registry_share_batches(
+    fds_data_context: AbstractDataContext,
+    batch_definition_with_event_type_partitioner: BatchDefinition,
+    expectation_suite: ExpectationSuite,
+    mocker: MockerFixture,
+):
+    batch_registry = BatchRegistry()
+    load_batch_spy = mocker.spy(SqlAlchemyExecutionEngine, "get_batch_data_and_markers")
+
+    results = []
+    for event_type in ("start", "stop", "start"):
+        validator = Validator(
+            batch_definition=batch_definition_with_event_type_partitioner,
+            batch_parameters={"event_type": event_type},
+            batch_registry=batch_registry,
+        )
+        results.append(validator.validate_expectation_suite(expectation_suite))
+
+    assert load_batch_spy.call_count == len(batch_registry) == 2
+    assert results[0].batch_id == results[2].batch_id != results[1].batch_id
+    assert results[0].describe_dict() == results[2].describe_dict()
+
+    execution_engine = batch_registry.get_batch(
+        batch_definition=batch_definition_with_event_type_partitioner,
+        batch_parameters={"event_type": "start"},
+    ).data.execution_engine
+    batch_registry.release()
+
+    assert len(batch_registry) == 0
+    assert execution_engine.batch_manager.loaded_batch_ids == []
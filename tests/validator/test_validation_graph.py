@@ -3,11 +3,13 @@ import uuid
 from typing import Dict, Iterable, Optional, Set, Tuple, Union, cast
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
 import great_expectations.expectations as gxe
-from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.expectations.expectation_configuration import (
     ExpectationConfiguration,
 )
@@ -19,6 +21,7 @@ from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
     ValidationGraph,
+    _MetricDependencyIndex,
 )
 from great_expectations.validator.validator import ValidationDependencies
 
@@ -28,6 +31,8 @@ def pandas_execution_engine_fake(
     failed_metric_config: MetricConfiguration,
 ) -> ExecutionEngine:
     class PandasExecutionEngineFake:
+        has_bounded_metric_cache: bool = False
+
         # noinspection PyUnusedLocal
         @staticmethod
         def resolve_metrics(
@@ -317,6 +322,68 @@ def test_parse_validation_graph(
     assert len(ready_metrics) == 2 and len(needed_metrics) == 9
 
 
+@pytest.mark.unit
+def test_validation_graph_deduplicates_edges_supplied_at_instantiation(metric_edge: MetricEdge):
+    class DummyExecutionEngine:
+        pass
+
+    execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
+
+    graph = ValidationGraph(execution_engine=execution_engine, edges=[metric_edge, metric_edge])
+
+    assert graph.edges == [metric_edge]
+
+
+@pytest.mark.unit
+def test_metric_dependency_index_schedules_waves_incrementally():
+    table_columns = MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={})
+    column_max = MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": "a"})
+    column_min = MetricConfiguration(metric_name="column.min", metric_domain_kwargs={"column": "a"})
+    column_range = MetricConfiguration(
+        metric_name="column.range", metric_domain_kwargs={"column": "a"}
+    )
+    metric_dependency_index = _MetricDependencyIndex(
+        edges=[
+            MetricEdge(left=table_columns),
+            MetricEdge(left=column_max, right=table_columns),
+            MetricEdge(left=column_min, right=table_columns),
+            MetricEdge(left=column_range, right=column_max),
+            MetricEdge(left=column_range, right=column_min),
+        ]
+    )
+
+    metric_dependency_index.initialize(metrics={})
+    assert metric_dependency_index.ready_metrics == [table_columns]
+    assert metric_dependency_index.num_needed_metrics == 3
+
+    metric_dependency_index.mark_resolved(metric_ids=[table_columns.id])
+    assert metric_dependency_index.ready_metrics == [column_max, column_min]
+    assert metric_dependency_index.needed_metrics == [column_range]
+
+    # "column.range" only becomes ready once both of its dependencies are resolved.
+    metric_dependency_index.mark_resolved(metric_ids=[column_max.id])
+    assert metric_dependency_index.ready_metrics == [column_min]
+    assert metric_dependency_index.num_needed_metrics == 1
+    assert metric_dependency_index.pending_dependency_ids == {
+        table_columns.id,
+        column_max.id,
+        column_min.id,
+    }
+
+    metric_dependency_index.mark_resolved(metric_ids=[column_min.id])
+    assert metric_dependency_index.ready_metrics == [column_range]
+    assert metric_dependency_index.num_needed_metrics == 0
+
+    metric_dependency_index.mark_resolved(metric_ids=[column_range.id])
+    assert metric_dependency_index.ready_metrics == []
+    assert metric_dependency_index.pending_dependency_ids == set()
+
+    # Previously resolved metrics are accounted for when (re-)initializing.
+    metric_dependency_index.initialize(metrics={table_columns.id: ["a"], column_max.id: 1})
+    assert metric_dependency_index.ready_metrics == [column_min]
+    assert metric_dependency_index.needed_metrics == [column_range]
+
+
 @pytest.mark.unit
 def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
@@ -433,7 +500,7 @@ def test_progress_bar_config(
         pass
 
     class DummyExecutionEngine:
-        pass
+        has_bounded_metric_cache: bool = False
 
     metric_configuration = cast(MetricConfiguration, DummyMetricConfiguration)
     execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
@@ -501,3 +568,34 @@ if __name__ == "__main__":
             "--log-level=DEBUG",
         ]
     )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric_cache_max_bytes,protected", [(None, False), (1_000_000, True)])
+def test_resolve_protects_cached_metrics_only_with_bounded_metric_cache(
+    metric_cache_max_bytes: Optional[int], protected: bool, mocker
+):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    batch = Batch(data=df)  # type: ignore[arg-type]
+    execution_engine = PandasExecutionEngine(
+        batch_data_dict={batch.id: batch.data}, metric_cache_max_bytes=metric_cache_max_bytes
+    )
+    protect_cached_metrics = mocker.spy(execution_engine, "protect_cached_metrics")
+    pending_dependency_ids = mocker.patch.object(
+        _MetricDependencyIndex,
+        "pending_dependency_ids",
+        new_callable=mocker.PropertyMock,
+        return_value=set(),
+    )
+
+    graph = ValidationGraph(execution_engine=execution_engine)
+    graph.build_metric_dependency_graph(
+        metric_configuration=MetricConfiguration(
+            metric_name="column.max", metric_domain_kwargs={"column": "a"}
+        )
+    )
+    resolved_metrics, _ = graph.resolve()
+
+    assert 3 in resolved_metrics.values()
+    assert protect_cached_metrics.called is protected
+    assert pending_dependency_ids.called is protected
@@ -362,6 +362,133 @@ def test_graph_validate_with_bad_config_catch_exceptions_false(
     assert str(eee.value) == 'Error: The column "not_in_table" in BatchData does not exist.'
 
 
+@pytest.mark.big
+def test_run_validation_plan_matches_graph_validate_for_other_batches(
+    basic_datasource: PandasDatasource,
+):
+    asset = basic_datasource.add_dataframe_asset("my_asset")
+    batch_definition = asset.add_batch_definition_whole_dataframe("my batch definition")
+    expectation_configurations = [
+        ExpectationConfiguration(
+            type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a", "value_set": [1, 3, 5], "row_condition": "b>2"},
+        ),
+        ExpectationConfiguration(
+            type="expect_column_max_to_be_between",
+            kwargs={"column": "not_in_table", "min_value": 1, "max_value": 29},
+        ),
+        ExpectationConfiguration(
+            type="expect_column_mean_to_be_between",
+            kwargs={"column": "b", "min_value": 2, "max_value": 4},
+        ),
+        ExpectationConfiguration(
+            type="expect_column_values_to_be_of_type",
+            kwargs={"column": "a", "type_": "int64"},
+        ),
+    ]
+    runtime_configuration = {"result_format": "COMPLETE"}
+
+    def get_validator(df: pd.DataFrame) -> Validator:
+        batch = batch_definition.get_batch(batch_parameters={"dataframe": df})
+        return Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+
+    validation_plan = get_validator(
+        pd.DataFrame({"a": [1, 5, 22], "b": [1, 2, 3]})
+    ).compile_validation_plan(
+        configurations=expectation_configurations,
+        runtime_configuration=runtime_configuration,
+    )
+    assert len(validation_plan) == len(expectation_configurations)
+
+    for df in (
+        pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]}),
+        pd.DataFrame({"a": [3, 5], "b": [3.0, 3.5]}),
+    ):
+        validator = get_validator(df)
+        planned_results = validator.run_validation_plan(validation_plan=validation_plan)
+        results = validator.graph_validate(
+            configurations=expectation_configurations,
+            runtime_configuration=runtime_configuration,
+        )
+
+        assert [result.expectation_config.kwargs["batch_id"] for result in planned_results] == [
+            validator.active_batch_id
+        ] * len(expectation_configurations)
+        assert [result.success for result in planned_results] == [
+            result.success for result in results
+        ]
+        assert [result.result for result in planned_results] == [
+            result.result for result in results
+        ]
+        assert [result.expectation_config for result in planned_results] == [
+            result.expectation_config for result in results
+        ]
+
+
+@pytest.mark.big
+def test_run_validation_plan_replans_kl_divergence_bins_for_other_batches(
+    basic_datasource: PandasDatasource,
+):
+    asset = basic_datasource.add_dataframe_asset("my_asset")
+    batch_definition = asset.add_batch_definition_whole_dataframe("my batch definition")
+    expectation_configurations = [
+        ExpectationConfiguration(
+            type="expect_column_kl_divergence_to_be_less_than",
+            kwargs={"column": "a", "bucketize_data": True, "threshold": 0.1},
+        ),
+    ]
+
+    def get_validator(df: pd.DataFrame) -> Validator:
+        batch = batch_definition.get_batch(batch_parameters={"dataframe": df})
+        return Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+
+    validation_plan = get_validator(pd.DataFrame({"a": [1, 2, 3, 4, 5]})).compile_validation_plan(
+        configurations=expectation_configurations
+    )
+
+    # Histogram bins computed for first Batch would not cover values of this one.
+    validator = get_validator(pd.DataFrame({"a": [100, 200, 200, 300, 400, 500]}))
+    planned_results = validator.run_validation_plan(validation_plan=validation_plan)
+    results = validator.graph_validate(configurations=expectation_configurations)
+
+    assert planned_results[0].result == results[0].result
+    assert planned_results[0].success == results[0].success
+
+
+@pytest.mark.unit
+def test_validation_dependencies_depend_on_batch_data_is_inferred_from_override():
+    class ExpectColumnValuesToBeCustomTyped(gxe.ExpectColumnValuesToBeOfType):
+        def get_validation_dependencies(self, execution_engine=None, runtime_configuration=None):
+            return super().get_validation_dependencies(execution_engine, runtime_configuration)
+
+    class ExpectColumnMaxToBeCustom(gxe.ExpectColumnMaxToBeBetween):
+        _validation_dependencies_depend_on_batch_data = False
+
+        def get_validation_dependencies(self, execution_engine=None, runtime_configuration=None):
+            return super().get_validation_dependencies(execution_engine, runtime_configuration)
+
+    assert not gxe.ExpectColumnMaxToBeBetween(
+        column="a", min_value=1
+    )._get_validation_dependencies_depend_on_batch_data()
+    assert gxe.ExpectColumnValuesToBeOfType(
+        column="a", type_="int64"
+    )._get_validation_dependencies_depend_on_batch_data()
+    assert ExpectColumnValuesToBeCustomTyped(
+        column="a", type_="int64"
+    )._get_validation_dependencies_depend_on_batch_data()
+    assert not ExpectColumnMaxToBeCustom(
+        column="a", min_value=1
+    )._get_validation_dependencies_depend_on_batch_data()
+    assert gxe.ExpectColumnKLDivergenceToBeLessThan(
+        column="a", threshold=0.1
+    )._get_validation_dependencies_depend_on_batch_data()
+    assert not gxe.ExpectColumnKLDivergenceToBeLessThan(
+        column="a",
+        partition_object={"values": [1, 2], "weights": [0.5, 0.5]},
+        threshold=0.1,
+    )._get_validation_dependencies_depend_on_batch_data()
+
+
 @pytest.mark.parametrize(
     "value_set, expected",
     [